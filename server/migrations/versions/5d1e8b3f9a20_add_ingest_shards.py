@@ -0,0 +1,42 @@
+"""add ingest shards
+
+Revision ID: 5d1e8b3f9a20
+Revises: 9c3f5e2a81d7
+Create Date: 2026-10-18 15:12:40.318825
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5d1e8b3f9a20"
+down_revision: Union[str, Sequence[str], None] = "9c3f5e2a81d7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "ingest_runs",
+        sa.Column("shards", sa.Integer(), server_default=sa.text("1"), nullable=False),
+    )
+    op.create_table(
+        "ingest_shards",
+        sa.Column("ingest_run_id", sa.String(), nullable=False),
+        sa.Column("shard", sa.Integer(), nullable=False),
+        sa.Column("batches_ingested", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("finished", sa.Boolean(), server_default=sa.text("false"), nullable=False),
+        sa.ForeignKeyConstraint(["ingest_run_id"], ["ingest_runs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("ingest_run_id", "shard"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("ingest_shards")
+    op.drop_column("ingest_runs", "shards")
@@ -0,0 +1,32 @@
+"""add conventions.hook_dependencies
+
+Revision ID: 7b2e91d4a6c3
+Revises: 44a8e3799b97
+Create Date: 2026-10-18 09:12:05.118204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7b2e91d4a6c3"
+down_revision: Union[str, Sequence[str], None] = "44a8e3799b97"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "conventions",
+        sa.Column("hook_dependencies", sa.JSON(), server_default=sa.text("'{}'"), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("conventions", "hook_dependencies")
@@ -0,0 +1,39 @@
+"""add hook_outcome_memo
+
+Revision ID: 9c3f5e2a81d7
+Revises: e4a1c9b07d52
+Create Date: 2026-10-18 13:05:51.204417
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9c3f5e2a81d7"
+down_revision: Union[str, Sequence[str], None] = "e4a1c9b07d52"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "hook_outcome_memo",
+        sa.Column("release_id", sa.UUID(), nullable=False),
+        sa.Column("input_key", sa.String(length=64), nullable=False),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("outcome", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["release_id"], ["hook_releases.id"]),
+        sa.PrimaryKeyConstraint("release_id", "input_key"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("hook_outcome_memo")
@@ -0,0 +1,29 @@
+"""add hook_runs.oom_batch_mb
+
+Revision ID: a7d3e5b19c42
+Revises: f2c8a6d41e93
+Create Date: 2026-10-19 09:12:44.318205
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7d3e5b19c42"
+down_revision: Union[str, Sequence[str], None] = "f2c8a6d41e93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("hook_runs", sa.Column("oom_batch_mb", sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("hook_runs", "oom_batch_mb")
@@ -0,0 +1,64 @@
+"""add incremental statistics
+
+Revision ID: b3e7a2c58d14
+Revises: 5d1e8b3f9a20
+Create Date: 2026-10-18 17:04:12.581930
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b3e7a2c58d14"
+down_revision: Union[str, Sequence[str], None] = "5d1e8b3f9a20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "instance_statistics",
+        sa.Column("records", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+    )
+    op.add_column(
+        "instance_statistics",
+        sa.Column(
+            "records_this_month", sa.BigInteger(), server_default=sa.text("0"), nullable=False
+        ),
+    )
+    op.add_column(
+        "instance_statistics",
+        sa.Column("month_start", sa.DateTime(timezone=True), nullable=True),
+    )
+    # NULL: the first refresh after upgrading runs a full reconcile.
+    op.add_column(
+        "instance_statistics",
+        sa.Column("reconciled_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_table(
+        "instance_statistics_deltas",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("table_name", sa.String(), nullable=False),
+        sa.Column("row_delta", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "recorded_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("instance_statistics_deltas")
+    op.drop_column("instance_statistics", "reconciled_at")
+    op.drop_column("instance_statistics", "month_start")
+    op.drop_column("instance_statistics", "records_this_month")
+    op.drop_column("instance_statistics", "records")
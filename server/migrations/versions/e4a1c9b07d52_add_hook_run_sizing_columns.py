@@ -0,0 +1,39 @@
+"""add hook_runs sizing columns
+
+Revision ID: e4a1c9b07d52
+Revises: 7b2e91d4a6c3
+Create Date: 2026-10-18 11:40:27.530114
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e4a1c9b07d52"
+down_revision: Union[str, Sequence[str], None] = "7b2e91d4a6c3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "hook_runs",
+        sa.Column("records", sa.Integer(), server_default=sa.text("0"), nullable=False),
+    )
+    op.add_column(
+        "hook_runs",
+        sa.Column("input_mb", sa.Float(), server_default=sa.text("0"), nullable=False),
+    )
+    op.add_column("hook_runs", sa.Column("memory", sa.String(length=16), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("hook_runs", "memory")
+    op.drop_column("hook_runs", "input_mb")
+    op.drop_column("hook_runs", "records")
@@ -0,0 +1,52 @@
+"""add delivery priority and worker counts
+
+Revision ID: f2c8a6d41e93
+Revises: b3e7a2c58d14
+Create Date: 2026-10-19 09:12:47.318204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2c8a6d41e93"
+down_revision: Union[str, Sequence[str], None] = "b3e7a2c58d14"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "deliveries",
+        sa.Column("priority", sa.SmallInteger(), server_default=sa.text("0"), nullable=False),
+    )
+    op.create_index(
+        "idx_deliveries_priority",
+        "deliveries",
+        ["consumer_group", sa.text("priority DESC")],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    op.create_table(
+        "worker_counts",
+        sa.Column("consumer_group", sa.String(length=128), nullable=False),
+        sa.Column("workers", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("consumer_group"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("worker_counts")
+    op.drop_index(
+        "idx_deliveries_priority",
+        table_name="deliveries",
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    op.drop_column("deliveries", "priority")
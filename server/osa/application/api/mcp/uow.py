@@ -5,7 +5,9 @@ MCP callbacks run outside FastAPI's request scope, so the dispatcher opens a
 resolves the tool class inside it (Dishka injects the tool's query-handler
 dependencies within the same scope). Identity is ``Anonymous``: the MCP
 surface mirrors the public, unauthenticated ``/data/`` read surface, and every
-delegated handler is ``__auth__ = public()``.
+delegated handler is ``__auth__ = public()``. Like ``/data/``, its reads run on
+the read session, so they are served from the read replica when one is
+configured (see ``DatabaseConfig``).
 """
 
 from contextlib import AbstractAsyncContextManager
@@ -99,11 +99,14 @@ async def lifespan(app: FastAPI):
     engine = await container.get(AsyncEngine)
     await ensure_system_user(engine)
 
-    # Run unified worker pool (pull-based event handlers + scheduled tasks)
-    worker_pool = await container.get(WorkerPool)
-
     async with AsyncExitStack() as stack:
-        await stack.enter_async_context(worker_pool)
+        # Run unified worker pool (pull-based event handlers + scheduled tasks)
+        # unless workers run as their own processes (OSA_ROLE=api, see
+        # osa.application.worker).
+        config = await container.get(Config)
+        if config.role != "api":
+            worker_pool = await container.get(WorkerPool)
+            await stack.enter_async_context(worker_pool)
         # MCP Apps surface (#162): renders SKILL.md instructions from the live
         # catalog and runs the streamable-HTTP session manager.
         mcp_surface: McpSurface | None = getattr(app.state, "mcp_surface", None)
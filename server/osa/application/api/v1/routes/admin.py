@@ -1,8 +1,10 @@
-"""Admin routes for role management."""
+"""Admin routes for role management, consumer-group control and dead letters."""
+
+from datetime import datetime
 
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
-from fastapi import APIRouter, Response
-from pydantic import BaseModel
+from fastapi import APIRouter, Query, Response
+from pydantic import BaseModel, Field
 
 from osa.domain.auth.command.assign_role import (
     AssignRole,
@@ -16,6 +18,20 @@ from osa.domain.auth.query.get_user_roles import (
     GetUserRoles,
     GetUserRolesHandler,
 )
+from osa.domain.delivery.command.requeue_failed_deliveries import (
+    DeliveriesRequeued,
+    RequeueFailedDeliveries,
+    RequeueFailedDeliveriesHandler,
+)
+from osa.domain.delivery.command.set_worker_count import (
+    SetWorkerCount,
+    SetWorkerCountHandler,
+)
+from osa.domain.delivery.query.list_failed_deliveries import (
+    FailedDeliveryList,
+    ListFailedDeliveries,
+    ListFailedDeliveriesHandler,
+)
 
 router = APIRouter(prefix="/admin", tags=["Admin"], route_class=DishkaRoute)
 
@@ -93,3 +109,70 @@ async def revoke_role(
     """Revoke a role from a user. Requires SuperAdmin role."""
     await handler.run(RevokeRole(user_id=user_id, role=role))
     return Response(status_code=204)
+
+
+class SetWorkerCountRequest(BaseModel):
+    """Request body for resizing a consumer group."""
+
+    workers: int = Field(ge=0, le=256)
+
+
+class WorkerCountResponse(BaseModel):
+    """Response for a consumer group's runtime worker count."""
+
+    consumer_group: str
+    workers: int
+
+
+@router.put(
+    "/consumer-groups/{consumer_group}/workers",
+    response_model=WorkerCountResponse,
+)
+async def set_worker_count(
+    consumer_group: str,
+    body: SetWorkerCountRequest,
+    handler: FromDishka[SetWorkerCountHandler],
+) -> WorkerCountResponse:
+    """Set a consumer group's worker count per worker process. Requires SuperAdmin role.
+
+    Running pools apply it within ``OSA_WORKER__WORKER_COUNT_SYNC_SECONDS``,
+    without a restart; 0 pauses the group.
+    """
+    result = await handler.run(SetWorkerCount(consumer_group=consumer_group, workers=body.workers))
+    return WorkerCountResponse(consumer_group=result.consumer_group, workers=result.workers)
+
+
+@router.get("/deliveries/failed", response_model=FailedDeliveryList)
+async def list_failed_deliveries(
+    handler: FromDishka[ListFailedDeliveriesHandler],
+    consumer_group: str | None = Query(None, description="Only this consumer group"),
+    error: str | None = Query(None, description="Case-insensitive substring of the error"),
+    failed_after: datetime | None = Query(None, description="Failed at or after this time"),
+    failed_before: datetime | None = Query(None, description="Failed before this time"),
+    limit: int = Query(100, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+) -> FailedDeliveryList:
+    """List failed deliveries, most recently failed first. Requires SuperAdmin role."""
+    return await handler.run(
+        ListFailedDeliveries(
+            consumer_group=consumer_group,
+            error=error,
+            failed_after=failed_after,
+            failed_before=failed_before,
+            limit=limit,
+            offset=offset,
+        )
+    )
+
+
+@router.post("/deliveries/failed/requeue", response_model=DeliveriesRequeued)
+async def requeue_failed_deliveries(
+    body: RequeueFailedDeliveries,
+    handler: FromDishka[RequeueFailedDeliveriesHandler],
+) -> DeliveriesRequeued:
+    """Requeue matching failed deliveries, released evenly over ``window_seconds``.
+
+    Requires SuperAdmin role. Progress shows in ``osa_deliveries_requeued_total``,
+    the ``osa_outbox_deferred`` backlog draining, and ``osa_deliveries_total``.
+    """
+    return await handler.run(body)
@@ -4,8 +4,10 @@
 component checks — database, worker pool, and configured runner — and returns
 ``200`` only when no checked component is failing, ``503`` otherwise. Each
 check is individually guarded so a failing dependency becomes a component
-``error`` rather than a 500. Both routes are unauthenticated and excluded from
-request tracing (see ``app.py``'s ``excluded_urls``).
+``error`` rather than a 500. ``/ready`` also reports which replica leads each
+singleton housekeeping task (see ``osa.infrastructure.event.leader``). Both
+routes are unauthenticated and excluded from request tracing (see ``app.py``'s
+``excluded_urls``).
 """
 
 import asyncio
@@ -18,6 +20,7 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from osa.config import Config
+from osa.infrastructure.event.leader import LeaderElector
 from osa.infrastructure.event.worker import WorkerPool
 from osa.infrastructure.k8s.health import check_k8s_health
 from osa.infrastructure.logging import get_logger
@@ -50,11 +53,19 @@ class ComponentStatus(BaseModel):
 
 
 class ReadyResponse(BaseModel):
-    """Readiness payload: overall verdict plus per-component detail."""
+    """Readiness payload: overall verdict plus per-component detail.
+
+    ``replica`` identifies the answering process; ``leaders`` maps each
+    singleton task to the replica currently leading it (``None``: no leader
+    right now, e.g. mid-failover). Leadership is informational and never
+    degrades readiness; ``leaders`` is empty when it can't be looked up.
+    """
 
     status: Literal["ready", "degraded"]
     version: str
     components: dict[str, ComponentStatus]
+    replica: str
+    leaders: dict[str, str | None] = {}
 
 
 class ReadinessProbe:
@@ -65,10 +76,17 @@ class ReadinessProbe:
     degrades readiness. Any *checked* component that errors degrades.
     """
 
-    def __init__(self, config: Config, session: AsyncSession, pool: WorkerPool) -> None:
+    def __init__(
+        self,
+        config: Config,
+        session: AsyncSession,
+        pool: WorkerPool,
+        leader: LeaderElector,
+    ) -> None:
         self._config = config
         self._session = session
         self._pool = pool
+        self._leader = leader
 
     async def run(self, request: Request) -> dict[str, ComponentStatus]:
         return {
@@ -77,6 +95,16 @@ class ReadinessProbe:
             "runner": await self._check_runner(request),
         }
 
+    async def leaders(self) -> dict[str, str | None]:
+        """Current leader of each singleton task, time-boxed; empty on failure."""
+        try:
+            return await asyncio.wait_for(
+                self._leader.describe(self._session), timeout=_CHECK_TIMEOUT_S
+            )
+        except Exception as exc:
+            logger.warn("Leader lookup failed: {error}", error=str(exc))
+            return {}
+
     async def _check_db(self) -> ComponentStatus:
         """``SELECT 1`` through the request's UOW session, time-boxed."""
         try:
@@ -93,8 +121,11 @@ class ReadinessProbe:
         "ok" means the pool has started (at least one worker's background task
         is running) and every worker's task is still alive. Under a TestClient
         without the lifespan the pool is never started, so this reports
-        ``error`` with "worker pool not running".
+        ``error`` with "worker pool not running". On an ``api``-role process
+        the workers run elsewhere, so the pool is reported ``unchecked``.
         """
+        if self._config.role == "api":
+            return ComponentStatus(status="unchecked", detail="workers run out of process")
         try:
             workers = self._pool.workers
             if not workers or not any(w.is_alive for w in workers):
@@ -152,6 +183,7 @@ async def ready(
     config: FromDishka[Config],
     session: FromDishka[AsyncSession],
     pool: FromDishka[WorkerPool],
+    leader: FromDishka[LeaderElector],
     request: Request,
     response: Response,
 ) -> ReadyResponse:
@@ -160,11 +192,14 @@ async def ready(
     Returns ``200`` when every *checked* component is healthy (``unchecked``
     is neutral), ``503`` when any checked component errors.
     """
-    components = await ReadinessProbe(config, session, pool).run(request)
+    probe = ReadinessProbe(config, session, pool, leader)
+    components = await probe.run(request)
     is_ready = all(c.status != "error" for c in components.values())
     response.status_code = 200 if is_ready else 503
     return ReadyResponse(
         status="ready" if is_ready else "degraded",
         version=config.version,
         components=components,
+        replica=leader.identity,
+        leaders=await probe.leaders(),
     )
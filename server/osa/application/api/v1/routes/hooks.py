@@ -36,6 +36,11 @@ from osa.domain.validation.query.get_hook_run_logs import (
     GetHookRunLogs,
     GetHookRunLogsHandler,
 )
+from osa.domain.validation.query.get_hook_sizing import (
+    GetHookSizing,
+    GetHookSizingHandler,
+    HookSizingDetail,
+)
 from osa.domain.validation.query.get_release import (
     GetRelease,
     GetReleaseHandler,
@@ -133,6 +138,15 @@ async def get_release(
     return await handler.run(GetRelease(name=HookName(name), version=version))
 
 
+@router.get("/{name}/sizing", response_model=HookSizingDetail)
+async def get_hook_sizing(
+    name: str,
+    handler: FromDishka[GetHookSizingHandler],
+    version: int | None = None,
+) -> HookSizingDetail:
+    return await handler.run(GetHookSizing(name=HookName(name), version=version))
+
+
 @router.get("/runs/{run_id}", response_model=HookRunDetail)
 async def get_hook_run(
     run_id: UUID,
@@ -23,9 +23,9 @@ class StatsResponse(BaseModel):
     per-feature-table row counts now live in each schema manifest at
     ``GET /api/v1/data/{schema}``; ``data_url`` points there.
 
-    ``records`` and ``records_this_month`` are live; ``storage_bytes`` and
-    ``features_per_record`` come from the periodically-refreshed snapshot
-    (``computed_at`` marks its freshness, null before the first refresh).
+    Every figure comes from the periodically-refreshed snapshot, so the route
+    never scans (``computed_at`` marks its freshness; null, with zero counts,
+    before the first refresh).
     """
 
     records: int
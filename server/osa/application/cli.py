@@ -0,0 +1,55 @@
+"""``osa-server`` command line.
+
+``osa-server worker`` runs the event-handler workers without the HTTP API —
+pair it with API replicas started under ``OSA_ROLE=api``::
+
+    OSA_ROLE=api uvicorn --factory osa.application.api.rest.app:create_app
+    osa-server worker --processes 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from collections.abc import Sequence
+
+
+def _parse_groups(value: str) -> list[str]:
+    return [group.strip() for group in value.split(",") if group.strip()]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="osa-server")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    worker = commands.add_parser("worker", help="run event-handler workers (no HTTP API)")
+    worker.add_argument(
+        "--processes",
+        type=int,
+        default=None,
+        help="worker processes to run (default: OSA_WORKER__PROCESSES)",
+    )
+    worker.add_argument(
+        "--groups",
+        type=_parse_groups,
+        default=None,
+        help="comma-separated consumer groups to run (default: all)",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.command == "worker":
+        if args.processes is not None and args.processes < 1:
+            print("osa-server: --processes must be >= 1", file=sys.stderr)
+            return 2
+
+        from osa.application.worker import run_workers
+
+        return run_workers(processes=args.processes, groups=args.groups)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+"""Dedicated worker processes — the ``worker`` side of the API/worker role split.
+
+With ``OSA_ROLE=api`` the HTTP lifespan no longer enters the
+:class:`~osa.infrastructure.event.worker.WorkerPool`; handlers run here
+instead, off the event loop that serves ``/data`` streams, and API and worker
+capacity scale independently.
+
+:func:`run_worker` runs one pool in the current process until SIGTERM/SIGINT,
+then drains: workers stop claiming, in-flight deliveries get
+``OSA_WORKER__DRAIN_TIMEOUT_SECONDS`` to finish, and the container closes.
+
+:class:`WorkerSupervisor` runs ``OSA_WORKER__PROCESSES`` such pools as child
+processes, each on its own share of the consumer groups (see
+:func:`partition_groups`). Only the first child runs the singleton tasks. The
+supervisor forwards SIGTERM/SIGINT to every child and waits for them to drain;
+if a child dies on its own the rest are stopped too, so the orchestrator
+restarts the set as a whole.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import multiprocessing
+import os
+import signal
+import time
+from collections.abc import Sequence
+from multiprocessing.process import BaseProcess
+from typing import Any
+
+import logfire
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from osa.application.di import create_container
+from osa.config import Config
+from osa.domain.shared.event import EventHandler
+from osa.infrastructure.event.di import consumer_groups
+from osa.infrastructure.event.worker import WorkerPool
+from osa.infrastructure.logging import get_logger
+from osa.infrastructure.persistence.seed import ensure_system_user
+from osa.infrastructure.telemetry.setup import bootstrap
+
+logger = get_logger(__name__)
+
+# Beyond the drain timeout, how long a child may take to close its container
+# before the supervisor kills it.
+_EXIT_GRACE_S = 10.0
+_POLL_INTERVAL_S = 0.5
+
+
+def partition_groups(groups: Sequence[str], processes: int) -> list[list[str]]:
+    """Split *groups* round-robin across *processes*.
+
+    With more processes than groups, the spare processes join groups again
+    (round-robin) — workers in one consumer group share its deliveries via
+    ``FOR UPDATE SKIP LOCKED``, so duplicates add capacity, not duplicate work.
+    """
+    if processes < 1:
+        raise ValueError(f"processes must be >= 1, got {processes}")
+    if not groups:
+        raise ValueError("no consumer groups to run")
+    return [list(groups[i::processes]) or [groups[i % len(groups)]] for i in range(processes)]
+
+
+async def run_worker(
+    *,
+    extra_handlers: list[type[EventHandler[Any]]] | None = None,
+) -> None:
+    """Run the configured WorkerPool in this process until SIGTERM/SIGINT, then drain."""
+    config = Config()
+    bootstrap.configure(config)
+    container = create_container(extra_handlers=extra_handlers)
+
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stopping.set)
+
+    try:
+        engine = await container.get(AsyncEngine)
+        await ensure_system_user(engine)
+
+        worker_pool = await container.get(WorkerPool)
+        async with worker_pool:
+            logger.info(
+                "Worker process {pid} running groups {groups} (singletons={singletons})",
+                pid=os.getpid(),
+                groups=sorted({w.consumer_group for w in worker_pool.workers}),
+                singletons=config.worker.singletons,
+            )
+            await stopping.wait()
+            logger.info("Worker process {pid} draining", pid=os.getpid())
+    finally:
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.remove_signal_handler(sig)
+        logfire.force_flush()
+        await container.close()
+
+
+def _child_main(
+    groups: list[str],
+    singletons: bool,
+    extra_handlers: list[type[EventHandler[Any]]] | None,
+) -> None:
+    # Children rebuild Config from the environment, so their share of the
+    # work is handed over the same way an operator would configure it.
+    os.environ["OSA_WORKER__CONSUMER_GROUPS"] = json.dumps(groups)
+    os.environ["OSA_WORKER__SINGLETONS"] = "true" if singletons else "false"
+    os.environ["OSA_WORKER__PROCESSES"] = "1"
+    asyncio.run(run_worker(extra_handlers=extra_handlers))
+
+
+class WorkerSupervisor:
+    """Runs one worker child process per consumer-group partition (see module docstring).
+
+    Children are started with the ``spawn`` method: each gets a fresh
+    interpreter rather than a forked copy of the supervisor's threads and
+    sockets. *extra_handlers* must therefore be importable classes.
+    """
+
+    def __init__(
+        self,
+        partitions: list[list[str]],
+        *,
+        drain_timeout: float,
+        extra_handlers: list[type[EventHandler[Any]]] | None = None,
+    ) -> None:
+        self._partitions = partitions
+        self._drain_timeout = drain_timeout
+        self._extra_handlers = extra_handlers
+        self._children: list[BaseProcess] = []
+        self._stopping = False
+
+    def run(self) -> int:
+        """Start the children and block until they have all exited.
+
+        Returns ``0`` after a requested shutdown, ``1`` when a child exited on
+        its own (and the others were stopped in response).
+        """
+        context = multiprocessing.get_context("spawn")
+        for index, groups in enumerate(self._partitions):
+            child = context.Process(
+                target=_child_main,
+                args=(groups, index == 0, self._extra_handlers),
+                name=f"osa-worker-{index}",
+            )
+            child.start()
+            self._children.append(child)
+            logger.info(
+                "Started {name} (pid {pid}) for groups {groups}",
+                name=child.name,
+                pid=child.pid,
+                groups=groups,
+            )
+
+        previous = {
+            sig: signal.signal(sig, self._on_signal) for sig in (signal.SIGTERM, signal.SIGINT)
+        }
+        try:
+            failed = False
+            while not self._stopping:
+                exited = [child for child in self._children if not child.is_alive()]
+                if exited:
+                    for child in exited:
+                        logger.error(
+                            "{name} exited unexpectedly (code {code}); stopping workers",
+                            name=child.name,
+                            code=child.exitcode,
+                        )
+                    failed = True
+                    self._terminate()
+                    break
+                time.sleep(_POLL_INTERVAL_S)
+            self._wait()
+        finally:
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+        return 1 if failed else 0
+
+    def _on_signal(self, signum: int, frame: object) -> None:
+        if not self._stopping:
+            logger.info("Received {signal}; draining workers", signal=signal.Signals(signum).name)
+            self._terminate()
+
+    def _terminate(self) -> None:
+        self._stopping = True
+        for child in self._children:
+            if child.is_alive():
+                child.terminate()  # SIGTERM: the child drains, then exits
+
+    def _wait(self) -> None:
+        deadline = time.monotonic() + self._drain_timeout + _EXIT_GRACE_S
+        for child in self._children:
+            child.join(max(0.0, deadline - time.monotonic()))
+            if child.is_alive():
+                logger.warn("{name} did not drain in time; killing it", name=child.name)
+                child.kill()
+                child.join()
+
+
+def run_workers(
+    *,
+    processes: int | None = None,
+    groups: Sequence[str] | None = None,
+    extra_handlers: list[type[EventHandler[Any]]] | None = None,
+) -> int:
+    """Entry point for ``osa-server worker``; returns the process exit code.
+
+    *processes* and *groups* override ``OSA_WORKER__PROCESSES`` and
+    ``OSA_WORKER__CONSUMER_GROUPS``. A single process runs in-process.
+    """
+    config = Config()
+    worker = config.worker
+    processes = processes or worker.processes
+    selected = list(groups or worker.consumer_groups or consumer_groups(extra_handlers, config))
+
+    if processes == 1:
+        os.environ["OSA_WORKER__CONSUMER_GROUPS"] = json.dumps(selected)
+        asyncio.run(run_worker(extra_handlers=extra_handlers))
+        return 0
+
+    supervisor = WorkerSupervisor(
+        partition_groups(selected, processes),
+        drain_timeout=worker.drain_timeout_seconds,
+        extra_handlers=extra_handlers,
+    )
+    return supervisor.run()
@@ -0,0 +1,65 @@
+"""BatchOutcomeCache — one batch's hook outcomes, read once per stage pair (#160)."""
+
+from collections.abc import AsyncIterator
+
+from osa.domain.feature.port.storage import FeatureStoragePort
+from osa.domain.shared.model.provenance import RunRef
+from osa.domain.validation.model.batch_outcome import BatchRecordOutcome, OutcomeStatus
+
+_PASSED = frozenset({OutcomeStatus.PASSED})
+
+
+class BatchOutcomeCache:
+    """Per-batch view of hook outcomes shared by the PUBLISH and INSERT_FEATURES stages.
+
+    Holds only the compact part of the outcomes — each hook's passed record IDs
+    and its run.json provenance. Feature payloads are never cached: INSERT_FEATURES
+    streams them straight from storage, so memory scales with the read chunk
+    rather than the batch's feature volume. Scoped to a single delivery.
+    """
+
+    def __init__(self, storage: FeatureStoragePort, batch_dir: str) -> None:
+        self._storage = storage
+        self._batch_dir = batch_dir
+        self._passed: dict[str, frozenset[str]] = {}
+        self._featured: dict[str, frozenset[str]] = {}
+        self._run_refs: dict[str, RunRef | None] = {}
+
+    async def passed_ids(self, hook_name: str) -> frozenset[str]:
+        """Record IDs that passed ``hook_name`` (features.jsonl only is read)."""
+        if hook_name not in self._passed:
+            passed: list[str] = []
+            featured: list[str] = []
+            async for outcome in self._storage.iter_batch_outcomes(
+                self._batch_dir, hook_name, statuses=_PASSED
+            ):
+                passed.append(outcome.record_id)
+                if outcome.features:
+                    featured.append(outcome.record_id)
+            self._passed[hook_name] = frozenset(passed)
+            self._featured[hook_name] = frozenset(featured)
+        return self._passed[hook_name]
+
+    async def featured_ids(self, hook_name: str) -> frozenset[str]:
+        """The passed record IDs whose outcome carries at least one feature row."""
+        await self.passed_ids(hook_name)
+        return self._featured[hook_name]
+
+    async def run_ref(self, hook_name: str) -> RunRef | None:
+        """The hook's run.json provenance for this batch, or ``None`` if absent."""
+        if hook_name not in self._run_refs:
+            self._run_refs[hook_name] = await self._storage.read_run_ref(self._batch_dir, hook_name)
+        return self._run_refs[hook_name]
+
+    async def iter_passed(self, hook_name: str) -> AsyncIterator[BatchRecordOutcome]:
+        """Stream the hook's passed outcomes, features included.
+
+        Short-circuits without touching storage when an earlier stage already
+        found that nothing passed.
+        """
+        if self._passed.get(hook_name) == frozenset():
+            return
+        async for outcome in self._storage.iter_batch_outcomes(
+            self._batch_dir, hook_name, statuses=_PASSED
+        ):
+            yield outcome
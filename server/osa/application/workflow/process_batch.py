@@ -6,11 +6,29 @@ guarded so a redelivery skips the work already durably recorded (the delivery
 is the restart *trigger*; durable domain state is the restart *position*). The
 #152 runtime-failure decision semantics (ingester per-failure match, hooks
 ``most_severe`` verdict) are absorbed here verbatim from the old handlers.
+
+With ``OSA_WORKER__BATCH_STAGES__ENABLED`` the same stages run instead as three
+consumer groups, each with its own concurrency, fed by the durable
+stage-completion events the stages already append at their checkpoints:
+
+- :class:`IngestBatchStage` (``NextBatchRequested``) — INGEST; checkpoint A
+  commits ``IngesterBatchReady``.
+- :class:`HookBatchStage` (``IngesterBatchReady``) — HOOKS; checkpoint B commits
+  ``HookBatchCompleted``.
+- :class:`PublishBatchStage` (``HookBatchCompleted``) — PUBLISH,
+  INSERT_FEATURES and the batch's completion.
+
+A slow hook stage then no longer holds back publishing batches already hooked.
+The skip guards are the same in both modes. Switch modes only while no ingest
+run is in flight: a batch mid-pipeline waits on a consumer group the other mode
+doesn't run.
 """
 
+import asyncio
+import time
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import ClassVar, assert_never
+from typing import Any, ClassVar, assert_never
 from uuid import NAMESPACE_URL, uuid4, uuid5
 
 from osa.domain.deposition.model.convention import Convention
@@ -45,19 +63,25 @@ from osa.domain.shared.model.hook import FeatureName, HookIdentity, HookName
 from osa.domain.shared.model.source import IngestSource
 from osa.domain.shared.model.srn import ConventionSlug, RecordSRN
 from osa.domain.shared.model.workflow import WorkflowName, WorkflowStage
+from osa.domain.shared.model.workload import Workload, WorkSource
 from osa.domain.shared.outbox import Outbox
 from osa.domain.shared.port.ingester_runner import IngesterInputs, IngesterRunner
 from osa.domain.shared.port.instrumentation import WorkflowInstrumentation
 from osa.domain.shared.port.unit_of_work import UnitOfWork
-from osa.domain.validation.model.batch_outcome import OutcomeStatus
+from osa.domain.shared.scheduler import ContainerScheduler
+from osa.domain.validation.model.batch_outcome import BatchRecordOutcome, HookRecordId
 from osa.domain.validation.model.hook_input import HookRecord
+from osa.domain.validation.model.hook_memo import MEMOIZABLE, input_keys
 from osa.domain.validation.model.hook_release import HookRelease
-from osa.domain.validation.model.hook_result import HookExecution
+from osa.domain.validation.model.hook_result import HookExecution, HookStatus
 from osa.domain.validation.model.hook_run import HookRun, HookRunId, HookRunStatus
 from osa.domain.validation.port.hook_runner import HookInputs
 from osa.domain.validation.port.instrumentation import HookInstrumentation
 from osa.domain.validation.service.hook import HookService
+from osa.domain.validation.service.hook_memo import HookMemoService
 from osa.domain.validation.service.hook_registry import HookRegistryService
+from osa.domain.validation.service.hook_sizing import HookSizingService
+from osa.application.workflow.batch_outcomes import BatchOutcomeCache
 from osa.application.workflow.stages import StageRunner
 from osa.infrastructure.logging import get_logger
 
@@ -72,25 +96,28 @@ BACKPRESSURE_DELAY = timedelta(seconds=60)
 _HOOK_RUN_NS = uuid5(NAMESPACE_URL, "osa:hook_run")
 
 
-class ProcessBatch(EventHandler[NextBatchRequested]):
-    """Orchestrates one ingest batch end-to-end as sequential stages (#160).
+# The events a batch's stages are driven by; each names its run and batch.
+_BatchEvent = NextBatchRequested | IngesterBatchReady | HookBatchCompleted
 
-    Replaces RunIngester→RunHooks→PublishBatch→InsertBatchFeatures choreography.
-    The delivery is the restart trigger; durable domain state is the restart
-    position — see each stage's crash-safety note. Emitting the next
-    NextBatchRequested right after the ingest stage preserves batch pipelining
-    (batch N+1 sources while batch N runs hooks) across the worker pool.
+
+class _BatchStages(EventHandler[Any]):
+    """The stages of one ingest batch, shared by :class:`ProcessBatch` and the
+    per-stage handlers. Each stage's crash-safety note holds in both modes.
     """
 
     __claim_timeout__: ClassVar[float] = 7200.0  # worst-case SUM of ingester + hooks stages
     __max_retries__: ClassVar[int] = 100  # sized for the flakiest stage (hooks)
+    __replayable__: ClassVar[bool] = False  # on_exhausted fails the batch and ingest run
 
     ingest_service: IngestService
     convention_service: ConventionService
     ingester_runner: IngesterRunner
+    scheduler: ContainerScheduler
     ingest_storage: IngestStoragePort
     hook_service: HookService
     hook_registry: HookRegistryService
+    hook_sizing: HookSizingService
+    hook_memo: HookMemoService
     record_service: RecordService
     feature_service: FeatureService
     feature_storage: FeatureStoragePort
@@ -109,7 +136,8 @@ class ProcessBatch(EventHandler[NextBatchRequested]):
         """
         return HookRunId(uuid5(_HOOK_RUN_NS, f"{ingest_run_id}:{batch_index}:{hook_name.root}"))
 
-    async def handle(self, event: NextBatchRequested) -> None:
+    async def _active_run(self, event: _BatchEvent) -> IngestRun | None:
+        """The batch's run, or None when it already finished (drop the delivery)."""
         try:
             run = await self.ingest_service.get_ingestion(event.ingest_run_id)
         except NotFoundError as missing:
@@ -126,61 +154,61 @@ class ProcessBatch(EventHandler[NextBatchRequested]):
                 status=run.status.value,
                 ingest_run_id=event.ingest_run_id,
             )
-            return
-
-        ingest_pending = run.batches_ingested <= event.batch_index
+            return None
+        return run
 
-        # Backpressure: don't source if the cluster can't schedule more Jobs. Only
-        # relevant while ingest is pending — a re-driven post-ingest batch has no
-        # container to submit here (#152).
-        if ingest_pending and not await self.ingester_runner.has_capacity():
-            log.info(
-                "[{short_id}] backpressure: deferring next pull +{delay}s",
-                short_id=event.ingest_run_id[:8],
-                delay=int(BACKPRESSURE_DELAY.total_seconds()),
+    async def _defer_for_backpressure(self, event: NextBatchRequested) -> bool:
+        """Requeue the request when the cluster can't schedule more ingester Jobs."""
+        if await self.ingester_runner.has_capacity():
+            return False
+        log.info(
+            "[{short_id}] backpressure: deferring next pull +{delay}s",
+            short_id=event.ingest_run_id[:8],
+            delay=int(BACKPRESSURE_DELAY.total_seconds()),
+            ingest_run_id=event.ingest_run_id,
+        )
+        await self.outbox.append(
+            NextBatchRequested(
+                id=EventId(uuid4()),
                 ingest_run_id=event.ingest_run_id,
-            )
-            await self.outbox.append(
-                NextBatchRequested(
-                    id=EventId(uuid4()),
-                    ingest_run_id=event.ingest_run_id,
-                    convention_id=event.convention_id,
-                    batch_size=event.batch_size,
-                    batch_index=event.batch_index,
-                ),
-                deliver_after=datetime.now(UTC) + BACKPRESSURE_DELAY,
-            )
-            return
-
-        convention = await self._get_convention(run.convention_id)
-        runner = StageRunner(WorkflowName.PROCESS_BATCH, self.instrumentation)
-
-        # ── INGEST ────────────────────────────────────────────────────────────
-        if ingest_pending:
-            async with runner.run(WorkflowStage.INGEST):
-                stop = await self._ingest(event, run, convention)
-            if stop:
-                return
-        else:
-            runner.skipped(WorkflowStage.INGEST)
+                convention_id=event.convention_id,
+                batch_size=event.batch_size,
+                batch_index=event.batch_index,
+                priority=event.priority,
+            ),
+            deliver_after=datetime.now(UTC) + BACKPRESSURE_DELAY,
+            priority=event.priority,
+        )
+        return True
 
-        # ── HOOKS ─────────────────────────────────────────────────────────────
+    async def _hooks_stage(
+        self, event: _BatchEvent, convention: Convention, runner: StageRunner
+    ) -> bool:
+        """HOOKS unless already concluded. Returns True to stop the batch."""
         hooks = list(convention.hooks)
         if not hooks or await self._hooks_recorded(event, hooks):
             runner.skipped(WorkflowStage.HOOKS)
-        else:
-            async with runner.run(WorkflowStage.HOOKS):
-                stop = await self._run_hooks(event, convention)
-            if stop:
-                return
+            return False
+        async with runner.run(WorkflowStage.HOOKS):
+            return await self._run_hooks(event, convention)
+
+    async def _publish_stages(
+        self, event: _BatchEvent, run: IngestRun, convention: Convention, runner: StageRunner
+    ) -> None:
+        """PUBLISH, INSERT_FEATURES, then count the batch complete."""
+        # PUBLISH and INSERT_FEATURES read the same hook outputs; share one view.
+        outcomes = BatchOutcomeCache(
+            self.feature_storage,
+            str(self.ingest_storage.batch_dir(event.ingest_run_id, event.batch_index)),
+        )
 
         # ── PUBLISH ───────────────────────────────────────────────────────────
         async with runner.run(WorkflowStage.PUBLISH):
-            mapping = await self._publish(event, run, convention)
+            mapping = await self._publish(event, run, convention, outcomes)
 
         # ── INSERT_FEATURES ───────────────────────────────────────────────────
         async with runner.run(WorkflowStage.INSERT_FEATURES):
-            await self._insert_features(event, convention, mapping)
+            await self._insert_features(event, convention, mapping, outcomes)
 
         # Complete LAST and deliberately WITHOUT a uow.commit: it rides the
         # scope-exit commit atomically with mark_delivered, so batches_completed
@@ -203,6 +231,9 @@ class ProcessBatch(EventHandler[NextBatchRequested]):
         Crash-safe via ``mark_batch_ingested`` (idempotent counter) + redelivery:
         nothing durable is written before the commit that releases the tx, and
         the container simply re-runs on redelivery.
+
+        For a sharded run everything here — session, limit, continuation — is
+        scoped to the batch's shard; the other shards' chains run independently.
         """
         # Rebind ``run`` to the refreshed aggregate the service returns.
         run = await self.ingest_service.ensure_running(event.ingest_run_id)
@@ -212,21 +243,25 @@ class ProcessBatch(EventHandler[NextBatchRequested]):
             raise PermanentError(str(missing)) from missing
 
         batch_index = event.batch_index
-        session = await self.ingest_storage.read_session(event.ingest_run_id)
+        stream = run.shard_of(batch_index)  # 0 when unsharded
+        shard = stream if run.sharded else None
+        position = await self.ingest_service.sourcing_position(run, batch_index)
+        session = await self.ingest_storage.read_session(event.ingest_run_id, shard=stream)
 
         effective_batch_limit = run.batch_size
-        if run.limit is not None:
-            ingested_so_far = run.batches_ingested * run.batch_size
-            remaining = run.limit - ingested_so_far
+        limit = run.shard_limit(stream)
+        if limit is not None:
+            ingested_so_far = position.batches_ingested * run.batch_size
+            remaining = limit - ingested_so_far
             if remaining <= 0:
                 log.warn(
                     "Ignoring redelivered NextBatchRequested — limit already met "
                     "(batches_ingested={batches_ingested}, limit={limit})",
-                    batches_ingested=run.batches_ingested,
-                    limit=run.limit,
+                    batches_ingested=position.batches_ingested,
+                    limit=limit,
                     ingest_run_id=event.ingest_run_id,
                 )
-                await self.ingest_service.close_sourcing(event.ingest_run_id)
+                await self.ingest_service.close_sourcing(event.ingest_run_id, shard=shard)
                 return True
             effective_batch_limit = min(run.batch_size, remaining)
 
@@ -237,6 +272,8 @@ class ProcessBatch(EventHandler[NextBatchRequested]):
             config=convention.ingester.config,
             limit=effective_batch_limit,
             session=session,
+            shard=stream,
+            shards=run.shards,
         )
         work_dir = self.ingest_storage.batch_work_dir(event.ingest_run_id, batch_index)
         files_dir = self.ingest_storage.batch_files_dir(event.ingest_run_id, batch_index)
@@ -245,13 +282,19 @@ class ProcessBatch(EventHandler[NextBatchRequested]):
         # uncommitted is lost, and the ingester re-runs on redelivery.
         await self.uow.commit()
 
+        limits = convention.ingester.limits
         try:
-            output = await self.ingester_runner.run(
-                ingester=convention.ingester,
-                inputs=inputs,
-                files_dir=files_dir,
-                work_dir=work_dir,
-            )
+            async with self.scheduler.admit(
+                Workload.of(WorkSource.INGEST, convention.id.root),
+                memory=limits.memory,
+                cpu=limits.cpu,
+            ):
+                output = await self.ingester_runner.run(
+                    ingester=convention.ingester,
+                    inputs=inputs,
+                    files_dir=files_dir,
+                    work_dir=work_dir,
+                )
         except RuntimeFailure as failure:
             # The runner reports facts; the policy decides; we execute the verb.
             # Ingester Jobs have no memory-bump lever, so PriorAttempts carries
@@ -284,7 +327,7 @@ class ProcessBatch(EventHandler[NextBatchRequested]):
                         ingest_run_id=event.ingest_run_id,
                     )
                     await self.ingest_service.fail_ingestion(
-                        event.ingest_run_id, reason=reason, kind=kind
+                        event.ingest_run_id, reason=reason, kind=kind, shard=shard
                     )
                 case RetryWithMoreMemory():
                     # Ingester Jobs have no memory-bump lever (unlike hooks, which
@@ -298,25 +341,31 @@ class ProcessBatch(EventHandler[NextBatchRequested]):
                         ingest_run_id=event.ingest_run_id,
                     )
                     await self.ingest_service.fail_ingestion(
-                        event.ingest_run_id, reason=failure.detail, kind=failure.kind
+                        event.ingest_run_id,
+                        reason=failure.detail,
+                        kind=failure.kind,
+                        shard=shard,
                     )
                 case _:
                     assert_never(decision)
             return True
 
+        await self.ingest_storage.seal_batch_files(event.ingest_run_id, batch_index)
         await self.ingest_storage.write_records(event.ingest_run_id, batch_index, output.records)
         if output.session:
-            await self.ingest_storage.write_session(event.ingest_run_id, output.session)
+            await self.ingest_storage.write_session(
+                event.ingest_run_id, output.session, shard=stream
+            )
 
         has_more = output.session is not None and len(output.records) > 0
-        if has_more and run.limit is not None:
-            total_sourced = (run.batches_ingested + 1) * run.batch_size
-            if total_sourced >= run.limit:
+        if has_more and limit is not None:
+            total_sourced = (position.batches_ingested + 1) * run.batch_size
+            if total_sourced >= limit:
                 has_more = False
 
         # Idempotent counter advance keyed on THIS batch index (redelivery-safe).
         match await self.ingest_service.mark_batch_ingested(
-            event.ingest_run_id, batch_index, ingestion_finished=not has_more
+            event.ingest_run_id, batch_index, ingestion_finished=not has_more, shards=run.shards
         ):
             case RunClosed():
                 log.warn(
@@ -334,7 +383,9 @@ class ProcessBatch(EventHandler[NextBatchRequested]):
                 ingest_run_id=event.ingest_run_id,
                 batch_index=batch_index,
                 has_more=has_more,
-            )
+                priority=event.priority,
+            ),
+            priority=event.priority,
         )
         log.info(
             "[{short_id}] batch {batch_index}: pulled {record_count} records (has_more={has_more})",
@@ -351,8 +402,10 @@ class ProcessBatch(EventHandler[NextBatchRequested]):
                     ingest_run_id=event.ingest_run_id,
                     convention_id=event.convention_id,
                     batch_size=run.batch_size,
-                    batch_index=event.batch_index + 1,
-                )
+                    batch_index=run.next_batch_index(event.batch_index),
+                    priority=event.priority,
+                ),
+                priority=event.priority,
             )
 
         # Checkpoint A: counter + next-request commit atomically, so the next
@@ -360,7 +413,7 @@ class ProcessBatch(EventHandler[NextBatchRequested]):
         await self.uow.commit()
         return False
 
-    async def _hooks_recorded(self, event: NextBatchRequested, hooks: list[HookName]) -> bool:
+    async def _hooks_recorded(self, event: _BatchEvent, hooks: list[HookName]) -> bool:
         """True iff every hook's deterministic run row exists (hooks concluded).
 
         Provenance rows are recorded all-or-nothing before checkpoint B, and a
@@ -373,7 +426,7 @@ class ProcessBatch(EventHandler[NextBatchRequested]):
                 return False
         return True
 
-    async def _run_hooks(self, event: NextBatchRequested, convention: Convention) -> bool:
+    async def _run_hooks(self, event: _BatchEvent, convention: Convention) -> bool:
         """HOOKS stage: run every hook on the batch. Returns True to stop the handle.
 
         Crash-safe: provenance is recorded all-or-nothing before checkpoint B and
@@ -402,6 +455,7 @@ class ProcessBatch(EventHandler[NextBatchRequested]):
             ],
             run_id=f"{event.ingest_run_id}_b{event.batch_index}",
             files_dirs=files_dirs,
+            workload=Workload.of(WorkSource.INGEST, convention.id.root),
         )
 
         # Resolve each hook's live release ONCE and snapshot it (R8) so a mid-run
@@ -424,13 +478,44 @@ class ProcessBatch(EventHandler[NextBatchRequested]):
             for name in hook_names
         }
 
+        # Launch memory and sub-batch bounds learned from each release's runs.
+        sizing = await self.hook_sizing.for_releases(release for _, release in pairs)
+
+        # Outcomes each release already produced for byte-identical input.
+        keys: dict[str, str] = {}
+        known: dict[HookName, dict[HookRecordId, BatchRecordOutcome]] = {}
+        if self.hook_memo.enabled:
+            digests = await self.ingest_storage.batch_file_digests(
+                event.ingest_run_id, event.batch_index
+            )
+            keys = input_keys(inputs.records, digests)
+            for hook, release in pairs:
+                known[hook.name] = await self.hook_memo.recall(release.id, keys)
+                if known[hook.name]:
+                    log.info(
+                        "[{short_id}] batch {batch_index} hook={hook_name}: "
+                        "{hits}/{total} records memoized",
+                        short_id=event.ingest_run_id[:8],
+                        batch_index=event.batch_index,
+                        hook_name=hook.name,
+                        hits=len(known[hook.name]),
+                        total=len(keys),
+                        ingest_run_id=event.ingest_run_id,
+                    )
+
         # Release the DB transaction before parking on the hook containers.
         await self.uow.commit()
 
-        # Run every hook. Failures are values (HookExecution.failure), not
-        # exceptions — one hook failing never discards another's outcome.
+        # Run every hook, concurrently unless the convention orders them.
+        # Failures are values (HookExecution.failure), not exceptions — one hook
+        # failing never discards another's outcome.
         executions = await self.hook_service.run_hooks_for_batch(
-            hook_releases=pairs, inputs=inputs, work_dirs=work_dirs
+            hook_releases=pairs,
+            inputs=inputs,
+            work_dirs=work_dirs,
+            depends_on=convention.hook_dependencies,
+            sizing=sizing,
+            known=known,
         )
 
         short_id = event.ingest_run_id[:8]
@@ -481,12 +566,15 @@ class ProcessBatch(EventHandler[NextBatchRequested]):
                 # Nothing failed, or every failure is terminal at batch level.
                 # Record each hook's own ERROR/PASS provenance and complete.
                 await self._record_provenance(event, executions, work_dirs)
+                await self._remember_outcomes(event, executions, keys, known)
                 await self.outbox.append(
                     HookBatchCompleted(
                         id=EventId(uuid4()),
                         ingest_run_id=event.ingest_run_id,
                         batch_index=event.batch_index,
-                    )
+                        priority=event.priority,
+                    ),
+                    priority=event.priority,
                 )
             case _:
                 assert_never(verdict)
@@ -496,9 +584,32 @@ class ProcessBatch(EventHandler[NextBatchRequested]):
         await self.uow.commit()
         return False
 
+    async def _remember_outcomes(
+        self,
+        event: _BatchEvent,
+        executions: list[HookExecution],
+        keys: dict[str, str],
+        known: dict[HookName, dict[HookRecordId, BatchRecordOutcome]],
+    ) -> None:
+        """Memoize each passed hook's fresh outcomes, in the checkpoint-B transaction."""
+        if not keys:
+            return
+        batch_dir = str(self.ingest_storage.batch_dir(event.ingest_run_id, event.batch_index))
+        for e in executions:
+            if e.status is not HookStatus.PASSED:
+                continue
+            await self.hook_memo.remember(
+                e.release_id,
+                keys,
+                self.feature_storage.iter_batch_outcomes(
+                    batch_dir, e.hook_name.root, statuses=MEMOIZABLE
+                ),
+                skip=known.get(e.hook_name, {}).keys(),
+            )
+
     async def _record_provenance(
         self,
-        event: NextBatchRequested,
+        event: _BatchEvent,
         executions: list[HookExecution],
         work_dirs: dict[HookName, Path],
     ) -> None:
@@ -528,6 +639,10 @@ class ProcessBatch(EventHandler[NextBatchRequested]):
                     duration_s=e.duration_s,
                     oom_retries=e.oom_retries,
                     log_ref=log_ref,
+                    records=e.records,
+                    input_mb=e.input_mb,
+                    memory=e.memory,
+                    oom_batch_mb=e.oom_batch_mb,
                 )
             )
             await self.ingest_storage.write_run_ref(
@@ -541,7 +656,11 @@ class ProcessBatch(EventHandler[NextBatchRequested]):
             )
 
     async def _publish(
-        self, event: NextBatchRequested, run: IngestRun, convention: Convention
+        self,
+        event: _BatchEvent,
+        run: IngestRun,
+        convention: Convention,
+        outcomes: BatchOutcomeCache,
     ) -> dict[str, RecordSRN]:
         """PUBLISH stage: bulk-publish passing records. Returns the batch's SRN map.
 
@@ -551,12 +670,11 @@ class ProcessBatch(EventHandler[NextBatchRequested]):
         """
         raw_records = await self.ingest_storage.read_records(event.ingest_run_id, event.batch_index)
         ingester_records = IngesterRecord.from_dicts(raw_records)
-        batch_dir = str(self.ingest_storage.batch_dir(event.ingest_run_id, event.batch_index))
 
         hook_names = list(convention.hooks)
         expected_features = [FeatureName(h.root) for h in convention.hooks]
 
-        passed_records = await self._get_passed_records(ingester_records, batch_dir, hook_names)
+        passed_records = await self._get_passed_records(ingester_records, outcomes, hook_names)
 
         drafts = [
             RecordDraft(
@@ -613,19 +731,18 @@ class ProcessBatch(EventHandler[NextBatchRequested]):
     async def _get_passed_records(
         self,
         ingester_records: list[IngesterRecord],
-        batch_dir: str,
+        outcomes: BatchOutcomeCache,
         hooks: list[HookName],
     ) -> list[IngesterRecord]:
         """Records that passed ALL hooks (via the storage port). No hooks ⇒ all pass."""
         if not hooks:
             return ingester_records
 
-        passed_ids: set[str] | None = None
+        passed_ids: frozenset[str] | None = None
         for hook_name in hooks:
-            outcomes = await self.feature_storage.read_batch_outcomes(batch_dir, hook_name.root)
-            if not outcomes:
+            hook_passed = await outcomes.passed_ids(hook_name.root)
+            if not hook_passed:
                 return []
-            hook_passed = {rid for rid, o in outcomes.items() if o.status == OutcomeStatus.PASSED}
             passed_ids = hook_passed if passed_ids is None else passed_ids & hook_passed
 
         if not passed_ids:
@@ -634,55 +751,40 @@ class ProcessBatch(EventHandler[NextBatchRequested]):
 
     async def _insert_features(
         self,
-        event: NextBatchRequested,
+        event: _BatchEvent,
         convention: Convention,
         mapping: dict[str, RecordSRN],
+        outcomes: BatchOutcomeCache,
     ) -> None:
         """INSERT_FEATURES stage: stamp feature rows per published record.
 
         Harmless-to-redo via the feature store's replace-by-record semantics. The
         upstream→record map is the DB-recomputed ``mapping``, not an event payload.
+        Passed outcomes are streamed per hook, so only one read chunk of feature
+        rows is held at a time per feature.
+
+        Features fill separate tables, each insert in its own transaction, so up
+        to ``feature_service.insert_concurrency`` features are filled at once.
+        The first failure cancels the rest and is re-raised as-is.
         """
         expected_features = [FeatureName(h.root) for h in convention.hooks]
         if not expected_features or not mapping:
             return
 
-        batch_output_dir = str(
-            self.ingest_storage.batch_dir(event.ingest_run_id, event.batch_index)
-        )
-        total_inserted = 0
-        skipped_dupes = 0
+        slots = asyncio.Semaphore(self.feature_service.insert_concurrency)
 
-        for feature in expected_features:
-            name = feature.root
-            outcomes = await self.feature_storage.read_batch_outcomes(batch_output_dir, name)
-            run_ref = await self.feature_storage.read_run_ref(batch_output_dir, name)
-            if run_ref is None:
-                log.warn(
-                    "no run.json for feature {feature} in batch {batch_index}; "
-                    "skipping feature insert (no provenance)",
-                    feature=name,
-                    batch_index=event.batch_index,
-                    ingest_run_id=event.ingest_run_id,
-                )
-                continue
+        async def insert(feature: FeatureName) -> tuple[int, int]:
+            async with slots:
+                return await self._insert_feature(event, feature, mapping, outcomes)
 
-            for upstream_id, outcome in outcomes.items():
-                if outcome.status != OutcomeStatus.PASSED or not outcome.features:
-                    continue
-                record_srn = mapping.get(upstream_id)
-                if record_srn is None:
-                    # Cross-batch duplicate — published in an earlier batch, whose
-                    # features were inserted then. Skip.
-                    skipped_dupes += 1
-                    continue
-                total_inserted += await self.feature_service.insert_features(
-                    feature=feature,
-                    record_srn=str(record_srn),
-                    rows=outcome.features,
-                    run_id=run_ref.run_id,
-                )
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(insert(feature)) for feature in expected_features]
+        except BaseExceptionGroup as eg:
+            raise eg.exceptions[0] from None
 
+        total_inserted = sum(task.result()[0] for task in tasks)
+        skipped_dupes = sum(task.result()[1] for task in tasks)
         dupe_msg = f", {skipped_dupes} duplicates skipped" if skipped_dupes else ""
         log.info(
             "[{short_id}] batch {batch_index}: inserted {total_inserted} feature rows "
@@ -695,7 +797,55 @@ class ProcessBatch(EventHandler[NextBatchRequested]):
             ingest_run_id=event.ingest_run_id,
         )
 
-    async def on_exhausted(self, event: NextBatchRequested) -> None:
+    async def _insert_feature(
+        self,
+        event: _BatchEvent,
+        feature: FeatureName,
+        mapping: dict[str, RecordSRN],
+        outcomes: BatchOutcomeCache,
+    ) -> tuple[int, int]:
+        """Insert one feature's rows for the batch. Returns (rows inserted, dupes skipped)."""
+        name = feature.root
+        passed = await outcomes.passed_ids(name)
+        if passed.isdisjoint(mapping):
+            # Nothing of this batch's to stamp (all cross-batch duplicates);
+            # as below, only records with feature rows count as skipped.
+            return 0, len(await outcomes.featured_ids(name))
+        run_ref = await outcomes.run_ref(name)
+        if run_ref is None:
+            log.warn(
+                "no run.json for feature {feature} in batch {batch_index}; "
+                "skipping feature insert (no provenance)",
+                feature=name,
+                batch_index=event.batch_index,
+                ingest_run_id=event.ingest_run_id,
+            )
+            return 0, 0
+
+        started = time.perf_counter()
+        inserted = 0
+        skipped_dupes = 0
+        async for outcome in outcomes.iter_passed(name):
+            if not outcome.features:
+                continue
+            record_srn = mapping.get(outcome.record_id)
+            if record_srn is None:
+                # Cross-batch duplicate — published in an earlier batch, whose
+                # features were inserted then. Skip.
+                skipped_dupes += 1
+                continue
+            inserted += await self.feature_service.insert_features(
+                feature=feature,
+                record_srn=str(record_srn),
+                rows=outcome.features,
+                run_id=run_ref.run_id,
+            )
+        self.instrumentation.features_inserted(
+            feature=feature, rows=inserted, duration_s=time.perf_counter() - started
+        )
+        return inserted, skipped_dupes
+
+    async def on_exhausted(self, event: _BatchEvent) -> None:
         """Workflow retries exhausted — account for the failure per stage (#152).
 
         If the batch was already sourced, fail just the batch (the run may still
@@ -712,7 +862,7 @@ class ProcessBatch(EventHandler[NextBatchRequested]):
             )
             return
 
-        if run.batches_ingested > event.batch_index:
+        if await self.ingest_service.batch_sourced(run, event.batch_index):
             await self.ingest_service.fail_batch(
                 event.ingest_run_id,
                 reason=f"batch {event.batch_index}: workflow retries exhausted",
@@ -720,5 +870,122 @@ class ProcessBatch(EventHandler[NextBatchRequested]):
             )
         else:
             await self.ingest_service.fail_ingestion(
-                event.ingest_run_id, reason="ingester retries exhausted", kind=None
+                event.ingest_run_id,
+                reason="ingester retries exhausted",
+                kind=None,
+                shard=run.shard_of(event.batch_index) if run.sharded else None,
             )
+
+
+class ProcessBatch(_BatchStages, EventHandler[NextBatchRequested]):
+    """Orchestrates one ingest batch end-to-end as sequential stages (#160).
+
+    Replaces RunIngester→RunHooks→PublishBatch→InsertBatchFeatures choreography.
+    The delivery is the restart trigger; durable domain state is the restart
+    position — see each stage's crash-safety note. Emitting the next
+    NextBatchRequested right after the ingest stage preserves batch pipelining
+    (batch N+1 sources while batch N runs hooks) across the worker pool.
+    """
+
+    async def handle(self, event: NextBatchRequested) -> None:
+        run = await self._active_run(event)
+        if run is None:
+            return
+
+        ingest_pending = not await self.ingest_service.batch_sourced(run, event.batch_index)
+
+        # Backpressure: don't source if the cluster can't schedule more Jobs. Only
+        # relevant while ingest is pending — a re-driven post-ingest batch has no
+        # container to submit here (#152).
+        if ingest_pending and await self._defer_for_backpressure(event):
+            return
+
+        convention = await self._get_convention(run.convention_id)
+        runner = StageRunner(WorkflowName.PROCESS_BATCH, self.instrumentation)
+
+        # ── INGEST ────────────────────────────────────────────────────────────
+        if ingest_pending:
+            async with runner.run(WorkflowStage.INGEST):
+                stop = await self._ingest(event, run, convention)
+            if stop:
+                return
+        else:
+            runner.skipped(WorkflowStage.INGEST)
+
+        # ── HOOKS ─────────────────────────────────────────────────────────────
+        if await self._hooks_stage(event, convention, runner):
+            return
+
+        await self._publish_stages(event, run, convention, runner)
+
+
+class IngestBatchStage(_BatchStages, EventHandler[NextBatchRequested]):
+    """INGEST as its own consumer group (see module docstring)."""
+
+    __claim_timeout__: ClassVar[float] = 3600.0  # one ingester container
+
+    async def handle(self, event: NextBatchRequested) -> None:
+        run = await self._active_run(event)
+        if run is None:
+            return
+        # Sourced already: checkpoint A committed IngesterBatchReady with the
+        # counter, so the hooks stage has its delivery.
+        if await self.ingest_service.batch_sourced(run, event.batch_index):
+            StageRunner(WorkflowName.PROCESS_BATCH, self.instrumentation).skipped(
+                WorkflowStage.INGEST
+            )
+            return
+        if await self._defer_for_backpressure(event):
+            return
+
+        convention = await self._get_convention(run.convention_id)
+        runner = StageRunner(WorkflowName.PROCESS_BATCH, self.instrumentation)
+        async with runner.run(WorkflowStage.INGEST):
+            await self._ingest(event, run, convention)
+
+
+class HookBatchStage(_BatchStages, EventHandler[IngesterBatchReady]):
+    """HOOKS as its own consumer group (see module docstring)."""
+
+    async def handle(self, event: IngesterBatchReady) -> None:
+        run = await self._active_run(event)
+        if run is None:
+            return
+        convention = await self._get_convention(run.convention_id)
+        runner = StageRunner(WorkflowName.PROCESS_BATCH, self.instrumentation)
+        if not convention.hooks:
+            # Nothing to run, but the publish stage is driven by this event.
+            # Appended without a commit, it rides mark_delivered: exactly once.
+            runner.skipped(WorkflowStage.HOOKS)
+            await self.outbox.append(
+                HookBatchCompleted(
+                    id=EventId(uuid4()),
+                    ingest_run_id=event.ingest_run_id,
+                    batch_index=event.batch_index,
+                    priority=event.priority,
+                ),
+                priority=event.priority,
+            )
+            return
+        # A redelivery finds the hooks concluded and skips: checkpoint B already
+        # committed HookBatchCompleted with the provenance rows (or the run was
+        # aborted, and nothing should follow).
+        await self._hooks_stage(event, convention, runner)
+
+
+class PublishBatchStage(_BatchStages, EventHandler[HookBatchCompleted]):
+    """PUBLISH and INSERT_FEATURES as their own consumer group (see module docstring).
+
+    No containers: only database work, so it never queues behind a hook.
+    """
+
+    __claim_timeout__: ClassVar[float] = 600.0
+    __max_retries__: ClassVar[int] = 10
+
+    async def handle(self, event: HookBatchCompleted) -> None:
+        run = await self._active_run(event)
+        if run is None:
+            return
+        convention = await self._get_convention(run.convention_id)
+        runner = StageRunner(WorkflowName.PROCESS_BATCH, self.instrumentation)
+        await self._publish_stages(event, run, convention, runner)
@@ -62,6 +62,7 @@ class ProcessSubmission(EventHandler[DepositionSubmittedEvent]):
 
     __claim_timeout__: ClassVar[float] = 3600.0  # validation runs containers
     __max_retries__: ClassVar[int] = 10  # transient budget; permanent errors bypass it
+    __replayable__: ClassVar[bool] = False  # on_exhausted returns the deposition to draft
 
     deposition_service: DepositionService
     validation_service: ValidationService
@@ -76,11 +76,40 @@ class DatabaseConfig(BaseModel):
     The url field uses empty string as sentinel to indicate "derive from OSAPaths".
     When user doesn't override via OSA_DATABASE__URL, we compute the actual path
     in Config's model_validator.
+
+    PostgreSQL connections come from three pools, so no kind of traffic can
+    starve the others of connections:
+
+    - primary (``POOL_SIZE`` / ``MAX_OVERFLOW``) — API request scopes.
+    - read (``READ_POOL_SIZE`` / ``READ_MAX_OVERFLOW``) — ``/data`` streams,
+      which hold a server-side cursor for as long as a download runs, and every
+      other anonymous ``/data`` and MCP read. Pointed at a read replica by
+      ``READ_URL`` (default: the primary); while the replica's replay lag
+      exceeds ``READ_MAX_LAG_SECONDS`` (probed at most every
+      ``READ_LAG_CHECK_SECONDS``) those reads go to a pool of the same size on
+      the primary instead.
+    - worker (``WORKER_POOL_SIZE`` / ``WORKER_MAX_OVERFLOW``) — event-handler
+      and housekeeping units of work.
+
+    ``POOL_TIMEOUT_SECONDS`` (wait for a free connection before erroring) and
+    ``POOL_RECYCLE_SECONDS`` (replace connections older than this; unset =
+    never) apply to every pool. SQLite uses one shared connection throughout.
     """
 
     url: str = ""  # Empty string = derive from paths; explicit value = use as-is
     echo: bool = False
     auto_migrate: bool = True  # Auto-migrate for SQLite, manual for PostgreSQL
+    pool_size: int = Field(default=5, ge=1)
+    max_overflow: int = Field(default=10, ge=0)
+    pool_timeout_seconds: float = Field(default=30.0, gt=0)
+    pool_recycle_seconds: int | None = Field(default=None, gt=0)
+    read_url: str | None = None
+    read_pool_size: int = Field(default=5, ge=1)
+    read_max_overflow: int = Field(default=5, ge=0)
+    read_max_lag_seconds: float = Field(default=10.0, ge=0)
+    read_lag_check_seconds: float = Field(default=5.0, gt=0)
+    worker_pool_size: int = Field(default=5, ge=1)
+    worker_max_overflow: int = Field(default=10, ge=0)
 
 
 class LoggingConfig(BaseModel):
@@ -98,6 +127,84 @@ class LoggingConfig(BaseModel):
         return os.environ.get("OSA_LOG_FILE")
 
 
+class HookSizingConfig(BaseModel):
+    """Adaptive hook sizing (``OSA_WORKER__HOOK_SIZING__*``).
+
+    - ``ENABLED`` — launch hooks at the memory their release's recent runs
+      needed and split oversized batches into sub-batches.
+    - ``WINDOW`` — how many recent runs of a release are consulted.
+    - ``MAX_MEMORY`` — ceiling for a recommended limit; past it, batches are split.
+    - ``TIMEOUT_HEADROOM`` — fraction of the hook timeout one sub-batch may use.
+    """
+
+    enabled: bool = True
+    window: int = Field(default=20, ge=1)
+    max_memory: str = "16g"
+    timeout_headroom: float = Field(default=0.8, gt=0, le=1)
+
+
+class SchedulerConfig(BaseModel):
+    """Container admission scheduler (``OSA_WORKER__SCHEDULER__*``).
+
+    Every hook and ingester container launch in the process is admitted by one
+    :class:`~osa.domain.shared.scheduler.ContainerScheduler`.
+
+    - ``SLOTS`` — containers admitted at once (default: ``HOOK_CONCURRENCY``).
+    - ``MEMORY`` / ``CPU`` — optional packing budgets summed over admitted
+      containers' declared limits (e.g. ``"32g"``, ``8``); unset = unconstrained.
+    - ``MAX_QUEUED`` — waiting launches beyond which new ones fail fast and are
+      redelivered later.
+    - ``DEPOSITION_WEIGHT`` / ``INGEST_WEIGHT`` — fair-share weights per source;
+      each is split evenly across the conventions active in that source.
+    - ``MAX_BYPASS`` — how often smaller launches may backfill past one that
+      doesn't fit before it holds the line.
+    """
+
+    slots: int | None = Field(default=None, ge=1)
+    memory: str | None = None
+    cpu: float | None = Field(default=None, gt=0)
+    max_queued: int = Field(default=256, ge=1)
+    deposition_weight: float = Field(default=4.0, gt=0)
+    ingest_weight: float = Field(default=1.0, gt=0)
+    max_bypass: int = Field(default=8, ge=0)
+
+
+class ValidationBatchingConfig(BaseModel):
+    """Coalesced deposition validation (``OSA_WORKER__VALIDATION_BATCHING__*``).
+
+    Concurrent single-record validations of one hook release, for the same
+    convention and hook set, run as one batched container.
+
+    - ``ENABLED`` — opt in (default off: every deposition runs its own hooks).
+    - ``WINDOW_SECONDS`` — how long the first deposition waits for others.
+    - ``MAX_RECORDS`` — a batch runs as soon as this many have joined; also the
+      number of submissions the ProcessSubmission workers take on at once.
+    """
+
+    enabled: bool = False
+    window_seconds: float = Field(default=0.5, gt=0)
+    max_records: int = Field(default=8, ge=1)
+
+
+class BatchStagesConfig(BaseModel):
+    """Ingest batch stages as separate consumer groups (``OSA_WORKER__BATCH_STAGES__*``).
+
+    By default one ProcessBatch delivery runs a batch's ingest, hooks, publish
+    and feature-insert stages back to back. Enabled, each stage is its own
+    consumer group, so the database stages never wait behind a container stage.
+
+    - ``ENABLED`` — opt in (default off). Switch only while no ingest runs.
+    - ``INGEST_CONCURRENCY`` — batches sourcing (ingester containers) at once.
+    - ``PUBLISH_CONCURRENCY`` — batches publishing and inserting features at once.
+
+    The hooks stage keeps ``OSA_WORKER__HOOK_CONCURRENCY``.
+    """
+
+    enabled: bool = False
+    ingest_concurrency: int = Field(default=2, ge=1)
+    publish_concurrency: int = Field(default=4, ge=1)
+
+
 class WorkerConfig(BaseModel):
     """Background worker configuration (nested in Config, uses env_nested_delimiter).
 
@@ -109,8 +216,39 @@ class WorkerConfig(BaseModel):
     # Sizes the ProcessBatch worker fan-out: the number of concurrent ingest-batch
     # orchestrators, which bounds concurrent hook containers and enables batch
     # pipelining (#160). Name kept for deployment compatibility; the rename to a
-    # workflow-neutral key is #160 Phase 2.
-    hook_concurrency: int = 8
+    # workflow-neutral key is #160 Phase 2. Also caps hooks executing at once
+    # across all batches, since a batch's independent hooks run concurrently.
+    hook_concurrency: int = Field(default=8, ge=1)
+    hook_sizing: HookSizingConfig = HookSizingConfig()
+    # Reuse a hook release's earlier per-record outcomes when a record's
+    # metadata and file contents are unchanged (OSA_WORKER__HOOK_MEMO).
+    hook_memo: bool = True
+    # Poll a running hook's features.jsonl this often (seconds) to parse and
+    # checkpoint outcomes during execution; unset reads output only after exit.
+    hook_output_tail_seconds: float | None = Field(default=None, gt=0)
+    # Feature tables a batch's INSERT_FEATURES stage fills at once (each on its
+    # own connection and transaction).
+    feature_insert_concurrency: int = Field(default=4, ge=1)
+    scheduler: SchedulerConfig = SchedulerConfig()
+    validation_batching: ValidationBatchingConfig = ValidationBatchingConfig()
+    batch_stages: BatchStagesConfig = BatchStagesConfig()
+    # Worker process layout (``osa-server worker``): how many processes share
+    # the consumer groups, which groups this process runs (unset = all), and
+    # whether it also runs the singleton tasks (stale-claim sweep, device-auth
+    # cleanup, statistics refresh, blob GC, telemetry sampler).
+    processes: int = Field(default=1, ge=1)
+    consumer_groups: list[str] | None = None
+    singletons: bool = True
+    # Seconds a stopping pool waits for in-flight deliveries before cancelling.
+    drain_timeout_seconds: float = Field(default=30.0, gt=0)
+    # How often each pool applies the per-group worker counts set at runtime
+    # (PUT /admin/consumer-groups/{group}/workers); 0 disables resizing.
+    worker_count_sync_seconds: float = Field(default=15.0, ge=0)
+    # Singleton tasks run on the replica holding their Postgres advisory lock;
+    # the holder renews every LEADER_RENEW_SECONDS and loses the lease after
+    # LEADER_LEASE_SECONDS without a renewal, when another replica takes over.
+    leader_lease_seconds: float = Field(default=30.0, gt=0)
+    leader_renew_seconds: float = Field(default=5.0, gt=0)
 
 
 class K8sConfig(BaseModel):
@@ -128,12 +266,42 @@ class K8sConfig(BaseModel):
     job_ttl_seconds: int = 300
     s3_bucket: str = ""
     s3_endpoint_url: str | None = None
+    # Requests kept in flight by bulk prefix operations (delete/copy trees).
+    s3_max_concurrency: int = 16
+    # Track Jobs/Pods through one shared watch instead of polling per Job.
+    job_informer: bool = True
+    # Pre-pull DaemonSet run when a hook release goes live.
+    prepull_timeout_seconds: int = 600
+    prepull_pause_image: str = "registry.k8s.io/pause:3.10"
+
+
+class OciRunnerConfig(BaseModel):
+    """Local Docker runner settings (nested in RunnerConfig, ``OSA_RUNNER__OCI__*``).
+
+    - ``WARM_POOL_SIZE`` — idle pre-started containers kept per hook release for
+      images labelled ``org.opensciencearchive.hook.protocol=persistent``
+      (default ``0``: disabled, every run gets a fresh container).
+    - ``WARM_POOL_MAX_RUNS`` — recycle a warm container after this many runs.
+    - ``WARM_POOL_IDLE_SECONDS`` — remove warm containers unused this long.
+    - ``IMAGE_CACHE_TTL_SECONDS`` — how long a resolved hook image reference is
+      trusted before Docker is asked again (``0`` disables the cache).
+    - ``FILES_MOUNT`` — ``single`` (default) hardlinks a batch's per-record file
+      directories into one staging tree bound at ``/osa/files``; ``per_record``
+      binds each record's directory separately (one bind per record).
+    """
+
+    warm_pool_size: int = Field(default=0, ge=0)
+    warm_pool_max_runs: int = Field(default=50, ge=1)
+    warm_pool_idle_seconds: float = Field(default=300.0, gt=0)
+    image_cache_ttl_seconds: float = Field(default=300.0, ge=0)
+    files_mount: Literal["single", "per_record"] = "single"
 
 
 class RunnerConfig(BaseModel):
     """Runner backend selection and Kubernetes configuration."""
 
     backend: Literal["oci", "k8s"] = "oci"
+    oci: OciRunnerConfig = OciRunnerConfig()
     k8s: K8sConfig = K8sConfig()
 
     @model_validator(mode="after")
@@ -307,6 +475,47 @@ class DataConfig(BaseModel):
     max_page_limit: int = 1000  # page-size ceiling; over-large requests are clamped, not 422d
 
 
+class StorageConfig(BaseModel):
+    """Server-side storage behaviour (nested in Config, ``OSA_STORAGE__*``).
+
+    - ``OSA_STORAGE__INTERMEDIATE_FORMAT`` — ``jsonl`` (default), ``jsonl.gz`` or
+      ``jsonl.zst`` for ingest batch ``records.jsonl`` and the canonical hook
+      outcome files. Reads detect the format from each file's extension, so
+      changing it leaves earlier runs readable. ``jsonl.zst`` needs Python 3.14+
+      or the ``zstandard`` package.
+    - ``OSA_STORAGE__DEDUPE_FILES`` — hardlink identical deposition and ingest
+      files onto a content-addressed store under ``{data_dir}/blobs/sha256``
+      (default ``false``). Filesystem backend only; the worker garbage-collects
+      unreferenced blobs every ``blob_gc_interval_seconds``.
+    """
+
+    intermediate_format: Literal["jsonl", "jsonl.gz", "jsonl.zst"] = "jsonl"
+    dedupe_files: bool = False
+    blob_gc_interval_seconds: float = Field(default=3600.0, gt=0)
+
+
+class StatisticsConfig(BaseModel):
+    """Instance statistics behind ``GET /stats`` (nested in Config, ``OSA_STATISTICS__*``).
+
+    Record and feature-row writes append per-table row deltas in their own
+    transaction; the replica leading the statistics task folds them into the
+    single ``instance_statistics`` row, which is all ``GET /stats`` reads.
+
+    - ``OSA_STATISTICS__FOLD_INTERVAL_SECONDS`` — how often pending deltas are
+      folded in (and storage size re-read from the catalog).
+    - ``OSA_STATISTICS__FEATURE_ROWS`` — ``exact`` (folded deltas, default) or
+      ``estimate`` (``pg_class.reltuples``, as fresh as the last ANALYZE).
+    - ``OSA_STATISTICS__RECONCILE_INTERVAL_SECONDS`` — how often the folded
+      counts are replaced by a full ``count(*)`` recount, correcting drift from
+      writes made outside the server. Feature tables aren't recounted in
+      ``estimate`` mode.
+    """
+
+    fold_interval_seconds: float = Field(default=60.0, gt=0)
+    feature_rows: Literal["exact", "estimate"] = "exact"
+    reconcile_interval_seconds: float = Field(default=86400.0, gt=0)
+
+
 class McpConfig(BaseModel):
     """MCP Apps surface configuration (nested in Config, ``OSA_MCP__*``).
 
@@ -376,6 +585,10 @@ class Config(BaseSettings):
     # `dev_mode` only gates intent. Set via OSA_DEV_MODE=true.
     dev_mode: bool = False
 
+    # Process role (OSA_ROLE): ``api`` serves HTTP only, ``worker`` runs the
+    # WorkerPool only (``osa-server worker``), ``all`` does both in one process.
+    role: Literal["api", "worker", "all"] = "all"
+
     # These are BaseModel, so env_nested_delimiter handles their env vars
     frontend: Frontend = Frontend()
     database: DatabaseConfig = DatabaseConfig()
@@ -384,7 +597,9 @@ class Config(BaseSettings):
     auth: AuthConfig = AuthConfig()  # Defaults are dev-safe; boot check enforces prod-correctness
     runner: RunnerConfig = RunnerConfig()
     data: DataConfig = DataConfig()  # /data/ read-surface filter-tree bounds
+    storage: StorageConfig = StorageConfig()  # intermediate file encoding (OSA_STORAGE__*)
     mcp: McpConfig = McpConfig()  # MCP Apps surface (OSA_MCP__*)
+    statistics: StatisticsConfig = StatisticsConfig()  # GET /stats upkeep (OSA_STATISTICS__*)
     observability: ObservabilityConfig = (
         ObservabilityConfig()
     )  # telemetry export (OSA_OBSERVABILITY__*)
@@ -445,23 +660,17 @@ class Config(BaseSettings):
         When a PostgreSQL URL is provided, normalizes the driver to asyncpg
         since the app uses async SQLAlchemy throughout. This handles URLs from
         providers like CloudNativePG that emit standard postgresql:// URIs.
+        The read-replica URL is normalized the same way.
         """
         if not self.database.url:
             # URL is sentinel (empty), derive from OSAPaths
             osa_paths = OSAPaths()
-            self.database = DatabaseConfig(
-                url=f"sqlite+aiosqlite:///{osa_paths.database_file}",
-                echo=self.database.echo,
-                auto_migrate=self.database.auto_migrate,
-            )
+            url = f"sqlite+aiosqlite:///{osa_paths.database_file}"
         else:
-            normalized = _normalize_pg_url(self.database.url)
-            if normalized != self.database.url:
-                self.database = DatabaseConfig(
-                    url=normalized,
-                    echo=self.database.echo,
-                    auto_migrate=self.database.auto_migrate,
-                )
+            url = _normalize_pg_url(self.database.url)
+        read_url = self.database.read_url and _normalize_pg_url(self.database.read_url)
+        if url != self.database.url or read_url != self.database.read_url:
+            self.database = self.database.model_copy(update={"url": url, "read_url": read_url})
         return self
 
     @classmethod
@@ -0,0 +1,91 @@
+"""RequeueFailedDeliveries command — bulk replay of failed deliveries."""
+
+from datetime import UTC, datetime, timedelta
+
+from pydantic import Field
+
+from osa.domain.auth.model.principal import Principal
+from osa.domain.auth.model.role import Role
+from osa.domain.shared.authorization.gate import at_least
+from osa.domain.shared.command import Command, CommandHandler, Result
+from osa.domain.shared.error import ValidationError
+from osa.domain.shared.event import FailedDeliveryFilter
+from osa.domain.shared.model.subscription_registry import NonReplayableGroups
+from osa.domain.shared.outbox import Outbox
+from osa.domain.shared.port.instrumentation import OutboxInstrumentation
+from osa.infrastructure.logging import get_logger
+
+log = get_logger(__name__)
+
+
+class RequeueFailedDeliveries(Command):
+    """Requeue failed deliveries matching the filter, released over a window.
+
+    Releases are spaced evenly across ``window_seconds`` (oldest failure
+    first), so recovering from an outage doesn't hand the workers the whole
+    backlog at once. ``limit`` caps one request; repeat it for larger backlogs.
+
+    Groups whose handler is not ``__replayable__`` are never requeued: their
+    ``on_exhausted`` already compensated (failed the batch, returned the
+    deposition to draft), so a replay would double-count or be dropped.
+    Naming one is refused; otherwise they are skipped and reported.
+    """
+
+    consumer_group: str | None = None
+    error: str | None = None  # case-insensitive substring of the recorded error
+    failed_after: datetime | None = None
+    failed_before: datetime | None = None
+    limit: int = Field(default=1000, ge=1, le=10_000)
+    window_seconds: float = Field(default=300.0, ge=0, le=86_400)
+
+
+class DeliveriesRequeued(Result):
+    requeued: int
+    by_consumer_group: dict[str, int]
+    release_until: datetime  # the last requeued delivery becomes claimable by then
+    skipped_consumer_groups: list[str] = []  # not replayable; see RequeueFailedDeliveries
+
+
+class RequeueFailedDeliveriesHandler(CommandHandler[RequeueFailedDeliveries, DeliveriesRequeued]):
+    __auth__ = at_least(Role.SUPERADMIN)
+    principal: Principal
+    outbox: Outbox
+    instrumentation: OutboxInstrumentation
+    non_replayable: NonReplayableGroups
+
+    async def run(self, cmd: RequeueFailedDeliveries) -> DeliveriesRequeued:
+        if cmd.consumer_group in self.non_replayable:
+            raise ValidationError(
+                f"Failed deliveries of {cmd.consumer_group} cannot be requeued: its "
+                "on_exhausted already compensated for them, and a replay would "
+                "double-count or be dropped. Resubmit the work instead.",
+                field="consumer_group",
+                code="consumer_group_not_replayable",
+            )
+        skipped = frozenset[str]() if cmd.consumer_group else self.non_replayable
+        criteria = FailedDeliveryFilter(
+            consumer_group=cmd.consumer_group,
+            exclude_consumer_groups=skipped,
+            error_contains=cmd.error,
+            failed_after=cmd.failed_after,
+            failed_before=cmd.failed_before,
+        )
+        started = datetime.now(UTC)
+        by_group = await self.outbox.requeue_failed(
+            criteria, limit=cmd.limit, window_seconds=cmd.window_seconds
+        )
+        for group, count in by_group.items():
+            self.instrumentation.deliveries_requeued(consumer_group=group, count=count)
+        requeued = sum(by_group.values())
+        log.info(
+            "requeued {requeued} failed deliveries over {window}s ({groups})",
+            requeued=requeued,
+            window=cmd.window_seconds,
+            groups=", ".join(f"{group}: {count}" for group, count in sorted(by_group.items())),
+        )
+        return DeliveriesRequeued(
+            requeued=requeued,
+            by_consumer_group=by_group,
+            release_until=started + timedelta(seconds=cmd.window_seconds),
+            skipped_consumer_groups=sorted(skipped),
+        )
@@ -0,0 +1,45 @@
+"""SetWorkerCount command — resize a consumer group's workers without a restart."""
+
+from pydantic import Field
+
+from osa.domain.auth.model.principal import Principal
+from osa.domain.auth.model.role import Role
+from osa.domain.shared.authorization.gate import at_least
+from osa.domain.shared.command import Command, CommandHandler, Result
+from osa.domain.shared.error import NotFoundError
+from osa.domain.shared.model.subscription_registry import SubscriptionRegistry
+from osa.domain.shared.outbox import Outbox
+
+
+class SetWorkerCount(Command):
+    """Set how many workers each process running a consumer group runs.
+
+    Zero pauses the group: its deliveries stay pending until it is resized.
+    """
+
+    consumer_group: str
+    workers: int = Field(ge=0, le=256)
+
+
+class WorkerCountSet(Result):
+    """The stored worker count; pools apply it on their next concurrency sync."""
+
+    consumer_group: str
+    workers: int
+
+
+class SetWorkerCountHandler(CommandHandler[SetWorkerCount, WorkerCountSet]):
+    __auth__ = at_least(Role.SUPERADMIN)
+    principal: Principal
+    outbox: Outbox
+    registry: SubscriptionRegistry
+
+    async def run(self, cmd: SetWorkerCount) -> WorkerCountSet:
+        known = set().union(*self.registry.values())
+        if cmd.consumer_group not in known:
+            raise NotFoundError(
+                f"Unknown consumer group: {cmd.consumer_group}",
+                code="unknown_consumer_group",
+            )
+        await self.outbox.set_worker_count(cmd.consumer_group, cmd.workers)
+        return WorkerCountSet(consumer_group=cmd.consumer_group, workers=cmd.workers)
@@ -0,0 +1,70 @@
+"""ListFailedDeliveries query — inspect the dead letters of the outbox."""
+
+from datetime import datetime
+
+from pydantic import Field
+
+from osa.domain.auth.model.principal import Principal
+from osa.domain.auth.model.role import Role
+from osa.domain.shared.authorization.gate import at_least
+from osa.domain.shared.event import FailedDeliveryFilter
+from osa.domain.shared.outbox import Outbox
+from osa.domain.shared.query import Query, QueryHandler, Result
+
+
+class ListFailedDeliveries(Query):
+    """Failed deliveries, optionally narrowed by group, error text and failure time."""
+
+    consumer_group: str | None = None
+    error: str | None = None  # case-insensitive substring of the recorded error
+    failed_after: datetime | None = None
+    failed_before: datetime | None = None
+    limit: int = Field(default=100, ge=1, le=500)
+    offset: int = Field(default=0, ge=0)
+
+
+class FailedDeliverySummary(Result):
+    id: str
+    event_id: str
+    event_type: str
+    consumer_group: str
+    error: str | None
+    retry_count: int
+    failed_at: datetime
+
+
+class FailedDeliveryList(Result):
+    items: list[FailedDeliverySummary]
+    total: int  # matching deliveries across all pages
+
+
+class ListFailedDeliveriesHandler(QueryHandler[ListFailedDeliveries, FailedDeliveryList]):
+    __auth__ = at_least(Role.SUPERADMIN)
+    principal: Principal
+    outbox: Outbox
+
+    async def run(self, cmd: ListFailedDeliveries) -> FailedDeliveryList:
+        criteria = FailedDeliveryFilter(
+            consumer_group=cmd.consumer_group,
+            error_contains=cmd.error,
+            failed_after=cmd.failed_after,
+            failed_before=cmd.failed_before,
+        )
+        deliveries = await self.outbox.failed_deliveries(
+            criteria, limit=cmd.limit, offset=cmd.offset
+        )
+        return FailedDeliveryList(
+            items=[
+                FailedDeliverySummary(
+                    id=d.id,
+                    event_id=d.event_id,
+                    event_type=d.event_type,
+                    consumer_group=d.consumer_group,
+                    error=d.error,
+                    retry_count=d.retry_count,
+                    failed_at=d.failed_at,
+                )
+                for d in deliveries
+            ],
+            total=await self.outbox.count_failed(criteria),
+        )
@@ -72,6 +72,9 @@ class DeployConventionHook(BaseModel):
     config: dict[str, Any]
     limits: OciLimits = Field(default_factory=OciLimits)
     release: DeployConventionRelease
+    # Sibling hooks that must finish before this one runs on a batch; hooks
+    # without an ordering constraint run concurrently.
+    after: list[HookName] = []
 
     def to_deploy(self) -> HookDeploy:
         # Re-gather authored config/limits (on the hook) with the built image
@@ -85,6 +88,7 @@ class DeployConventionHook(BaseModel):
                 limits=self.limits,
             ),
             source_ref=self.release.source_ref,
+            after=self.after,
         )
 
 
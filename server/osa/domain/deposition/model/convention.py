@@ -1,4 +1,5 @@
 from datetime import datetime
+from graphlib import CycleError, TopologicalSorter
 
 from osa.domain.deposition.model.docs import ConventionDocs
 from osa.domain.deposition.model.value import FileRequirements
@@ -23,7 +24,29 @@ class Convention(Aggregate):
     schema_id: SchemaId
     file_requirements: FileRequirements
     hooks: list[HookName] = []
+    # Optional ordering: hook → hooks it must run after. Hooks not constrained
+    # here run concurrently within a batch.
+    hook_dependencies: dict[HookName, list[HookName]] = {}
     ingester: IngesterDefinition | None = None
     # Author semantics — required: there is no docs-less convention state (#151).
     docs: ConventionDocs
     created_at: datetime
+
+    def model_post_init(self, __context: object) -> None:
+        from osa.domain.shared.error import ValidationError
+
+        declared = set(self.hooks)
+        for hook, after in self.hook_dependencies.items():
+            unknown = [h.root for h in (hook, *after) if h not in declared]
+            if unknown:
+                raise ValidationError(
+                    f"hook dependencies reference undeclared hooks: {', '.join(unknown)}",
+                    field="hook_dependencies",
+                )
+        try:
+            TopologicalSorter(self.hook_dependencies).prepare()
+        except CycleError as e:
+            cycle = " -> ".join(h.root for h in e.args[1])
+            raise ValidationError(
+                f"hook dependencies form a cycle: {cycle}", field="hook_dependencies"
+            ) from None
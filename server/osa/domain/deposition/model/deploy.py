@@ -17,7 +17,7 @@ from typing import Annotated
 
 from pydantic import Field
 
-from osa.domain.shared.model.hook import HookIdentity, OciConfig
+from osa.domain.shared.model.hook import HookIdentity, HookName, OciConfig
 from osa.domain.shared.model.value import ValueObject
 
 
@@ -27,3 +27,5 @@ class HookDeploy(ValueObject):
     identity: HookIdentity
     runtime: Annotated[OciConfig, Field(discriminator="type")]
     source_ref: str
+    # Hooks of the same convention this one must run after (default: none).
+    after: list[HookName] = []
@@ -21,6 +21,7 @@ class ConventionDetail(Result):
     schema_id: SchemaId
     file_requirements: FileRequirements
     hooks: list[HookName]
+    hook_dependencies: dict[HookName, list[HookName]] = {}
     ingester: IngesterDefinition | None = None
     docs: ConventionDocs
     created_at: datetime
@@ -39,6 +40,7 @@ class GetConventionHandler(QueryHandler[GetConvention, ConventionDetail]):
             schema_id=conv.schema_id,
             file_requirements=conv.file_requirements,
             hooks=list(conv.hooks),
+            hook_dependencies=conv.hook_dependencies,
             ingester=conv.ingester,
             docs=conv.docs,
             created_at=conv.created_at,
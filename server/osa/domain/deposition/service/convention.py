@@ -101,6 +101,7 @@ class ConventionService(Service):
             schema_id=created_schema.id,
             file_requirements=file_requirements,
             hooks=[spec.identity.name for spec in hooks],
+            hook_dependencies={spec.identity.name: spec.after for spec in hooks if spec.after},
             ingester=ingester,
             docs=docs,
             created_at=datetime.now(UTC),
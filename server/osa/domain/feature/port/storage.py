@@ -1,11 +1,16 @@
 """Storage port scoped to the feature domain."""
 
 from abc import abstractmethod
+from collections.abc import AsyncIterator, Collection
 from typing import Any, Protocol
 
 from osa.domain.shared.model.provenance import RunRef
 from osa.domain.shared.port import Port
-from osa.domain.validation.model.batch_outcome import BatchRecordOutcome, HookRecordId
+from osa.domain.validation.model.batch_outcome import (
+    BatchRecordOutcome,
+    HookRecordId,
+    OutcomeStatus,
+)
 
 
 class FeatureStoragePort(Port, Protocol):
@@ -50,6 +55,24 @@ class FeatureStoragePort(Port, Protocol):
         Parses features.jsonl, rejections.jsonl, and errors.jsonl from the
         hook's output directory. Each record appears in exactly one file.
 
-        Returns a dict keyed by record ID.
+        Returns a dict keyed by record ID. Holds the whole batch in memory —
+        prefer :meth:`iter_batch_outcomes` when the outcomes are consumed once.
+        """
+        ...
+
+    @abstractmethod
+    def iter_batch_outcomes(
+        self,
+        output_dir: str,
+        hook_name: str,
+        *,
+        statuses: Collection[OutcomeStatus] | None = None,
+    ) -> AsyncIterator[BatchRecordOutcome]:
+        """Stream a hook's batch outcomes one record at a time.
+
+        Same files and semantics as :meth:`read_batch_outcomes`, but read and
+        parsed incrementally so memory follows the read chunk, not the batch's
+        feature volume. ``statuses`` narrows which outcome files are read at
+        all (e.g. ``{PASSED}`` reads features.jsonl only).
         """
         ...
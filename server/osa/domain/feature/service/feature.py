@@ -16,6 +16,8 @@ class FeatureService(Service):
 
     feature_store: FeatureStore
     feature_storage: FeatureStoragePort
+    # How many feature tables a batch inserts into concurrently.
+    insert_concurrency: int = 4
 
     async def create_table(self, hook: HookIdentity) -> None:
         """Create a feature table for a hook's output (named by the hook)."""
@@ -2,10 +2,24 @@
 
 from dishka import provide
 
+from osa.config import Config
+from osa.domain.feature.port.feature_store import FeatureStore
+from osa.domain.feature.port.storage import FeatureStoragePort
 from osa.domain.feature.service.feature import FeatureService
 from osa.util.di.base import Provider
 from osa.util.di.scope import Scope
 
 
 class FeatureProvider(Provider):
-    service = provide(FeatureService, scope=Scope.UOW)
+    @provide(scope=Scope.UOW)
+    def get_feature_service(
+        self,
+        feature_store: FeatureStore,
+        feature_storage: FeatureStoragePort,
+        config: Config,
+    ) -> FeatureService:
+        return FeatureService(
+            feature_store=feature_store,
+            feature_storage=feature_storage,
+            insert_concurrency=config.worker.feature_insert_concurrency,
+        )
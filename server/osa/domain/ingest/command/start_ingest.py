@@ -1,5 +1,7 @@
 """StartIngest command — initiates a bulk ingestion run for a convention."""
 
+from pydantic import Field
+
 from osa.domain.shared.authorization.gate import requires_scope
 from osa.domain.shared.command import Command, CommandHandler, Result
 
@@ -10,6 +12,10 @@ class StartIngest(Command):
     convention_id: str
     batch_size: int = 1000
     limit: int | None = None  # Max total records to ingest (None = unlimited)
+    # Delivery priority of the run's batches (DeliveryPriority: -10 background
+    # backfill, 0 normal, 10 interactive); higher is claimed first. Bounded
+    # to the SmallInteger range of ``deliveries.priority``.
+    priority: int = Field(default=0, ge=-32768, le=32767)
 
 
 class IngestRunCreated(Result):
@@ -44,6 +50,7 @@ class StartIngestHandler(CommandHandler[StartIngest, IngestRunCreated]):
             convention_id=cmd.convention_id,
             batch_size=cmd.batch_size,
             limit=cmd.limit,
+            priority=cmd.priority,
         )
 
         node_domain: Domain = self.service.node_domain
@@ -1,7 +1,7 @@
 """Ingest domain events — payloads carry path references, not inline data (AD-1)."""
 
 from osa.domain.ingest.model.ingest_run import IngestRunId
-from osa.domain.shared.event import Event, EventId
+from osa.domain.shared.event import DeliveryPriority, Event, EventId
 from osa.domain.shared.model.hook import FeatureName
 
 
@@ -32,6 +32,10 @@ class NextBatchRequested(Event):
     Carried in the event so retries and pipelined batches never re-derive it
     from mutable run counters — the index is fixed at emission time.
     """
+    priority: int = DeliveryPriority.NORMAL
+    """Delivery priority of the run, set by ``start_ingest`` and carried by
+    every event the run's batches append, so a backfill's queued batches yield
+    to other runs in the same consumer group."""
 
 
 class IngesterBatchReady(Event):
@@ -44,6 +48,7 @@ class IngesterBatchReady(Event):
     ingest_run_id: IngestRunId
     batch_index: int
     has_more: bool
+    priority: int = DeliveryPriority.NORMAL
 
 
 class HookBatchCompleted(Event):
@@ -55,6 +60,7 @@ class HookBatchCompleted(Event):
     id: EventId
     ingest_run_id: IngestRunId
     batch_index: int
+    priority: int = DeliveryPriority.NORMAL
 
 
 class IngestBatchPublished(Event):
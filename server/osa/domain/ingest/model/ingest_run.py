@@ -32,6 +32,12 @@ class IngestRun(Aggregate):
 
     No per-record data — batch output directories on disk are the audit trail.
     Counter updates use atomic SQL increments in the repository.
+
+    A sharded run (``shards > 1``) sources K independent session streams. Shard
+    ``s`` owns batch indices ``s, s+K, s+2K, …`` — its own namespace within the
+    run's, so batch directories and hook_run ids never collide. Per-shard
+    progress lives in :class:`ShardProgress`; ``batches_ingested`` and
+    ``ingestion_finished`` aggregate it (sum / all shards finished).
     """
 
     id: IngestRunId
@@ -44,6 +50,7 @@ class IngestRun(Aggregate):
     batches_failed: int = 0
     batch_size: int = 1000
     limit: int | None = None  # Max total records (None = unlimited)
+    shards: int = 1
     started_at: datetime
     completed_at: datetime | None = None
     # Why the run failed (or why ingestion stopped early), queryable via
@@ -83,6 +90,32 @@ class IngestRun(Aggregate):
         self.batches_completed += 1
         self.published_count += published_count
 
+    @property
+    def sharded(self) -> bool:
+        return self.shards > 1
+
+    def shard_of(self, batch_index: int) -> int:
+        return batch_index % self.shards
+
+    def shard_batch(self, batch_index: int) -> int:
+        """Position of ``batch_index`` within its shard's own sequence."""
+        return batch_index // self.shards
+
+    def next_batch_index(self, batch_index: int) -> int:
+        """The index the same shard pulls next."""
+        return batch_index + self.shards
+
+    def shard_limit(self, shard: int) -> int | None:
+        """Record limit of one shard — the run's limit split across shards.
+
+        The first ``limit % shards`` shards take one record more, so the shard
+        limits sum to exactly the run's limit (shards past it get 0).
+        """
+        if self.limit is None:
+            return None
+        base, extra = divmod(self.limit, self.shards)
+        return base + (1 if shard < extra else 0)
+
     @property
     def is_complete(self) -> bool:
         """Check the completion condition: all sourced batches are accounted for."""
@@ -103,6 +136,18 @@ class IngestRun(Aggregate):
         return False
 
 
+@dataclass(frozen=True)
+class ShardProgress:
+    """One sourcing stream's position: batches it has sourced, and whether it is done.
+
+    An unsharded run is a single stream, described by the run's own counters.
+    """
+
+    shard: int
+    batches_ingested: int = 0
+    finished: bool = False
+
+
 # ── Guarded-mutation outcome ─────────────────────────────────────────────────
 # Counter/state mutations only apply while a run is non-terminal (#152). The
 # repo reports which happened via this sum type instead of an ambiguous None: a
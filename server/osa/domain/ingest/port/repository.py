@@ -4,7 +4,7 @@ from abc import abstractmethod
 from datetime import datetime
 from typing import Protocol
 
-from osa.domain.ingest.model.ingest_run import IngestRun, IngestRunId, RunUpdate
+from osa.domain.ingest.model.ingest_run import IngestRun, IngestRunId, RunUpdate, ShardProgress
 from osa.domain.shared.failure import FailureKind
 from osa.domain.shared.port import Port
 
@@ -63,6 +63,27 @@ class IngestRunRepository(Port, Protocol):
         """
         ...
 
+    @abstractmethod
+    async def get_shard(self, id: IngestRunId, shard: int) -> ShardProgress | None:
+        """Progress of one shard of a sharded run (``None`` if it has no such shard)."""
+        ...
+
+    @abstractmethod
+    async def advance_shard(
+        self, id: IngestRunId, shard: int, *, batches: int | None = None, finished: bool
+    ) -> RunUpdate:
+        """Advance one shard of a sharded run, then re-aggregate the run's counters.
+
+        ``batches`` raises the shard's count to at least that value (idempotent,
+        as :meth:`mark_batch_ingested`); ``None`` counts one more batch instead (a
+        pull that produced nothing). ``finished`` latches the shard done. The run's
+        ``batches_ingested`` becomes the sum over its shards and
+        ``ingestion_finished`` latches once every shard is finished. Serialized
+        per run so concurrent shards never lose each other's updates. Guarded to
+        non-terminal runs, like the other counters.
+        """
+        ...
+
     @abstractmethod
     async def increment_failed(self, id: IngestRunId) -> RunUpdate:
         """Atomically increment batches_failed while the run is non-terminal.
@@ -20,12 +20,17 @@ class IngestStoragePort(Port, Protocol):
     """
 
     @abstractmethod
-    async def read_session(self, ingest_run_id: str) -> dict[str, Any] | None:
-        """Read session state for ingester continuation. Returns None if no session."""
+    async def read_session(self, ingest_run_id: str, shard: int = 0) -> dict[str, Any] | None:
+        """Read session state for ingester continuation. Returns None if no session.
+
+        Each shard of a sharded run continues its own session.
+        """
         ...
 
     @abstractmethod
-    async def write_session(self, ingest_run_id: str, session: dict[str, Any]) -> None:
+    async def write_session(
+        self, ingest_run_id: str, session: dict[str, Any], shard: int = 0
+    ) -> None:
         """Persist session state between batches."""
         ...
 
@@ -41,6 +46,25 @@ class IngestStoragePort(Port, Protocol):
         """Read raw ingester output records for a batch."""
         ...
 
+    @abstractmethod
+    async def seal_batch_files(self, ingest_run_id: str, batch_index: int) -> None:
+        """Finalise a batch's ingested files once the ingester has written them.
+
+        With file dedupe enabled, identical payloads are collapsed onto shared
+        content-addressed blobs and a ``manifest.json`` is written beside
+        ``files/``. A no-op where the backend has no dedupe.
+        """
+        ...
+
+    @abstractmethod
+    async def batch_file_digests(self, ingest_run_id: str, batch_index: int) -> dict[str, str]:
+        """Content digests of a batch's files as ``{"{source_id}/{relpath}": digest}``.
+
+        Digests are opaque content identifiers: sha256 on the filesystem (from
+        the dedupe manifest when present), the object ETag on S3.
+        """
+        ...
+
     @abstractmethod
     def batch_dir(self, ingest_run_id: str, batch_index: int) -> Path:
         """Return the batch-level directory (parent of ingester/ and hooks/)."""
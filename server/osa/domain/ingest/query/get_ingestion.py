@@ -32,6 +32,7 @@ class IngestRunDetail(Result):
     published_count: int
     batch_size: int
     limit: int | None
+    shards: int = 1
     started_at: datetime
     completed_at: datetime | None
     failure_reason: str | None
@@ -60,6 +61,7 @@ class GetIngestionHandler(QueryHandler[GetIngestion, IngestRunDetail]):
             published_count=ingest_run.published_count,
             batch_size=ingest_run.batch_size,
             limit=ingest_run.limit,
+            shards=ingest_run.shards,
             started_at=ingest_run.started_at,
             completed_at=ingest_run.completed_at,
             failure_reason=ingest_run.failure_reason,
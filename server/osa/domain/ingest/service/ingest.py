@@ -12,11 +12,12 @@ from osa.domain.ingest.model.ingest_run import (
     IngestStatus,
     RunClosed,
     RunUpdate,
+    ShardProgress,
 )
 from osa.domain.ingest.port.instrumentation import IngestInstrumentation
 from osa.domain.ingest.port.repository import IngestRunRepository
 from osa.domain.shared.error import ConflictError, NotFoundError
-from osa.domain.shared.event import EventId
+from osa.domain.shared.event import DeliveryPriority, EventId
 from osa.domain.shared.failure import FailureKind
 from osa.domain.shared.model.srn import ConventionSlug, Domain
 from osa.domain.shared.outbox import Outbox
@@ -40,6 +41,7 @@ class IngestService(Service):
         convention_id: str,  # TODO: use convention ID instead of SRN
         batch_size: int = 1000,
         limit: int | None = None,
+        priority: int = DeliveryPriority.NORMAL,
     ) -> IngestRun:
         """Create an ingest run for a convention.
 
@@ -47,6 +49,11 @@ class IngestService(Service):
         - Convention exists
         - Convention has an ingester configured
         - No ingest is already running for this convention
+
+        A shardable ingester (``shards > 1``) starts one NextBatchRequested
+        chain per shard, at batch indices ``0..shards-1``. Every batch of the
+        run is delivered at *priority* (e.g. ``DeliveryPriority.BACKGROUND`` for
+        a backfill that shouldn't hold up other runs).
         """
         parsed_srn = ConventionSlug.parse(convention_id)
         convention = await self.convention_service.get_convention(parsed_srn)
@@ -73,6 +80,7 @@ class IngestService(Service):
             status=IngestStatus.PENDING,
             batch_size=batch_size,
             limit=limit,
+            shards=convention.ingester.shards,
             started_at=now,
         )
 
@@ -87,15 +95,18 @@ class IngestService(Service):
             )
         )
 
-        await self.outbox.append(
-            NextBatchRequested(
-                id=EventId(uuid4()),
-                ingest_run_id=run_id,
-                convention_id=convention_id,
-                batch_size=batch_size,
-                batch_index=0,
+        for shard in range(ingest_run.shards):
+            await self.outbox.append(
+                NextBatchRequested(
+                    id=EventId(uuid4()),
+                    ingest_run_id=run_id,
+                    convention_id=convention_id,
+                    batch_size=batch_size,
+                    batch_index=shard,
+                    priority=priority,
+                ),
+                priority=priority,
             )
-        )
 
         srn = f"urn:osa:{self.node_domain.root}:ing:{run_id}"
         log.info(
@@ -104,6 +115,8 @@ class IngestService(Service):
             convention_id=convention_id,
             batch_size=batch_size,
             limit=limit,
+            shards=ingest_run.shards,
+            priority=priority,
         )
         return ingest_run
 
@@ -126,22 +139,55 @@ class IngestService(Service):
             await self.ingest_repo.save(run)
         return run
 
+    async def sourcing_position(self, run: IngestRun, batch_index: int) -> ShardProgress:
+        """Progress of the stream ``batch_index`` belongs to (the run itself if unsharded)."""
+        if not run.sharded:
+            return ShardProgress(
+                shard=0, batches_ingested=run.batches_ingested, finished=run.ingestion_finished
+            )
+        shard = run.shard_of(batch_index)
+        return await self.ingest_repo.get_shard(run.id, shard) or ShardProgress(shard=shard)
+
+    async def batch_sourced(self, run: IngestRun, batch_index: int) -> bool:
+        """Whether ``batch_index`` was already pulled by its stream."""
+        position = await self.sourcing_position(run, batch_index)
+        return position.batches_ingested > run.shard_batch(batch_index)
+
     async def mark_batch_ingested(
-        self, ingest_run_id: IngestRunId, batch_index: int, *, ingestion_finished: bool
+        self,
+        ingest_run_id: IngestRunId,
+        batch_index: int,
+        *,
+        ingestion_finished: bool,
+        shards: int = 1,
     ) -> RunUpdate:
-        """Idempotently record that ``batch_index`` was sourced (#160)."""
+        """Idempotently record that ``batch_index`` was sourced (#160).
+
+        For a sharded run, ``ingestion_finished`` finishes only that batch's shard.
+        """
+        if shards > 1:
+            return await self.ingest_repo.advance_shard(
+                ingest_run_id,
+                batch_index % shards,
+                batches=batch_index // shards + 1,
+                finished=ingestion_finished,
+            )
         return await self.ingest_repo.mark_batch_ingested(
             ingest_run_id, batch_index, ingestion_finished=ingestion_finished
         )
 
-    async def close_sourcing(self, ingest_run_id: IngestRunId) -> RunUpdate:
+    async def close_sourcing(
+        self, ingest_run_id: IngestRunId, *, shard: int | None = None
+    ) -> RunUpdate:
         """Record that sourcing stopped without producing a batch (#160).
 
         The record limit was already met on a redelivered request, so no batch
         was pulled; latch ``ingestion_finished`` so completion accounting can
         close the run. Behaviour preserved verbatim from the legacy handler,
-        including the counter increment.
+        including the counter increment. With ``shard``, only that stream closes.
         """
+        if shard is not None:
+            return await self.ingest_repo.advance_shard(ingest_run_id, shard, finished=True)
         return await self.ingest_repo.increment_batches_ingested(
             ingest_run_id, set_ingestion_finished=True
         )
@@ -192,7 +238,12 @@ class IngestService(Service):
                 await self.ingest_repo.record_failure(ingest_run_id, reason=reason, kind=kind)
 
     async def fail_ingestion(
-        self, ingest_run_id: IngestRunId, *, reason: str, kind: FailureKind | None
+        self,
+        ingest_run_id: IngestRunId,
+        *,
+        reason: str,
+        kind: FailureKind | None,
+        shard: int | None = None,
     ) -> None:
         """Account for a failed ingester pull, recording why (#152).
 
@@ -202,11 +253,16 @@ class IngestService(Service):
         The reason/kind land on the run so an operator sees the explanation
         without log archaeology. ``record_failure`` runs LAST for the same
         reason as ``fail_batch`` — so a completing run's save can't clobber it.
+        With ``shard``, only that stream stops; the other shards keep sourcing.
         """
-        match await self.ingest_repo.increment_batches_ingested(
-            ingest_run_id,
-            set_ingestion_finished=True,
-        ):
+        if shard is not None:
+            sourced = await self.ingest_repo.advance_shard(ingest_run_id, shard, finished=True)
+        else:
+            sourced = await self.ingest_repo.increment_batches_ingested(
+                ingest_run_id,
+                set_ingestion_finished=True,
+            )
+        match sourced:
             case RunClosed():
                 log.warn(
                     "fail_ingestion no-op — run already terminal",
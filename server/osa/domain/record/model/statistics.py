@@ -1,4 +1,4 @@
-"""Instance-wide statistics — the materialized snapshot of O(rows) aggregates."""
+"""Instance-wide statistics — the materialized snapshot behind ``GET /stats``."""
 
 from __future__ import annotations
 
@@ -10,11 +10,15 @@ from pydantic import BaseModel
 class InstanceStats(BaseModel):
     """Precomputed instance-wide aggregates.
 
-    Only the expensive-to-compute figures are materialized here (total storage
-    footprint and total feature-table rows); cheap counts (records, this-month)
-    are read live. Refreshed periodically by the WorkerPool.
+    Every figure is materialized, so reading them is a single-row lookup: row
+    counts are maintained incrementally from per-write deltas and periodically
+    reconciled by a full recount (``reconciled_at``); storage size is re-read
+    from the catalog on each refresh. Refreshed periodically by the WorkerPool.
     """
 
+    records: int
+    records_this_month: int
     storage_bytes: int
     feature_rows: int
     computed_at: datetime
+    reconciled_at: datetime | None = None
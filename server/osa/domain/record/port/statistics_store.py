@@ -10,23 +10,18 @@ from osa.domain.record.model.statistics import InstanceStats
 class StatisticsStore(Protocol):
     """Reads the materialized instance-statistics snapshot and refreshes it.
 
-    The snapshot holds the expensive aggregates (storage, feature rows). Cheap
-    counts (this-month) are exposed here as live queries so the read path stays
-    fresh without a refresh cycle.
+    Reads never compute anything: the snapshot holds every aggregate, kept
+    current by :meth:`refresh` from the row-count deltas writers record.
     """
 
-    async def count_this_month(self) -> int:
-        """Records published since the start of the current month (live)."""
-        ...
-
     async def read_snapshot(self) -> InstanceStats | None:
-        """The last materialized snapshot, or None if never refreshed."""
-        ...
-
-    async def compute_snapshot(self) -> InstanceStats:
-        """Compute the aggregates live (cold-start fallback; O(rows))."""
+        """The last materialized snapshot, or None if never refreshed (O(1))."""
         ...
 
     async def refresh(self) -> None:
-        """Recompute and upsert the singleton snapshot row."""
+        """Fold pending row-count deltas into the snapshot.
+
+        Falls back to a full recount when there is no snapshot yet or the last
+        reconcile is older than the configured interval.
+        """
         ...
@@ -3,7 +3,6 @@
 from datetime import datetime
 
 from osa.domain.record.port.statistics_store import StatisticsStore
-from osa.domain.record.service.record import RecordService
 from osa.domain.shared.authorization.gate import public
 from osa.domain.shared.query import Query, QueryHandler, Result
 
@@ -21,32 +20,32 @@ class StatsResult(Result):
 
 
 class GetStatsHandler(QueryHandler[GetStats, StatsResult]):
-    """Node statistics: live counts + the materialized storage/feature snapshot.
+    """Node statistics, read from the materialized snapshot in one O(1) lookup.
 
-    ``records`` and ``records_this_month`` are read live (cheap, indexed) so they
-    stay fresh; ``storage_bytes`` and ``features_per_record`` come from the
-    periodically-refreshed snapshot, falling back to a live computation on cold
-    start (before the first refresh).
+    Nothing is counted on the read path: every figure comes from the snapshot
+    the WorkerPool keeps current. Before its first refresh every figure is
+    zero and ``computed_at`` is None.
     """
 
     __auth__ = public()
-    record_service: RecordService
     stats_store: StatisticsStore
 
     async def run(self, cmd: GetStats) -> StatsResult:
-        records = await self.record_service.count()
-        records_this_month = await self.stats_store.count_this_month()
-
         snapshot = await self.stats_store.read_snapshot()
         if snapshot is None:
-            snapshot = await self.stats_store.compute_snapshot()
-
-        features_per_record = snapshot.feature_rows / records if records else 0.0
-
+            return StatsResult(
+                records=0,
+                records_this_month=0,
+                storage_bytes=0,
+                features_per_record=0.0,
+                computed_at=None,
+            )
+
+        records = snapshot.records
         return StatsResult(
             records=records,
-            records_this_month=records_this_month,
+            records_this_month=snapshot.records_this_month,
             storage_bytes=snapshot.storage_bytes,
-            features_per_record=features_per_record,
+            features_per_record=snapshot.feature_rows / records if records else 0.0,
             computed_at=snapshot.computed_at,
         )
@@ -4,7 +4,7 @@ from abc import ABC, ABCMeta, abstractmethod
 from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from enum import Enum, StrEnum
+from enum import Enum, IntEnum, StrEnum
 from typing import (
     Any,
     ClassVar,
@@ -68,6 +68,19 @@ class DeliveryStatus(StrEnum):
     SKIPPED = "skipped"
 
 
+class DeliveryPriority(IntEnum):
+    """Vocabulary for the ``deliveries.priority`` column.
+
+    Within a consumer group, pending deliveries are claimed highest priority
+    first and FIFO (by event time) within a priority. Gaps allow lanes to be
+    added between the existing ones.
+    """
+
+    BACKGROUND = -10  # bulk backfills: yield to everything else
+    NORMAL = 0
+    INTERACTIVE = 10
+
+
 class WorkerConfig(BaseModel):
     """Configuration for a single worker instance.
 
@@ -172,10 +185,46 @@ class DeliveryStats:
             — i.e. work a worker could claim right now. Deliveries scheduled
             for later (a future ``deliver_after``) are excluded so they never
             inflate outbox-lag measurements. Timezone-aware (UTC).
+        deferred: Pending deliveries per consumer group that are not yet
+            eligible (a future ``deliver_after``): backoffs and replays still
+            waiting for their release slot.
     """
 
     counts: Mapping[tuple[str, DeliveryStatus], int]
     oldest_pending_created_at: datetime | None
+    deferred: Mapping[str, int] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class FailedDeliveryFilter:
+    """Selects permanently failed deliveries; unset fields match everything.
+
+    Attributes:
+        consumer_group: Only this consumer group's deliveries.
+        error_contains: Case-insensitive substring of the recorded error.
+        failed_after: Failed at or after this time (inclusive).
+        failed_before: Failed before this time (exclusive).
+        exclude_consumer_groups: Never these consumer groups' deliveries.
+    """
+
+    consumer_group: str | None = None
+    error_contains: str | None = None
+    failed_after: datetime | None = None
+    failed_before: datetime | None = None
+    exclude_consumer_groups: frozenset[str] = frozenset()
+
+
+@dataclass(frozen=True)
+class FailedDelivery:
+    """A delivery that exhausted its retries (``status = 'failed'``)."""
+
+    id: str
+    event_id: str
+    event_type: str
+    consumer_group: str
+    error: str | None
+    retry_count: int
+    failed_at: datetime
 
 
 @dataclass(frozen=True)
@@ -253,6 +302,9 @@ class EventHandler(Generic[E], metaclass=_EventHandlerMeta):
         __poll_interval__: Seconds between polls when idle (default: 0.5)
         __max_retries__: Max retry attempts before marking failed (default: 3)
         __claim_timeout__: Seconds before claim considered stale (default: 300.0)
+        __replayable__: Whether failed deliveries may be requeued (default: True).
+            Set False when on_exhausted compensates: a replay would run again
+            on top of the compensation, which requeuing does not undo.
 
     Example (single event):
         class HandleRecordPublished(EventHandler[RecordPublished]):
@@ -280,6 +332,7 @@ class EventHandler(Generic[E], metaclass=_EventHandlerMeta):
     __max_retries__: ClassVar[int] = 3
     __claim_timeout__: ClassVar[float] = 300.0
     __concurrency__: ClassVar[int] = 1
+    __replayable__: ClassVar[bool] = True
 
     async def handle(self, event: E) -> None:
         """Handle a single event. Override for single-event processing.
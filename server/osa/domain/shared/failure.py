@@ -57,6 +57,7 @@ class RuntimeFailure(OSAError):
         exit_code: int | None = None,
         container_logs: str | None = None,
         oom_retries: int = 0,
+        oom_batch_mb: float | None = None,
     ) -> None:
         super().__init__(detail, code=kind.value)
         self.kind = kind
@@ -68,6 +69,8 @@ class RuntimeFailure(OSAError):
         # Memory bumps performed before HookService gave up on an OOM (#145).
         # Runners always raise with 0; HookService re-raises with the real count.
         self.oom_retries = oom_retries
+        # Input MB of the last sub-batch that OOMed, set alongside oom_retries.
+        self.oom_batch_mb = oom_batch_mb
 
 
 class DecisionKind(StrEnum):
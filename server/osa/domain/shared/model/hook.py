@@ -107,6 +107,19 @@ def parse_memory(memory: str) -> int:
             raise ValueError(f"Unknown memory unit: {unit}")
 
 
+_CPU_RE = re.compile(r"^(\d+(?:\.\d+)?)(m)?$")
+
+
+def parse_cpu(cpu: str) -> float:
+    """Parse a CPU quantity like '2', '0.5' or Kubernetes millicores '500m' to cores."""
+    match = _CPU_RE.match(cpu.strip().lower())
+    if not match:
+        raise ValueError(f"Invalid cpu format: {cpu}")
+
+    amount = float(match.group(1))
+    return amount / 1000 if match.group(2) else amount
+
+
 def format_memory(byte_count: int) -> str:
     """Format bytes to a compact memory string (e.g. '2g', '1536m')."""
     if byte_count % _GIB == 0:
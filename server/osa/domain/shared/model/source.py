@@ -91,6 +91,10 @@ class IngesterDefinition(ValueObject):
     limits: IngesterLimits = Field(default_factory=IngesterLimits)
     schedule: IngesterScheduleConfig | None = None
     initial_run: InitialRunConfig | None = None
+    # Capability declaration: the source can be listed as this many independent
+    # partitions (date/ID ranges). Each partition is sourced as its own session
+    # stream, told its slice via OSA_SHARD/OSA_SHARDS. 1 = not shardable.
+    shards: int = Field(default=1, ge=1, le=64)
     # Reproducibility anchor for the build that produced ``image`` (parity with
     # a hook's release ``source_ref``). ``None`` for ingesters predating the field.
     source_ref: str | None = None
@@ -12,3 +12,10 @@ SubscriptionRegistry = NewType("SubscriptionRegistry", dict[str, set[str]])
 Built at startup from the HANDLERS list by mapping each handler's
 ``__event_type__.__name__`` to the handler's ``__name__``.
 """
+
+NonReplayableGroups = NewType("NonReplayableGroups", frozenset[str])
+"""Consumer groups whose failed deliveries must not be requeued.
+
+The handlers that set ``__replayable__ = False``: their ``on_exhausted``
+already compensated for the failure, and requeuing does not undo it.
+"""
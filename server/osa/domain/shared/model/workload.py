@@ -0,0 +1,34 @@
+"""Who a container run is for — the unit of fair sharing in the ContainerScheduler."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import StrEnum
+
+
+class WorkSource(StrEnum):
+    """What a container run serves — the top level of fair sharing."""
+
+    DEPOSITION = "deposition"
+    INGEST = "ingest"
+
+    @property
+    def priority(self) -> int:
+        """Default admission priority: a deposition has a user waiting on it, so
+        it is admitted ahead of any queued ingest batch rather than merely
+        weighted above it."""
+        return 1 if self is WorkSource.DEPOSITION else 0
+
+
+@dataclass(frozen=True)
+class Workload:
+    """A container run's fair-share flow ``(source, convention)`` and priority."""
+
+    source: WorkSource
+    convention: str
+    priority: int = 0
+
+    @classmethod
+    def of(cls, source: WorkSource, convention: str) -> Workload:
+        """A workload at its source's default priority."""
+        return cls(source=source, convention=convention, priority=source.priority)
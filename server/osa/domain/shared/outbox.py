@@ -3,7 +3,13 @@
 from datetime import datetime
 from typing import TypeVar
 
-from osa.domain.shared.event import ClaimResult, Event
+from osa.domain.shared.event import (
+    ClaimResult,
+    DeliveryPriority,
+    Event,
+    FailedDelivery,
+    FailedDeliveryFilter,
+)
 from osa.domain.shared.model.subscription_registry import SubscriptionRegistry
 from osa.domain.shared.port.event_repository import EventRepository
 from osa.domain.shared.service import Service
@@ -25,7 +31,13 @@ class Outbox(Service):
     _repo: EventRepository
     _registry: SubscriptionRegistry
 
-    async def append(self, event: Event, *, deliver_after: datetime | None = None) -> None:
+    async def append(
+        self,
+        event: Event,
+        *,
+        deliver_after: datetime | None = None,
+        priority: int = DeliveryPriority.NORMAL,
+    ) -> None:
         """Add an event to the outbox for delivery.
 
         Creates one delivery row per consumer group subscribed to this event type.
@@ -34,11 +46,16 @@ class Outbox(Service):
         Args:
             event: The event to append.
             deliver_after: If set, deliveries won't be claimed until this time.
+            priority: Claim order within each consumer group — higher first
+                (see :class:`DeliveryPriority`).
         """
         event_type_name = type(event).__name__
         consumer_groups = self._registry.get(event_type_name, set())
         await self._repo.save_with_deliveries(
-            event, consumer_groups=consumer_groups, deliver_after=deliver_after
+            event,
+            consumer_groups=consumer_groups,
+            deliver_after=deliver_after,
+            priority=priority,
         )
 
     async def claim(
@@ -115,6 +132,40 @@ class Outbox(Service):
         """
         return await self._repo.reset_stale_deliveries(timeout_seconds)
 
+    async def failed_deliveries(
+        self, criteria: FailedDeliveryFilter, *, limit: int = 100, offset: int = 0
+    ) -> list[FailedDelivery]:
+        """Failed deliveries matching *criteria*, most recently failed first."""
+        return await self._repo.list_failed_deliveries(criteria, limit=limit, offset=offset)
+
+    async def count_failed(self, criteria: FailedDeliveryFilter) -> int:
+        """Number of failed deliveries matching *criteria*."""
+        return await self._repo.count_failed_deliveries(criteria)
+
+    async def requeue_failed(
+        self, criteria: FailedDeliveryFilter, *, limit: int, window_seconds: float
+    ) -> dict[str, int]:
+        """Requeue up to *limit* matching failed deliveries, released over *window_seconds*.
+
+        Returns:
+            Number of deliveries requeued per consumer group.
+        """
+        return await self._repo.requeue_failed_deliveries(
+            criteria, limit=limit, window_seconds=window_seconds
+        )
+
+    async def set_worker_count(self, consumer_group: str, workers: int) -> None:
+        """Set how many workers each process running *consumer_group* should run.
+
+        Worker pools pick the change up on their next concurrency sync, without
+        a restart.
+        """
+        await self._repo.set_worker_count(consumer_group, workers)
+
+    async def worker_counts(self) -> dict[str, int]:
+        """Per-consumer-group worker counts set at runtime (unset groups are absent)."""
+        return await self._repo.get_worker_counts()
+
     async def find_latest(self, event_type: type[E]) -> E | None:
         """Find the most recent event of a given type."""
         return await self._repo.find_latest_by_type(event_type)
@@ -3,7 +3,14 @@
 from datetime import datetime
 from typing import Protocol, TypeVar
 
-from osa.domain.shared.event import ClaimResult, DeliveryStats, Event, EventId
+from osa.domain.shared.event import (
+    ClaimResult,
+    DeliveryStats,
+    Event,
+    EventId,
+    FailedDelivery,
+    FailedDeliveryFilter,
+)
 
 E = TypeVar("E", bound=Event)
 
@@ -20,6 +27,7 @@ class EventRepository(Protocol):
         event: Event,
         consumer_groups: set[str],
         deliver_after: datetime | None = None,
+        priority: int = 0,
     ) -> None:
         """Save event to the append-only log and create delivery rows.
 
@@ -28,6 +36,7 @@ class EventRepository(Protocol):
             consumer_groups: Set of consumer group names to create deliveries for.
                 If empty, the event is saved without any delivery rows (audit-only).
             deliver_after: If set, deliveries won't be claimed until this time.
+            priority: Claim priority of the deliveries (higher is claimed first).
         """
         ...
 
@@ -79,7 +88,8 @@ class EventRepository(Protocol):
         """Claim pending deliveries for a specific consumer group.
 
         Atomically selects and locks delivery rows using FOR UPDATE SKIP LOCKED.
-        Joins to the events table to return the full event payload.
+        Joins to the events table to return the full event payload. Deliveries
+        are claimed highest priority first, oldest event first within a priority.
 
         Args:
             consumer_group: The handler class name claiming deliveries.
@@ -151,3 +161,44 @@ class EventRepository(Protocol):
             max_retries: Maximum retry attempts before marking as failed.
         """
         ...
+
+    async def list_failed_deliveries(
+        self,
+        criteria: FailedDeliveryFilter,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[FailedDelivery]:
+        """List failed deliveries matching *criteria*, most recently failed first."""
+        ...
+
+    async def count_failed_deliveries(self, criteria: FailedDeliveryFilter) -> int:
+        """Count failed deliveries matching *criteria*."""
+        ...
+
+    async def requeue_failed_deliveries(
+        self,
+        criteria: FailedDeliveryFilter,
+        *,
+        limit: int,
+        window_seconds: float,
+    ) -> dict[str, int]:
+        """Reset up to *limit* matching failed deliveries to pending, spread over a window.
+
+        Deliveries are released oldest failure first, their ``deliver_after``
+        evenly spaced across the next *window_seconds* so workers see a steady
+        trickle rather than the whole backlog at once. Retry counts restart
+        from zero; the last error is kept. Rows locked by a concurrent requeue
+        are skipped.
+
+        Returns:
+            Number of deliveries requeued per consumer group.
+        """
+        ...
+
+    async def set_worker_count(self, consumer_group: str, workers: int) -> None:
+        """Upsert the runtime worker count for a consumer group."""
+        ...
+
+    async def get_worker_counts(self) -> dict[str, int]:
+        """Runtime worker counts keyed by consumer group."""
+        ...
@@ -27,6 +27,9 @@ class IngesterInputs:
     limit: int | None = None
     offset: int = 0
     session: dict[str, Any] | None = None
+    # Which partition of a shardable source to list (see IngesterDefinition.shards).
+    shard: int = 0
+    shards: int = 1
 
 
 @dataclass(frozen=True)
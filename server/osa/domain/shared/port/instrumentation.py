@@ -1,16 +1,19 @@
 """OutboxInstrumentation port — a domain-probe for outbox-delivery telemetry.
 
 One method per business fact worth measuring (a delivery reached a terminal
-disposition). Consumed by the infrastructure worker and implemented by an OTel
-adapter; trivially no-op-able in tests. Synchronous (emission must never block
-dispatch) and keyword-only. Labels are typed enums so cardinality stays bounded.
+disposition, failed deliveries were requeued for replay). Consumed by the
+infrastructure worker and implemented by an OTel adapter; trivially
+no-op-able in tests. Synchronous (emission must never block dispatch) and
+keyword-only. Labels are typed enums so cardinality stays bounded.
 """
 
 from abc import abstractmethod
 from typing import Protocol
 
 from osa.domain.shared.event import DeliveryStatus
+from osa.domain.shared.model.hook import FeatureName
 from osa.domain.shared.model.workflow import StageOutcome, WorkflowName, WorkflowStage
+from osa.domain.shared.model.workload import WorkSource
 from osa.domain.shared.port import Port
 
 
@@ -29,6 +32,11 @@ class OutboxInstrumentation(Port, Protocol):
         """Record a delivery reaching a terminal disposition after dispatch."""
         ...
 
+    @abstractmethod
+    def deliveries_requeued(self, *, consumer_group: str, count: int) -> None:
+        """Record failed deliveries put back in the queue for replay."""
+        ...
+
 
 class WorkflowInstrumentation(Port, Protocol):
     """Domain-probe for workflow-stage outcomes.
@@ -45,3 +53,32 @@ class WorkflowInstrumentation(Port, Protocol):
     ) -> None:
         """Record a workflow stage concluding with the given outcome."""
         ...
+
+    @abstractmethod
+    def features_inserted(self, *, feature: FeatureName, rows: int, duration_s: float) -> None:
+        """Record one batch's rows inserted into one feature table, and how long it took."""
+        ...
+
+
+class SchedulerInstrumentation(Port, Protocol):
+    """Domain-probe for container-admission metrics (queue depth and wait).
+
+    Emitted by the :class:`~osa.domain.shared.scheduler.ContainerScheduler`,
+    labelled by :class:`WorkSource` so depositions waiting behind ingest
+    backlog are directly visible.
+    """
+
+    @abstractmethod
+    def queue_depth_changed(self, *, source: WorkSource, delta: int) -> None:
+        """Record tickets joining (+) or leaving (-) the admission queue."""
+        ...
+
+    @abstractmethod
+    def admitted(self, *, source: WorkSource, wait_s: float) -> None:
+        """Record one admission and how long it waited in the queue."""
+        ...
+
+    @abstractmethod
+    def admission_rejected(self, *, source: WorkSource) -> None:
+        """Record a launch refused because the admission queue was full."""
+        ...
@@ -0,0 +1,245 @@
+"""ContainerScheduler — process-wide admission for hook and ingester containers.
+
+Without it, whichever worker holds a delivery launches its container at once:
+a large ingest run's batches occupy every slot and a user's deposition
+validation waits behind them. Every container launch instead asks the
+scheduler for admission, describing *who* it runs for (:class:`Workload`) and
+*what* it needs (the release's or ingester's memory/cpu limits).
+
+Admission order:
+
+1. **Priority** — a higher :attr:`Workload.priority` is always admitted first.
+   Workloads built with :meth:`Workload.of` take their source's priority, so a
+   deposition is admitted ahead of every queued ingest batch.
+2. **Weighted fair queuing** — within a priority, tickets carry start-time
+   fair-queuing tags per flow ``(source, convention)``. A source's weight
+   (e.g. depositions 4, ingest 1) is split evenly across its active
+   conventions, so two concurrent ingest runs share the ingest share and
+   depositions keep theirs however deep the ingest backlog is. A flow's state
+   is dropped once it goes idle; it rejoins at the current virtual time.
+3. **Resource-aware packing** — a ticket is admitted when a slot is free and
+   its memory/cpu fit the remaining budget. A ticket that doesn't fit may be
+   passed by smaller ones (backfill) at most ``max_bypass`` times, after
+   which it holds the line until enough capacity drains. A ticket larger
+   than the whole budget runs alone.
+
+The admission queue is bounded: past ``max_queued`` waiting tickets a launch
+fails fast with a transient :class:`RuntimeFailure`, which the failure policy
+turns into a budgeted redelivery rather than an unbounded in-memory backlog.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+from collections import Counter
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+from osa.domain.shared.failure import FailureKind, RuntimeFailure
+from osa.domain.shared.model.hook import parse_cpu, parse_memory
+from osa.domain.shared.model.workload import WorkSource, Workload
+from osa.domain.shared.port.instrumentation import SchedulerInstrumentation
+
+
+DEFAULT_WEIGHTS: Mapping[WorkSource, float] = {
+    WorkSource.DEPOSITION: 4.0,
+    WorkSource.INGEST: 1.0,
+}
+
+_Flow = tuple[WorkSource, str]
+
+
+@dataclass(eq=False)
+class _Ticket:
+    workload: Workload
+    memory: int
+    cpu: float
+    start: float
+    finish: float
+    seq: int
+    enqueued_at: float
+    admitted: asyncio.Future[None] = field(repr=False)
+    bypassed: int = 0
+
+    @property
+    def flow(self) -> _Flow:
+        return (self.workload.source, self.workload.convention)
+
+    def order(self) -> tuple[int, float, int]:
+        return (-self.workload.priority, self.finish, self.seq)
+
+
+class ContainerScheduler:
+    """Process-wide admission queue for container launches (see module docstring).
+
+    ``slots`` caps concurrently admitted containers; ``memory`` (bytes) and
+    ``cpu`` (cores) are optional packing budgets — ``None`` leaves that
+    dimension unconstrained.
+    """
+
+    def __init__(
+        self,
+        *,
+        slots: int,
+        memory: int | None = None,
+        cpu: float | None = None,
+        max_queued: int = 256,
+        weights: Mapping[WorkSource, float] | None = None,
+        max_bypass: int = 8,
+        instrumentation: SchedulerInstrumentation | None = None,
+    ) -> None:
+        if slots < 1:
+            raise ValueError(f"scheduler slots must be >= 1, got {slots}")
+        self.slots = slots
+        self.memory = memory
+        self.cpu = cpu
+        self.max_queued = max_queued
+        self.max_bypass = max_bypass
+        self._weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self._instrumentation = instrumentation
+        self._queue: list[_Ticket] = []
+        self._running = 0
+        self._memory_used = 0
+        self._cpu_used = 0.0
+        self._virtual = 0.0
+        self._last_finish: dict[_Flow, float] = {}
+        self._active: Counter[_Flow] = Counter()
+        self._seq = itertools.count()
+
+    @property
+    def queued(self) -> int:
+        return len(self._queue)
+
+    @property
+    def running(self) -> int:
+        return self._running
+
+    @asynccontextmanager
+    async def admit(
+        self, workload: Workload, *, memory: str | int = 0, cpu: str | float = 0.0
+    ) -> AsyncIterator[None]:
+        """Hold an admission for the duration of the block.
+
+        *memory* accepts a limit string (``"2g"``) or bytes; *cpu* a quantity
+        string (``"0.5"``, ``"500m"``) or cores.
+        Raises a transient :class:`RuntimeFailure` when the queue is full.
+        """
+        ticket = self._enqueue(
+            workload,
+            parse_memory(memory) if isinstance(memory, str) else memory,
+            parse_cpu(cpu) if isinstance(cpu, str) else cpu,
+        )
+        try:
+            await ticket.admitted
+        except BaseException:
+            if ticket.admitted.done() and not ticket.admitted.cancelled():
+                self._release(ticket)
+            else:
+                self._withdraw(ticket)
+            raise
+        try:
+            yield
+        finally:
+            self._release(ticket)
+
+    # ── Queue mechanics ──
+
+    def _enqueue(self, workload: Workload, memory: int, cpu: float) -> _Ticket:
+        if len(self._queue) >= self.max_queued:
+            if self._instrumentation is not None:
+                self._instrumentation.admission_rejected(source=workload.source)
+            raise RuntimeFailure(
+                FailureKind.RUNTIME,
+                f"container admission queue full ({self.max_queued} waiting)",
+            )
+        flow = (workload.source, workload.convention)
+        self._active[flow] += 1
+        start = max(self._virtual, self._last_finish.get(flow, 0.0))
+        finish = start + 1.0 / self._flow_weight(workload.source)
+        self._last_finish[flow] = finish
+        ticket = _Ticket(
+            workload=workload,
+            memory=memory,
+            cpu=cpu,
+            start=start,
+            finish=finish,
+            seq=next(self._seq),
+            enqueued_at=time.monotonic(),
+            admitted=asyncio.get_running_loop().create_future(),
+        )
+        self._queue.append(ticket)
+        if self._instrumentation is not None:
+            self._instrumentation.queue_depth_changed(source=workload.source, delta=1)
+        self._dispatch()
+        return ticket
+
+    def _flow_weight(self, source: WorkSource) -> float:
+        """The source's weight, shared evenly by its active conventions."""
+        flows = sum(1 for (s, _), n in self._active.items() if s is source and n > 0)
+        return self._weights.get(source, 1.0) / max(flows, 1)
+
+    def _fits(self, ticket: _Ticket) -> bool:
+        if self._running >= self.slots:
+            return False
+        if self._running == 0:
+            return True  # nothing to share with: even an oversized ticket runs
+        if self.memory is not None and self._memory_used + ticket.memory > self.memory:
+            return False
+        if self.cpu is not None and self._cpu_used + ticket.cpu > self.cpu:
+            return False
+        return True
+
+    def _dispatch(self) -> None:
+        blocked: _Ticket | None = None
+        for ticket in sorted(self._queue, key=_Ticket.order):
+            if self._running >= self.slots:
+                break
+            if ticket.admitted.cancelled():
+                continue  # its waiter is unwinding and will withdraw it
+            if not self._fits(ticket):
+                blocked = blocked or ticket
+                continue
+            if blocked is not None:
+                if blocked.bypassed >= self.max_bypass:
+                    break  # the blocked ticket holds the line now
+                blocked.bypassed += 1
+            self._start(ticket)
+
+    def _start(self, ticket: _Ticket) -> None:
+        self._queue.remove(ticket)
+        self._running += 1
+        self._memory_used += ticket.memory
+        self._cpu_used += ticket.cpu
+        self._virtual = max(self._virtual, ticket.start)
+        ticket.admitted.set_result(None)
+        if self._instrumentation is not None:
+            source = ticket.workload.source
+            self._instrumentation.queue_depth_changed(source=source, delta=-1)
+            self._instrumentation.admitted(
+                source=source, wait_s=time.monotonic() - ticket.enqueued_at
+            )
+
+    def _release(self, ticket: _Ticket) -> None:
+        self._running -= 1
+        self._memory_used -= ticket.memory
+        self._cpu_used -= ticket.cpu
+        self._leave(ticket.flow)
+        self._dispatch()
+
+    def _withdraw(self, ticket: _Ticket) -> None:
+        """A waiter gave up (cancelled/timed out) before admission."""
+        self._queue.remove(ticket)
+        self._leave(ticket.flow)
+        if self._instrumentation is not None:
+            self._instrumentation.queue_depth_changed(source=ticket.workload.source, delta=-1)
+        self._dispatch()
+
+    def _leave(self, flow: _Flow) -> None:
+        """One of *flow*'s tickets is gone; forget the flow once it has none."""
+        self._active[flow] -= 1
+        if self._active[flow] <= 0:
+            del self._active[flow]
+            self._last_finish.pop(flow, None)
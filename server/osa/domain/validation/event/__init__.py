@@ -1,3 +1,4 @@
+from osa.domain.validation.event.hook_release_activated import HookReleaseActivated
 from osa.domain.validation.event.validation_completed import ValidationCompleted
 
-__all__ = ["ValidationCompleted"]
+__all__ = ["HookReleaseActivated", "ValidationCompleted"]
@@ -0,0 +1,14 @@
+from osa.domain.shared.event import Event, EventId
+from osa.domain.shared.model.hook import HookName
+from osa.domain.validation.model.hook_release import HookReleaseId
+
+
+class HookReleaseActivated(Event):
+    """Emitted when a hook's live pointer moves to a release (new or rolled back)."""
+
+    id: EventId
+    hook_name: HookName
+    release_id: HookReleaseId
+    version: int
+    image: str
+    digest: str
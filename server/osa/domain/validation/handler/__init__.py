@@ -0,0 +1,3 @@
+from osa.domain.validation.handler.prefetch_hook_image import PrefetchHookImage
+
+__all__ = ["PrefetchHookImage"]
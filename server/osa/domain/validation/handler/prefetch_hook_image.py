@@ -0,0 +1,31 @@
+"""PrefetchHookImage — pull a hook image as soon as its release goes live.
+
+Without it, the first batch after a deploy or rollback resolves (and possibly
+pulls) the image itself. The runners keep resolution outside the hook's timeout
+either way; prefetching takes it off the batch's critical path altogether.
+"""
+
+from osa.domain.shared.event import EventHandler
+from osa.domain.validation.event.hook_release_activated import HookReleaseActivated
+from osa.domain.validation.port.image_prefetcher import ImagePrefetcher
+from osa.infrastructure.logging import get_logger
+
+log = get_logger(__name__)
+
+
+class PrefetchHookImage(EventHandler[HookReleaseActivated]):
+    __max_retries__ = 2
+    # A cold pull of a large scientific image can take minutes.
+    __claim_timeout__ = 900.0
+
+    prefetcher: ImagePrefetcher
+
+    async def handle(self, event: HookReleaseActivated) -> None:
+        log.info(
+            "prefetching hook image {image}@{digest} for {hook} v{version}",
+            image=event.image,
+            digest=event.digest,
+            hook=event.hook_name,
+            version=event.version,
+        )
+        await self.prefetcher.prefetch(event.image, event.digest)
@@ -0,0 +1,45 @@
+"""Hook outcome memo keys — what a hook's per-record outcome depends on.
+
+A release's outcome for a record is a function of the record's metadata, its
+files, and the release itself. :func:`input_key` condenses the first two into
+one content hash; together with the release id it addresses a memoized
+outcome, so re-ingesting unchanged upstream data reuses earlier results
+instead of re-running containers.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from osa.domain.validation.model.batch_outcome import OutcomeStatus
+from osa.domain.validation.model.hook_input import HookRecord
+
+# Errors may be transient (or fixed upstream); only verdicts are reused.
+MEMOIZABLE = frozenset({OutcomeStatus.PASSED, OutcomeStatus.REJECTED})
+
+
+def input_key(metadata: Mapping[str, Any], file_digests: Mapping[str, str]) -> str:
+    """sha256 over a record's canonical metadata and ``{relpath: digest}`` files."""
+    canonical = json.dumps(
+        {"metadata": metadata, "files": sorted(file_digests.items())},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def input_keys(records: Iterable[HookRecord], file_digests: Mapping[str, str]) -> dict[str, str]:
+    """``{record_id: input_key}`` for a batch.
+
+    *file_digests* covers the whole batch as ``{"{record_id}/{relpath}": digest}``
+    — the layout of an ingest batch's ``files/`` directory.
+    """
+    per_record: dict[str, dict[str, str]] = {}
+    for path, digest in file_digests.items():
+        record_id, _, relpath = path.partition("/")
+        per_record.setdefault(record_id, {})[relpath] = digest
+    return {r.id: input_key(r.metadata, per_record.get(r.id, {})) for r in records}
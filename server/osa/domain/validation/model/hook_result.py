@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import datetime
 from enum import StrEnum
 
 from pydantic import Field
 
 from osa.domain.shared.failure import FailureKind, RuntimeFailure
-from osa.domain.shared.model.hook import HookIdentity, HookName
+from osa.domain.shared.model.hook import HookIdentity, HookName, format_memory, parse_memory
 from osa.domain.shared.model.value import ValueObject
+from osa.domain.validation.model.hook_input import HookRecord
 from osa.domain.validation.model.hook_release import HookRelease, HookReleaseId
 
 
@@ -39,6 +41,12 @@ class HookResult(ValueObject):
     """Number of times the run was retried with doubled memory after an OOM
     eviction (#145). 0 for a clean single-attempt run. Surfaced into the
     ``hook_runs`` provenance record."""
+    records_run: int = 0
+    """Records sent to containers by attempts that ran to completion — the
+    records ``duration_seconds`` was spent on. Excludes checkpointed and
+    memoized records, and sub-batches that OOMed."""
+    oom_batch_mb: float | None = None
+    """Input MB of the last sub-batch that OOMed; ``None`` without an OOM."""
 
 
 class HookExecution(ValueObject):
@@ -67,6 +75,13 @@ class HookExecution(ValueObject):
     (#145/#147). The ingestion handler persists this to a tenant-scoped artifact
     and records the locator as ``HookRun.log_ref``. ``None`` for passed hooks or
     when log capture itself failed."""
+    records: int = 0
+    input_mb: float = 0.0
+    memory: str | None = None
+    """Memory limit of the final attempt (the launch limit, doubled per OOM
+    retry) — with ``records``/``input_mb``, the hook_run's sizing sample."""
+    oom_batch_mb: float | None = None
+    """Input MB of the sub-batch the final limit was raised for."""
 
     @classmethod
     def completed(
@@ -76,6 +91,7 @@ class HookExecution(ValueObject):
         result: HookResult,
         started_at: datetime,
         finished_at: datetime,
+        records: Sequence[HookRecord] = (),
     ) -> HookExecution:
         return cls(
             hook_name=hook.name,
@@ -83,10 +99,15 @@ class HookExecution(ValueObject):
             status=result.status,
             started_at=started_at,
             finished_at=finished_at,
+            # Container time only: slot and scheduler waits are not the hook's pace.
             duration_s=result.duration_seconds,
             oom_retries=result.oom_retries,
             failure=None,
             error_message=result.error_message or result.rejection_reason,
+            records=result.records_run,
+            input_mb=sum(r.size_hint_mb for r in records),
+            memory=_final_memory(release, result.oom_retries),
+            oom_batch_mb=result.oom_batch_mb,
         )
 
     @classmethod
@@ -97,6 +118,7 @@ class HookExecution(ValueObject):
         failure: RuntimeFailure,
         started_at: datetime,
         finished_at: datetime,
+        records: Sequence[HookRecord] = (),
     ) -> HookExecution:
         # The failure already carries the observed facts — no isinstance tree.
         return cls(
@@ -110,6 +132,10 @@ class HookExecution(ValueObject):
             failure=failure.kind,
             error_message=str(failure),
             log_text=failure.container_logs,
+            records=len(records),
+            input_mb=sum(r.size_hint_mb for r in records),
+            memory=_final_memory(release, failure.oom_retries),
+            oom_batch_mb=failure.oom_batch_mb,
         )
 
     def as_failure(self) -> RuntimeFailure:
@@ -129,3 +155,8 @@ class HookExecution(ValueObject):
             self.error_message or "",
             oom_retries=self.oom_retries,
         )
+
+
+def _final_memory(release: HookRelease, oom_retries: int) -> str:
+    """The limit the last attempt ran with: each OOM retry doubles it."""
+    return format_memory(parse_memory(release.runtime.limits.memory) * 2**oom_retries)
@@ -52,6 +52,14 @@ class HookRun(Entity):
     Runs are recorded as a single insert at completion, so ``finished_at`` /
     ``duration_s`` / ``oom_retries`` are always known. ``log_ref`` is the only
     genuine optional (logs may not have been persisted).
+
+    ``records`` / ``input_mb`` / ``memory`` describe the batch's shape and the
+    memory limit of its final attempt — the samples adaptive sizing learns
+    from. ``memory`` is ``None`` on rows recorded before it was tracked.
+    On a finished run ``records`` counts only records a container ran to
+    completion, so ``duration_s / records`` is the hook's pace.
+    ``oom_batch_mb`` is the input MB of the last sub-batch that OOMed — what
+    the final limit was raised for.
     """
 
     id: HookRunId
@@ -62,3 +70,7 @@ class HookRun(Entity):
     duration_s: float
     oom_retries: int
     log_ref: str | None = None
+    records: int = 0
+    input_mb: float = 0.0
+    memory: str | None = None
+    oom_batch_mb: float | None = None
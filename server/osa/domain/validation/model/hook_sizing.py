@@ -0,0 +1,164 @@
+"""Adaptive hook sizing — learn a release's memory/duration profile from its runs.
+
+Without feedback every ingest repeats the same ladder: a batch OOMs at the
+release's declared limit, is retried at 2x, maybe 4x, and the next batch starts
+from the declared limit again. :class:`HookSizingPolicy` reads the release's
+recent ``hook_runs`` (batch size, input MB, final memory limit, OOM retries,
+duration) and recommends:
+
+- a starting memory limit — the level recent OOM-retried runs needed, capped;
+- sub-batch bounds — input MB per sub-batch so the capped limit still fits,
+  and records per sub-batch so one container run stays inside its timeout.
+
+Recommendations only ever *raise* memory above the release's declared limit:
+a run that never OOMed says nothing about how much less it could have used.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from osa.domain.shared.model.hook import HookName, format_memory, parse_memory
+from osa.domain.shared.model.value import ValueObject
+from osa.domain.validation.model.hook_input import HookRecord
+from osa.domain.validation.model.hook_release import HookRelease, HookReleaseId
+from osa.domain.validation.model.hook_run import HookRun, HookRunStatus
+
+_MIB = 1024 * 1024
+
+
+class HookSizing(ValueObject):
+    """Sizing recommendation for one hook release, derived from its recent runs."""
+
+    release_id: HookReleaseId
+    hook_name: HookName
+    declared_memory: str
+    runs_observed: int
+    oom_runs: int
+    memory: str | None = None
+    """Recommended starting limit; ``None`` keeps the release's own."""
+    memory_mb_per_input_mb: float | None = None
+    seconds_per_record: float | None = None
+    max_batch_records: int | None = None
+    max_batch_mb: float | None = None
+
+    @property
+    def oom_rate(self) -> float:
+        return self.oom_runs / self.runs_observed if self.runs_observed else 0.0
+
+    def apply(self, release: HookRelease) -> HookRelease:
+        """The release to launch with: its limit raised to the recommendation."""
+        if self.memory is None:
+            return release
+        if parse_memory(self.memory) <= parse_memory(release.runtime.limits.memory):
+            return release
+        return release.with_memory(self.memory)
+
+    def split(self, records: Sequence[HookRecord]) -> list[list[HookRecord]]:
+        """Cut *records* (in order) into sub-batches within the recommended bounds.
+
+        A single record larger than ``max_batch_mb`` still gets a sub-batch of
+        its own — it can't be split further, and the OOM ladder remains its
+        safety net.
+        """
+        chunks: list[list[HookRecord]] = []
+        current: list[HookRecord] = []
+        current_mb = 0.0
+        for record in records:
+            full = self.max_batch_records is not None and len(current) >= self.max_batch_records
+            heavy = (
+                self.max_batch_mb is not None
+                and current_mb + record.size_hint_mb > self.max_batch_mb
+            )
+            if current and (full or heavy):
+                chunks.append(current)
+                current, current_mb = [], 0.0
+            current.append(record)
+            current_mb += record.size_hint_mb
+        if current:
+            chunks.append(current)
+        return chunks
+
+
+@dataclass(frozen=True)
+class HookSizingPolicy:
+    """Turns a release's recent hook_runs into a :class:`HookSizing`.
+
+    ``window`` bounds how many recent runs are consulted, ``max_memory`` caps
+    any recommended limit (beyond it, batches are split instead), and
+    ``timeout_headroom`` is the fraction of the release timeout one sub-batch
+    is planned to use.
+    """
+
+    enabled: bool = True
+    window: int = 20
+    max_memory: str = "16g"
+    timeout_headroom: float = 0.8
+
+    def recommend(self, release: HookRelease, runs: Sequence[HookRun]) -> HookSizing:
+        limits = release.runtime.limits
+        declared = parse_memory(limits.memory)
+        cap = max(parse_memory(self.max_memory), declared)
+
+        # Rows recorded before sizing was tracked carry no batch shape. A run
+        # whose every sub-batch OOMed ran no records to completion but is still
+        # a memory sample.
+        samples = [r for r in runs if r.memory is not None and (r.records > 0 or r.oom_retries > 0)]
+
+        # Memory that sufficed for each OOM-retried run, with the input size of
+        # the sub-batch that needed it (the whole batch on rows that predate
+        # tracking it). A run that errored out of bumps needed more than its
+        # last limit; assume one more doubling.
+        needed: list[tuple[int, float]] = []
+        for run in samples:
+            if run.oom_retries == 0 or run.memory is None:
+                continue
+            limit = parse_memory(run.memory)
+            if run.status is HookRunStatus.ERROR:
+                limit *= 2
+            mb = run.oom_batch_mb if run.oom_batch_mb is not None else run.input_mb
+            needed.append((limit, mb))
+
+        memory: str | None = None
+        density: float | None = None
+        max_batch_mb: float | None = None
+        if needed:
+            peak = max(limit for limit, _ in needed)
+            if peak > declared:
+                memory = format_memory(_round_up_mib(min(peak, cap)))
+            densities = [limit / _MIB / mb for limit, mb in needed if mb > 0]
+            if densities:
+                density = max(densities)
+                max_batch_mb = cap / _MIB / density
+
+        # Slowest observed per-record pace among runs that finished: container
+        # seconds over the records those containers actually ran.
+        paces = [
+            r.duration_s / r.records
+            for r in samples
+            if r.status is not HookRunStatus.ERROR and r.records > 0
+        ]
+        pace = max(paces) if paces else None
+        max_batch_records: int | None = None
+        if pace:
+            budget = limits.timeout_seconds * self.timeout_headroom
+            max_batch_records = max(1, math.floor(budget / pace))
+
+        return HookSizing(
+            release_id=release.id,
+            hook_name=release.hook_name,
+            declared_memory=limits.memory,
+            runs_observed=len(samples),
+            oom_runs=sum(1 for r in samples if r.oom_retries > 0),
+            memory=memory,
+            memory_mb_per_input_mb=density,
+            seconds_per_record=pace,
+            max_batch_records=max_batch_records,
+            max_batch_mb=max_batch_mb,
+        )
+
+
+def _round_up_mib(byte_count: int) -> int:
+    return -(-byte_count // _MIB) * _MIB
@@ -1,8 +1,12 @@
 from osa.domain.validation.port.hook_runner import HookInputs, HookRunner
+from osa.domain.validation.port.image_prefetcher import ImagePrefetcher
+from osa.domain.validation.port.outcome_memo import HookOutcomeMemo
 from osa.domain.validation.port.repository import ValidationRunRepository
 
 __all__ = [
     "HookInputs",
+    "HookOutcomeMemo",
     "HookRunner",
+    "ImagePrefetcher",
     "ValidationRunRepository",
 ]
@@ -14,7 +14,7 @@ from typing import Protocol
 from osa.domain.shared.model.hook import HookName, OciConfig, TableFeatureSpec
 from osa.domain.shared.port import Port
 from osa.domain.validation.model.hook import Hook
-from osa.domain.validation.model.hook_release import HookRelease, ReleaseOutcome
+from osa.domain.validation.model.hook_release import HookRelease, HookReleaseId, ReleaseOutcome
 from osa.domain.validation.model.hook_run import HookRun, HookRunId
 
 
@@ -79,6 +79,11 @@ class HookRegistry(Port, Protocol):
         """Read a single hook_run by id. ``None`` if absent."""
         ...
 
+    @abstractmethod
+    async def recent_runs(self, release_id: HookReleaseId, limit: int) -> list[HookRun]:
+        """The release's latest *limit* hook_runs, most recently finished first."""
+        ...
+
     @abstractmethod
     async def resolve_live(self, names: list[HookName]) -> dict[HookName, HookRelease]:
         """Resolve each hook's current live release in one indexed lookup.
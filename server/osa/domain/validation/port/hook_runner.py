@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Protocol, runtime_checkable
 
 from osa.domain.shared.model.hook import HookIdentity
+from osa.domain.shared.model.workload import Workload
 from osa.domain.shared.port import Port
 from osa.domain.validation.model.hook_input import HookRecord
 from osa.domain.validation.model.hook_release import HookRelease
@@ -19,12 +20,15 @@ class HookInputs:
     Uses the unified batch contract: records is a list of HookRecord
     (1 for depositions, N for ingests).
     files_dirs maps record ID → directory containing that record's files.
+    workload says who the run is for; it schedules the container and is not
+    passed into it.
     """
 
     records: list[HookRecord]
     run_id: str
     files_dirs: dict[str, Path] = field(default_factory=dict)
     config: dict | None = None
+    workload: Workload | None = None
 
 
 @runtime_checkable
@@ -0,0 +1,21 @@
+"""Port for warming a hook release's image ahead of its first run."""
+
+from abc import abstractmethod
+from typing import Protocol, runtime_checkable
+
+from osa.domain.shared.port import Port
+
+
+@runtime_checkable
+class ImagePrefetcher(Port, Protocol):
+    """Make a hook image available where hooks run, before it is needed."""
+
+    @abstractmethod
+    async def prefetch(self, image: str, digest: str) -> None:
+        """Pull (or otherwise cache) ``image`` pinned at ``digest``.
+
+        Best-effort from the caller's point of view: a missed prefetch only
+        means the first run resolves the image itself. Raises on failure so
+        the event worker can retry.
+        """
+        ...
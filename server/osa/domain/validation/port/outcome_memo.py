@@ -0,0 +1,29 @@
+"""HookOutcomeMemo port — persistent per-release outcome memo."""
+
+from __future__ import annotations
+
+from abc import abstractmethod
+from collections.abc import Collection, Mapping
+from typing import Protocol
+
+from osa.domain.shared.port import Port
+from osa.domain.validation.model.batch_outcome import BatchRecordOutcome
+from osa.domain.validation.model.hook_release import HookReleaseId
+
+
+class HookOutcomeMemo(Port, Protocol):
+    """Outcomes keyed by ``(release_id, input_key)``; written once, never updated."""
+
+    @abstractmethod
+    async def get_many(
+        self, release_id: HookReleaseId, keys: Collection[str]
+    ) -> dict[str, BatchRecordOutcome]:
+        """The memoized outcomes among *keys*, keyed by input key."""
+        ...
+
+    @abstractmethod
+    async def put_many(
+        self, release_id: HookReleaseId, outcomes: Mapping[str, BatchRecordOutcome]
+    ) -> None:
+        """Memoize outcomes by input key; keys already present are left as is."""
+        ...
@@ -1,13 +1,17 @@
 """Storage port scoped to the validation domain."""
 
 from abc import abstractmethod
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Collection
 from pathlib import Path
 from typing import Protocol
 
 from osa.domain.shared.model.srn import DepositionSRN
 from osa.domain.shared.port import Port
-from osa.domain.validation.model.batch_outcome import BatchRecordOutcome, HookRecordId
+from osa.domain.validation.model.batch_outcome import (
+    BatchRecordOutcome,
+    HookRecordId,
+    OutcomeStatus,
+)
 
 
 class HookStoragePort(Port, Protocol):
@@ -18,6 +22,20 @@ class HookStoragePort(Port, Protocol):
         """Return the durable output directory for a hook's results."""
         ...
 
+    @abstractmethod
+    def get_hook_batch_dir(self, batch_id: str, hook_name: str) -> Path:
+        """Return the scratch work dir for one hook's coalesced validation batch.
+
+        Laid out like a deposition's (``<root>/hooks/<hook_name>``), so the
+        batch's outcomes read back through :meth:`read_batch_outcomes`.
+        """
+        ...
+
+    @abstractmethod
+    async def delete_hook_batch(self, batch_id: str) -> None:
+        """Remove a coalesced validation batch's scratch tree."""
+        ...
+
     @abstractmethod
     def get_files_dir(self, deposition_id: DepositionSRN) -> Path:
         """Return the directory containing data files for a deposition."""
@@ -59,6 +77,29 @@ class HookStoragePort(Port, Protocol):
         """Atomically write checkpoint JSONL to work_dir/_checkpoint.jsonl."""
         ...
 
+    @abstractmethod
+    async def read_outcomes_since(
+        self, work_dir: Path, offset: int, *, final: bool = False
+    ) -> tuple[list[BatchRecordOutcome], int]:
+        """Passed outcomes on ``{work_dir}/output/features.jsonl`` lines past byte *offset*.
+
+        Returns the outcomes and the offset to resume from. Lets the caller
+        tail a hook's features while its container is still writing them: a
+        trailing partial line waits for the next call, unless *final* (the
+        container has exited) makes it complete.
+        """
+        ...
+
+    @abstractmethod
+    async def read_output_outcomes(
+        self, work_dir: Path, *, statuses: Collection[OutcomeStatus] | None = None
+    ) -> dict[HookRecordId, BatchRecordOutcome]:
+        """Outcomes a hook run wrote to ``{work_dir}/output``, optionally only some statuses.
+
+        Parsed exactly as :meth:`read_outcomes_since` and :meth:`iter_batch_outcomes`.
+        """
+        ...
+
     @abstractmethod
     async def write_batch_outcomes(
         self,
@@ -74,3 +115,14 @@ class HookStoragePort(Port, Protocol):
     ) -> dict[HookRecordId, BatchRecordOutcome]:
         """Read JSONL batch outputs (features/rejections/errors) for a hook."""
         ...
+
+    @abstractmethod
+    def iter_batch_outcomes(
+        self,
+        output_dir: str,
+        hook_name: str,
+        *,
+        statuses: Collection[OutcomeStatus] | None = None,
+    ) -> AsyncIterator[BatchRecordOutcome]:
+        """Stream a hook's batch outcomes, optionally only the given statuses."""
+        ...
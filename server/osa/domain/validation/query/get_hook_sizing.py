@@ -0,0 +1,73 @@
+"""GetHookSizing — inspect the adaptive sizing a hook release runs with.
+
+``GET /hooks/{name}/sizing`` returns what :class:`HookSizingPolicy` currently
+recommends for the hook's live release (or ``?version=N``): the starting memory
+limit, sub-batch bounds, and the recent-run evidence behind them.
+"""
+
+from __future__ import annotations
+
+from osa.domain.auth.model.principal import Principal
+from osa.domain.auth.model.role import Role
+from osa.domain.shared.authorization.gate import at_least
+from osa.domain.shared.error import NotFoundError
+from osa.domain.shared.model.hook import HookName
+from osa.domain.shared.query import Query, QueryHandler, Result
+from osa.domain.validation.model.hook_release import HookReleaseId
+from osa.domain.validation.service.hook_registry import HookRegistryService
+from osa.domain.validation.service.hook_sizing import HookSizingService
+
+
+class GetHookSizing(Query):
+    name: HookName
+    version: int | None = None  # None = the live release
+
+
+class HookSizingDetail(Result):
+    hook_name: HookName
+    release_id: HookReleaseId
+    version: int
+    enabled: bool
+    runs_observed: int
+    oom_runs: int
+    oom_rate: float
+    declared_memory: str
+    recommended_memory: str | None
+    memory_mb_per_input_mb: float | None
+    seconds_per_record: float | None
+    max_batch_records: int | None
+    max_batch_mb: float | None
+
+
+class GetHookSizingHandler(QueryHandler[GetHookSizing, HookSizingDetail]):
+    __auth__ = at_least(Role.ADMIN)
+    principal: Principal
+    registry: HookRegistryService
+    sizing: HookSizingService
+
+    async def run(self, cmd: GetHookSizing) -> HookSizingDetail:
+        if cmd.version is None:
+            release = (await self.registry.resolve_live([cmd.name])).get(cmd.name)
+            if release is None:
+                raise NotFoundError(f"Hook {cmd.name!r} has no live release")
+        else:
+            release = await self.registry.get_release(cmd.name, cmd.version)
+            if release is None:
+                raise NotFoundError(f"Release not found: {cmd.name} v{cmd.version}")
+
+        sizing = await self.sizing.for_release(release)
+        return HookSizingDetail(
+            hook_name=release.hook_name,
+            release_id=release.id,
+            version=release.version,
+            enabled=self.sizing.policy.enabled,
+            runs_observed=sizing.runs_observed,
+            oom_runs=sizing.oom_runs,
+            oom_rate=sizing.oom_rate,
+            declared_memory=sizing.declared_memory,
+            recommended_memory=sizing.memory,
+            memory_mb_per_input_mb=sizing.memory_mb_per_input_mb,
+            seconds_per_record=sizing.seconds_per_record,
+            max_batch_records=sizing.max_batch_records,
+            max_batch_mb=sizing.max_batch_mb,
+        )
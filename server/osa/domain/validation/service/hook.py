@@ -8,11 +8,33 @@ Checkpoints partial progress so crash recovery skips completed records.
 Sorting assumption: hooks process records in input order and write output
 incrementally (features.jsonl line by line). Sorting by file size ascending
 maximizes checkpoint progress before a potential OOM on a large record.
+
+A batch's hooks run concurrently: each reads the same read-only inputs and
+writes only its own work dir. A convention may declare an ordering between
+hooks; otherwise batch latency approaches the slowest hook, not the sum.
+Process-wide, :class:`HookSlots` caps how many hooks execute at once, and
+each container launch (every OOM retry and sub-batch included) is admitted by
+the shared :class:`ContainerScheduler` at the limits it launches with, fairly
+against other conventions' hooks, deposition validations, and ingesters.
+
+Given a :class:`HookSizing` learned from the release's past runs, a hook
+launches at the recommended memory limit and oversized batches are run as
+sequential sub-batches in the same work dir, merged through the checkpoint
+exactly as an OOM retry's partial output is.
+
+With :attr:`HookService.output_tail_interval` set, features.jsonl is tailed
+while the container runs: complete lines are parsed and checkpointed as they
+land, so a worker crash or OOM loses at most one interval of output, and the
+post-exit read only covers what was written since the last poll.
 """
 
+import asyncio
+import contextlib
 import json
-from collections.abc import Iterable
+from collections.abc import Collection, Iterable, Mapping
+from dataclasses import replace
 from datetime import UTC, datetime
+from graphlib import TopologicalSorter
 from pathlib import Path
 
 from osa.domain.shared.failure import (
@@ -23,6 +45,8 @@ from osa.domain.shared.failure import (
     RuntimeFailure,
 )
 from osa.domain.shared.model.hook import HookIdentity, HookName
+from osa.domain.shared.model.workload import Workload, WorkSource
+from osa.domain.shared.scheduler import ContainerScheduler
 from osa.domain.shared.service import Service
 from osa.domain.validation.model.hook_release import HookRelease
 from osa.domain.validation.model.batch_outcome import (
@@ -32,12 +56,37 @@ from osa.domain.validation.model.batch_outcome import (
 )
 from osa.domain.validation.model.hook_input import HookRecord
 from osa.domain.validation.model.hook_result import HookExecution, HookResult, HookStatus
+from osa.domain.validation.model.hook_sizing import HookSizing
 from osa.domain.validation.port.hook_runner import HookInputs, HookRunner
 from osa.domain.validation.port.storage import HookStoragePort
 from osa.infrastructure.logging import get_logger
 
 log = get_logger(__name__)
 
+# Runs whose caller didn't say who they are for share the lowest-weight flow.
+_UNATTRIBUTED = Workload.of(WorkSource.INGEST, "")
+
+
+class HookSlots:
+    """Process-wide cap on concurrently executing hooks.
+
+    Shared by every batch in the process (``WorkerConfig.hook_concurrency``),
+    so fanning a batch's hooks out never exceeds the container budget the
+    ProcessBatch worker count was sized for.
+    """
+
+    def __init__(self, limit: int) -> None:
+        if limit < 1:
+            raise ValueError(f"hook slot limit must be >= 1, got {limit}")
+        self.limit = limit
+        self._semaphore = asyncio.Semaphore(limit)
+
+    async def __aenter__(self) -> None:
+        await self._semaphore.acquire()
+
+    async def __aexit__(self, *exc: object) -> None:
+        self._semaphore.release()
+
 
 class HookService(Service):
     """Executes a hook with OOM retry, checkpointing, and finalization."""
@@ -45,6 +94,12 @@ class HookService(Service):
     hook_runner: HookRunner
     hook_storage: HookStoragePort
     failure_policy: FailurePolicy
+    # None = no process-wide cap (tests, single-hook deposition runs).
+    hook_slots: HookSlots | None = None
+    # None = launch containers without admission (tests).
+    scheduler: ContainerScheduler | None = None
+    # Seconds between reads of a running hook's features.jsonl; None = read after exit.
+    output_tail_interval: float | None = None
 
     async def run_hook(
         self,
@@ -52,6 +107,8 @@ class HookService(Service):
         release: HookRelease,
         inputs: HookInputs,
         work_dir: Path,
+        sizing: HookSizing | None = None,
+        known: Mapping[HookRecordId, BatchRecordOutcome] | None = None,
     ) -> HookResult:
         """Run a single hook against a batch of records, retrying on OOM.
 
@@ -59,6 +116,13 @@ class HookService(Service):
         after the first attempt. On OOM, consults the FailurePolicy: retry with
         doubled memory while the bump budget lasts, checkpointing partial
         progress between attempts; then give up with the real bump count.
+
+        With *sizing*, the records run as sub-batches within its bounds, one
+        container run each, checkpointing between them. *release* is launched
+        as given — apply the sizing's memory to it beforehand.
+
+        *known* outcomes (memoized for identical input under this release) are
+        taken as already done, like checkpointed ones: no container runs for them.
         """
         records = inputs.records
         if not records:
@@ -70,10 +134,12 @@ class HookService(Service):
 
         # Load checkpoint (crash recovery)
         outcomes = _load_checkpoint(work_dir)
+        for rid, outcome in (known or {}).items():
+            outcomes.setdefault(rid, outcome)
         remaining = _sort_by_size(r for r in records if r.id not in outcomes)
 
         if not remaining:
-            # All records already checkpointed
+            # All records already checkpointed (or memoized)
             await self.hook_storage.write_batch_outcomes(work_dir, outcomes)
             return HookResult(
                 hook_name=hook.name,
@@ -83,25 +149,28 @@ class HookService(Service):
 
         current_release = release
         total_duration = 0.0
+        records_run = 0
         oom_retries = 0
+        oom_batch_mb: float | None = None
+        # Records of sub-batches that already ran to completion.
+        finished: set[str] = set()
 
         while True:
-            attempt_inputs = HookInputs(
-                records=remaining,
-                run_id=inputs.run_id,
-                files_dirs=inputs.files_dirs,
-                config=inputs.config,
-            )
+            attempt = sizing.split(remaining)[0] if sizing is not None else remaining
+            attempt_inputs = replace(inputs, records=attempt)
 
             try:
-                result = await self.hook_runner.run(hook, current_release, attempt_inputs, work_dir)
+                result = await self._run_container(
+                    hook, current_release, attempt_inputs, work_dir, outcomes
+                )
             except RuntimeFailure as exc:
                 if exc.kind is not FailureKind.OOM:
                     # Non-OOM failures propagate; disposition is decided upstream.
                     raise
+                oom_batch_mb = sum(r.size_hint_mb for r in attempt)
 
                 # Read any partial output written before OOM
-                new_outcomes = _read_output_dir(work_dir)
+                new_outcomes = await self.hook_storage.read_output_outcomes(work_dir)
                 for rid, outcome in new_outcomes.items():
                     if rid not in outcomes:
                         outcomes[rid] = outcome
@@ -109,7 +178,9 @@ class HookService(Service):
                 # Checkpoint what we have so far
                 await self.hook_storage.write_checkpoint(work_dir, outcomes)
 
-                remaining = _sort_by_size(r for r in records if r.id not in outcomes)
+                remaining = _sort_by_size(
+                    r for r in records if r.id not in outcomes and r.id not in finished
+                )
                 if not remaining:
                     break
 
@@ -142,13 +213,18 @@ class HookService(Service):
                     f"OOM after {oom_retries} retries "
                     f"(last limit: {current_release.runtime.limits.memory})",
                     oom_retries=oom_retries,
+                    oom_batch_mb=oom_batch_mb,
                     container_logs=exc.container_logs,
                 )
 
             total_duration += result.duration_seconds
+            records_run += len(attempt)
 
-            # Read any output written by this attempt
-            new_outcomes = _read_output_dir(work_dir)
+            # Read any output written by this attempt (features already tailed)
+            new_outcomes = await self.hook_storage.read_output_outcomes(
+                work_dir,
+                statuses=_UNTAILED if self.output_tail_interval is not None else None,
+            )
             for rid, outcome in new_outcomes.items():
                 if rid not in outcomes:
                     outcomes[rid] = outcome
@@ -162,10 +238,16 @@ class HookService(Service):
                     rejection_reason=result.rejection_reason,
                     duration_seconds=total_duration,
                     oom_retries=oom_retries,
+                    records_run=records_run,
+                    oom_batch_mb=oom_batch_mb,
                 )
-            else:
-                # Success (PASSED)
+            # Success (PASSED). The attempt's records are done, whether or not
+            # the hook wrote an outcome for each; move on to the next sub-batch.
+            finished.update(r.id for r in attempt)
+            remaining = [r for r in remaining if r.id not in finished]
+            if not remaining:
                 break
+            await self.hook_storage.write_checkpoint(work_dir, outcomes)
 
         # Finalize: write canonical output files
         await self.hook_storage.write_batch_outcomes(work_dir, outcomes)
@@ -176,39 +258,177 @@ class HookService(Service):
             status=HookStatus.PASSED,
             duration_seconds=total_duration,
             oom_retries=oom_retries,
+            records_run=records_run,
+            oom_batch_mb=oom_batch_mb,
         )
 
+    async def _run_container(
+        self,
+        hook: HookIdentity,
+        release: HookRelease,
+        inputs: HookInputs,
+        work_dir: Path,
+        outcomes: dict[HookRecordId, BatchRecordOutcome],
+    ) -> HookResult:
+        """One container run. When tailing, its features are staged into *outcomes*."""
+        interval = self.output_tail_interval
+        if interval is None:
+            return await self._launch(hook, release, inputs, work_dir)
+
+        tail = _OutputTail(self.hook_storage, work_dir)
+        follower = asyncio.create_task(self._follow(tail, interval, work_dir, outcomes))
+        try:
+            result = await self._launch(hook, release, inputs, work_dir)
+        finally:
+            follower.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await follower
+        # Lines written between the last poll and exit.
+        _stage(outcomes, await tail.poll(final=True))
+        return result
+
+    async def _launch(
+        self, hook: HookIdentity, release: HookRelease, inputs: HookInputs, work_dir: Path
+    ) -> HookResult:
+        """Run the container once the scheduler admits it at *release*'s limits."""
+        if self.scheduler is None:
+            return await self.hook_runner.run(hook, release, inputs, work_dir)
+        limits = release.runtime.limits
+        async with self.scheduler.admit(
+            inputs.workload or _UNATTRIBUTED, memory=limits.memory, cpu=limits.cpu
+        ):
+            return await self.hook_runner.run(hook, release, inputs, work_dir)
+
+    async def _follow(
+        self,
+        tail: "_OutputTail",
+        interval: float,
+        work_dir: Path,
+        outcomes: dict[HookRecordId, BatchRecordOutcome],
+    ) -> None:
+        try:
+            while True:
+                await asyncio.sleep(interval)
+                if _stage(outcomes, await tail.poll()):
+                    await self.hook_storage.write_checkpoint(work_dir, outcomes)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            # Tailing is an optimization; the post-exit drain still reads from
+            # the last offset, so nothing is lost by stopping early.
+            log.warn("output tail stopped for {work_dir}: {error}", work_dir=work_dir, error=exc)
+
     async def run_hooks_for_batch(
         self,
         hook_releases: list[tuple[HookIdentity, HookRelease]],
         inputs: HookInputs,
         work_dirs: dict[HookName, Path],
+        depends_on: Mapping[HookName, Collection[HookName]] | None = None,
+        sizing: Mapping[HookName, HookSizing] | None = None,
+        known: Mapping[HookName, Mapping[HookRecordId, BatchRecordOutcome]] | None = None,
     ) -> list[HookExecution]:
-        """Run multiple hooks sequentially for a batch of records.
+        """Run multiple hooks concurrently for a batch of records.
 
         *hook_releases* pairs each hook identity with the release resolved for
         this run (snapshot, R8). work_dirs maps hook_name → output directory.
+        *depends_on* maps a hook to the hooks it must run after; edges to hooks
+        outside this batch are ignored. Unconstrained hooks start together,
+        bounded by :attr:`hook_slots`. Executions are returned in input order.
+        *sizing* maps a hook to the recommendation its run is launched with;
+        *known* to outcomes it can reuse without running (see :meth:`run_hook`).
 
         Errors are **values, not control flow**: a hook that raises is caught and
         recorded as a failed :class:`HookExecution` (with its observed cause
         FailureKind) rather than aborting the batch — so a failing hook never
-        discards its siblings' outcomes. Each execution carries *its own*
-        wall-clock window.
+        discards its siblings' outcomes, and its dependents still run. Each
+        execution carries *its own* wall-clock window, opened once it holds a slot.
         """
-        executions: list[HookExecution] = []
-        for hook, release in hook_releases:
-            work_dir = work_dirs[hook.name]
-            started_at = datetime.now(UTC)
-            try:
-                result = await self.run_hook(hook, release, inputs, work_dir)
-                finished_at = datetime.now(UTC)
-                executions.append(
-                    HookExecution.completed(hook, release, result, started_at, finished_at)
+        by_name = {hook.name: (hook, release) for hook, release in hook_releases}
+        depends_on = depends_on or {}
+        sizing = sizing or {}
+        known = known or {}
+        sorter: TopologicalSorter[HookName] = TopologicalSorter(
+            {name: [d for d in depends_on.get(name, ()) if d in by_name] for name in by_name}
+        )
+        sorter.prepare()  # CycleError (a ValueError) before any hook starts
+
+        executions: dict[HookName, HookExecution] = {}
+        running: dict[asyncio.Task[HookExecution], HookName] = {}
+        try:
+            while sorter.is_active():
+                for name in sorter.get_ready():
+                    hook, release = by_name[name]
+                    task = asyncio.create_task(
+                        self._execute(
+                            hook,
+                            release,
+                            inputs,
+                            work_dirs[name],
+                            sizing.get(name),
+                            known.get(name),
+                        ),
+                        name=f"hook-{name.root}",
+                    )
+                    running[task] = name
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = running.pop(task)
+                    executions[name] = task.result()
+                    sorter.done(name)
+        finally:
+            # An unexpected (non-RuntimeFailure) error propagates as before;
+            # don't leave sibling hooks running unobserved.
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.wait(running)
+        return [executions[hook.name] for hook, _ in hook_releases]
+
+    async def _execute(
+        self,
+        hook: HookIdentity,
+        release: HookRelease,
+        inputs: HookInputs,
+        work_dir: Path,
+        sizing: HookSizing | None,
+        known: Mapping[HookRecordId, BatchRecordOutcome] | None,
+    ) -> HookExecution:
+        if sizing is not None:
+            sized = sizing.apply(release)
+            if sized is not release:
+                log.info(
+                    "Sizing hook={hook_name}: memory {declared} -> {memory} "
+                    "({oom_runs}/{runs} recent runs OOMed)",
+                    hook_name=hook.name,
+                    declared=release.runtime.limits.memory,
+                    memory=sized.runtime.limits.memory,
+                    oom_runs=sizing.oom_runs,
+                    runs=sizing.runs_observed,
                 )
-            except RuntimeFailure as exc:
-                finished_at = datetime.now(UTC)
-                executions.append(HookExecution.failed(hook, release, exc, started_at, finished_at))
-        return executions
+            release = sized
+        if self.hook_slots is None:
+            return await self._timed_execution(hook, release, inputs, work_dir, sizing, known)
+        async with self.hook_slots:
+            return await self._timed_execution(hook, release, inputs, work_dir, sizing, known)
+
+    async def _timed_execution(
+        self,
+        hook: HookIdentity,
+        release: HookRelease,
+        inputs: HookInputs,
+        work_dir: Path,
+        sizing: HookSizing | None,
+        known: Mapping[HookRecordId, BatchRecordOutcome] | None,
+    ) -> HookExecution:
+        # Memoized records never reach a container: the execution's shape (its
+        # sizing sample) covers only the records this hook actually ran.
+        ran = [r for r in inputs.records if r.id not in (known or {})]
+        started_at = datetime.now(UTC)
+        try:
+            result = await self.run_hook(hook, release, inputs, work_dir, sizing, known)
+        except RuntimeFailure as exc:
+            return HookExecution.failed(hook, release, exc, started_at, datetime.now(UTC), ran)
+        return HookExecution.completed(hook, release, result, started_at, datetime.now(UTC), ran)
 
 
 def _sort_by_size(records: Iterable[HookRecord]) -> list[HookRecord]:
@@ -241,38 +461,41 @@ def _load_checkpoint(work_dir: Path) -> dict[HookRecordId, BatchRecordOutcome]:
     return outcomes
 
 
-def _read_output_dir(work_dir: Path) -> dict[HookRecordId, BatchRecordOutcome]:
-    """Read hook output files (features.jsonl, rejections.jsonl, errors.jsonl)."""
-    output_dir = work_dir / "output"
-    outcomes: dict[HookRecordId, BatchRecordOutcome] = {}
+# With tailing on, features.jsonl is already staged; only these are read after exit.
+_UNTAILED = frozenset({OutcomeStatus.REJECTED, OutcomeStatus.ERRORED})
 
-    for filename, status, field_map in [
-        ("features.jsonl", OutcomeStatus.PASSED, {"features": "features"}),
-        ("rejections.jsonl", OutcomeStatus.REJECTED, {"reason": "reason"}),
-        ("errors.jsonl", OutcomeStatus.ERRORED, {"error": "error", "retryable": "retryable"}),
-    ]:
-        path = output_dir / filename
-        if not path.exists():
-            continue
-        for line in path.open():
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                data = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            raw_id = data.get("id")
-            if not raw_id:
-                continue
-            record_id = HookRecordId(raw_id)
-            kwargs: dict = {"record_id": record_id, "status": status}
-            for src, dst in field_map.items():
-                if src in data:
-                    kwargs[dst] = data[src]
-            outcomes[record_id] = BatchRecordOutcome(**kwargs)
 
-    return outcomes
+class _OutputTail:
+    """Byte cursor over a running hook's features.jsonl (written append-only)."""
+
+    def __init__(self, storage: HookStoragePort, work_dir: Path) -> None:
+        self._storage = storage
+        self._work_dir = work_dir
+        self.offset = 0
+
+    async def poll(self, *, final: bool = False) -> dict[HookRecordId, BatchRecordOutcome]:
+        """Outcomes on lines completed since the last poll; a partial line waits.
+
+        With *final* (the container has exited) an unterminated last line is
+        complete too and is parsed.
+        """
+        outcomes, self.offset = await self._storage.read_outcomes_since(
+            self._work_dir, self.offset, final=final
+        )
+        return {outcome.record_id: outcome for outcome in outcomes}
+
+
+def _stage(
+    outcomes: dict[HookRecordId, BatchRecordOutcome],
+    fresh: Mapping[HookRecordId, BatchRecordOutcome],
+) -> bool:
+    """Merge *fresh* outcomes for records not yet done. True if any were added."""
+    added = False
+    for rid, outcome in fresh.items():
+        if rid not in outcomes:
+            outcomes[rid] = outcome
+            added = True
+    return added
 
 
 def _cleanup_checkpoint(work_dir: Path) -> None:
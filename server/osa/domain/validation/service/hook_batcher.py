@@ -0,0 +1,271 @@
+"""HookBatcher — coalesce concurrent deposition validations into batched hook runs.
+
+Each deposition is validated as a one-record batch, so a burst of submissions
+for one convention pays container startup once per deposition per hook. With
+batching enabled, concurrent single-record runs of the same hook release — for
+depositions of the same convention and hook set — gather for up to ``window``
+seconds (or until ``max_records`` have joined) and run as one container over
+all their records, in a scratch work dir of their own.
+
+Each record's outcome is then fanned back to its deposition's work dir, as the
+canonical output files a solo run would have written, and each caller gets its
+own :class:`HookResult` (a ``REJECTED`` record outcome rejects only that
+deposition). The per-deposition contract is otherwise untouched: hook runs,
+``run.json`` provenance and the ``VALIDATED`` checkpoint are still recorded per
+deposition by :class:`~osa.domain.validation.service.validation.ValidationService`.
+
+Whenever the batch can't be attributed record by record, the affected
+depositions run solo instead, exactly as without batching:
+
+- the batched container fails, or rejects the run as a whole;
+- a record comes back ``ERRORED``;
+- a deposition's work dir holds a checkpoint from an earlier attempt.
+
+A batch outlives the callers that joined it — the first may return (or be
+cancelled) while later members still fall back to solo runs — so it never runs
+on a caller's unit-of-work-scoped :class:`HookService`. Each flushed batch opens
+a scope of its own through ``hook_service_scope`` and runs entirely inside it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Sequence
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass, field
+from pathlib import Path
+from uuid import uuid4
+
+from osa.domain.shared.failure import RuntimeFailure
+from osa.domain.shared.model.hook import HookIdentity, HookName
+from osa.domain.validation.model.batch_outcome import (
+    BatchRecordOutcome,
+    HookRecordId,
+    OutcomeStatus,
+)
+from osa.domain.validation.model.hook_release import HookRelease
+from osa.domain.validation.model.hook_result import HookResult, HookStatus
+from osa.domain.validation.port.hook_runner import HookInputs
+from osa.domain.validation.service.hook import HookService
+from osa.infrastructure.logging import get_logger
+
+log = get_logger(__name__)
+
+# (convention, hook set, release id)
+_Key = tuple[str, tuple[str, ...], str]
+
+# Opens a dedicated scope and yields a HookService valid for its duration.
+HookServiceScope = Callable[[], AbstractAsyncContextManager[HookService]]
+
+
+@dataclass(eq=False)
+class _Member:
+    inputs: HookInputs
+    work_dir: Path
+    result: asyncio.Future[HookResult]
+
+
+@dataclass(eq=False)
+class _Batch:
+    hook: HookIdentity
+    release: HookRelease
+    members: list[_Member] = field(default_factory=list)
+    timer: asyncio.TimerHandle | None = None
+    flushed: bool = False
+
+
+class HookBatcher:
+    """Process-wide coalescing of single-record hook runs (see module docstring).
+
+    Disabled, :meth:`run_hook` is a plain :meth:`HookService.run_hook`.
+    Enabled, it needs ``hook_service_scope`` to run flushed batches in.
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = False,
+        window: float = 0.5,
+        max_records: int = 8,
+        hook_service_scope: HookServiceScope | None = None,
+    ):
+        if max_records < 1:
+            raise ValueError(f"max_records must be >= 1, got {max_records}")
+        if enabled and hook_service_scope is None:
+            raise ValueError("batching needs a hook_service_scope to run batches in")
+        self.enabled = enabled
+        self._hook_service_scope = hook_service_scope
+        self.window = window
+        self.max_records = max_records
+        self._open: dict[_Key, _Batch] = {}
+        self._running: set[asyncio.Task[None]] = set()
+
+    async def run_hook(
+        self,
+        hook_service: HookService,
+        hook: HookIdentity,
+        release: HookRelease,
+        inputs: HookInputs,
+        work_dir: Path,
+        *,
+        hook_set: Sequence[HookName],
+    ) -> HookResult:
+        """Run *hook* for one deposition, batched with concurrent ones when enabled.
+
+        *hook_service* runs it when it isn't batched; a batch runs on its own.
+        """
+        if (
+            not self.enabled
+            or len(inputs.records) != 1
+            or (work_dir / "_checkpoint.jsonl").exists()
+        ):
+            return await hook_service.run_hook(hook, release, inputs, work_dir)
+
+        loop = asyncio.get_running_loop()
+        convention = inputs.workload.convention if inputs.workload is not None else ""
+        key: _Key = (convention, tuple(name.root for name in hook_set), str(release.id))
+        batch = self._open.get(key)
+        if batch is None:
+            batch = self._open[key] = _Batch(hook, release)
+            batch.timer = loop.call_later(self.window, self._flush, key, batch)
+        member = _Member(inputs, work_dir, loop.create_future())
+        batch.members.append(member)
+        if len(batch.members) >= self.max_records:
+            self._flush(key, batch)
+
+        try:
+            # Shielded: the batch owns the future and resolves it for whoever
+            # is still waiting; one caller's cancellation mustn't break that.
+            return await asyncio.shield(member.result)
+        except asyncio.CancelledError:
+            if not batch.flushed:
+                batch.members.remove(member)
+            else:
+                # Nobody awaits this result any more; retrieve a failure set
+                # on it so it isn't reported as never retrieved.
+                member.result.add_done_callback(_consume)
+            raise
+
+    def _flush(self, key: _Key, batch: _Batch) -> None:
+        if batch.flushed:
+            return
+        batch.flushed = True
+        if batch.timer is not None:
+            batch.timer.cancel()
+        if self._open.get(key) is batch:
+            del self._open[key]
+        if not batch.members:
+            return
+        task = asyncio.create_task(self._run(batch), name=f"hook-batch-{batch.hook.name.root}")
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: _Batch) -> None:
+        assert self._hook_service_scope is not None
+        try:
+            async with self._hook_service_scope() as hook_service:
+                if len(batch.members) == 1:
+                    await self._run_solo(hook_service, batch, batch.members)
+                else:
+                    await self._run_batched(hook_service, batch)
+        except Exception as exc:
+            for member in batch.members:
+                if not member.result.done():
+                    member.result.set_exception(exc)
+        except BaseException:
+            for member in batch.members:
+                member.result.cancel()
+            raise
+
+    async def _run_solo(
+        self, hook_service: HookService, batch: _Batch, members: Sequence[_Member]
+    ) -> None:
+        async def solo(member: _Member) -> None:
+            try:
+                result = await hook_service.run_hook(
+                    batch.hook, batch.release, member.inputs, member.work_dir
+                )
+            except Exception as exc:
+                member.result.set_exception(exc)
+            else:
+                member.result.set_result(result)
+
+        await asyncio.gather(*(solo(member) for member in members))
+
+    async def _run_batched(self, hook_service: HookService, batch: _Batch) -> None:
+        members = batch.members
+        storage = hook_service.hook_storage
+        batch_id = uuid4().hex
+        scratch = storage.get_hook_batch_dir(batch_id, batch.hook.name.root)
+        files_dirs = {rid: d for m in members for rid, d in m.inputs.files_dirs.items()}
+        inputs = HookInputs(
+            records=[m.inputs.records[0] for m in members],
+            run_id=f"batch_{batch_id}",
+            files_dirs=files_dirs,
+            config=members[0].inputs.config,
+            workload=members[0].inputs.workload,
+        )
+        log.info(
+            "Validating {count} depositions in one run of hook={hook_name}",
+            count=len(members),
+            hook_name=batch.hook.name,
+        )
+        try:
+            try:
+                result: HookResult | None = await hook_service.run_hook(
+                    batch.hook, batch.release, inputs, scratch
+                )
+            except RuntimeFailure as exc:
+                log.warn(
+                    "Batched run of hook={hook_name} failed ({error}); validating solo",
+                    hook_name=batch.hook.name,
+                    error=str(exc),
+                )
+                result = None
+            if result is None or result.status is not HookStatus.PASSED:
+                await self._run_solo(hook_service, batch, members)
+                return
+
+            outcomes = await storage.read_batch_outcomes(
+                str(scratch.parent.parent), batch.hook.name.root
+            )
+            unattributed: list[_Member] = []
+            for member in members:
+                rid = HookRecordId(member.inputs.records[0].id)
+                outcome = outcomes.get(rid)
+                if outcome is not None and outcome.status is OutcomeStatus.ERRORED:
+                    unattributed.append(member)
+                    continue
+                await storage.write_batch_outcomes(
+                    member.work_dir, {rid: outcome} if outcome is not None else {}
+                )
+                member.result.set_result(_member_result(batch.hook, result, outcome))
+            if unattributed:
+                await self._run_solo(hook_service, batch, unattributed)
+        finally:
+            await storage.delete_hook_batch(batch_id)
+
+
+def _consume(result: asyncio.Future[HookResult]) -> None:
+    if not result.cancelled():
+        result.exception()
+
+
+def _member_result(
+    hook: HookIdentity, result: HookResult, outcome: BatchRecordOutcome | None
+) -> HookResult:
+    """One deposition's share of a passed batched run."""
+    if outcome is not None and outcome.status is OutcomeStatus.REJECTED:
+        return HookResult(
+            hook_name=hook.name,
+            status=HookStatus.REJECTED,
+            rejection_reason=outcome.reason,
+            duration_seconds=result.duration_seconds,
+            oom_retries=result.oom_retries,
+        )
+    return HookResult(
+        hook_name=hook.name,
+        status=HookStatus.PASSED,
+        duration_seconds=result.duration_seconds,
+        oom_retries=result.oom_retries,
+    )
@@ -0,0 +1,67 @@
+"""HookMemoService — reuse hook outcomes for inputs a release has already seen."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterable, Collection, Mapping
+
+from osa.domain.shared.service import Service
+from osa.domain.validation.model.batch_outcome import BatchRecordOutcome, HookRecordId
+from osa.domain.validation.model.hook_memo import MEMOIZABLE
+from osa.domain.validation.model.hook_release import HookReleaseId
+from osa.domain.validation.port.outcome_memo import HookOutcomeMemo
+
+_WRITE_CHUNK = 500
+
+
+class HookMemoService(Service):
+    """Recall and remember per-record outcomes by ``(release, input_key)``.
+
+    *keys* arguments map a batch's record ids to their input keys. Outcomes
+    are stored with the record id they were produced for and re-addressed to
+    the recalling record, since distinct records may share content.
+    """
+
+    memo: HookOutcomeMemo
+    enabled: bool = True
+
+    async def recall(
+        self, release_id: HookReleaseId, keys: Mapping[str, str]
+    ) -> dict[HookRecordId, BatchRecordOutcome]:
+        """Memoized outcomes for the batch's records, keyed by record id."""
+        if not self.enabled or not keys:
+            return {}
+        hits = await self.memo.get_many(release_id, set(keys.values()))
+        return {
+            HookRecordId(record_id): hits[key].model_copy(
+                update={"record_id": HookRecordId(record_id)}
+            )
+            for record_id, key in keys.items()
+            if key in hits
+        }
+
+    async def remember(
+        self,
+        release_id: HookReleaseId,
+        keys: Mapping[str, str],
+        outcomes: AsyncIterable[BatchRecordOutcome],
+        *,
+        skip: Collection[str] = (),
+    ) -> int:
+        """Memoize the passed/rejected *outcomes* not in *skip*. Returns how many."""
+        if not self.enabled:
+            return 0
+        stored = 0
+        chunk: dict[str, BatchRecordOutcome] = {}
+        async for outcome in outcomes:
+            key = keys.get(outcome.record_id)
+            if key is None or outcome.status not in MEMOIZABLE or outcome.record_id in skip:
+                continue
+            chunk[key] = outcome
+            if len(chunk) >= _WRITE_CHUNK:
+                await self.memo.put_many(release_id, chunk)
+                stored += len(chunk)
+                chunk = {}
+        if chunk:
+            await self.memo.put_many(release_id, chunk)
+            stored += len(chunk)
+        return stored
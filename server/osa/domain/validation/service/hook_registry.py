@@ -4,12 +4,21 @@ Thin orchestration over the :class:`HookRegistry` port: upsert identities,
 mint releases (advancing the live pointer), repoint live for rollback, and
 resolve the live release set once at run start (snapshot, R8). The
 concurrency-critical version/pointer mechanics live in the adapter.
+
+Every live-pointer move appends :class:`HookReleaseActivated`, whose handler
+pre-pulls the release's image before the first batch needs it.
 """
 
 from __future__ import annotations
 
+from uuid import uuid4
+
+from osa.domain.shared.error import NotFoundError
+from osa.domain.shared.event import EventId
 from osa.domain.shared.model.hook import HookName, OciConfig, TableFeatureSpec
+from osa.domain.shared.outbox import Outbox
 from osa.domain.shared.service import Service
+from osa.domain.validation.event.hook_release_activated import HookReleaseActivated
 from osa.domain.validation.model.hook import Hook
 from osa.domain.validation.model.hook_release import HookRelease, ReleaseOutcome
 from osa.domain.validation.model.hook_run import HookRun, HookRunId
@@ -18,6 +27,7 @@ from osa.domain.validation.port.hook_registry import HookRegistry
 
 class HookRegistryService(Service):
     registry: HookRegistry
+    outbox: Outbox
 
     async def upsert_identity(self, name: HookName, feature: TableFeatureSpec) -> Hook:
         """Create the hook identity if absent; reject a differing contract."""
@@ -36,11 +46,19 @@ class HookRegistryService(Service):
         the registry's row lock) distinguishes a new version from an idempotent
         no-op.
         """
-        return await self.registry.create_release(name, runtime, source_ref, built_by)
+        outcome = await self.registry.create_release(name, runtime, source_ref, built_by)
+        if outcome.created:
+            await self._activated(outcome.release)
+        return outcome
 
     async def set_live(self, name: HookName, version: int) -> Hook:
         """Repoint the live pointer to a prior release (rollback / pin)."""
-        return await self.registry.set_live(name, version)
+        hook = await self.registry.set_live(name, version)
+        release = await self.registry.get_release(name, version)
+        if release is None:
+            raise NotFoundError(f"Release {name} v{version} not found")
+        await self._activated(release)
+        return hook
 
     async def get_hook(self, name: HookName) -> Hook | None:
         return await self.registry.get_hook(name)
@@ -65,3 +83,15 @@ class HookRegistryService(Service):
     async def get_run(self, run_id: HookRunId) -> HookRun | None:
         """Read a single hook_run by id (provenance lookup)."""
         return await self.registry.get_run(run_id)
+
+    async def _activated(self, release: HookRelease) -> None:
+        await self.outbox.append(
+            HookReleaseActivated(
+                id=EventId(uuid4()),
+                hook_name=release.hook_name,
+                release_id=release.id,
+                version=release.version,
+                image=release.runtime.image,
+                digest=release.runtime.digest,
+            )
+        )
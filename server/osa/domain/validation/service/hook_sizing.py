@@ -0,0 +1,28 @@
+"""HookSizingService — per-release sizing recommendations from hook_run history."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from osa.domain.shared.model.hook import HookName
+from osa.domain.shared.service import Service
+from osa.domain.validation.model.hook_release import HookRelease
+from osa.domain.validation.model.hook_sizing import HookSizing, HookSizingPolicy
+from osa.domain.validation.port.hook_registry import HookRegistry
+
+
+class HookSizingService(Service):
+    """Reads a release's recent runs and applies the :class:`HookSizingPolicy`."""
+
+    registry: HookRegistry
+    policy: HookSizingPolicy
+
+    async def for_release(self, release: HookRelease) -> HookSizing:
+        runs = await self.registry.recent_runs(release.id, self.policy.window)
+        return self.policy.recommend(release, runs)
+
+    async def for_releases(self, releases: Iterable[HookRelease]) -> dict[HookName, HookSizing]:
+        """Recommendations keyed by hook name; empty when sizing is disabled."""
+        if not self.policy.enabled:
+            return {}
+        return {release.hook_name: await self.for_release(release) for release in releases}
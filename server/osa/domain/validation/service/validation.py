@@ -10,6 +10,7 @@ from typing import Any
 from osa.domain.shared.error import NotFoundError
 from osa.domain.shared.failure import FailurePolicy, RuntimeFailure
 from osa.domain.shared.model.hook import HookIdentity, HookName
+from osa.domain.shared.model.workload import Workload, WorkSource
 from osa.domain.shared.model.srn import (
     ConventionSlug,
     DepositionSRN,
@@ -17,6 +18,7 @@ from osa.domain.shared.model.srn import (
     LocalId,
     ValidationRunSRN,
 )
+from osa.domain.shared.scheduler import ContainerScheduler
 from osa.domain.shared.service import Service
 from osa.domain.validation.model import (
     RunStatus,
@@ -30,6 +32,7 @@ from osa.domain.validation.port.hook_runner import HookInputs, HookRunner
 from osa.domain.validation.port.repository import ValidationRunRepository
 from osa.domain.validation.port.storage import HookStoragePort
 from osa.domain.validation.service.hook import HookService
+from osa.domain.validation.service.hook_batcher import HookBatcher
 from osa.domain.validation.service.hook_registry import HookRegistryService
 
 logger = logging.getLogger(__name__)
@@ -44,6 +47,8 @@ class ValidationService(Service):
     hook_registry: HookRegistryService
     failure_policy: FailurePolicy
     node_domain: Domain
+    scheduler: ContainerScheduler
+    hook_batcher: HookBatcher
 
     async def create_run(
         self,
@@ -89,6 +94,7 @@ class ValidationService(Service):
             hook_runner=self.hook_runner,
             hook_storage=self.hook_storage,
             failure_policy=self.failure_policy,
+            scheduler=self.scheduler,
         )
 
         # Resolve identity + live release per hook (snapshot).
@@ -109,7 +115,9 @@ class ValidationService(Service):
             started_at = datetime.now(timezone.utc)
             run_id = HookRunId(uuid4())
             try:
-                result = await hook_service.run_hook(hook, release, inputs, work_dir)
+                result = await self.hook_batcher.run_hook(
+                    hook_service, hook, release, inputs, work_dir, hook_set=hook_names
+                )
             except Exception as exc:
                 finished_at = datetime.now(timezone.utc)
                 # Record ANY failure as a terminal ERROR run. Capture the failed
@@ -187,6 +195,7 @@ class ValidationService(Service):
             records=[record],
             run_id=run_id,
             files_dirs={local_id: files_dir} if files_dir else {},
+            workload=Workload.of(WorkSource.DEPOSITION, convention_id.root),
         )
 
         run = await self.create_run(inputs=inputs)
@@ -1,7 +1,15 @@
-from dishka import provide
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from dishka import AsyncContainer, provide
 
 from osa.config import Config
+from osa.domain.auth.model.identity import Identity, System
 from osa.domain.shared.failure import FailurePolicy
+from osa.domain.shared.model.hook import parse_memory
+from osa.domain.shared.model.workload import WorkSource
+from osa.domain.shared.port.instrumentation import SchedulerInstrumentation
+from osa.domain.shared.scheduler import ContainerScheduler
 from osa.domain.shared.model.srn import Domain
 from osa.domain.validation.command.create_release import CreateReleaseHandler
 from osa.domain.validation.command.set_live import SetLiveHandler
@@ -11,15 +19,85 @@ from osa.domain.validation.query.get_release import GetReleaseHandler
 from osa.domain.validation.query.list_hooks import ListHooksHandler
 from osa.domain.validation.query.list_releases import ListReleasesHandler
 from osa.domain.validation.service import ValidationService
-from osa.domain.validation.service.hook import HookService
+from osa.domain.validation.port.hook_runner import HookRunner
+from osa.domain.validation.port.storage import HookStoragePort
+from osa.domain.validation.model.hook_sizing import HookSizingPolicy
+from osa.domain.validation.query.get_hook_sizing import GetHookSizingHandler
+from osa.domain.validation.service.hook import HookService, HookSlots
+from osa.domain.validation.service.hook_batcher import HookBatcher
+from osa.domain.validation.port.outcome_memo import HookOutcomeMemo
+from osa.domain.validation.service.hook_memo import HookMemoService
 from osa.domain.validation.service.hook_registry import HookRegistryService
+from osa.domain.validation.service.hook_sizing import HookSizingService
 from osa.util.di.base import Provider
 from osa.util.di.scope import Scope
 
 
 class ValidationProvider(Provider):
     service = provide(ValidationService, scope=Scope.UOW)
-    hook_service = provide(HookService, scope=Scope.UOW)
+
+    @provide(scope=Scope.APP)
+    def get_hook_slots(self, config: Config) -> HookSlots:
+        """One cap on concurrently executing hooks, shared by every batch."""
+        return HookSlots(config.worker.hook_concurrency)
+
+    @provide(scope=Scope.APP)
+    def get_hook_batcher(self, config: Config, container: AsyncContainer) -> HookBatcher:
+        """Coalesces concurrent deposition validations process-wide (opt-in)."""
+
+        # A batch outlives the units of work that joined it, so each runs on a
+        # HookService from a scope of its own.
+        @asynccontextmanager
+        async def hook_service_scope() -> AsyncIterator[HookService]:
+            async with container(scope=Scope.UOW, context={Identity: System()}) as scope:
+                yield await scope.get(HookService)
+
+        batching = config.worker.validation_batching
+        return HookBatcher(
+            enabled=batching.enabled,
+            window=batching.window_seconds,
+            max_records=batching.max_records,
+            hook_service_scope=hook_service_scope,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_container_scheduler(
+        self, config: Config, instrumentation: SchedulerInstrumentation
+    ) -> ContainerScheduler:
+        """One admission queue for every hook and ingester container in the process."""
+        worker = config.worker
+        scheduler = worker.scheduler
+        return ContainerScheduler(
+            slots=scheduler.slots or worker.hook_concurrency,
+            memory=parse_memory(scheduler.memory) if scheduler.memory else None,
+            cpu=scheduler.cpu,
+            max_queued=scheduler.max_queued,
+            weights={
+                WorkSource.DEPOSITION: scheduler.deposition_weight,
+                WorkSource.INGEST: scheduler.ingest_weight,
+            },
+            max_bypass=scheduler.max_bypass,
+            instrumentation=instrumentation,
+        )
+
+    @provide(scope=Scope.UOW)
+    def get_hook_service(
+        self,
+        hook_runner: HookRunner,
+        hook_storage: HookStoragePort,
+        failure_policy: FailurePolicy,
+        hook_slots: HookSlots,
+        scheduler: ContainerScheduler,
+        config: Config,
+    ) -> HookService:
+        return HookService(
+            hook_runner=hook_runner,
+            hook_storage=hook_storage,
+            failure_policy=failure_policy,
+            hook_slots=hook_slots,
+            scheduler=scheduler,
+            output_tail_interval=config.worker.hook_output_tail_seconds,
+        )
 
     # Hook registry (feature #145).
     hook_registry_service = provide(HookRegistryService, scope=Scope.UOW)
@@ -37,6 +115,25 @@ class ValidationProvider(Provider):
     get_hook_run_handler = provide(GetHookRunHandler, scope=Scope.UOW)
     get_hook_run_logs_handler = provide(GetHookRunLogsHandler, scope=Scope.UOW)
 
+    # Adaptive sizing learned from hook_runs, and its admin read handler.
+    hook_sizing_service = provide(HookSizingService, scope=Scope.UOW)
+    get_hook_sizing_handler = provide(GetHookSizingHandler, scope=Scope.UOW)
+
+    @provide(scope=Scope.APP)
+    def get_hook_sizing_policy(self, config: Config) -> HookSizingPolicy:
+        sizing = config.worker.hook_sizing
+        return HookSizingPolicy(
+            enabled=sizing.enabled,
+            window=sizing.window,
+            max_memory=sizing.max_memory,
+            timeout_headroom=sizing.timeout_headroom,
+        )
+
+    # Outcome memo: reuse a release's outcomes for byte-identical inputs.
+    @provide(scope=Scope.UOW)
+    def get_hook_memo_service(self, memo: HookOutcomeMemo, config: Config) -> HookMemoService:
+        return HookMemoService(memo=memo, enabled=config.worker.hook_memo)
+
     @provide(scope=Scope.UOW)
     def get_node_domain(self, config: Config) -> Domain:
         return Domain(config.domain)
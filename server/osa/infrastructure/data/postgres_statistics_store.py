@@ -1,19 +1,36 @@
 """Postgres adapter for the instance-statistics snapshot.
 
+``GET /stats`` reads one row. Keeping it current never scans data tables:
+
+- **Fold** (every refresh) — record and feature-row writers append per-table
+  row deltas (:mod:`osa.infrastructure.persistence.row_deltas`); the refresh
+  consumes them with one ``DELETE … RETURNING`` and adds them to the counts.
+  Deltas stamped before ``month_start`` don't count towards this month.
+- **Estimate mode** — feature rows come from ``pg_class.reltuples`` instead of
+  the folded deltas (as fresh as autovacuum's last ANALYZE).
+- **Reconcile** (every ``reconcile_interval`` seconds, and when there is no
+  snapshot yet) — the counts are replaced by a genuine O(rows) ``count(*)``
+  recount, correcting drift from writes made outside the server.
+
+A refresh runs in one REPEATABLE READ transaction, so the deltas it consumes
+and the tables it recounts reflect exactly the same committed writes: a write
+committing mid-refresh is neither counted nor consumed, and is folded next time.
+
 Storage size is summed via ``pg_total_relation_size`` over ``records`` plus every
 dynamic ``features.*`` and ``metadata.*`` table (enumerated from their catalogs —
 never string-built from user input; ``to_regclass`` yields NULL for a missing
-table so a dropped table can't error the sum). Feature-row totals are a genuine
-O(rows) scan, which is exactly why the result is materialized.
+table so a dropped table can't error the sum).
 """
 
 from __future__ import annotations
 
 import re
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from typing import Any, Literal
 
-import sqlalchemy as sa
-from sqlalchemy import func, select, text
+from sqlalchemy import ColumnElement, func, select, text
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from osa.domain.record.model.statistics import InstanceStats
@@ -21,8 +38,10 @@ from osa.infrastructure.persistence.api_naming import (
     feature_pg_schema,
     metadata_pg_schema,
 )
+from osa.infrastructure.persistence.row_deltas import RECORDS
 from osa.infrastructure.persistence.tables import (
     feature_tables_table,
+    instance_statistics_deltas_table,
     instance_statistics_table,
     records_table,
 )
@@ -31,48 +50,111 @@ from osa.infrastructure.persistence.tables import (
 # (``_validate_pg_identifier``); re-check defensively before interpolating.
 _SAFE_IDENT = re.compile(r"^[a-z][a-z0-9_]{0,62}$")
 
+_SNAPSHOT = select(instance_statistics_table).where(instance_statistics_table.c.id == 1)
+
+
+@dataclass
+class _Deltas:
+    records: int
+    records_this_month: int
+    feature_rows: int
+
 
 class PostgresStatisticsStore:
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        *,
+        feature_rows: Literal["exact", "estimate"] = "exact",
+        reconcile_interval: float = 86400.0,
+    ) -> None:
         self.session = session
-
-    async def count_this_month(self) -> int:
-        stmt = (
-            select(func.count())
-            .select_from(records_table)
-            .where(records_table.c.published_at >= func.date_trunc("month", func.now()))
-        )
-        return int((await self.session.execute(stmt)).scalar_one())
+        self._estimate_feature_rows = feature_rows == "estimate"
+        self._reconcile_interval = reconcile_interval
 
     async def read_snapshot(self) -> InstanceStats | None:
-        row = (await self.session.execute(select(instance_statistics_table))).mappings().first()
+        row = (await self.session.execute(_SNAPSHOT)).mappings().first()
         if row is None:
             return None
         return InstanceStats(
+            records=row["records"],
+            records_this_month=row["records_this_month"],
             storage_bytes=row["storage_bytes"],
             feature_rows=row["feature_rows"],
             computed_at=row["computed_at"],
+            reconciled_at=row["reconciled_at"],
         )
 
-    async def compute_snapshot(self) -> InstanceStats:
-        return InstanceStats(
+    async def refresh(self) -> None:
+        await self.session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+        now = datetime.now(UTC)
+        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+        current = (await self.session.execute(_SNAPSHOT)).mappings().first()
+        deltas = await self._take_deltas(month_start)
+
+        values: dict[str, Any]
+        if current is None or self._reconcile_due(current["reconciled_at"], now):
+            values = await self._recount(month_start)
+            values["reconciled_at"] = now
+        else:
+            same_month = current["month_start"] == month_start
+            values = {
+                "records": current["records"] + deltas.records,
+                "records_this_month": (current["records_this_month"] if same_month else 0)
+                + deltas.records_this_month,
+                "feature_rows": current["feature_rows"] + deltas.feature_rows,
+            }
+        if self._estimate_feature_rows:
+            values["feature_rows"] = await self._estimated_feature_rows()
+        values.update(
             storage_bytes=await self._storage_bytes(),
-            feature_rows=await self._feature_rows(),
-            computed_at=datetime.now(UTC),
+            month_start=month_start,
+            computed_at=now,
         )
 
-    async def refresh(self) -> None:
-        snapshot = await self.compute_snapshot()
-        # Singleton upsert: clear then insert row id=1.
-        await self.session.execute(sa.delete(instance_statistics_table))
-        await self.session.execute(
-            sa.insert(instance_statistics_table).values(
-                id=1,
-                storage_bytes=snapshot.storage_bytes,
-                feature_rows=snapshot.feature_rows,
-                computed_at=snapshot.computed_at,
+        stmt = insert(instance_statistics_table).values(id=1, **values)
+        await self.session.execute(stmt.on_conflict_do_update(index_elements=["id"], set_=values))
+
+    def _reconcile_due(self, reconciled_at: datetime | None, now: datetime) -> bool:
+        if reconciled_at is None:
+            return True
+        return (now - reconciled_at).total_seconds() >= self._reconcile_interval
+
+    async def _take_deltas(self, month_start: datetime) -> _Deltas:
+        """Consume every pending delta, summed for records, this month's records and features."""
+        taken = (
+            instance_statistics_deltas_table.delete()
+            .returning(
+                instance_statistics_deltas_table.c.table_name,
+                instance_statistics_deltas_table.c.row_delta,
+                instance_statistics_deltas_table.c.recorded_at,
             )
+            .cte("taken")
+        )
+        is_records = taken.c.table_name == RECORDS
+
+        def total(*where: ColumnElement[bool]) -> ColumnElement[int]:
+            return func.coalesce(func.sum(taken.c.row_delta).filter(*where), 0)
+
+        stmt = select(
+            total(is_records),
+            total(is_records, taken.c.recorded_at >= month_start),
+            total(~is_records),
         )
+        records, records_this_month, feature_rows = (await self.session.execute(stmt)).one()
+        return _Deltas(int(records), int(records_this_month), int(feature_rows))
+
+    async def _recount(self, month_start: datetime) -> dict[str, Any]:
+        records = select(func.count()).select_from(records_table)
+        this_month = records.where(records_table.c.published_at >= month_start)
+        values: dict[str, Any] = {
+            "records": int((await self.session.execute(records)).scalar_one()),
+            "records_this_month": int((await self.session.execute(this_month)).scalar_one()),
+        }
+        if not self._estimate_feature_rows:
+            values["feature_rows"] = await self._counted_feature_rows()
+        return values
 
     async def _storage_bytes(self) -> int:
         stmt = text(
@@ -94,7 +176,20 @@ class PostgresStatisticsStore:
         )
         return int(result.scalar_one() or 0)
 
-    async def _feature_rows(self) -> int:
+    async def _estimated_feature_rows(self) -> int:
+        # reltuples is -1 for a table never vacuumed or analyzed: count it as empty.
+        stmt = text(
+            """
+            SELECT COALESCE(sum(GREATEST(c.reltuples, 0)), 0)
+            FROM feature_tables ft
+            JOIN pg_class c
+              ON c.oid = to_regclass(:fschema || '.' || quote_ident(ft.pg_table))
+            """
+        )
+        result = await self.session.execute(stmt, {"fschema": feature_pg_schema()})
+        return int(result.scalar_one())
+
+    async def _counted_feature_rows(self) -> int:
         names = (
             (await self.session.execute(select(feature_tables_table.c.pg_table))).scalars().all()
         )
@@ -8,15 +8,30 @@ from dishka import AsyncContainer, provide
 # Composition-root wiring: this DI module is the one place the application layer
 # is imported from infrastructure, so the orchestrators can be registered as the
 # node's core event handlers (#160).
-from osa.application.workflow.process_batch import ProcessBatch
+from osa.application.workflow.process_batch import (
+    HookBatchStage,
+    IngestBatchStage,
+    ProcessBatch,
+    PublishBatchStage,
+)
 from osa.application.workflow.process_submission import ProcessSubmission
 from osa.config import Config
+from osa.domain.delivery.command.requeue_failed_deliveries import RequeueFailedDeliveriesHandler
+from osa.domain.delivery.command.set_worker_count import SetWorkerCountHandler
+from osa.domain.delivery.query.list_failed_deliveries import ListFailedDeliveriesHandler
 from osa.domain.shared.event import EventHandler
+from osa.domain.shared.error import ConfigurationError
 from osa.domain.shared.event_log import EventLog
-from osa.domain.shared.model.subscription_registry import SubscriptionRegistry
+from osa.domain.shared.model.subscription_registry import (
+    NonReplayableGroups,
+    SubscriptionRegistry,
+)
 from osa.domain.shared.outbox import Outbox
 from osa.domain.shared.port.event_repository import EventRepository
+from osa.domain.validation.handler import PrefetchHookImage
+from osa.infrastructure.event.leader import LeaderElector
 from osa.infrastructure.event.worker import WorkerPool
+from osa.infrastructure.persistence.database import WorkerEngine
 from osa.infrastructure.telemetry.sampler import TelemetrySampler
 from osa.util.di.base import Provider
 from osa.util.di.scope import Scope
@@ -34,15 +49,46 @@ HandlerTypes = NewType("HandlerTypes", list[type[EventHandler[Any]]])
 # between them, replacing the former ten-handler event chain. ProcessSubmission
 # drives the deposition path (DepositionSubmittedEvent) and ProcessBatch drives
 # the ingest path (NextBatchRequested). Every domain event those workflows
-# append is now audit-only (no subscribers). Feature-table creation on convention
+# append is now audit-only (no subscribers), unless ProcessBatch's stages run
+# as separate consumer groups (_BATCH_STAGE_HANDLERS below). Feature-table creation on convention
 # deploy is inlined at the deploy command handler (decision 9), not an event
 # handler. Metadata projection is a synchronous dual-write inside the services.
+# PrefetchHookImage is a side channel, not a pipeline stage: it warms a release's
+# image when the live pointer moves (HookReleaseActivated).
 _CORE_HANDLERS: list[type[EventHandler[Any]]] = [
     ProcessSubmission,
     ProcessBatch,
+    PrefetchHookImage,
+]
+
+# ProcessBatch's stages as separate consumer groups, which replace it when
+# ``config.worker.batch_stages.enabled``; the stage-completion events
+# ProcessBatch appends as audit records then drive the next stage.
+_BATCH_STAGE_HANDLERS: list[type[EventHandler[Any]]] = [
+    IngestBatchStage,
+    HookBatchStage,
+    PublishBatchStage,
 ]
 
 
+def core_handlers(config: Config | None = None) -> list[type[EventHandler[Any]]]:
+    """The core handlers *config* runs: ProcessBatch or its stage handlers."""
+    if config is None or not config.worker.batch_stages.enabled:
+        return list(_CORE_HANDLERS)
+    handlers: list[type[EventHandler[Any]]] = []
+    for handler in _CORE_HANDLERS:
+        handlers.extend(_BATCH_STAGE_HANDLERS if handler is ProcessBatch else [handler])
+    return handlers
+
+
+def consumer_groups(
+    extra_handlers: list[type[EventHandler[Any]]] | None = None,
+    config: Config | None = None,
+) -> list[str]:
+    """Consumer group names of the core handlers plus *extra_handlers*, in order."""
+    return [handler.__name__ for handler in [*core_handlers(config), *(extra_handlers or [])]]
+
+
 def build_subscription_registry(handlers: HandlerTypes) -> SubscriptionRegistry:
     """Build a SubscriptionRegistry from handler list.
 
@@ -78,13 +124,14 @@ class EventProvider(Provider):
         extra_handlers: list[type[EventHandler[Any]]] | None = None,
     ) -> None:
         super().__init__()
-        self._all_handlers = HandlerTypes([*_CORE_HANDLERS, *(extra_handlers or [])])
+        self._extra_handlers = list(extra_handlers or [])
+        self._all_handlers = HandlerTypes([*_CORE_HANDLERS, *self._extra_handlers])
 
         # Register DI bindings for every handler (core + extra).
         # Each handler becomes a UOW-scoped dependency that Dishka can
         # instantiate with its declared fields injected.
         seen: set[type] = set()
-        for handler_type in self._all_handlers:
+        for handler_type in [*self._all_handlers, *_BATCH_STAGE_HANDLERS]:
             if handler_type in seen:
                 raise ValueError(
                     f"Duplicate event handler registration: {handler_type.__name__!r}. "
@@ -93,6 +140,11 @@ class EventProvider(Provider):
             seen.add(handler_type)
             self.provide(handler_type, scope=Scope.UOW)
 
+    # Admin command handlers for delivery and consumer-group control
+    set_worker_count_handler = provide(SetWorkerCountHandler, scope=Scope.UOW)
+    requeue_failed_deliveries_handler = provide(RequeueFailedDeliveriesHandler, scope=Scope.UOW)
+    list_failed_deliveries_handler = provide(ListFailedDeliveriesHandler, scope=Scope.UOW)
+
     # UOW-scoped Outbox (wraps EventRepository + SubscriptionRegistry)
     @provide(scope=Scope.UOW)
     def get_outbox(self, repo: EventRepository, registry: SubscriptionRegistry) -> Outbox:
@@ -104,9 +156,9 @@ class EventProvider(Provider):
         return EventLog(repo)
 
     @provide(scope=Scope.APP)
-    def get_handler_types(self) -> HandlerTypes:
-        """Return all handler types (core + extra) for WorkerPool registration."""
-        return self._all_handlers
+    def get_handler_types(self, config: Config) -> HandlerTypes:
+        """Return the handler types (core + extra) for subscriptions and WorkerPool registration."""
+        return HandlerTypes([*core_handlers(config), *self._extra_handlers])
 
     @provide(scope=Scope.APP)
     def get_subscription_registry(self, handler_types: HandlerTypes) -> SubscriptionRegistry:
@@ -118,6 +170,33 @@ class EventProvider(Provider):
         )
         return registry
 
+    @provide(scope=Scope.APP)
+    def get_non_replayable_groups(self) -> NonReplayableGroups:
+        """Groups whose failed deliveries must not be requeued.
+
+        Covers every registered handler, not just the ones *config* runs:
+        failures recorded before ``batch_stages`` was toggled stay failed.
+        """
+        return NonReplayableGroups(
+            frozenset(
+                handler.__name__
+                for handler in [*self._all_handlers, *_BATCH_STAGE_HANDLERS]
+                if not handler.__replayable__
+            )
+        )
+
+    @provide(scope=Scope.APP)
+    def get_leader_elector(self, engine: WorkerEngine, config: Config) -> LeaderElector:
+        """Advisory-lock election of the replica running each singleton task.
+
+        Its long-lived lock connection comes from the worker pool.
+        """
+        return LeaderElector(
+            engine,
+            lease_seconds=config.worker.leader_lease_seconds,
+            renew_interval=config.worker.leader_renew_seconds,
+        )
+
     @provide(scope=Scope.APP)
     def get_worker_pool(
         self,
@@ -125,11 +204,40 @@ class EventProvider(Provider):
         handler_types: HandlerTypes,
         config: Config,
         sampler: TelemetrySampler,
+        leader: LeaderElector,
     ) -> WorkerPool:
-        """WorkerPool with pull-based event handlers."""
-        pool = WorkerPool(container=container, stale_claim_interval=60.0, sampler=sampler)
+        """WorkerPool with pull-based event handlers.
+
+        ``config.worker.consumer_groups`` restricts the pool to a subset of the
+        handlers, so several worker processes can split the groups between them.
+        """
+        storage = config.storage
+        worker = config.worker
+        selected = list(handler_types)
+        if worker.consumer_groups is not None:
+            known = {handler_type.__name__ for handler_type in handler_types}
+            unknown = sorted(set(worker.consumer_groups) - known)
+            if unknown:
+                raise ConfigurationError(
+                    f"Unknown consumer groups in OSA_WORKER__CONSUMER_GROUPS: {unknown}. "
+                    f"Known groups: {sorted(known)}"
+                )
+            selected = [h for h in handler_types if h.__name__ in worker.consumer_groups]
+
+        pool = WorkerPool(
+            container=container,
+            stale_claim_interval=60.0,
+            sampler=sampler,
+            blob_gc_interval=storage.blob_gc_interval_seconds if storage.dedupe_files else 0.0,
+            singletons=worker.singletons,
+            stale_claim_timeout=max((h.__claim_timeout__ for h in handler_types), default=None),
+            drain_timeout=worker.drain_timeout_seconds,
+            leader=leader,
+            statistics_interval=config.statistics.fold_interval_seconds,
+            worker_count_sync_interval=worker.worker_count_sync_seconds,
+        )
 
-        for handler_type in handler_types:
+        for handler_type in selected:
             pool.register(handler_type, config=config)
 
         logger.info(f"WorkerPool created with {len(pool.workers)} workers")
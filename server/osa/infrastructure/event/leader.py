@@ -0,0 +1,207 @@
+"""LeaderElector — one replica runs each singleton housekeeping task.
+
+Every replica's :class:`~osa.infrastructure.event.worker.WorkerPool` starts the
+stale-claim sweep, device-auth cleanup, statistics refresh and cron schedules;
+without coordination N replicas repeat the same O(rows) statistics scan every
+interval. Each task is instead guarded by a Postgres session-level advisory
+lock (``pg_try_advisory_lock(hashtextextended('osa:leader:<task>', 0))``) held
+on one dedicated connection per replica:
+
+- **Lease renewal** — every ``renew_interval`` the holder pings its connection.
+  The connection carries ``idle_session_timeout = lease``, so a replica that
+  stops renewing (hung process, partitioned host) has its session — and with it
+  every lock — dropped by the server after one lease. Locally, leadership also
+  lapses once the last successful renewal is older than the lease.
+- **Fast failover** — followers retry the lock on every renewal tick, so a
+  crashed leader is replaced within ``renew_interval`` of its session ending,
+  and a stopping leader closes its session for an immediate hand-over.
+
+The replica identity (``host:pid``) is the connection's ``application_name``,
+which is how :meth:`LeaderElector.describe` reports who leads each task.
+
+Non-Postgres databases (the local SQLite setup) have a single process by
+construction: every task is led locally and no connection is held.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+import time
+from collections.abc import Sequence
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from osa.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+STALE_CLAIM_CLEANUP = "stale-claim-cleanup"
+DEVICE_AUTH_CLEANUP = "device-auth-cleanup"
+STATISTICS_REFRESH = "statistics-refresh"
+SCHEDULES = "schedules"
+
+# Housekeeping that must run on exactly one replica. Blob GC and the telemetry
+# sampler stay per-replica: they act on local disk and per-process gauges.
+SINGLETON_TASKS: tuple[str, ...] = (
+    STALE_CLAIM_CLEANUP,
+    DEVICE_AUTH_CLEANUP,
+    STATISTICS_REFRESH,
+    SCHEDULES,
+)
+
+_LOCK_KEY = "hashtextextended(:key, 0)"
+
+# Holder of a session-level advisory lock on a bigint key: pg_locks splits the
+# key into classid (high 32 bits) and objid (low 32 bits), objsubid = 1.
+_DESCRIBE_SQL = text(
+    f"""
+    SELECT a.application_name
+    FROM pg_locks l
+    JOIN pg_stat_activity a ON a.pid = l.pid
+    WHERE l.locktype = 'advisory'
+      AND l.granted
+      AND l.objsubid = 1
+      AND ((l.classid::bigint << 32) | l.objid::bigint) = {_LOCK_KEY}
+    LIMIT 1
+    """
+)
+
+
+def replica_identity() -> str:
+    """``host:pid`` — unique per worker process across the deployment."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _lock_key(task: str) -> str:
+    return f"osa:leader:{task}"
+
+
+class LeaderElector:
+    """Advisory-lock leader election for :data:`SINGLETON_TASKS` (see module docstring)."""
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        tasks: Sequence[str] = SINGLETON_TASKS,
+        *,
+        identity: str | None = None,
+        lease_seconds: float = 30.0,
+        renew_interval: float = 5.0,
+    ) -> None:
+        if renew_interval >= lease_seconds:
+            raise ValueError("leader renew_interval must be shorter than the lease")
+        self._engine = engine
+        self._tasks = tuple(tasks)
+        # The identity doubles as application_name, which Postgres truncates
+        # to 63 bytes; truncate it here so describe() reports the same value.
+        self.identity = (identity or replica_identity())[:63]
+        self._lease = lease_seconds
+        self._renew_interval = renew_interval
+        self._local = engine.dialect.name != "postgresql"
+        self._conn: AsyncConnection | None = None
+        self._held: set[str] = set()
+        self._renewed_at = 0.0
+        self._task: asyncio.Task | None = None
+
+    @property
+    def tasks(self) -> tuple[str, ...]:
+        return self._tasks
+
+    def is_leader(self, task: str) -> bool:
+        """Whether this replica should run *task* now."""
+        if self._local:
+            return True
+        if task not in self._held:
+            return False
+        return time.monotonic() - self._renewed_at < self._lease
+
+    async def start(self) -> None:
+        if self._local or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run(), name="leader-election")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        # Ending the session releases its locks at once: the immediate hand-over.
+        await self._drop_connection()
+
+    async def describe(self, session: AsyncSession) -> dict[str, str | None]:
+        """Which replica currently leads each task (``None`` = no leader)."""
+        if self._local:
+            return {task: self.identity for task in self._tasks}
+        leaders: dict[str, str | None] = {}
+        for task in self._tasks:
+            result = await session.execute(_DESCRIBE_SQL, {"key": _lock_key(task)})
+            leaders[task] = result.scalar_one_or_none()
+        return leaders
+
+    # ── Election loop ──
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._renew()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if self._held:
+                    logger.warn(f"Lost leadership of {sorted(self._held)}: {e}")
+                await self._drop_connection()
+            await asyncio.sleep(self._renew_interval)
+
+    async def _renew(self) -> None:
+        conn = self._conn or await self._connect()
+        # The ping is the lease renewal: it proves the session (and so every
+        # lock it holds) is alive, and resets the server's idle timer.
+        await conn.execute(text("SELECT 1"))
+        self._renewed_at = time.monotonic()
+
+        for task in self._tasks:
+            if task in self._held:
+                continue
+            acquired = await conn.scalar(
+                text(f"SELECT pg_try_advisory_lock({_LOCK_KEY})"), {"key": _lock_key(task)}
+            )
+            if acquired:
+                self._held.add(task)
+                logger.info(
+                    "Replica {identity} now leads {task}", identity=self.identity, task=task
+                )
+
+    async def _connect(self) -> AsyncConnection:
+        conn = self._conn = await self._engine.connect()
+        # Autocommit: session-level locks must not ride on an open transaction.
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(
+            text("SELECT set_config('application_name', :name, false)"),
+            {"name": self.identity},
+        )
+        try:
+            await conn.execute(
+                text("SELECT set_config('idle_session_timeout', :ms, false)"),
+                {"ms": str(int(self._lease * 1000))},
+            )
+        except Exception as e:
+            # idle_session_timeout needs PostgreSQL 14+; without it a hung
+            # holder keeps its locks until its TCP connection dies.
+            logger.warn(f"Leader lease not enforced server-side: {e}")
+        return conn
+
+    async def _drop_connection(self) -> None:
+        self._held.clear()
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            try:
+                await conn.invalidate()
+                await conn.close()
+            except Exception:
+                pass
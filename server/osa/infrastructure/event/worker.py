@@ -1,6 +1,7 @@
 """Worker and WorkerPool for pull-based event processing."""
 
 import asyncio
+import itertools
 import time
 from contextlib import AsyncExitStack
 from dataclasses import dataclass, field
@@ -31,6 +32,13 @@ from osa.domain.shared.event import (
 )
 from osa.domain.shared.outbox import Outbox
 from osa.domain.shared.port.instrumentation import OutboxInstrumentation
+from osa.infrastructure.event.leader import (
+    DEVICE_AUTH_CLEANUP,
+    LeaderElector,
+    SCHEDULES,
+    STALE_CLAIM_CLEANUP,
+    STATISTICS_REFRESH,
+)
 from osa.infrastructure.logging import get_logger
 from osa.util.di.scope import Scope
 
@@ -97,6 +105,11 @@ class Worker:
             return self._handler_type.__name__
         return f"{self._handler_type.__name__}-{self._instance_id}"
 
+    @property
+    def instance_id(self) -> int:
+        """Index of this worker among its consumer group's workers."""
+        return self._instance_id
+
     @property
     def consumer_group(self) -> str:
         """Consumer group name for delivery claiming."""
@@ -419,17 +432,43 @@ class WorkerPool:
         *,
         sampler: "TelemetrySampler | None" = None,
         sampler_interval: float = 15.0,
+        blob_gc_interval: float = 0.0,
+        singletons: bool = True,
+        stale_claim_timeout: float | None = None,
+        drain_timeout: float = 30.0,
+        leader: LeaderElector | None = None,
+        statistics_interval: float = 60.0,
+        worker_count_sync_interval: float = 0.0,
     ) -> None:
         self._container = container
         self._workers: list[Worker] = []
+        # Handler type per consumer group, so a group resized to zero workers
+        # can be grown again.
+        self._groups: dict[str, type[EventHandler[Any]]] = {}
+        # Workers removed by resize() that may still be finishing a batch.
+        self._retired: list[Worker] = []
+        self._worker_count_sync_interval = worker_count_sync_interval  # 0 disables
+        self._worker_count_sync_task: asyncio.Task | None = None
         self._stale_claim_interval = stale_claim_interval
         self._stale_claim_task: asyncio.Task | None = None
         self._device_auth_cleanup_task: asyncio.Task | None = None
         self._sampler = sampler
         self._sampler_interval = sampler_interval
         self._telemetry_sampler_task: asyncio.Task | None = None
-        self._statistics_interval = 300.0  # 5 minutes
+        self._statistics_interval = statistics_interval
         self._statistics_task: asyncio.Task | None = None
+        self._blob_gc_interval = blob_gc_interval  # 0 disables (file dedupe off)
+        self._blob_gc_task: asyncio.Task | None = None
+        # When several worker processes share the consumer groups, only one of
+        # them runs the periodic singleton tasks.
+        self._singletons = singletons
+        # The sweep must not reset claims of groups this process doesn't run
+        # before their own timeout; unset derives it from the local workers.
+        self._stale_claim_timeout = stale_claim_timeout
+        self._drain_timeout = drain_timeout
+        # Across replicas, each singleton task runs only where this replica
+        # holds its lease; without an elector every task is led locally.
+        self._leader = leader
         self._shutdown = False
         self._scheduler: AsyncScheduler | None = None
         self._exit_stack: AsyncExitStack | None = None
@@ -446,6 +485,14 @@ class WorkerPool:
         """List of managed workers."""
         return self._workers
 
+    @property
+    def leader(self) -> LeaderElector | None:
+        """The elector deciding which replica runs each singleton task."""
+        return self._leader
+
+    def _leads(self, task: str) -> bool:
+        return self._leader is None or self._leader.is_leader(task)
+
     def register(
         self,
         handler_type: type[EventHandler[Any]],
@@ -454,7 +501,9 @@ class WorkerPool:
         """Register an EventHandler type and create Worker(s) for it.
 
         Concurrency is determined by (in priority order):
-        1. Config override (``config.worker.hook_concurrency`` for ProcessBatch)
+        1. Config override (``config.worker.hook_concurrency`` for ProcessBatch
+           and HookBatchStage; ``batch_stages`` for the other batch stages;
+           ``validation_batching.max_records`` for ProcessSubmission when enabled)
         2. Handler classvar ``__concurrency__``
         3. Default of 1
 
@@ -468,17 +517,29 @@ class WorkerPool:
         # ``hook_concurrency`` sizes its fan-out. Running >1 workers is also what
         # preserves batch pipelining (batch N+1 ingests while batch N runs hooks).
         if config is not None:
-            from osa.application.workflow.process_batch import ProcessBatch
+            from osa.application.workflow.process_batch import (
+                HookBatchStage,
+                IngestBatchStage,
+                ProcessBatch,
+                PublishBatchStage,
+            )
+            from osa.application.workflow.process_submission import ProcessSubmission
 
-            if handler_type is ProcessBatch:
+            if handler_type is ProcessBatch or handler_type is HookBatchStage:
                 concurrency = config.worker.hook_concurrency
+            elif handler_type is IngestBatchStage:
+                concurrency = config.worker.batch_stages.ingest_concurrency
+            elif handler_type is PublishBatchStage:
+                concurrency = config.worker.batch_stages.publish_concurrency
+            # Coalesced validation needs submissions in flight together to batch.
+            batching = config.worker.validation_batching
+            if handler_type is ProcessSubmission and batching.enabled:
+                concurrency = max(concurrency, batching.max_records)
 
         first_worker = None
         for i in range(concurrency):
             worker = Worker(handler_type, instance_id=i)
-            if self._container is not None:
-                worker.set_container(self._container)
-            self._workers.append(worker)
+            self.add_worker(worker)
             if first_worker is None:
                 first_worker = worker
         if concurrency > 1:
@@ -494,8 +555,57 @@ class WorkerPool:
         if self._container is not None:
             worker.set_container(self._container)
         self._workers.append(worker)
+        self._groups.setdefault(worker.consumer_group, worker.handler_type)
         logger.debug(f"Added worker '{worker.name}' to pool")
 
+    def resize(self, consumer_group: str, workers: int) -> None:
+        """Run *workers* workers for *consumer_group*, adding or retiring the difference.
+
+        New workers start at once on a running pool. Retired workers stop
+        claiming and finish their in-flight batch; :meth:`stop` still waits
+        for them. Groups this pool doesn't run are ignored.
+        """
+        if workers < 0:
+            raise ValueError(f"workers must be >= 0, got {workers}")
+        handler_type = self._groups.get(consumer_group)
+        if handler_type is None:
+            return
+        current = [w for w in self._workers if w.consumer_group == consumer_group]
+        if workers == len(current):
+            return
+
+        running = self._exit_stack is not None and not self._shutdown
+        if workers > len(current):
+            taken = {w.instance_id for w in current}
+            free = (i for i in itertools.count() if i not in taken)
+            for _ in range(workers - len(current)):
+                worker = Worker(handler_type, instance_id=next(free))
+                self.add_worker(worker)
+                if running:
+                    worker.start()
+        else:
+            for worker in sorted(current, key=lambda w: w.instance_id)[workers:]:
+                worker.stop()
+                self._workers.remove(worker)
+                self._retired.append(worker)
+        self._retired = [w for w in self._retired if w.is_alive]
+        logger.info(
+            "Resized consumer group {group} from {before} to {after} workers",
+            group=consumer_group,
+            before=len(current),
+            after=workers,
+        )
+
+    async def sync_worker_counts(self) -> None:
+        """Apply the worker counts set at runtime to the groups this pool runs."""
+        if self._container is None:
+            return
+        async with self._container(scope=Scope.UOW, context={Identity: System()}) as scope:
+            outbox = await scope.get(Outbox)
+            counts = await outbox.worker_counts()
+        for group, workers in counts.items():
+            self.resize(group, workers)
+
     def get_worker(self, name: str) -> Worker | None:
         """Get a worker by name."""
         for worker in self._workers:
@@ -538,6 +648,23 @@ class WorkerPool:
         for worker in self._workers:
             worker.start()
 
+        # Every pool applies runtime worker counts to its own groups.
+        if self._worker_count_sync_interval > 0:
+            self._worker_count_sync_task = asyncio.create_task(
+                self._run_worker_count_sync(), name="worker-count-sync"
+            )
+
+        if self._singletons:
+            if self._leader is not None:
+                await self._leader.start()
+            self._start_singleton_tasks()
+
+        logger.info(
+            f"WorkerPool started with {len(self._workers)} workers, {len(schedules)} schedules"
+        )
+
+    def _start_singleton_tasks(self) -> None:
+        """Start the periodic tasks only one process in the deployment should run."""
         # Start stale claim cleanup task
         if self._stale_claim_interval > 0:
             self._stale_claim_task = asyncio.create_task(
@@ -549,28 +676,34 @@ class WorkerPool:
             self._run_device_auth_cleanup(), name="device-auth-cleanup"
         )
 
-        # Start instance-statistics refresh task (materializes O(rows) aggregates)
+        # Start instance-statistics refresh task (folds row-count deltas into the snapshot)
         self._statistics_task = asyncio.create_task(
             self._run_statistics_refresh(), name="statistics-refresh"
         )
 
+        # Start blob-store garbage collection (only when file dedupe is enabled)
+        if self._blob_gc_interval > 0:
+            self._blob_gc_task = asyncio.create_task(self._run_blob_gc(), name="blob-gc")
+
         # Start telemetry gauge sampler (only when observability is wired in)
         if self._sampler is not None:
             self._telemetry_sampler_task = asyncio.create_task(
                 self._run_telemetry_sampler(), name="telemetry-sampler"
             )
 
-        logger.info(
-            f"WorkerPool started with {len(self._workers)} workers, {len(schedules)} schedules"
-        )
-
     async def _build_schedules_from_conventions(self) -> list[ScheduleConfig]:
         """Query conventions with sources and build schedule configs."""
         return []
 
-    async def stop(self, timeout: float = 30.0) -> None:
-        """Stop all workers gracefully."""
+    async def stop(self, timeout: float | None = None) -> None:
+        """Stop all workers gracefully.
+
+        In-flight deliveries get *timeout* seconds (default: the pool's drain
+        timeout) to finish before their tasks are cancelled.
+        """
         self._shutdown = True
+        if timeout is None:
+            timeout = self._drain_timeout
 
         for worker in self._workers:
             worker.stop()
@@ -603,12 +736,31 @@ class WorkerPool:
             except asyncio.CancelledError:
                 pass
 
-        tasks = [w._task for w in self._workers if w._task and not w._task.done()]
+        if self._blob_gc_task and not self._blob_gc_task.done():
+            self._blob_gc_task.cancel()
+            try:
+                await self._blob_gc_task
+            except asyncio.CancelledError:
+                pass
+
+        if self._worker_count_sync_task and not self._worker_count_sync_task.done():
+            self._worker_count_sync_task.cancel()
+            try:
+                await self._worker_count_sync_task
+            except asyncio.CancelledError:
+                pass
+
+        tasks = [
+            w._task for w in [*self._workers, *self._retired] if w._task and not w._task.done()
+        ]
         if tasks:
             done, pending = await asyncio.wait(tasks, timeout=timeout)
             for task in pending:
                 task.cancel()
 
+        if self._leader is not None:
+            await self._leader.stop()
+
         if self._exit_stack:
             await self._exit_stack.__aexit__(None, None, None)
             self._exit_stack = None
@@ -616,8 +768,8 @@ class WorkerPool:
         logger.info("WorkerPool stopped")
 
     async def _run_schedule(self, config: "ScheduleConfig") -> None:
-        """Cron task: run a scheduled task in UOW scope."""
-        if self._container is None:
+        """Cron task: run a scheduled task in UOW scope (on the leading replica only)."""
+        if self._container is None or not self._leads(SCHEDULES):
             return
 
         try:
@@ -657,9 +809,13 @@ class WorkerPool:
                 if self._shutdown or self._container is None:
                     break
 
-                if self._workers:
-                    max_timeout = max(w.config.claim_timeout for w in self._workers)
+                if not self._leads(STALE_CLAIM_CLEANUP):
+                    continue
 
+                max_timeout = self._stale_claim_timeout
+                if max_timeout is None and self._workers:
+                    max_timeout = max(w.config.claim_timeout for w in self._workers)
+                if max_timeout is not None:
                     async with self._container(
                         scope=Scope.UOW, context={Identity: System()}
                     ) as scope:
@@ -708,6 +864,8 @@ class WorkerPool:
 
                 if self._shutdown or self._container is None:
                     break
+                if not self._leads(DEVICE_AUTH_CLEANUP):
+                    continue
 
                 async with self._container(scope=Scope.UOW, context={Identity: System()}) as scope:
                     repo = await scope.get(DeviceAuthorizationRepository)
@@ -721,7 +879,7 @@ class WorkerPool:
                 logger.error(f"Device auth cleanup failed: {e}")
 
     async def _run_statistics_refresh(self) -> None:
-        """Periodically refresh the materialized instance-statistics snapshot."""
+        """Periodically fold row-count deltas into the instance-statistics snapshot."""
         from osa.domain.record.port.statistics_store import StatisticsStore
 
         while not self._shutdown:
@@ -730,6 +888,8 @@ class WorkerPool:
 
                 if self._shutdown or self._container is None:
                     break
+                if not self._leads(STATISTICS_REFRESH):
+                    continue
 
                 async with self._container(scope=Scope.UOW, context={Identity: System()}) as scope:
                     store = await scope.get(StatisticsStore)
@@ -739,3 +899,41 @@ class WorkerPool:
                 break
             except Exception as e:
                 logger.error(f"Statistics refresh failed: {e}")
+
+    async def _run_worker_count_sync(self) -> None:
+        """Apply runtime worker counts now, then every sync interval."""
+        while not self._shutdown:
+            try:
+                if self._container is None:
+                    break
+                await self.sync_worker_counts()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Worker count sync failed: {e}")
+            try:
+                await asyncio.sleep(self._worker_count_sync_interval)
+            except asyncio.CancelledError:
+                break
+
+    async def _run_blob_gc(self) -> None:
+        """Periodically remove content-addressed blobs no file links to any more."""
+        from osa.infrastructure.storage.blobs import FilesystemBlobStore
+        from osa.infrastructure.storage.blocking import run_blocking
+
+        while not self._shutdown:
+            try:
+                await asyncio.sleep(self._blob_gc_interval)
+
+                if self._shutdown or self._container is None:
+                    break
+
+                store = await self._container.get(FilesystemBlobStore)
+                removed = await run_blocking(store.collect_garbage)
+                if removed > 0:
+                    logger.info(f"Removed {removed} unreferenced file blobs")
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Blob GC failed: {e}")
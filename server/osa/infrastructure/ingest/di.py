@@ -17,6 +17,8 @@ from osa.domain.shared.model.srn import Domain
 from osa.domain.shared.outbox import Outbox
 from osa.infrastructure.persistence.adapter.ingest_storage import FilesystemIngestStorage
 from osa.infrastructure.persistence.repository.ingest import PostgresIngestRunRepository
+from osa.infrastructure.storage.blobs import FilesystemBlobStore
+from osa.infrastructure.storage.jsonl import IntermediateFormat, ensure_available
 from osa.infrastructure.storage.layout import StorageLayout
 from osa.util.di.base import Provider
 from osa.util.di.markers import K8S
@@ -28,8 +30,14 @@ class IngestProvider(Provider):
     """Provides IngestService, IngestRunRepository, StorageLayout, and StartIngestHandler."""
 
     @provide(scope=Scope.APP)
-    def get_storage_layout(self, paths: OSAPaths) -> StorageLayout:
-        return StorageLayout(paths.data_dir)
+    def get_storage_layout(self, paths: OSAPaths, config: Config) -> StorageLayout:
+        fmt = IntermediateFormat(config.storage.intermediate_format)
+        ensure_available(fmt)
+        return StorageLayout(paths.data_dir, intermediate_format=fmt)
+
+    @provide(scope=Scope.APP)
+    def get_blob_store(self, layout: StorageLayout) -> FilesystemBlobStore:
+        return FilesystemBlobStore(layout)
 
     @provide(scope=Scope.UOW)
     def get_ingest_repo(self, session: AsyncSession) -> IngestRunRepository:
@@ -54,8 +62,12 @@ class IngestProvider(Provider):
 
     # Ingest storage — default (filesystem, for local/Docker)
     @provide(scope=Scope.APP)
-    def get_ingest_storage(self, layout: StorageLayout) -> IngestStoragePort:
-        return FilesystemIngestStorage(layout=layout)
+    def get_ingest_storage(
+        self, layout: StorageLayout, config: Config, blobs: FilesystemBlobStore
+    ) -> IngestStoragePort:
+        return FilesystemIngestStorage(
+            layout=layout, blobs=blobs if config.storage.dedupe_files else None
+        )
 
     # Ingest storage — K8s (S3 via aioboto3, reuses S3Client from RunnerProvider)
     @provide(when=K8S, scope=Scope.APP)
@@ -15,12 +15,17 @@ from dishka import activate, provide
 from osa.config import Config
 from osa.domain.shared.port.ingester_runner import IngesterRunner
 from osa.domain.validation.port.hook_runner import HookRunner
+from osa.domain.validation.port.image_prefetcher import ImagePrefetcher
+from osa.infrastructure.k8s.informer import JobInformer
+from osa.infrastructure.oci.images import ImageResolver
 from osa.infrastructure.oci.ingester_runner import OciIngesterRunner
+from osa.infrastructure.oci.pool import WarmContainerPool
 from osa.infrastructure.oci.runner import OciHookRunner
 from osa.infrastructure.s3.client import S3Client
 from osa.util.di.base import Provider
 from osa.util.di.markers import K8S
 from osa.util.di.scope import Scope
+from osa.util.paths import OSAPaths
 
 try:
     from kubernetes_asyncio.client import ApiClient
@@ -53,13 +58,45 @@ class RunnerProvider(Provider):
         yield docker
         await docker.close()
 
+    @provide(scope=Scope.APP)
+    def get_image_resolver(self, docker: aiodocker.Docker, config: Config) -> ImageResolver:
+        """Shared across units of work so resolutions (and pulls) are cached."""
+        return ImageResolver(docker, ttl=config.runner.oci.image_cache_ttl_seconds)
+
+    @provide(scope=Scope.APP)
+    def get_image_prefetcher_oci(self, images: ImageResolver) -> ImagePrefetcher:
+        return images
+
+    @provide(scope=Scope.APP)
+    async def get_warm_pool(
+        self, config: Config, paths: OSAPaths
+    ) -> AsyncIterable[WarmContainerPool]:
+        """Warm hook containers outlive a unit of work; closed at shutdown."""
+        oci = config.runner.oci
+        pool = WarmContainerPool(
+            paths.data_dir / "hook-pool",
+            max_idle_per_release=oci.warm_pool_size,
+            max_runs=oci.warm_pool_max_runs,
+            idle_timeout=oci.warm_pool_idle_seconds,
+        )
+        yield pool
+        await pool.close()
+
     @provide(scope=Scope.UOW)
     def get_hook_runner_oci(
         self,
         docker: aiodocker.Docker,
         config: Config,
+        pool: WarmContainerPool,
+        images: ImageResolver,
     ) -> HookRunner:
-        return OciHookRunner(docker=docker, host_data_dir=config.host_data_dir)
+        return OciHookRunner(
+            docker=docker,
+            host_data_dir=config.host_data_dir,
+            pool=pool if config.runner.oci.warm_pool_size > 0 else None,
+            images=images,
+            files_mount=config.runner.oci.files_mount,
+        )
 
     @provide(scope=Scope.UOW)
     def get_ingester_runner_oci(
@@ -117,20 +154,50 @@ class RunnerProvider(Provider):
         client = S3Client(
             bucket=k8s.s3_bucket,
             endpoint_url=k8s.s3_endpoint_url,
+            max_concurrency=k8s.s3_max_concurrency,
         )
         logger.info("S3 client initialized (bucket=%s)", k8s.s3_bucket)
         return client
 
+    @provide(when=K8S, scope=Scope.APP)
+    async def get_job_informer(
+        self, k8s_api_client: ApiClient, config: Config
+    ) -> AsyncIterable[JobInformer]:
+        """One LIST+WATCH of OSA Jobs/Pods shared by every runner; stopped at shutdown."""
+        from osa.infrastructure.k8s.informer import ApiSource
+
+        k8s = config.runner.k8s
+        informer = JobInformer(ApiSource(k8s_api_client), k8s.namespace)
+        if k8s.job_informer:
+            await informer.start()
+        yield informer
+        await informer.stop()
+
     @provide(when=K8S, scope=Scope.UOW)
     def get_hook_runner_k8s(
         self,
         k8s_api_client: ApiClient,
         config: Config,
         s3: S3Client,
+        informer: JobInformer,
     ) -> HookRunner:
         from osa.infrastructure.k8s.runner import K8sHookRunner
 
-        return K8sHookRunner(api_client=k8s_api_client, config=config.runner.k8s, s3=s3)
+        k8s = config.runner.k8s
+        return K8sHookRunner(
+            api_client=k8s_api_client,
+            config=k8s,
+            s3=s3,
+            informer=informer if k8s.job_informer else None,
+        )
+
+    @provide(when=K8S, scope=Scope.APP)
+    def get_image_prefetcher_k8s(
+        self, k8s_api_client: ApiClient, config: Config
+    ) -> ImagePrefetcher:
+        from osa.infrastructure.k8s.prepull import K8sImagePrefetcher
+
+        return K8sImagePrefetcher(api_client=k8s_api_client, config=config.runner.k8s)
 
     @provide(when=K8S, scope=Scope.UOW)
     def get_ingester_runner_k8s(
@@ -138,7 +205,14 @@ class RunnerProvider(Provider):
         k8s_api_client: ApiClient,
         config: Config,
         s3: S3Client,
+        informer: JobInformer,
     ) -> IngesterRunner:
         from osa.infrastructure.k8s.ingester_runner import K8sIngesterRunner
 
-        return K8sIngesterRunner(api_client=k8s_api_client, config=config.runner.k8s, s3=s3)
+        k8s = config.runner.k8s
+        return K8sIngesterRunner(
+            api_client=k8s_api_client,
+            config=k8s,
+            s3=s3,
+            informer=informer if k8s.job_informer else None,
+        )
@@ -0,0 +1,365 @@
+"""Process-wide watch cache of OSA's Jobs and Pods (a minimal informer).
+
+Without it every running Job polls the API server on its own: a pod list every
+2 s until scheduled, a Job read every 5 s until done, and another namespace-wide
+pod list per ``has_capacity`` check. With ``hook_concurrency`` Jobs in flight
+that is a steady stream of LIST calls, and completion is noticed up to 5 s late.
+
+:class:`JobInformer` instead keeps one LIST+WATCH per resource kind, filtered to
+OSA-managed objects (those carrying the ``osa.io/role`` label), and mirrors
+them in memory. Watches resume from the last seen ``resourceVersion`` when a
+stream ends (the server closes them periodically) and re-list only when the
+version has expired (HTTP 410 Gone). Runners await per-Job futures — resolved
+by the watch event that satisfies them — and capacity checks read the cache.
+
+The API surface is behind :class:`KubeSource`, so the informer can be driven
+by a fake API server in tests.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from typing import TYPE_CHECKING, Any, Literal, Protocol
+
+from osa.domain.shared.failure import FailureKind, RuntimeFailure
+from osa.infrastructure.logging import get_logger
+
+if TYPE_CHECKING:
+    from kubernetes_asyncio.client import ApiClient
+
+logger = get_logger(__name__)
+
+Kind = Literal["jobs", "pods"]
+
+# Every Job/Pod OSA creates carries this label (hook, ingester, prepull).
+MANAGED_SELECTOR = "osa.io/role"
+
+_PENDING = object()
+
+
+class WatchExpired(Exception):
+    """The watch's resourceVersion is too old (410 Gone); a re-list is needed."""
+
+
+class KubeSource(Protocol):
+    """The two API calls an informer needs, per resource kind."""
+
+    async def list_objects(
+        self, kind: Kind, namespace: str, selector: str
+    ) -> tuple[list[Any], str]:
+        """Return ``(items, resourceVersion)`` of a consistent snapshot."""
+        ...
+
+    def watch(
+        self, kind: Kind, namespace: str, selector: str, resource_version: str
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """Yield ``(event_type, object)`` changes after ``resource_version``.
+
+        Ends when the server closes the stream; raises :class:`WatchExpired`
+        when the version is no longer available.
+        """
+        ...
+
+
+class ApiSource:
+    """:class:`KubeSource` over kubernetes-asyncio's Batch/Core APIs."""
+
+    def __init__(self, api_client: ApiClient, *, watch_timeout: int = 300) -> None:
+        from kubernetes_asyncio.client import BatchV1Api, CoreV1Api
+
+        self._batch_api = BatchV1Api(api_client)
+        self._core_api = CoreV1Api(api_client)
+        self._watch_timeout = watch_timeout
+
+    def _list_fn(self, kind: Kind) -> Callable[..., Any]:
+        if kind == "jobs":
+            return self._batch_api.list_namespaced_job
+        return self._core_api.list_namespaced_pod
+
+    async def list_objects(
+        self, kind: Kind, namespace: str, selector: str
+    ) -> tuple[list[Any], str]:
+        result = await self._list_fn(kind)(namespace, label_selector=selector)
+        return list(result.items), result.metadata.resource_version
+
+    async def watch(
+        self, kind: Kind, namespace: str, selector: str, resource_version: str
+    ) -> AsyncIterator[tuple[str, Any]]:
+        from kubernetes_asyncio import watch
+
+        try:
+            async with watch.Watch().stream(
+                self._list_fn(kind),
+                namespace,
+                label_selector=selector,
+                resource_version=resource_version,
+                allow_watch_bookmarks=True,
+                timeout_seconds=self._watch_timeout,
+            ) as stream:
+                async for event in stream:
+                    yield event["type"], event["object"]
+        except Exception as exc:
+            if getattr(exc, "status", None) == 410:
+                raise WatchExpired(str(exc)) from exc
+            raise
+
+
+class _Waiter:
+    __slots__ = ("check", "future")
+
+    def __init__(self, check: Callable[[Any, list[Any]], Any], future: asyncio.Future) -> None:
+        self.check = check
+        self.future = future
+
+
+class JobInformer:
+    """Shared cache of OSA Jobs/Pods in one namespace, fed by LIST+WATCH."""
+
+    def __init__(
+        self,
+        source: KubeSource,
+        namespace: str,
+        *,
+        selector: str = MANAGED_SELECTOR,
+        max_backoff: float = 30.0,
+    ) -> None:
+        self._source = source
+        self._namespace = namespace
+        self._selector = selector
+        self._max_backoff = max_backoff
+        self._jobs: dict[str, Any] = {}
+        self._pods: dict[str, Any] = {}
+        self._pods_by_job: dict[str, set[str]] = {}
+        self._waiters: dict[str, list[_Waiter]] = {}
+        self._synced = {"jobs": asyncio.Event(), "pods": asyncio.Event()}
+        self._tasks: list[asyncio.Task] = []
+
+    # ── Lifecycle ───────────────────────────────────────────────────────
+
+    async def start(self) -> None:
+        self._tasks = [
+            asyncio.create_task(self._run("jobs"), name="k8s-informer-jobs"),
+            asyncio.create_task(self._run("pods"), name="k8s-informer-pods"),
+        ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    @property
+    def synced(self) -> bool:
+        return all(event.is_set() for event in self._synced.values())
+
+    async def wait_synced(self, timeout: float | None = None) -> None:
+        await asyncio.wait_for(asyncio.gather(*(e.wait() for e in self._synced.values())), timeout)
+
+    # ── Reads ───────────────────────────────────────────────────────────
+
+    def job(self, name: str) -> Any | None:
+        return self._jobs.get(name)
+
+    def pods_for(self, job_name: str) -> list[Any]:
+        return [self._pods[p] for p in self._pods_by_job.get(job_name, ()) if p in self._pods]
+
+    def pods(self) -> list[Any]:
+        return list(self._pods.values())
+
+    # ── Waiting ─────────────────────────────────────────────────────────
+
+    async def wait_scheduled(self, job_name: str, *, timeout: float) -> None:
+        """Return once the Job's pod has left Pending; raise on pull/eviction failure."""
+        try:
+            await self._wait(job_name, _scheduled, timeout)
+        except TimeoutError:
+            raise RuntimeFailure(
+                FailureKind.TIMEOUT,
+                f"Pod scheduling timeout after {timeout}s for Job {job_name}",
+            ) from None
+
+    async def wait_finished(self, job_name: str, *, timeout: float) -> str | None:
+        """Wait for the Job to finish. ``None`` on success, else the failure reason."""
+        try:
+            return await self._wait(job_name, _finished, timeout)
+        except TimeoutError:
+            raise RuntimeFailure(
+                FailureKind.TIMEOUT, f"Watch timeout waiting for Job {job_name} completion"
+            ) from None
+
+    async def _wait(
+        self, job_name: str, check: Callable[[Any, list[Any]], Any], timeout: float
+    ) -> Any:
+        waiter = _Waiter(check, asyncio.get_running_loop().create_future())
+        self._waiters.setdefault(job_name, []).append(waiter)
+        try:
+            if self.synced:
+                self._evaluate(job_name, waiter)
+            return await asyncio.wait_for(waiter.future, timeout)
+        finally:
+            waiters = self._waiters.get(job_name, [])
+            if waiter in waiters:
+                waiters.remove(waiter)
+            if not waiters:
+                self._waiters.pop(job_name, None)
+
+    def _evaluate(self, job_name: str, waiter: _Waiter) -> None:
+        if waiter.future.done():
+            return
+        try:
+            result = waiter.check(self._jobs.get(job_name), self.pods_for(job_name))
+        except Exception as exc:
+            waiter.future.set_exception(exc)
+            return
+        if result is not _PENDING:
+            waiter.future.set_result(result)
+
+    def _notify(self, job_name: str | None) -> None:
+        if job_name is None or not self.synced:
+            return
+        for waiter in list(self._waiters.get(job_name, ())):
+            self._evaluate(job_name, waiter)
+
+    def _abandon(self, job_name: str) -> None:
+        """Fail the waiters of a Job deleted out from under them."""
+        for waiter in self._waiters.get(job_name, ()):
+            if not waiter.future.done():
+                waiter.future.set_exception(
+                    RuntimeFailure(FailureKind.RUNTIME, f"Job {job_name} was deleted")
+                )
+
+    def _notify_all(self) -> None:
+        for job_name in list(self._waiters):
+            self._notify(job_name)
+
+    # ── Watch loop ──────────────────────────────────────────────────────
+
+    async def _run(self, kind: Kind) -> None:
+        resource_version: str | None = None
+        backoff = initial = min(1.0, self._max_backoff)
+        while True:
+            try:
+                if resource_version is None:
+                    items, resource_version = await self._source.list_objects(
+                        kind, self._namespace, self._selector
+                    )
+                    self._replace(kind, items)
+                    self._synced[kind].set()
+                    self._notify_all()
+                async for event_type, obj in self._source.watch(
+                    kind, self._namespace, self._selector, resource_version
+                ):
+                    resource_version = obj.metadata.resource_version or resource_version
+                    if event_type != "BOOKMARK":
+                        self._apply(kind, event_type, obj)
+                    backoff = initial
+                # The server closed the stream: resume from the last version seen.
+            except WatchExpired:
+                logger.info("K8s {kind} watch expired; re-listing", kind=kind)
+                resource_version = None
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warn(
+                    "K8s {kind} watch failed: {error} — retrying in {delay}s",
+                    kind=kind,
+                    error=str(exc),
+                    delay=backoff,
+                )
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, self._max_backoff)
+
+    def _replace(self, kind: Kind, items: list[Any]) -> None:
+        if kind == "jobs":
+            self._jobs = {job.metadata.name: job for job in items}
+            return
+        self._pods = {}
+        self._pods_by_job = {}
+        for pod in items:
+            self._put_pod(pod)
+
+    def _apply(self, kind: Kind, event_type: str, obj: Any) -> None:
+        name = obj.metadata.name
+        if kind == "jobs":
+            if event_type == "DELETED":
+                self._jobs.pop(name, None)
+                self._abandon(name)
+            else:
+                self._jobs[name] = obj
+                self._notify(name)
+            return
+        job_name = _job_of(obj)
+        if event_type == "DELETED":
+            self._pods.pop(name, None)
+            if job_name is not None:
+                self._pods_by_job.get(job_name, set()).discard(name)
+        else:
+            self._put_pod(obj)
+        self._notify(job_name)
+
+    def _put_pod(self, pod: Any) -> None:
+        self._pods[pod.metadata.name] = pod
+        job_name = _job_of(pod)
+        if job_name is not None:
+            self._pods_by_job.setdefault(job_name, set()).add(pod.metadata.name)
+
+
+def _job_of(pod: Any) -> str | None:
+    labels = pod.metadata.labels or {}
+    return labels.get("job-name") or labels.get("batch.kubernetes.io/job-name")
+
+
+# ── Job state checks ───────────────────────────────────────────────────
+
+
+def _scheduled(job: Any, pods: list[Any]) -> Any:
+    for pod in pods:
+        phase = pod.status.phase
+        if phase == "Failed":
+            reason = getattr(pod.status, "reason", None) or "Unknown"
+            raise RuntimeFailure(
+                FailureKind.RUNTIME, f"Pod evicted or failed during scheduling: {reason}"
+            )
+        if phase == "Pending" and pod.status.container_statuses:
+            for cs in pod.status.container_statuses:
+                waiting = getattr(cs.state, "waiting", None)
+                if waiting and waiting.reason in ("ImagePullBackOff", "ErrImagePull"):
+                    message = getattr(waiting, "message", "")
+                    raise RuntimeFailure(
+                        FailureKind.IMAGE_PULL,
+                        f"Image pull failed: {waiting.reason}: {message}",
+                    )
+        if phase in ("Running", "Succeeded"):
+            return None
+    # A Job that already finished (e.g. attached to late) has nothing to schedule.
+    if job is not None and (job.status.succeeded or job.status.failed):
+        return None
+    return _PENDING
+
+
+def _finished(job: Any, pods: list[Any]) -> Any:
+    if job is None:
+        return _PENDING
+    status = job.status
+    if status.succeeded:
+        return None
+    for condition in status.conditions or []:
+        if condition.type == "Failed" and condition.status == "True":
+            return getattr(condition, "reason", None) or "Unknown"
+        if condition.type == "Complete" and condition.status == "True":
+            return None
+    if status.failed:
+        return "BackoffLimitExceeded"
+    return _PENDING
+
+
+def has_unschedulable(pods: list[Any]) -> bool:
+    """Whether any Pending pod has been marked Unschedulable by the scheduler."""
+    for pod in pods:
+        if pod.status.phase != "Pending":
+            continue
+        for condition in pod.status.conditions or []:
+            if condition.type == "PodScheduled" and condition.reason == "Unschedulable":
+                return True
+    return False
@@ -14,6 +14,7 @@ from osa.domain.shared.model.source import IngesterDefinition
 from osa.domain.shared.model.srn import ConventionSlug
 from osa.domain.shared.port.ingester_runner import IngesterInputs, IngesterOutput, IngesterRunner
 from osa.infrastructure.k8s.errors import classify_api_error
+from osa.infrastructure.k8s.informer import JobInformer, has_unschedulable
 from osa.infrastructure.logging import get_logger
 from osa.infrastructure.k8s.naming import job_name, label_value, sanitize_label
 from osa.infrastructure.runner_utils import (
@@ -42,13 +43,21 @@ class K8sIngesterRunner(IngesterRunner):
     - Source-specific env vars (OSA_FILES, OSA_SINCE, etc.)
     """
 
-    def __init__(self, api_client: ApiClient, config: K8sConfig, s3: S3Client) -> None:
+    def __init__(
+        self,
+        api_client: ApiClient,
+        config: K8sConfig,
+        s3: S3Client,
+        informer: JobInformer | None = None,
+    ) -> None:
         from kubernetes_asyncio.client import BatchV1Api, CoreV1Api
 
         self._batch_api = BatchV1Api(api_client)
         self._core_api = CoreV1Api(api_client)
         self._config = config
         self._s3 = s3
+        # Shared watch cache; without one, each wait polls the API server.
+        self._informer = informer
 
     def _s3_prefix(self, work_dir: Path, subdir: str) -> str:
         """Convert a PVC path + subdir to an S3 key prefix."""
@@ -61,7 +70,12 @@ class K8sIngesterRunner(IngesterRunner):
         reason=Unschedulable, meaning the cluster genuinely can't place it.
         Pods that are Pending but actively scheduling (image pull, node
         assignment) are normal and should not block ingestion.
+
+        With an informer this reads its cache (OSA-managed pods only) instead
+        of listing the namespace.
         """
+        if self._informer is not None and self._informer.synced:
+            return not has_unschedulable(self._informer.pods())
         namespace = self._config.namespace
         try:
             pod_list = await self._core_api.list_namespaced_pod(
@@ -144,9 +158,9 @@ class K8sIngesterRunner(IngesterRunner):
             else:
                 # Clear stale output and files from previous failed runs
                 output_prefix = self._s3_prefix(work_dir, "output")
-                await self._s3.delete_objects(output_prefix)
+                await self._s3.delete_prefix(output_prefix)
                 files_prefix = relative_path(files_dir, self._config.data_mount_path)
-                await self._s3.delete_objects(files_prefix)
+                await self._s3.delete_prefix(files_prefix)
 
                 spec = self._build_job_spec(
                     ingester,
@@ -295,6 +309,9 @@ class K8sIngesterRunner(IngesterRunner):
                 env.append(V1EnvVar(name="OSA_LIMIT", value=str(inputs.limit)))
             if inputs.offset:
                 env.append(V1EnvVar(name="OSA_OFFSET", value=str(inputs.offset)))
+            if inputs.shards > 1:
+                env.append(V1EnvVar(name="OSA_SHARD", value=str(inputs.shard)))
+                env.append(V1EnvVar(name="OSA_SHARDS", value=str(inputs.shards)))
 
         mounts = [
             V1VolumeMount(
@@ -376,6 +393,10 @@ class K8sIngesterRunner(IngesterRunner):
         timeout_seconds: float = SCHEDULING_TIMEOUT,
         poll_interval: float = 2.0,
     ) -> None:
+        if self._informer is not None:
+            await self._informer.wait_scheduled(job_name, timeout=timeout_seconds)
+            return
+
         deadline = time.monotonic() + timeout_seconds
         label_selector = f"job-name={job_name}"
 
@@ -423,6 +444,12 @@ class K8sIngesterRunner(IngesterRunner):
         poll_interval: float = 5.0,
     ) -> None:
         """Wait for Job to complete. Returns on success, raises on failure."""
+        if self._informer is not None:
+            reason = await self._informer.wait_finished(job_name, timeout=timeout_seconds)
+            if reason is not None:
+                raise await self._diagnose_failure(job_name, namespace, reason)
+            return
+
         deadline = time.monotonic() + timeout_seconds
 
         while time.monotonic() < deadline:
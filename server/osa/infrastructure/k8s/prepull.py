@@ -0,0 +1,215 @@
+"""Pre-pull hook images onto every node with a short-lived DaemonSet.
+
+A hook Job's pod pulls its image while Pending, which eats into the scheduling
+window and delays the first batch after a deploy. Prefetching schedules one pod
+per node whose init container uses the hook image (pinned by digest) and whose
+main container is a pause image. Once every pod's init container has been
+created from the image — its command's exit status is irrelevant — the image is
+in each node's cache and the DaemonSet is deleted.
+
+The DaemonSet name is derived from the image reference, so concurrent
+prefetches of the same release share one DaemonSet.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from typing import TYPE_CHECKING, Any
+
+from osa.config import K8sConfig
+from osa.domain.shared.failure import FailureKind, RuntimeFailure
+from osa.domain.validation.port.image_prefetcher import ImagePrefetcher
+from osa.infrastructure.k8s.errors import classify_api_error
+from osa.infrastructure.logging import get_logger
+
+if TYPE_CHECKING:
+    from kubernetes_asyncio.client import ApiClient, V1DaemonSet
+
+logger = get_logger(__name__)
+
+# Waiting reasons that mean the node is still fetching, or can't.
+_PULLING = {"ContainerCreating", "PodInitializing"}
+_PULL_FAILED = {"ErrImagePull", "ImagePullBackOff", "InvalidImageName"}
+
+
+def prepull_name(image_ref: str) -> str:
+    """Deterministic DNS-1035 name for the pre-pull DaemonSet of ``image_ref``."""
+    return f"osa-prepull-{hashlib.sha256(image_ref.encode()).hexdigest()[:16]}"
+
+
+class K8sImagePrefetcher(ImagePrefetcher):
+    """Warms node image caches for a release via a pre-pull DaemonSet."""
+
+    def __init__(
+        self,
+        api_client: ApiClient,
+        config: K8sConfig,
+        *,
+        poll_interval: float = 5.0,
+    ) -> None:
+        from kubernetes_asyncio.client import AppsV1Api, CoreV1Api
+
+        self._apps_api = AppsV1Api(api_client)
+        self._core_api = CoreV1Api(api_client)
+        self._config = config
+        self._poll_interval = poll_interval
+
+    async def prefetch(self, image: str, digest: str) -> None:
+        image_ref = f"{image}@{digest}"
+        name = prepull_name(image_ref)
+        namespace = self._config.namespace
+        try:
+            await self._apps_api.create_namespaced_daemon_set(
+                namespace, self._build_daemonset(name, image_ref)
+            )
+        except Exception as exc:
+            if getattr(exc, "status", None) != 409:  # 409: a concurrent prefetch owns it
+                raise classify_api_error(exc) from exc
+
+        try:
+            await self._wait_until_pulled(name, image_ref)
+        finally:
+            await self._cleanup(name)
+
+    async def _wait_until_pulled(self, name: str, image_ref: str) -> None:
+        """Poll until every scheduled pod has the image (or the timeout lapses)."""
+        namespace = self._config.namespace
+        deadline = time.monotonic() + self._config.prepull_timeout_seconds
+        while time.monotonic() < deadline:
+            try:
+                ds = await self._apps_api.read_namespaced_daemon_set(name, namespace)
+                pods = await self._core_api.list_namespaced_pod(
+                    namespace, label_selector=f"osa.io/prepull={name}"
+                )
+            except Exception as exc:
+                raise classify_api_error(exc) from exc
+
+            desired = (ds.status.desired_number_scheduled or 0) if ds.status else 0
+            pulled = 0
+            for pod in pods.items:
+                state = _init_state(pod)
+                if state in _PULL_FAILED:
+                    raise RuntimeFailure(
+                        FailureKind.IMAGE_PULL,
+                        f"Pre-pull of {image_ref} failed on node {pod.spec.node_name}: {state}",
+                    )
+                if state is not None and state not in _PULLING:
+                    pulled += 1
+            if desired and pulled >= desired:
+                logger.info("Pre-pulled {image} on {nodes} nodes", image=image_ref, nodes=pulled)
+                return
+            await asyncio.sleep(self._poll_interval)
+
+        # Not an error: nodes still pulling will finish on a hook's first run.
+        logger.warn(
+            "Pre-pull of {image} did not finish within {timeout}s",
+            image=image_ref,
+            timeout=self._config.prepull_timeout_seconds,
+        )
+
+    def _build_daemonset(self, name: str, image_ref: str) -> V1DaemonSet:
+        from kubernetes_asyncio.client import (
+            V1Capabilities,
+            V1Container,
+            V1DaemonSet,
+            V1DaemonSetSpec,
+            V1LabelSelector,
+            V1LocalObjectReference,
+            V1ObjectMeta,
+            V1PodSecurityContext,
+            V1PodSpec,
+            V1PodTemplateSpec,
+            V1ResourceRequirements,
+            V1SeccompProfile,
+            V1SecurityContext,
+        )
+
+        labels = {"osa.io/role": "prepull", "osa.io/prepull": name}
+        security = V1SecurityContext(
+            read_only_root_filesystem=True,
+            capabilities=V1Capabilities(drop=["ALL"]),
+            allow_privilege_escalation=False,
+            run_as_user=65534,
+            run_as_group=65534,
+            seccomp_profile=V1SeccompProfile(type="RuntimeDefault"),
+        )
+        tiny = V1ResourceRequirements(
+            requests={"cpu": "1m", "memory": "8Mi"},
+            limits={"cpu": "50m", "memory": "32Mi"},
+        )
+
+        pod_spec = V1PodSpec(
+            automount_service_account_token=False,
+            security_context=V1PodSecurityContext(
+                run_as_non_root=True,
+                seccomp_profile=V1SeccompProfile(type="RuntimeDefault"),
+            ),
+            # The hook image only needs to be *created* to land in the node
+            # cache; whatever its entrypoint does with "true" is irrelevant.
+            init_containers=[
+                V1Container(
+                    name="pull",
+                    image=image_ref,
+                    command=["true"],
+                    image_pull_policy="IfNotPresent",
+                    resources=tiny,
+                    security_context=security,
+                )
+            ],
+            containers=[
+                V1Container(
+                    name="pause",
+                    image=self._config.prepull_pause_image,
+                    resources=tiny,
+                    security_context=security,
+                )
+            ],
+            image_pull_secrets=[
+                V1LocalObjectReference(name=s) for s in self._config.image_pull_secrets
+            ]
+            or None,
+            service_account_name=self._config.service_account,
+            termination_grace_period_seconds=0,
+        )
+
+        return V1DaemonSet(
+            api_version="apps/v1",
+            kind="DaemonSet",
+            metadata=V1ObjectMeta(name=name, namespace=self._config.namespace, labels=labels),
+            spec=V1DaemonSetSpec(
+                selector=V1LabelSelector(match_labels=labels),
+                template=V1PodTemplateSpec(metadata=V1ObjectMeta(labels=labels), spec=pod_spec),
+            ),
+        )
+
+    async def _cleanup(self, name: str) -> None:
+        try:
+            await self._apps_api.delete_namespaced_daemon_set(
+                name, self._config.namespace, propagation_policy="Background"
+            )
+        except Exception as exc:
+            if getattr(exc, "status", None) == 404:
+                return  # Already gone (a concurrent prefetch cleaned up)
+            logger.warn(
+                "Failed to clean up pre-pull DaemonSet: {name} ({error})",
+                name=name,
+                error=str(exc),
+            )
+
+
+def _init_state(pod: Any) -> str | None:
+    """The pull init container's state: a waiting reason, "created", or None."""
+    statuses = getattr(pod.status, "init_container_statuses", None) if pod.status else None
+    if not statuses:
+        return None
+    status = statuses[0]
+    waiting = getattr(status.state, "waiting", None) if status.state else None
+    if waiting is not None:
+        reason = getattr(waiting, "reason", None) or "ContainerCreating"
+        # A failing "true" (e.g. absent in a distroless image) still means pulled.
+        if status.image_id or reason not in _PULLING | _PULL_FAILED:
+            return "created"
+        return reason
+    return "created"
@@ -15,6 +15,7 @@ from osa.domain.validation.model.hook_release import HookRelease
 from osa.domain.validation.model.hook_result import HookResult, HookStatus
 from osa.domain.validation.port.hook_runner import HookInputs, HookRunner
 from osa.infrastructure.k8s.errors import classify_api_error
+from osa.infrastructure.k8s.informer import JobInformer
 from osa.infrastructure.logging import get_logger
 from osa.infrastructure.k8s.naming import job_name
 from osa.infrastructure.runner_utils import (
@@ -43,13 +44,21 @@ class K8sHookRunner(HookRunner):
     - Timeout via activeDeadlineSeconds
     """
 
-    def __init__(self, api_client: ApiClient, config: K8sConfig, s3: S3Client) -> None:
+    def __init__(
+        self,
+        api_client: ApiClient,
+        config: K8sConfig,
+        s3: S3Client,
+        informer: JobInformer | None = None,
+    ) -> None:
         from kubernetes_asyncio.client import BatchV1Api, CoreV1Api
 
         self._batch_api = BatchV1Api(api_client)
         self._core_api = CoreV1Api(api_client)
         self._config = config
         self._s3 = s3
+        # Shared watch cache; without one, each wait polls the API server.
+        self._informer = informer
 
     def _s3_prefix(self, work_dir: Path, subdir: str) -> str:
         """Convert a PVC path + subdir to an S3 key prefix."""
@@ -155,6 +164,8 @@ class K8sHookRunner(HookRunner):
 
             # Phase 1: Wait for scheduling
             await self._wait_for_scheduling(job_name_to_watch, namespace)
+            # The hook's time runs from container start, not from pod creation.
+            start_time = time.monotonic()
 
             # Phase 2: Wait for completion (raises on failure)
             await self._wait_for_completion(
@@ -387,6 +398,10 @@ class K8sHookRunner(HookRunner):
         poll_interval: float = 2.0,
     ) -> None:
         """Wait for the Job's pod to leave Pending (Phase 1)."""
+        if self._informer is not None:
+            await self._informer.wait_scheduled(job_name, timeout=timeout_seconds)
+            return
+
         deadline = time.monotonic() + timeout_seconds
         label_selector = f"job-name={job_name}"
 
@@ -439,6 +454,12 @@ class K8sHookRunner(HookRunner):
         poll_interval: float = 5.0,
     ) -> None:
         """Wait for Job to complete (Phase 2). Returns on success, raises on failure."""
+        if self._informer is not None:
+            reason = await self._informer.wait_finished(job_name, timeout=timeout_seconds)
+            if reason is not None:
+                raise await self._diagnose_failure(job_name, namespace, reason)
+            return
+
         deadline = time.monotonic() + timeout_seconds
 
         while time.monotonic() < deadline:
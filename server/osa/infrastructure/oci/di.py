@@ -21,7 +21,11 @@ class OciProvider(Provider):
 
     @provide(scope=Scope.UOW)
     def get_hook_runner(self, docker: aiodocker.Docker, config: Config) -> HookRunner:
-        return OciHookRunner(docker=docker, host_data_dir=config.host_data_dir)
+        return OciHookRunner(
+            docker=docker,
+            host_data_dir=config.host_data_dir,
+            files_mount=config.runner.oci.files_mount,
+        )
 
     @provide(scope=Scope.UOW)
     def get_ingester_runner(self, docker: aiodocker.Docker, config: Config) -> IngesterRunner:
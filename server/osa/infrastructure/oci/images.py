@@ -0,0 +1,89 @@
+"""Hook image resolution for the OCI runner, cached per process.
+
+``resolve`` maps ``(image, digest)`` to a local image reference: the tag if it
+is present locally (locally-built images), else the pinned digest reference,
+else the image pulled from its registry. Each step is a Docker API call, and
+the pull can take minutes, so results are cached for ``ttl`` seconds and
+concurrent resolutions of the same pair share one in-flight lookup.
+
+The resolver also serves as the :class:`ImagePrefetcher` for the OCI backend:
+prefetching a release resolves (and so pulls) its image ahead of the first run.
+"""
+
+import asyncio
+import time
+
+import aiodocker
+
+from osa.domain.shared.failure import FailureKind, RuntimeFailure
+from osa.domain.validation.port.image_prefetcher import ImagePrefetcher
+from osa.infrastructure.logging import get_logger
+
+log = get_logger(__name__)
+
+
+class ImageResolver(ImagePrefetcher):
+    """Resolve hook images to local references, with a TTL cache.
+
+    ``ttl=0`` disables caching (every call goes to the Docker daemon). A cached
+    entry can go stale if the image is removed locally (``docker image prune``);
+    callers that hit "no such image" should :meth:`forget` it and resolve again.
+    """
+
+    def __init__(self, docker: aiodocker.Docker, *, ttl: float = 300.0) -> None:
+        self._docker = docker
+        self._ttl = ttl
+        self._cache: dict[tuple[str, str], tuple[str, float]] = {}
+        self._inflight: dict[tuple[str, str], asyncio.Task[str]] = {}
+
+    async def resolve(self, image: str, digest: str) -> str:
+        key = (image, digest)
+        cached = self._cache.get(key)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+
+        task = self._inflight.get(key)
+        if task is None:
+            # A task of its own, so a cancelled caller never aborts a shared pull.
+            task = asyncio.ensure_future(self._lookup(image, digest))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._settle(key, t))
+        return await asyncio.shield(task)
+
+    def forget(self, image: str, digest: str) -> None:
+        self._cache.pop((image, digest), None)
+
+    async def prefetch(self, image: str, digest: str) -> None:
+        await self.resolve(image, digest)
+
+    def _settle(self, key: tuple[str, str], task: asyncio.Task[str]) -> None:
+        del self._inflight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        if self._ttl > 0:
+            self._cache[key] = (task.result(), time.monotonic() + self._ttl)
+
+    async def _lookup(self, image: str, digest: str) -> str:
+        """Prefer a local tag, then the local digest ref, then a registry pull."""
+        # Try the tag first (works for locally-built images)
+        try:
+            await self._docker.images.inspect(image)
+            return image
+        except aiodocker.DockerError:
+            pass
+
+        # Try digest reference
+        digest_ref = f"{image}@{digest}"
+        try:
+            await self._docker.images.inspect(digest_ref)
+            return digest_ref
+        except aiodocker.DockerError:
+            pass
+
+        # Pull from registry as last resort
+        log.info("Pulling hook image", image=image)
+        try:
+            await self._docker.images.pull(image)
+        except aiodocker.DockerError as e:
+            raise RuntimeFailure(FailureKind.IMAGE_PULL, f"Image pull failed: {e}") from e
+        return image
@@ -135,6 +135,9 @@ class OciIngesterRunner(IngesterRunner):
                 env.append(f"OSA_LIMIT={inputs.limit}")
             if inputs.offset:
                 env.append(f"OSA_OFFSET={inputs.offset}")
+            if inputs.shards > 1:
+                env.append(f"OSA_SHARD={inputs.shard}")
+                env.append(f"OSA_SHARDS={inputs.shards}")
 
             binds = [
                 f"{self._host_path(staging_dir)}:/osa/in:ro",
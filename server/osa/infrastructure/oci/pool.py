@@ -0,0 +1,155 @@
+"""Warm container pool for the OCI hook runner's persistent protocol.
+
+A one-shot hook run creates, starts, waits for and deletes a container per
+invocation. Images that opt in — the label ``org.opensciencearchive.hook.protocol``
+set to ``persistent`` — may instead be kept running between runs. Each pooled
+container owns a *slot* directory whose subdirectories are bind-mounted once,
+at creation, on the usual contract paths:
+
+- ``{slot}/in``    → ``/osa/in:ro``     (records.jsonl, config.json)
+- ``{slot}/files`` → ``/osa/files:ro``  (per-record files, ``{safe_id}/``)
+- ``{slot}/out``   → ``/osa/out:rw``    (features.jsonl, progress.jsonl, …)
+- ``{slot}/ctl``   → ``/osa/ctl:rw``    (control handshake)
+
+The container starts with ``OSA_PROTOCOL=persistent`` and ``OSA_CONTROL=/osa/ctl``
+and waits for work. For each run the runner stages ``in``/``files``, then writes
+``/osa/ctl/request.json`` (``{"seq": n}``). The hook processes the batch exactly
+as a one-shot run would and signals completion by writing
+``/osa/ctl/response.json`` (``{"seq": n, "exit_code": 0}``), written atomically
+via rename. The runner moves ``out`` into the run's work dir and clears the slot.
+The mounted directories are only ever emptied in place — a replaced directory
+would stay invisible to the running container.
+
+Containers keep the one-shot sandbox (no network, read-only rootfs, all
+capabilities dropped, unprivileged user). A container is recycled after
+``max_runs`` runs, on any failure or timeout, and after ``idle_timeout``
+seconds unused.
+"""
+
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from shutil import rmtree
+from typing import Any
+
+from osa.infrastructure.logging import get_logger
+
+log = get_logger(__name__)
+
+PROTOCOL_LABEL = "org.opensciencearchive.hook.protocol"
+PERSISTENT = "persistent"
+
+
+@dataclass
+class WarmContainer:
+    """A started container bound to its slot directory."""
+
+    container: Any  # aiodocker DockerContainer
+    slot_dir: Path
+    runs: int = 0
+    idle_since: float = field(default_factory=time.monotonic)
+
+    @property
+    def in_dir(self) -> Path:
+        return self.slot_dir / "in"
+
+    @property
+    def files_dir(self) -> Path:
+        return self.slot_dir / "files"
+
+    @property
+    def out_dir(self) -> Path:
+        return self.slot_dir / "out"
+
+    @property
+    def ctl_dir(self) -> Path:
+        return self.slot_dir / "ctl"
+
+
+class WarmContainerPool:
+    """Idle warm containers keyed by hook release, shared across runner instances.
+
+    The pool only parks and evicts containers; creating them and speaking the
+    protocol is the runner's job. Single event loop: no locking needed.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        max_idle_per_release: int = 2,
+        max_runs: int = 50,
+        idle_timeout: float = 300.0,
+    ) -> None:
+        self.root = root
+        self.max_runs = max_runs
+        self._max_idle = max_idle_per_release
+        self._idle_timeout = idle_timeout
+        self._idle: dict[str, list[WarmContainer]] = {}
+        # image ref → whether the image speaks the persistent protocol
+        self._protocols: dict[str, bool] = {}
+        self._closed = False
+
+    def known_protocol(self, image_ref: str) -> bool | None:
+        return self._protocols.get(image_ref)
+
+    def remember_protocol(self, image_ref: str, persistent: bool) -> None:
+        self._protocols[image_ref] = persistent
+
+    def new_slot(self, name: str) -> Path:
+        slot = self.root / name
+        for sub in ("in", "files", "out", "ctl"):
+            (slot / sub).mkdir(parents=True, exist_ok=True)
+        return slot
+
+    async def acquire(self, key: str) -> WarmContainer | None:
+        """Pop an idle container for *key*, evicting expired ones on the way."""
+        await self._evict_expired()
+        stack = self._idle.get(key)
+        if stack:
+            return stack.pop()
+        return None
+
+    async def release(self, key: str, warm: WarmContainer, *, reusable: bool) -> None:
+        """Park *warm* for reuse, or destroy it if spent, failed, or surplus."""
+        warm.runs += 1
+        stack = self._idle.setdefault(key, [])
+        if (
+            reusable
+            and not self._closed
+            and warm.runs < self.max_runs
+            and len(stack) < self._max_idle
+        ):
+            warm.idle_since = time.monotonic()
+            stack.append(warm)
+            return
+        await self.discard(warm)
+
+    async def discard(self, warm: WarmContainer) -> None:
+        try:
+            await warm.container.delete(force=True)
+        except Exception as e:
+            log.warn(
+                "failed to delete warm hook container {container_id}: {error}",
+                container_id=getattr(warm.container, "id", "?"),
+                error=str(e),
+            )
+        rmtree(warm.slot_dir, ignore_errors=True)
+
+    async def close(self) -> None:
+        """Destroy every idle container; leased ones are destroyed on release."""
+        self._closed = True
+        idle, self._idle = self._idle, {}
+        for stack in idle.values():
+            for warm in stack:
+                await self.discard(warm)
+
+    async def _evict_expired(self) -> None:
+        cutoff = time.monotonic() - self._idle_timeout
+        for key, stack in list(self._idle.items()):
+            expired = [w for w in stack if w.idle_since < cutoff]
+            if not expired:
+                continue
+            self._idle[key] = [w for w in stack if w.idle_since >= cutoff]
+            for warm in expired:
+                await self.discard(warm)
@@ -3,10 +3,14 @@
 import asyncio
 import json
 import os
+import shutil
 import stat
 import time
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 from shutil import rmtree
+from typing import Any, Literal
+from uuid import uuid4
 
 import aiodocker
 from osa.domain.shared.failure import FailureKind, RuntimeFailure
@@ -15,11 +19,19 @@ from osa.domain.validation.model.hook_release import HookRelease
 from osa.domain.validation.model.hook_result import HookResult, HookStatus
 from osa.domain.validation.port.hook_runner import HookInputs, HookRunner
 from osa.infrastructure.logging import get_logger
+from osa.infrastructure.oci.images import ImageResolver
+from osa.infrastructure.oci.pool import (
+    PERSISTENT,
+    PROTOCOL_LABEL,
+    WarmContainer,
+    WarmContainerPool,
+)
 from osa.infrastructure.runner_utils import (
     detect_rejection,
     parse_memory,
     parse_progress_file,
 )
+from osa.infrastructure.storage.blocking import run_blocking
 
 
 def _force_remove(func, path, exc):
@@ -32,17 +44,36 @@ log = get_logger(__name__)
 
 
 class OciHookRunner(HookRunner):
-    """Executes hooks in OCI containers via aiodocker."""
+    """Executes hooks in OCI containers via aiodocker.
+
+    By default every run is a fresh container. Given a :class:`WarmContainerPool`,
+    images labelled for the persistent protocol are run in pooled, pre-started
+    containers instead (see :mod:`osa.infrastructure.oci.pool`).
+
+    Per-record files reach the container as ``$OSA_FILES/{id}/``. With
+    ``files_mount="single"`` (the default) they are hardlinked into the run's
+    staging ``files/`` directory and bound once, so container setup stays
+    constant in the batch size; ``"per_record"`` binds each record's directory
+    separately, which the daemon sets up one mount at a time.
+    """
 
     def __init__(
         self,
         docker: aiodocker.Docker,
         host_data_dir: str | None = None,
         container_data_dir: str = "/data",
+        pool: WarmContainerPool | None = None,
+        poll_interval: float = 0.05,
+        images: ImageResolver | None = None,
+        files_mount: Literal["single", "per_record"] = "single",
     ):
         self._docker = docker
+        self._images = images or ImageResolver(docker, ttl=0)
         self._host_data_dir = host_data_dir
         self._container_data_dir = container_data_dir
+        self._pool = pool
+        self._poll_interval = poll_interval
+        self._files_mount = files_mount
 
     async def capture_logs(self, run_id: str) -> str:
         """OCI containers are deleted after run — logs captured inline during execution."""
@@ -76,14 +107,26 @@ class OciHookRunner(HookRunner):
             files_base = staging_dir / "files"
             files_base.mkdir(exist_ok=True)
 
+            # Resolved (and pulled, if need be) before the clock starts: image
+            # availability is not the hook's time budget.
+            image_ref = await self._images.resolve(release.runtime.image, release.runtime.digest)
+
             start_time = time.monotonic()
 
             try:
 
-                async def _resolve_and_run():
-                    image_ref = await self._resolve_image(
-                        release.runtime.image, release.runtime.digest
-                    )
+                async def _execute():
+                    if self._pool is not None and await self._speaks_persistent(image_ref):
+                        return await self._run_warm(
+                            self._pool,
+                            image_ref,
+                            staging_dir,
+                            inputs.files_dirs,
+                            container_output,
+                            hook,
+                            release,
+                            files_base,
+                        )
                     return await self._run_container(
                         image_ref,
                         staging_dir,
@@ -95,7 +138,7 @@ class OciHookRunner(HookRunner):
                     )
 
                 result = await asyncio.wait_for(
-                    _resolve_and_run(),
+                    _execute(),
                     timeout=timeout,
                 )
                 result_duration = time.monotonic() - start_time
@@ -136,39 +179,18 @@ class OciHookRunner(HookRunner):
                 f"{self._host_path(output_dir)}:/osa/out:rw",
             ]
 
-            # Mount per-record file directories under /osa/files/{id}/
-            # Sanitize IDs to avoid colons breaking Docker's bind mount syntax
-            if files_dirs:
+            # Per-record file directories appear under /osa/files/{id}/
+            if files_dirs and self._files_mount == "single":
+                await run_blocking(_link_record_files, files_dirs, files_base)
+                binds.append(f"{self._host_path(files_base)}:/osa/files:ro")
+            elif files_dirs:
                 for record_id, fdir in files_dirs.items():
                     if fdir and fdir.exists():
-                        safe_id = record_id.replace(":", "_").replace("@", "_")
-                        binds.append(f"{self._host_path(fdir)}:/osa/files/{safe_id}:ro")
+                        binds.append(f"{self._host_path(fdir)}:/osa/files/{_safe_id(record_id)}:ro")
             elif files_base.exists():
                 binds.append(f"{self._host_path(files_base)}:/osa/files:ro")
 
-            # todo: use pydantic
-            config = {
-                "Image": image_ref,
-                "Env": [
-                    "OSA_IN=/osa/in",
-                    "OSA_OUT=/osa/out",
-                    "OSA_FILES=/osa/files",
-                    f"OSA_HOOK_NAME={hook.name}",
-                ],
-                "User": "65534:65534",
-                "HostConfig": {
-                    "Binds": binds,
-                    "Memory": parse_memory(release.runtime.limits.memory),
-                    "MemorySwap": parse_memory(release.runtime.limits.memory),
-                    "NanoCpus": int(float(release.runtime.limits.cpu) * 1e9),
-                    "NetworkMode": "none",
-                    "ReadonlyRootfs": True,
-                    "CapDrop": ["ALL"],
-                    "SecurityOpt": ["no-new-privileges"],
-                    "PidsLimit": 256,
-                    "Tmpfs": {"/tmp": "rw,noexec,nosuid,size=100m"},
-                },
-            }
+            config = self._container_config(image_ref, binds, hook, release)
 
             container = await self._docker.containers.create(config)
             await container.start()
@@ -180,56 +202,17 @@ class OciHookRunner(HookRunner):
             inspect_data = await container.show()
             oom_killed = inspect_data.get("State", {}).get("OOMKilled", False)
 
-            if oom_killed:
-                # Capture the container's logs as a tenant-scoped artifact for
-                # provenance — never echo tenant output to operator logs/stderr (#147).
-                try:
-                    oom_logs = await container.log(stdout=True, stderr=True)
-                    oom_text = "".join(oom_logs) if oom_logs else None
-                except Exception:
-                    oom_text = None
-                log.error(
-                    "OOM: hook={hook_name} limit={memory}",
-                    hook_name=hook.name,
-                    memory=release.runtime.limits.memory,
-                )
-                raise RuntimeFailure(
-                    FailureKind.OOM,
-                    f"Hook killed by OOM (limit: {release.runtime.limits.memory})",
-                    container_logs=oom_text,
-                )
-
-            # Parse progress file
-            progress = parse_progress_file(output_dir)
-
-            # Check for rejection in progress
-            rejected, rejection = detect_rejection(progress)
-            if rejected:
-                return {
-                    "status": HookStatus.REJECTED,
-                    "rejection_reason": rejection,
-                    "progress": progress,
-                }
-
-            if exit_code != 0:
+            async def _logs() -> str | None:
                 logs = await container.log(stdout=True, stderr=True)
-                logs_str = "".join(logs) if logs else None
-                raise RuntimeFailure(
-                    FailureKind.HOOK_EXIT,
-                    f"Hook exited with code {exit_code}",
-                    exit_code=exit_code,
-                    container_logs=logs_str,
-                )
+                return "".join(logs) if logs else None
 
-            return {
-                "status": HookStatus.PASSED,
-                "progress": progress,
-            }
+            return await self._evaluate(exit_code, oom_killed, output_dir, hook, release, _logs)
 
         except RuntimeFailure:
             raise
         except aiodocker.DockerError as e:
             log.error("Docker error running hook", error=str(e))
+            self._forget_missing_image(e, release)
             raise RuntimeFailure(FailureKind.RUNTIME, f"Docker error: {e}") from e
         except Exception as e:
             log.error("Unexpected error running hook", error=str(e))
@@ -245,6 +228,253 @@ class OciHookRunner(HookRunner):
                         error=str(e),
                     )
 
+    def _forget_missing_image(self, error: aiodocker.DockerError, release: HookRelease) -> None:
+        """Drop a cached resolution the daemon no longer has (e.g. pruned)."""
+        if error.status == 404:
+            self._images.forget(release.runtime.image, release.runtime.digest)
+
+    def _container_config(
+        self,
+        image_ref: str,
+        binds: list[str],
+        hook: HookIdentity,
+        release: HookRelease,
+        extra_env: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Sandboxed container spec shared by one-shot and warm containers."""
+        # todo: use pydantic
+        return {
+            "Image": image_ref,
+            "Env": [
+                "OSA_IN=/osa/in",
+                "OSA_OUT=/osa/out",
+                "OSA_FILES=/osa/files",
+                f"OSA_HOOK_NAME={hook.name}",
+                *(extra_env or []),
+            ],
+            "User": "65534:65534",
+            "HostConfig": {
+                "Binds": binds,
+                "Memory": parse_memory(release.runtime.limits.memory),
+                "MemorySwap": parse_memory(release.runtime.limits.memory),
+                "NanoCpus": int(float(release.runtime.limits.cpu) * 1e9),
+                "NetworkMode": "none",
+                "ReadonlyRootfs": True,
+                "CapDrop": ["ALL"],
+                "SecurityOpt": ["no-new-privileges"],
+                "PidsLimit": 256,
+                "Tmpfs": {"/tmp": "rw,noexec,nosuid,size=100m"},
+            },
+        }
+
+    async def _evaluate(
+        self,
+        exit_code: int,
+        oom_killed: bool,
+        output_dir: Path,
+        hook: HookIdentity,
+        release: HookRelease,
+        fetch_logs: Callable[[], Awaitable[str | None]],
+    ) -> dict:
+        """Turn a finished run (exit code + outputs) into a result or a failure."""
+        if oom_killed:
+            # Capture the container's logs as a tenant-scoped artifact for
+            # provenance — never echo tenant output to operator logs/stderr (#147).
+            try:
+                oom_text = await fetch_logs()
+            except Exception:
+                oom_text = None
+            log.error(
+                "OOM: hook={hook_name} limit={memory}",
+                hook_name=hook.name,
+                memory=release.runtime.limits.memory,
+            )
+            raise RuntimeFailure(
+                FailureKind.OOM,
+                f"Hook killed by OOM (limit: {release.runtime.limits.memory})",
+                container_logs=oom_text,
+            )
+
+        # Parse progress file
+        progress = parse_progress_file(output_dir)
+
+        # Check for rejection in progress
+        rejected, rejection = detect_rejection(progress)
+        if rejected:
+            return {
+                "status": HookStatus.REJECTED,
+                "rejection_reason": rejection,
+                "progress": progress,
+            }
+
+        if exit_code != 0:
+            raise RuntimeFailure(
+                FailureKind.HOOK_EXIT,
+                f"Hook exited with code {exit_code}",
+                exit_code=exit_code,
+                container_logs=await fetch_logs(),
+            )
+
+        return {
+            "status": HookStatus.PASSED,
+            "progress": progress,
+        }
+
+    # ── Warm (persistent-protocol) containers ───────────────────────────
+
+    async def _speaks_persistent(self, image_ref: str) -> bool:
+        """Whether the image opts in to the persistent protocol (label, cached)."""
+        assert self._pool is not None
+        known = self._pool.known_protocol(image_ref)
+        if known is None:
+            try:
+                info = await self._docker.images.inspect(image_ref)
+                labels = (info.get("Config") or {}).get("Labels") or {}
+            except (aiodocker.DockerError, AttributeError):
+                labels = {}
+            known = labels.get(PROTOCOL_LABEL) == PERSISTENT
+            self._pool.remember_protocol(image_ref, known)
+        return known
+
+    async def _run_warm(
+        self,
+        pool: WarmContainerPool,
+        image_ref: str,
+        staging_dir: Path,
+        files_dirs: dict[str, Path],
+        output_dir: Path,
+        hook: HookIdentity,
+        release: HookRelease,
+        files_base: Path,
+    ) -> dict:
+        # Limits are baked into the container, so an OOM retry's doubled-memory
+        # release gets its own pool entry.
+        limits = release.runtime.limits
+        key = f"{release.id}:{image_ref}:{limits.memory}:{limits.cpu}"
+        reusable = False
+        warm = await pool.acquire(key)
+        try:
+            if warm is None:
+                warm = await self._start_warm(pool, image_ref, hook, release)
+            exit_code, oom_killed, fetch_logs = await self._dispatch(
+                warm, staging_dir, files_dirs, files_base, output_dir
+            )
+            result = await self._evaluate(
+                exit_code, oom_killed, output_dir, hook, release, fetch_logs
+            )
+            reusable = True
+            return result
+        except RuntimeFailure:
+            raise
+        except aiodocker.DockerError as e:
+            log.error("Docker error running warm hook", error=str(e))
+            self._forget_missing_image(e, release)
+            raise RuntimeFailure(FailureKind.RUNTIME, f"Docker error: {e}") from e
+        except Exception as e:
+            log.error("Unexpected error running warm hook", error=str(e))
+            raise RuntimeFailure(FailureKind.RUNTIME, f"Unexpected error: {e}") from e
+        finally:
+            # Failures, timeouts (cancellation) and spent containers are recycled.
+            if warm is not None:
+                if reusable:
+                    await pool.release(key, warm, reusable=True)
+                else:
+                    await pool.discard(warm)
+
+    async def _start_warm(
+        self,
+        pool: WarmContainerPool,
+        image_ref: str,
+        hook: HookIdentity,
+        release: HookRelease,
+    ) -> WarmContainer:
+        slot = pool.new_slot(uuid4().hex)
+        binds = [
+            f"{self._host_path(slot / 'in')}:/osa/in:ro",
+            f"{self._host_path(slot / 'files')}:/osa/files:ro",
+            f"{self._host_path(slot / 'out')}:/osa/out:rw",
+            f"{self._host_path(slot / 'ctl')}:/osa/ctl:rw",
+        ]
+        config = self._container_config(
+            image_ref,
+            binds,
+            hook,
+            release,
+            extra_env=[f"OSA_PROTOCOL={PERSISTENT}", "OSA_CONTROL=/osa/ctl"],
+        )
+        container = None
+        try:
+            container = await self._docker.containers.create(config)
+            await container.start()
+        except BaseException:
+            if container is not None:
+                await pool.discard(WarmContainer(container=container, slot_dir=slot))
+            else:
+                rmtree(slot, ignore_errors=True)
+            raise
+        return WarmContainer(container=container, slot_dir=slot)
+
+    async def _dispatch(
+        self,
+        warm: WarmContainer,
+        staging_dir: Path,
+        files_dirs: dict[str, Path],
+        files_base: Path,
+        output_dir: Path,
+    ) -> tuple[int, bool, Callable[[], Awaitable[str | None]]]:
+        """Hand one batch to a warm container and wait for its response.
+
+        Returns ``(exit_code, oom_killed, fetch_logs)`` for :meth:`_evaluate`;
+        the container's outputs are moved into *output_dir*.
+        """
+        await run_blocking(_stage_slot, warm, staging_dir, files_dirs, files_base)
+
+        seq = warm.runs + 1
+        since = int(time.time())
+        await run_blocking(_write_json_atomic, warm.ctl_dir / "request.json", {"seq": seq})
+
+        exit_code = await self._await_response(warm, seq, output_dir)
+        await run_blocking(_move_tree, warm.out_dir, output_dir)
+
+        async def _logs() -> str | None:
+            logs = await warm.container.log(stdout=True, stderr=True, since=since)
+            return "".join(logs) if logs else None
+
+        if exit_code is not None:
+            return exit_code, False, _logs
+
+        # The container died instead of answering: OOM, or a protocol violation.
+        state = (await warm.container.show()).get("State", {})
+        if state.get("OOMKilled", False):
+            return state.get("ExitCode", -1), True, _logs
+        raise RuntimeFailure(
+            FailureKind.RUNTIME,
+            f"Warm hook container exited without responding (code {state.get('ExitCode')})",
+            container_logs=await _logs(),
+        )
+
+    async def _await_response(self, warm: WarmContainer, seq: int, output_dir: Path) -> int | None:
+        """Poll for the response to request *seq*; ``None`` if the container died.
+
+        While it waits, features.jsonl is mirrored into *output_dir* as it
+        grows, so the hook service's output tail sees a warm run's records as
+        early as a one-shot run's. The final move replaces the mirror.
+        """
+        response = warm.ctl_dir / "response.json"
+        mirrored = 0
+        polls = 0
+        liveness_every = max(1, int(1.0 / self._poll_interval))
+        while True:
+            data, mirrored = await run_blocking(
+                _poll_slot, response, warm.out_dir, output_dir, mirrored
+            )
+            if data is not None and data.get("seq") == seq:
+                return int(data.get("exit_code", 0))
+            polls += 1
+            if polls % liveness_every == 0 and not await _is_running(warm):
+                return None
+            await asyncio.sleep(self._poll_interval)
+
     def _host_path(self, container_path: Path) -> str:
         """Translate a container-internal path to a host path for bind mounts."""
         path_str = str(container_path)
@@ -252,27 +482,112 @@ class OciHookRunner(HookRunner):
             path_str = path_str.replace(self._container_data_dir, self._host_data_dir, 1)
         return path_str
 
-    async def _resolve_image(self, image: str, digest: str) -> str:
-        """Resolve an image reference, preferring local tag over registry pull."""
-        # Try the tag first (works for locally-built images)
-        try:
-            await self._docker.images.inspect(image)
-            return image
-        except aiodocker.DockerError:
-            pass
 
-        # Try digest reference
-        digest_ref = f"{image}@{digest}"
-        try:
-            await self._docker.images.inspect(digest_ref)
-            return digest_ref
-        except aiodocker.DockerError:
-            pass
-
-        # Pull from registry as last resort
-        log.info("Pulling hook image", image=image)
-        try:
-            await self._docker.images.pull(image)
-        except aiodocker.DockerError as e:
-            raise RuntimeFailure(FailureKind.IMAGE_PULL, f"Image pull failed: {e}") from e
-        return image
+async def _is_running(warm: WarmContainer) -> bool:
+    state = (await warm.container.show()).get("State", {})
+    return bool(state.get("Running", False))
+
+
+def _clear_dir(path: Path) -> None:
+    """Empty *path* in place.
+
+    A warm slot's ``in``/``files``/``out`` are bind-mounted into the running
+    container one by one; replacing such a directory would leave the container
+    holding the deleted original, so only its contents are removed.
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    for entry in path.iterdir():
+        if entry.is_dir() and not entry.is_symlink():
+            rmtree(entry, onexc=_force_remove)
+        else:
+            entry.unlink()
+
+
+def _stage_slot(
+    warm: WarmContainer, staging_dir: Path, files_dirs: dict[str, Path], files_base: Path
+) -> None:
+    """Refill a warm slot with one run's inputs (on the storage I/O pool)."""
+    for d in (warm.in_dir, warm.files_dir, warm.out_dir):
+        _clear_dir(d)
+    (warm.ctl_dir / "response.json").unlink(missing_ok=True)
+
+    _link_tree(staging_dir, warm.in_dir, skip={"files"})
+    if files_dirs:
+        _link_record_files(files_dirs, warm.files_dir)
+    elif files_base.exists():
+        _link_tree(files_base, warm.files_dir)
+
+
+def _poll_slot(
+    response: Path, out_dir: Path, output_dir: Path, mirrored: int
+) -> tuple[dict[str, Any] | None, int]:
+    """Read the slot's response (if any) and mirror features.jsonl past *mirrored*.
+
+    Returns ``(response, bytes mirrored so far)``; a response mid-write by a
+    non-atomic writer reads as ``{}`` and is polled again.
+    """
+    try:
+        with (out_dir / "features.jsonl").open("rb") as f:
+            f.seek(mirrored)
+            chunk = f.read()
+    except FileNotFoundError:
+        chunk = b""
+    if chunk:
+        with (output_dir / "features.jsonl").open("ab" if mirrored else "wb") as f:
+            f.write(chunk)
+        mirrored += len(chunk)
+
+    try:
+        data = json.loads(response.read_text())
+    except FileNotFoundError:
+        return None, mirrored
+    except ValueError:
+        return {}, mirrored
+    return data, mirrored
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _link_tree(src: Path, dst: Path, skip: set[str] | None = None) -> None:
+    """Materialise *src* under *dst* by hardlinks (copy fallback across devices)."""
+    dst.mkdir(parents=True, exist_ok=True)
+    for entry in src.iterdir():
+        if skip and entry.name in skip:
+            continue
+        target = dst / entry.name
+        if entry.is_dir():
+            shutil.copytree(entry, target, copy_function=_link_or_copy, dirs_exist_ok=True)
+        else:
+            _link_or_copy(str(entry), str(target))
+
+
+def _safe_id(record_id: str) -> str:
+    """Record id as a path segment; colons would also break Docker's bind syntax."""
+    return record_id.replace(":", "_").replace("@", "_")
+
+
+def _link_record_files(files_dirs: dict[str, Path], dst: Path) -> None:
+    """Lay out each record's files as ``dst/{id}/`` for a single ``/osa/files`` mount."""
+    for record_id, fdir in files_dirs.items():
+        if fdir and fdir.exists():
+            _link_tree(fdir, dst / _safe_id(record_id))
+
+
+def _move_tree(src: Path, dst: Path) -> None:
+    dst.mkdir(parents=True, exist_ok=True)
+    for entry in src.iterdir():
+        target = dst / entry.name
+        if target.is_dir():
+            rmtree(target, onexc=_force_remove)
+        shutil.move(str(entry), str(target))
+
+
+def _write_json_atomic(path: Path, data: dict[str, Any]) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(data))
+    os.replace(tmp, path)
@@ -5,6 +5,19 @@ import os
 from pathlib import Path
 from typing import Any
 
+from osa.infrastructure.storage.blobs import (
+    FilesystemBlobStore,
+    hash_tree,
+    read_manifest,
+    write_manifest,
+)
+from osa.infrastructure.storage.blocking import run_blocking, write_output_text
+from osa.infrastructure.storage.jsonl import (
+    IntermediateFormat,
+    open_text,
+    read_candidates,
+    stale_variants,
+)
 from osa.infrastructure.storage.layout import StorageLayout
 
 
@@ -12,50 +25,48 @@ class FilesystemIngestStorage:
     """Local filesystem adapter for IngestStoragePort.
 
     Used in local dev and self-hosted (Docker) deployments.
-    Delegates path computation to StorageLayout.
+    Delegates path computation to StorageLayout; async methods do their file
+    I/O on the bounded storage I/O pool. Given a ``blobs`` store, sealed batch
+    files are deduplicated against it.
     """
 
-    def __init__(self, layout: StorageLayout) -> None:
+    def __init__(self, layout: StorageLayout, blobs: FilesystemBlobStore | None = None) -> None:
         self._layout = layout
+        self._blobs = blobs
 
-    async def read_session(self, ingest_run_id: str) -> dict[str, Any] | None:
-        session_file = self._layout.ingest_session_file(ingest_run_id)
-        if not session_file.exists():
-            return None
-        return json.loads(session_file.read_text())
+    async def read_session(self, ingest_run_id: str, shard: int = 0) -> dict[str, Any] | None:
+        session_file = self._layout.ingest_session_file(ingest_run_id, shard)
+        return await run_blocking(_read_session_file, session_file)
 
-    async def write_session(self, ingest_run_id: str, session: dict[str, Any]) -> None:
-        session_file = self._layout.ingest_session_file(ingest_run_id)
-        session_file.parent.mkdir(parents=True, exist_ok=True)
-        # Atomic write via temp file + os.replace to handle mountpoint-for-s3
-        tmp = session_file.with_suffix(".tmp")
-        tmp.write_text(json.dumps(session))
-        os.replace(tmp, session_file)
+    async def write_session(
+        self, ingest_run_id: str, session: dict[str, Any], shard: int = 0
+    ) -> None:
+        session_file = self._layout.ingest_session_file(ingest_run_id, shard)
+        await run_blocking(_write_session_file, session_file, json.dumps(session))
 
     async def write_records(
         self, ingest_run_id: str, batch_index: int, records: list[dict[str, Any]]
     ) -> None:
-        ingester_dir = self._layout.ingest_batch_ingester_dir(ingest_run_id, batch_index)
-        ingester_dir.mkdir(parents=True, exist_ok=True)
-        records_file = ingester_dir / "records.jsonl"
-        tmp = records_file.with_suffix(".tmp")
-        with tmp.open("w") as f:
-            for record in records:
-                f.write(json.dumps(record) + "\n")
-        os.replace(tmp, records_file)
+        records_file = self._layout.ingest_batch_records_file(ingest_run_id, batch_index)
+        await run_blocking(
+            _write_records_file, records_file, records, self._layout.intermediate_format
+        )
 
     async def read_records(self, ingest_run_id: str, batch_index: int) -> list[dict[str, Any]]:
         ingester_dir = self._layout.ingest_batch_ingester_dir(ingest_run_id, batch_index)
-        records_file = ingester_dir / "records.jsonl"
-        if not records_file.exists():
-            return []
-        records: list[dict[str, Any]] = []
-        for line in records_file.open():
-            line = line.strip()
-            if not line:
-                continue
-            records.append(json.loads(line))
-        return records
+        return await run_blocking(
+            _read_records_file, ingester_dir, self._layout.intermediate_format
+        )
+
+    async def seal_batch_files(self, ingest_run_id: str, batch_index: int) -> None:
+        if self._blobs is None:
+            return
+        ingester_dir = self._layout.ingest_batch_ingester_dir(ingest_run_id, batch_index)
+        await run_blocking(_seal_files_dir, self._blobs, ingester_dir)
+
+    async def batch_file_digests(self, ingest_run_id: str, batch_index: int) -> dict[str, str]:
+        ingester_dir = self._layout.ingest_batch_ingester_dir(ingest_run_id, batch_index)
+        return await run_blocking(_file_digests, ingester_dir)
 
     def batch_dir(self, ingest_run_id: str, batch_index: int) -> Path:
         d = self._layout.ingest_batch_dir(ingest_run_id, batch_index)
@@ -79,16 +90,67 @@ class FilesystemIngestStorage:
 
     async def write_run_ref(self, work_dir: Path, run_id: str, release_id: str) -> None:
         """Write run.json alongside a hook's features (per-row provenance, #145)."""
-        output_dir = Path(work_dir) / "output"
-        output_dir.mkdir(parents=True, exist_ok=True)
-        (output_dir / "run.json").write_text(
-            json.dumps({"run_id": run_id, "release_id": release_id})
+        run_file = Path(work_dir) / "output" / "run.json"
+        await run_blocking(
+            write_output_text, run_file, json.dumps({"run_id": run_id, "release_id": release_id})
         )
 
     async def write_hook_log(self, work_dir: Path, text: str) -> str:
         """Write a failed hook's container logs to output/hook.log (#145/#147)."""
-        output_dir = Path(work_dir) / "output"
-        output_dir.mkdir(parents=True, exist_ok=True)
-        log_path = output_dir / "hook.log"
-        log_path.write_text(text)
+        log_path = Path(work_dir) / "output" / "hook.log"
+        await run_blocking(write_output_text, log_path, text)
         return str(log_path)
+
+
+def _seal_files_dir(blobs: FilesystemBlobStore, ingester_dir: Path) -> None:
+    write_manifest(ingester_dir, blobs.adopt_tree(ingester_dir / "files"))
+
+
+def _file_digests(ingester_dir: Path) -> dict[str, str]:
+    # A sealed (deduped) batch already has every digest in its manifest.
+    return read_manifest(ingester_dir) or hash_tree(ingester_dir / "files")
+
+
+def _read_session_file(session_file: Path) -> dict[str, Any] | None:
+    if not session_file.exists():
+        return None
+    return json.loads(session_file.read_text())
+
+
+def _write_session_file(session_file: Path, content: str) -> None:
+    session_file.parent.mkdir(parents=True, exist_ok=True)
+    # Atomic write via temp file + os.replace to handle mountpoint-for-s3
+    tmp = session_file.with_suffix(".tmp")
+    tmp.write_text(content)
+    os.replace(tmp, session_file)
+
+
+def _write_records_file(
+    records_file: Path, records: list[dict[str, Any]], fmt: IntermediateFormat
+) -> None:
+    records_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp = records_file.with_name(records_file.name + ".tmp")
+    with open_text(tmp, "w", fmt) as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+    os.replace(tmp, records_file)
+    # A redo under a different format must not leave the old variant behind.
+    for stale in stale_variants("records.jsonl", fmt):
+        (records_file.parent / stale).unlink(missing_ok=True)
+
+
+def _read_records_file(ingester_dir: Path, preferred: IntermediateFormat) -> list[dict[str, Any]]:
+    for name, fmt in read_candidates("records.jsonl", preferred):
+        records_file = ingester_dir / name
+        if records_file.exists():
+            break
+    else:
+        return []
+    records: list[dict[str, Any]] = []
+    with open_text(records_file, "r", fmt) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            records.append(json.loads(line))
+    return records
@@ -4,10 +4,10 @@ import logging
 import os
 import shutil
 import tempfile
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Collection
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, TextIO
 
 from osa.domain.deposition.model.value import DepositionFile
 from osa.domain.deposition.port.storage import FileStoragePort
@@ -19,6 +19,28 @@ from osa.domain.validation.model.batch_outcome import (
     HookRecordId,
     OutcomeStatus,
 )
+from osa.infrastructure.storage.batch_outcomes import (
+    BATCH_OUTPUT_FILES,
+    OUTCOME_CHUNK_BYTES,
+    batch_output_files,
+    parse_features_tail,
+    parse_outcome_lines,
+    read_output_dir,
+)
+from osa.infrastructure.storage.blobs import (
+    FilesystemBlobStore,
+    detach,
+    read_manifest,
+    write_manifest,
+)
+from osa.infrastructure.storage.blocking import run_blocking, write_output_text
+from osa.infrastructure.storage.jsonl import (
+    IntermediateFormat,
+    open_text,
+    read_candidates,
+    stale_variants,
+    variant_name,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -28,10 +50,27 @@ class FilesystemStorageAdapter(FileStoragePort):
 
     Implements FileStoragePort (deposition files),
     HookStoragePort, and FeatureStoragePort via structural subtyping.
+
+    Every async method does its POSIX work on the bounded storage I/O pool
+    (:func:`run_blocking`) — on the S3-CSI mount a single call can block for
+    hundreds of ms, which must not stall the worker's event loop.
+
+    Given a ``blobs`` store, deposition files are deduplicated against it and
+    each deposition keeps a ``manifest.json`` of filename → sha256 digest.
     """
 
-    def __init__(self, base_path: str, data_root: str | None = None) -> None:
+    def __init__(
+        self,
+        base_path: str,
+        data_root: str | None = None,
+        intermediate_format: IntermediateFormat = IntermediateFormat.JSONL,
+        blobs: FilesystemBlobStore | None = None,
+    ) -> None:
         self.base_path = Path(base_path)
+        self._blobs = blobs
+        # Encoding of the canonical outcome files written by write_batch_outcomes;
+        # reads detect each file's format from its extension.
+        self._intermediate_format = intermediate_format
         # Confinement root for read-by-locator (read_hook_log). The node data root
         # spans both deposition logs (under files/, where base_path points) and
         # ingestion logs (under ingests/), so a locator from either path resolves
@@ -65,6 +104,16 @@ class FilesystemStorageAdapter(FileStoragePort):
         output_dir.mkdir(parents=True, exist_ok=True)
         return output_dir
 
+    def get_hook_batch_dir(self, batch_id: str, hook_name: str) -> Path:
+        batch_dir = self.base_path / "validation-batches" / batch_id / "hooks" / hook_name
+        batch_dir.mkdir(parents=True, exist_ok=True)
+        return batch_dir
+
+    async def delete_hook_batch(self, batch_id: str) -> None:
+        await run_blocking(
+            shutil.rmtree, self.base_path / "validation-batches" / batch_id, ignore_errors=True
+        )
+
     def get_hook_output_root(self, source_type: str, source_id: str) -> str:
         """Resolve the root directory for a given source type and id."""
         if source_type == "deposition":
@@ -78,33 +127,25 @@ class FilesystemStorageAdapter(FileStoragePort):
         self, hook_output_dir: str, feature_name: str
     ) -> list[dict[str, Any]]:
         features_file = Path(hook_output_dir) / "hooks" / feature_name / "output" / "features.json"
-        if not features_file.exists():
-            return []
-        data = json.loads(features_file.read_text())
-        if isinstance(data, list):
-            return data
-        elif isinstance(data, dict):
-            return [data]
-        return []
+        return await run_blocking(_read_features_json, features_file)
 
     async def hook_features_exist(self, hook_output_dir: str, feature_name: str) -> bool:
         features_file = Path(hook_output_dir) / "hooks" / feature_name / "output" / "features.json"
-        return features_file.exists()
+        return await run_blocking(features_file.exists)
 
     async def write_run_ref(self, work_dir: Path, run_id: str, release_id: str) -> None:
         """Write run.json alongside a hook's features (per-row provenance, #145)."""
         output_dir = Path(work_dir) / "output"
-        output_dir.mkdir(parents=True, exist_ok=True)
-        (output_dir / "run.json").write_text(
-            json.dumps({"run_id": run_id, "release_id": release_id})
+        await run_blocking(
+            write_output_text,
+            output_dir / "run.json",
+            json.dumps({"run_id": run_id, "release_id": release_id}),
         )
 
     async def write_hook_log(self, work_dir: Path, text: str) -> str:
         """Write a failed hook's container logs to output/hook.log (#145/#147)."""
-        output_dir = Path(work_dir) / "output"
-        output_dir.mkdir(parents=True, exist_ok=True)
-        log_path = output_dir / "hook.log"
-        log_path.write_text(text)
+        log_path = Path(work_dir) / "output" / "hook.log"
+        await run_blocking(write_output_text, log_path, text)
         return str(log_path)
 
     async def read_hook_log(self, log_ref: str) -> AsyncIterator[bytes]:
@@ -116,24 +157,20 @@ class FilesystemStorageAdapter(FileStoragePort):
         """
         from osa.domain.shared.error import NotFoundError
 
-        target = Path(log_ref).resolve()
-        if not target.is_relative_to(self._data_root.resolve()):
+        target = await run_blocking(Path(log_ref).resolve)
+        data_root = await run_blocking(self._data_root.resolve)
+        if not target.is_relative_to(data_root):
             raise ValueError(f"log_ref escapes the data root: {log_ref}")
-        if not target.is_file():
+        if not await run_blocking(target.is_file):
             raise NotFoundError(f"Hook log not found: {log_ref}")
 
-        async def _stream() -> AsyncIterator[bytes]:
-            with open(target, "rb") as f:
-                while chunk := f.read(8192):
-                    yield chunk
-
-        return _stream()
+        return _stream_file(target)
 
     async def read_run_ref(self, output_dir: str, hook_name: str) -> RunRef | None:
         run_file = Path(output_dir) / "hooks" / hook_name / "output" / "run.json"
-        if not run_file.exists():
+        data = await run_blocking(_read_json_or_none, run_file)
+        if data is None:
             return None
-        data = json.loads(run_file.read_text())
         return RunRef(run_id=data["run_id"], release_id=data["release_id"])
 
     async def save_file(
@@ -143,6 +180,17 @@ class FilesystemStorageAdapter(FileStoragePort):
         content: bytes,
         size: int,
     ) -> DepositionFile:
+        checksum = await run_blocking(self._save_file_sync, deposition_id, filename, content)
+        return DepositionFile(
+            name=filename,
+            size=size,
+            checksum=f"sha256:{checksum}",
+            content_type=None,
+            uploaded_at=datetime.now(UTC),
+        )
+
+    def _save_file_sync(self, deposition_id: DepositionSRN, filename: str, content: bytes) -> str:
+        """Blocking half of save_file. Returns the sha256 hex digest of *content*."""
         files_dir = self._files_dir(deposition_id)
         target = self._safe_path(files_dir, filename)
 
@@ -155,6 +203,7 @@ class FilesystemStorageAdapter(FileStoragePort):
                 Path(tmp_path).rename(target)
             except OSError:
                 try:
+                    detach(target)
                     shutil.copyfile(tmp_path, target)
                 except OSError as e:
                     raise InfrastructureError(f"Failed to write file {filename}: {e}") from e
@@ -166,50 +215,56 @@ class FilesystemStorageAdapter(FileStoragePort):
             Path(tmp_path).unlink(missing_ok=True)
             raise
 
-        checksum = hashlib.sha256(content).hexdigest()
-        return DepositionFile(
-            name=filename,
-            size=size,
-            checksum=f"sha256:{checksum}",
-            content_type=None,
-            uploaded_at=datetime.now(UTC),
-        )
+        digest = hashlib.sha256(content).hexdigest()
+        if self._blobs is not None:
+            self._blobs.adopt(target, digest)
+            self._update_manifest(deposition_id, {filename: digest})
+        return digest
+
+    def _update_manifest(
+        self, deposition_id: DepositionSRN, changes: dict[str, str | None]
+    ) -> None:
+        """Apply ``{filename: digest}`` changes (``None`` removes) to the manifest."""
+        dep_dir = self._dep_dir(deposition_id)
+        entries = read_manifest(dep_dir)
+        for name, digest in changes.items():
+            if digest is None:
+                entries.pop(name, None)
+            else:
+                entries[name] = digest
+        write_manifest(dep_dir, entries)
 
     async def get_file(
         self,
         deposition_id: DepositionSRN,
         filename: str,
     ) -> AsyncIterator[bytes]:
-        files_dir = self._files_dir(deposition_id)
-        target = self._safe_path(files_dir, filename)
-        if not target.exists():
+        files_dir = await run_blocking(self._files_dir, deposition_id)
+        target = await run_blocking(self._safe_path, files_dir, filename)
+        if not await run_blocking(target.exists):
             from osa.domain.shared.error import NotFoundError
 
             raise NotFoundError(f"File not found: {filename}")
 
-        async def _stream() -> AsyncIterator[bytes]:
-            with open(target, "rb") as f:
-                while chunk := f.read(8192):
-                    yield chunk
-
-        return _stream()
+        return _stream_file(target)
 
     async def delete_file(
         self,
         deposition_id: DepositionSRN,
         filename: str,
     ) -> None:
-        files_dir = self._files_dir(deposition_id)
-        target = self._safe_path(files_dir, filename)
-        target.unlink(missing_ok=True)
+        files_dir = await run_blocking(self._files_dir, deposition_id)
+        target = await run_blocking(self._safe_path, files_dir, filename)
+        await run_blocking(target.unlink, missing_ok=True)
+        if self._blobs is not None:
+            await run_blocking(self._update_manifest, deposition_id, {filename: None})
 
     async def delete_files_for_deposition(
         self,
         deposition_id: DepositionSRN,
     ) -> None:
         dep_dir = self._dep_dir(deposition_id)
-        if dep_dir.exists():
-            shutil.rmtree(dep_dir)
+        await run_blocking(_rmtree_if_exists, dep_dir)
 
     def _conv_id(self, convention_id: ConventionSlug) -> str:
         return convention_id.root
@@ -230,10 +285,15 @@ class FilesystemStorageAdapter(FileStoragePort):
         source_id: str,
         deposition_srn: DepositionSRN,
     ) -> None:
-        source_files_dir = staging_dir / source_id
+        await run_blocking(self._move_source_files_sync, staging_dir / source_id, deposition_srn)
+
+    def _move_source_files_sync(
+        self, source_files_dir: Path, deposition_srn: DepositionSRN
+    ) -> None:
         if not source_files_dir.exists():
             return
         files_dir = self._files_dir(deposition_srn)
+        moved: dict[str, str | None] = {}
         # Move files into deposition dir (copy+delete fallback for S3 CSI)
         for f in source_files_dir.iterdir():
             target = files_dir / f.name
@@ -241,10 +301,15 @@ class FilesystemStorageAdapter(FileStoragePort):
                 f.rename(target)
             except OSError:
                 try:
+                    detach(target)
                     shutil.copyfile(f, target)
                     f.unlink()
                 except OSError as e:
                     raise InfrastructureError(f"Failed to copy file {f.name}: {e}") from e
+            if self._blobs is not None and target.is_file():
+                moved[f.name] = self._blobs.adopt(target)
+        if moved:
+            self._update_manifest(deposition_srn, moved)
         # Clean up empty source_id directory
         if source_files_dir.exists():
             source_files_dir.rmdir()
@@ -252,24 +317,57 @@ class FilesystemStorageAdapter(FileStoragePort):
     async def read_batch_outcomes(
         self, output_dir: str, hook_name: str
     ) -> dict[HookRecordId, BatchRecordOutcome]:
-        """Read JSONL batch outputs from the filesystem, streaming line-by-line."""
-        hook_output = Path(output_dir) / "hooks" / hook_name / "output"
-        outcomes: dict[HookRecordId, BatchRecordOutcome] = {}
-
-        _parse_batch_output_files(hook_output, outcomes)
+        """Collect :meth:`iter_batch_outcomes` into a dict keyed by record ID."""
+        return {o.record_id: o async for o in self.iter_batch_outcomes(output_dir, hook_name)}
 
-        return outcomes
+    async def iter_batch_outcomes(
+        self,
+        output_dir: str,
+        hook_name: str,
+        *,
+        statuses: Collection[OutcomeStatus] | None = None,
+    ) -> AsyncIterator[BatchRecordOutcome]:
+        """Stream JSONL batch outputs from the filesystem, one chunk at a time.
+
+        Each chunk is read and parsed on the storage I/O pool: a large
+        features.jsonl is both slow to read off the mount and CPU-heavy to
+        validate, and only one chunk of it is held at once.
+        """
+        hook_output = Path(output_dir) / "hooks" / hook_name / "output"
+        for filename, status, field_map in batch_output_files(statuses):
+            f = await run_blocking(
+                _open_outcome_file, hook_output, filename, self._intermediate_format
+            )
+            if f is None:
+                continue
+            try:
+                while (
+                    chunk := await run_blocking(
+                        _parse_outcome_chunk, f, filename, status, field_map
+                    )
+                ) is not None:
+                    for outcome in chunk:
+                        yield outcome
+            finally:
+                await run_blocking(f.close)
 
     async def write_checkpoint(
         self, work_dir: Path, outcomes: dict[HookRecordId, BatchRecordOutcome]
     ) -> None:
         """Atomically write checkpoint JSONL via os.replace()."""
-        checkpoint_path = work_dir / "_checkpoint.jsonl"
-        tmp_path = work_dir / "_checkpoint.jsonl.tmp"
-        with tmp_path.open("w") as f:
-            for outcome in outcomes.values():
-                f.write(outcome.model_dump_json() + "\n")
-        os.replace(tmp_path, checkpoint_path)
+        await run_blocking(_write_checkpoint_file, work_dir, outcomes)
+
+    async def read_outcomes_since(
+        self, work_dir: Path, offset: int, *, final: bool = False
+    ) -> tuple[list[BatchRecordOutcome], int]:
+        data = await run_blocking(_read_from, work_dir / "output" / "features.jsonl", offset)
+        outcomes, consumed = parse_features_tail(data, final=final)
+        return outcomes, offset + consumed
+
+    async def read_output_outcomes(
+        self, work_dir: Path, *, statuses: Collection[OutcomeStatus] | None = None
+    ) -> dict[HookRecordId, BatchRecordOutcome]:
+        return await run_blocking(read_output_dir, Path(work_dir) / "output", statuses)
 
     async def write_batch_outcomes(
         self,
@@ -277,73 +375,129 @@ class FilesystemStorageAdapter(FileStoragePort):
         outcomes: dict[HookRecordId, BatchRecordOutcome],
     ) -> None:
         """Write canonical features.jsonl, rejections.jsonl, errors.jsonl."""
-        output_dir = work_dir / "output"
-        output_dir.mkdir(parents=True, exist_ok=True)
+        await run_blocking(
+            _write_batch_output_files, work_dir / "output", outcomes, self._intermediate_format
+        )
+
+
+# ── Blocking helpers (run on the storage I/O pool) ──────────────────────
+
+
+_STREAM_CHUNK_SIZE = 8192
+
+
+async def _stream_file(path: Path) -> AsyncIterator[bytes]:
+    """Stream a file in chunks, reading each chunk off the event loop."""
+    f = await run_blocking(_open_binary, path)
+    try:
+        while chunk := await run_blocking(f.read, _STREAM_CHUNK_SIZE):
+            yield chunk
+    finally:
+        await run_blocking(f.close)
+
+
+def _open_binary(path: Path) -> BinaryIO:
+    return path.open("rb")
+
+
+def _rmtree_if_exists(path: Path) -> None:
+    if path.exists():
+        shutil.rmtree(path)
+
+
+def _read_json_or_none(path: Path) -> Any:
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
 
-        features: list[str] = []
-        rejections: list[str] = []
-        errors: list[str] = []
 
+def _read_features_json(path: Path) -> list[dict[str, Any]]:
+    data = _read_json_or_none(path)
+    if isinstance(data, list):
+        return data
+    elif isinstance(data, dict):
+        return [data]
+    return []
+
+
+def _write_checkpoint_file(
+    work_dir: Path, outcomes: dict[HookRecordId, BatchRecordOutcome]
+) -> None:
+    checkpoint_path = work_dir / "_checkpoint.jsonl"
+    tmp_path = work_dir / "_checkpoint.jsonl.tmp"
+    with tmp_path.open("w") as f:
+        for outcome in outcomes.values():
+            f.write(outcome.model_dump_json() + "\n")
+    os.replace(tmp_path, checkpoint_path)
+
+
+def _read_from(path: Path, offset: int) -> bytes:
+    try:
+        with path.open("rb") as f:
+            f.seek(offset)
+            return f.read()
+    except FileNotFoundError:
+        return b""
+
+
+def _write_batch_output_files(
+    output_dir: Path,
+    outcomes: dict[HookRecordId, BatchRecordOutcome],
+    fmt: IntermediateFormat,
+) -> None:
+    """Stream outcomes into their per-status JSONL files, line by line.
+
+    A file is only created once it has a line to hold, so an empty status
+    leaves no file behind (readers treat absence as "no rows"). Other-format
+    variants — e.g. the hook's own plain features.jsonl once a compressed
+    canonical copy exists — are removed so readers see a single file.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    handles: dict[str, Any] = {}
+    try:
         for outcome in outcomes.values():
             row: dict[str, Any] = {"id": outcome.record_id}
             if outcome.status == OutcomeStatus.PASSED:
+                filename = "features.jsonl"
                 row["features"] = outcome.features
-                features.append(json.dumps(row))
             elif outcome.status == OutcomeStatus.REJECTED:
+                filename = "rejections.jsonl"
                 row["reason"] = outcome.reason
-                rejections.append(json.dumps(row))
             elif outcome.status == OutcomeStatus.ERRORED:
+                filename = "errors.jsonl"
                 row["error"] = outcome.error
                 row["retryable"] = outcome.retryable
-                errors.append(json.dumps(row))
-
-        for filename, lines in [
-            ("features.jsonl", features),
-            ("rejections.jsonl", rejections),
-            ("errors.jsonl", errors),
-        ]:
-            if lines:
-                (output_dir / filename).write_text("\n".join(lines) + "\n")
-
-
-# ── Shared parsing ──────────────────────────────────────────────────────
-
-
-_FILE_STATUS_MAP: list[tuple[str, OutcomeStatus, dict[str, str]]] = [
-    ("features.jsonl", OutcomeStatus.PASSED, {"features": "features"}),
-    ("rejections.jsonl", OutcomeStatus.REJECTED, {"reason": "reason"}),
-    ("errors.jsonl", OutcomeStatus.ERRORED, {"error": "error", "retryable": "retryable"}),
-]
-
-
-def _parse_batch_output_files(
-    output_dir: Path, outcomes: dict[HookRecordId, BatchRecordOutcome]
-) -> None:
-    """Parse features/rejections/errors JSONL files into BatchRecordOutcome dict."""
-    for filename, status, field_map in _FILE_STATUS_MAP:
-        path = output_dir / filename
-        if not path.exists():
-            continue
-        with path.open() as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    data = json.loads(line)
-                except json.JSONDecodeError:
-                    logger.warning("Skipping malformed JSON line in %s", filename)
-                    continue
-                raw_id = data.get("id")
-                if not raw_id:
-                    logger.warning("Skipping JSONL line without 'id' in %s", filename)
-                    continue
-                record_id = HookRecordId(raw_id)
-                kwargs: dict[str, Any] = {
-                    "record_id": record_id,
-                    "status": status,
-                }
-                for src, dst in field_map.items():
-                    if src in data:
-                        kwargs[dst] = data[src]
-                outcomes[record_id] = BatchRecordOutcome(**kwargs)
+            else:
+                continue
+            f = handles.get(filename)
+            if f is None:
+                f = handles[filename] = open_text(
+                    output_dir / variant_name(filename, fmt), "w", fmt
+                )
+            f.write(json.dumps(row) + "\n")
+    finally:
+        for f in handles.values():
+            f.close()
+    for filename, _status, _fields in BATCH_OUTPUT_FILES:
+        for stale in stale_variants(filename, fmt):
+            (output_dir / stale).unlink(missing_ok=True)
+
+
+def _open_outcome_file(
+    output_dir: Path, filename: str, preferred: IntermediateFormat
+) -> TextIO | None:
+    for name, fmt in read_candidates(filename, preferred):
+        path = output_dir / name
+        if path.exists():
+            return open_text(path, "r", fmt)
+    return None
+
+
+def _parse_outcome_chunk(
+    f: TextIO, filename: str, status: OutcomeStatus, field_map: dict[str, str]
+) -> list[BatchRecordOutcome] | None:
+    """Parse the next chunk of lines from an outcome file; ``None`` at EOF."""
+    lines = f.readlines(OUTCOME_CHUNK_BYTES)
+    if not lines:
+        return None
+    return parse_outcome_lines(lines, filename, status, field_map)
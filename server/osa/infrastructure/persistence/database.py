@@ -1,9 +1,18 @@
-"""Database engine and session factory creation."""
+"""Database engine and session factory creation.
+
+PostgreSQL gets one engine per connection pool (see ``DatabaseConfig``): the
+primary :class:`AsyncEngine` for API request scopes, :data:`ReadEngine` for
+the public ``/data`` and MCP reads (optionally on a read replica, see
+:mod:`~osa.infrastructure.persistence.replica`) and :data:`WorkerEngine` for
+background units of work. Each pool is a :class:`TimedQueuePool`, which records
+how long checkouts wait for a connection for the telemetry sampler.
+"""
 
 import os
+import time
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, AsyncGenerator
+from typing import Any, AsyncGenerator, NewType
 
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -11,10 +20,56 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
 
 from osa.config import Config
 
+ReadEngine = NewType("ReadEngine", AsyncEngine)
+ReadSession = NewType("ReadSession", AsyncSession)
+WorkerEngine = NewType("WorkerEngine", AsyncEngine)
+WorkerSessionFactory = NewType("WorkerSessionFactory", async_sessionmaker[AsyncSession])
+
+
+class PoolWaits:
+    """Checkout wait times accumulated since the last :meth:`drain`."""
+
+    def __init__(self) -> None:
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self._count += 1
+        self._total += seconds
+        self._max = max(self._max, seconds)
+
+    def drain(self) -> tuple[float, float]:
+        """Mean and max wait (seconds) since the last drain, then reset."""
+        mean = self._total / self._count if self._count else 0.0
+        result = (mean, self._max)
+        self._count, self._total, self._max = 0, 0.0, 0.0
+        return result
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that times every checkout.
+
+    The wait covers queueing for a free connection plus, when the pool grows,
+    opening the new one — the latency a unit of work sees before its first
+    statement.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.waits = PoolWaits()
+
+    def _do_get(self) -> Any:
+        started = time.monotonic()
+        try:
+            return super()._do_get()
+        finally:
+            self.waits.record(time.monotonic() - started)
+
 
 def _expand_sqlite_path(url: str) -> str:
     """Expand ~ in SQLite URLs and ensure parent directory exists."""
@@ -38,11 +93,43 @@ def _expand_sqlite_path(url: str) -> str:
 
 
 def create_db_engine(config: Config) -> AsyncEngine:
-    """Create async database engine.
+    """Create the primary async database engine.
 
     Handles SQLite and PostgreSQL with appropriate settings.
     """
-    url = _expand_sqlite_path(config.database.url)
+    db = config.database
+    return _create_engine(config, db.url, pool_size=db.pool_size, max_overflow=db.max_overflow)
+
+
+def create_read_engine(config: Config) -> AsyncEngine:
+    """Create the engine for long-running reads, on the read replica when configured."""
+    db = config.database
+    return _create_engine(
+        config,
+        db.read_url or db.url,
+        pool_size=db.read_pool_size,
+        max_overflow=db.read_max_overflow,
+    )
+
+
+def create_read_fallback_engine(config: Config) -> AsyncEngine:
+    """Create the read-sized pool on the primary that reads use while the replica lags."""
+    db = config.database
+    return _create_engine(
+        config, db.url, pool_size=db.read_pool_size, max_overflow=db.read_max_overflow
+    )
+
+
+def create_worker_engine(config: Config) -> AsyncEngine:
+    """Create the engine for background units of work."""
+    db = config.database
+    return _create_engine(
+        config, db.url, pool_size=db.worker_pool_size, max_overflow=db.worker_max_overflow
+    )
+
+
+def _create_engine(config: Config, url: str, *, pool_size: int, max_overflow: int) -> AsyncEngine:
+    url = _expand_sqlite_path(url)
     is_sqlite = url.startswith("sqlite")
 
     # SQLite-specific settings
@@ -58,9 +145,12 @@ def create_db_engine(config: Config) -> AsyncEngine:
         # PostgreSQL settings
         engine_kwargs = {
             "echo": config.database.echo,
+            "poolclass": TimedQueuePool,
             "pool_pre_ping": True,
-            "pool_size": 5,
-            "max_overflow": 10,
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_timeout": config.database.pool_timeout_seconds,
+            "pool_recycle": config.database.pool_recycle_seconds or -1,
         }
 
     return create_async_engine(url, **engine_kwargs)
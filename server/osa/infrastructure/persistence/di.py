@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from osa.util.paths import OSAPaths
 from osa.config import Config
+from osa.domain.auth.model.identity import Identity, System
 from osa.domain.deposition.port.convention_repository import ConventionRepository
 from osa.domain.deposition.port.ontology_reader import OntologyReader
 from osa.domain.deposition.port.repository import DepositionRepository
@@ -31,6 +32,7 @@ from osa.domain.shared.port.unit_of_work import UnitOfWork
 from osa.domain.feature.port.feature_store import FeatureStore
 from osa.domain.validation.port.repository import ValidationRunRepository
 from osa.domain.validation.port.hook_registry import HookRegistry
+from osa.domain.validation.port.outcome_memo import HookOutcomeMemo
 from osa.domain.data.port.data_read_store import (
     DataCatalogReadStore,
     DataTableReadStore,
@@ -43,13 +45,26 @@ from osa.infrastructure.persistence.adapter.readers import (
     SchemaReaderAdapter,
 )
 from osa.infrastructure.persistence.adapter.storage import FilesystemStorageAdapter
+from osa.infrastructure.storage.blobs import FilesystemBlobStore
+from osa.infrastructure.storage.layout import StorageLayout
 from osa.infrastructure.persistence.database import (
+    ReadEngine,
+    ReadSession,
+    WorkerEngine,
+    WorkerSessionFactory,
     create_db_engine,
+    create_read_engine,
+    create_read_fallback_engine,
     create_session_factory,
+    create_worker_engine,
 )
+from osa.infrastructure.persistence.replica import ReplicaRouter
 from osa.infrastructure.persistence.repository.convention import (
     PostgresConventionRepository,
 )
+from osa.infrastructure.persistence.repository.hook_outcome_memo import (
+    PostgresHookOutcomeMemo,
+)
 from osa.infrastructure.persistence.repository.hook_registry import (
     PostgresHookRegistry,
 )
@@ -86,19 +101,63 @@ class PersistenceProvider(Provider):
     def get_engine(self, config: Config) -> AsyncEngine:
         return create_db_engine(config)
 
+    # Separate pools for long reads and background work (DatabaseConfig). SQLite
+    # shares its single connection, so it keeps one engine for everything.
+    @provide(scope=Scope.APP)
+    def get_read_engine(self, config: Config, engine: AsyncEngine) -> ReadEngine:
+        if engine.dialect.name != "postgresql":
+            return ReadEngine(engine)
+        return ReadEngine(create_read_engine(config))
+
+    @provide(scope=Scope.APP)
+    def get_worker_engine(self, config: Config, engine: AsyncEngine) -> WorkerEngine:
+        if engine.dialect.name != "postgresql":
+            return WorkerEngine(engine)
+        return WorkerEngine(create_worker_engine(config))
+
     @provide(scope=Scope.APP)
     def get_session_factory(self, engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
         return create_session_factory(engine)
 
-    # UOW-scoped session (one per unit of work)
+    @provide(scope=Scope.APP)
+    def get_worker_session_factory(self, engine: WorkerEngine) -> WorkerSessionFactory:
+        return WorkerSessionFactory(create_session_factory(engine))
+
+    # UOW-scoped session (one per unit of work). Background units of work run
+    # as System and draw from the worker pool; everything else from the primary.
     @provide(scope=Scope.UOW)
     async def get_session(
-        self, session_factory: async_sessionmaker[AsyncSession]
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        worker_session_factory: WorkerSessionFactory,
+        identity: Identity,
     ) -> AsyncIterable[AsyncSession]:
-        async with session_factory() as session:
+        factory = worker_session_factory if isinstance(identity, System) else session_factory
+        async with factory() as session:
             yield session
             await session.commit()
 
+    @provide(scope=Scope.APP)
+    def get_replica_router(
+        self, config: Config, engine: AsyncEngine, read_engine: ReadEngine
+    ) -> ReplicaRouter:
+        replica = read_engine is not engine and config.database.read_url is not None
+        return ReplicaRouter(
+            read_engine,
+            create_read_fallback_engine(config) if replica else read_engine,
+            replica=replica,
+            max_lag=config.database.read_max_lag_seconds,
+            check_interval=config.database.read_lag_check_seconds,
+        )
+
+    # Read-only session for the public /data and MCP reads: on the read pool
+    # (the replica, while it is fresh enough), since streams may hold a
+    # connection for minutes. Never committed: it only ever reads.
+    @provide(scope=Scope.UOW)
+    async def get_read_session(self, router: ReplicaRouter) -> AsyncIterable[ReadSession]:
+        async with create_session_factory(await router.engine())() as session:
+            yield ReadSession(session)
+
     # UOW-scoped repositories
     dep_repo = provide(PostgresDepositionRepository, scope=Scope.UOW, provides=DepositionRepository)
     record_repo = provide(PostgresRecordRepository, scope=Scope.UOW, provides=RecordRepository)
@@ -115,12 +174,26 @@ class PersistenceProvider(Provider):
 
     # Feature store
     @provide(scope=Scope.UOW)
-    def get_feature_store(self, engine: AsyncEngine, session: AsyncSession) -> FeatureStore:
+    def get_feature_store(
+        self,
+        engine: AsyncEngine,
+        worker_engine: WorkerEngine,
+        session: AsyncSession,
+        identity: Identity,
+    ) -> FeatureStore:
+        engine = worker_engine if isinstance(identity, System) else engine
         return PostgresFeatureStore(engine=engine, session=session)
 
     # Metadata store
     @provide(scope=Scope.UOW)
-    def get_metadata_store(self, engine: AsyncEngine, session: AsyncSession) -> MetadataStore:
+    def get_metadata_store(
+        self,
+        engine: AsyncEngine,
+        worker_engine: WorkerEngine,
+        session: AsyncSession,
+        identity: Identity,
+    ) -> MetadataStore:
+        engine = worker_engine if isinstance(identity, System) else engine
         return PostgresMetadataStore(engine=engine, session=session)
 
     # Semantics repositories
@@ -139,6 +212,9 @@ class PersistenceProvider(Provider):
     # Hook registry (validation domain — feature #145). Owns hooks, releases,
     # the live pointer, and hook_runs (record + provenance reads).
     hook_registry_repo = provide(PostgresHookRegistry, scope=Scope.UOW, provides=HookRegistry)
+    hook_outcome_memo_repo = provide(
+        PostgresHookOutcomeMemo, scope=Scope.UOW, provides=HookOutcomeMemo
+    )
 
     # Cross-domain readers
     schema_reader = provide(SchemaReaderAdapter, scope=Scope.UOW, provides=SchemaReader)
@@ -146,20 +222,34 @@ class PersistenceProvider(Provider):
 
     # File storage — default (OCI/Docker, filesystem)
     @provide(scope=Scope.APP)
-    def get_file_storage(self, paths: "OSAPaths") -> FileStoragePort:
+    def get_file_storage(
+        self,
+        paths: "OSAPaths",
+        config: Config,
+        layout: StorageLayout,
+        blobs: FilesystemBlobStore,
+    ) -> FileStoragePort:
         return FilesystemStorageAdapter(
             base_path=str(paths.data_dir / "files"),
             # Confinement root for hook-log reads spans files/ (deposition) and
             # ingests/ (ingestion); see read_hook_log (#147).
             data_root=str(paths.data_dir),
+            intermediate_format=layout.intermediate_format,
+            blobs=blobs if config.storage.dedupe_files else None,
         )
 
     # File storage — K8s (S3 via aioboto3, reuses S3Client from RunnerProvider)
     @provide(when=K8S, scope=Scope.APP)
-    def get_file_storage_s3(self, config: Config, s3: "S3Client") -> FileStoragePort:
+    def get_file_storage_s3(
+        self, config: Config, s3: "S3Client", layout: StorageLayout
+    ) -> FileStoragePort:
         from osa.infrastructure.s3.storage import S3StorageAdapter
 
-        return S3StorageAdapter(s3=s3, data_mount_path=config.runner.k8s.data_mount_path)
+        return S3StorageAdapter(
+            s3=s3,
+            data_mount_path=config.runner.k8s.data_mount_path,
+            intermediate_format=layout.intermediate_format,
+        )
 
     @provide(scope=Scope.APP)
     def get_hook_storage(self, file_storage: FileStoragePort) -> HookStoragePort:
@@ -197,18 +287,24 @@ class PersistenceProvider(Provider):
 
     # Data read surface adapter (unified /data/* engine)
     @provide(scope=Scope.UOW, provides=DataTableReadStore)
-    def get_data_table_read_store(self, session: AsyncSession) -> PostgresTableReadStore:
+    def get_data_table_read_store(self, session: ReadSession) -> PostgresTableReadStore:
         return PostgresTableReadStore(session=session)
 
     @provide(scope=Scope.UOW, provides=DataCatalogReadStore)
     def get_data_catalog_read_store(
-        self, session: AsyncSession, config: Config
+        self, session: ReadSession, config: Config
     ) -> PostgresCatalogReadStore:
         return PostgresCatalogReadStore(session=session, node_domain=Domain(config.domain))
 
     @provide(scope=Scope.UOW, provides=StatisticsStore)
-    def get_statistics_store(self, session: AsyncSession) -> PostgresStatisticsStore:
-        return PostgresStatisticsStore(session=session)
+    def get_statistics_store(
+        self, session: AsyncSession, config: Config
+    ) -> PostgresStatisticsStore:
+        return PostgresStatisticsStore(
+            session=session,
+            feature_rows=config.statistics.feature_rows,
+            reconcile_interval=config.statistics.reconcile_interval_seconds,
+        )
 
     # Record query handlers
     get_record_handler = provide(GetRecordHandler, scope=Scope.UOW)
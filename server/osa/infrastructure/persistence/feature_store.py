@@ -17,6 +17,7 @@ from osa.infrastructure.persistence.feature_table import (
     FeatureSchema,
     build_feature_table,
 )
+from osa.infrastructure.persistence.row_deltas import row_delta
 from osa.infrastructure.persistence.tables import feature_tables_table
 
 _PG_IDENTIFIER = re.compile(r"^[a-z][a-z0-9_]{0,62}$")
@@ -117,10 +118,15 @@ class PostgresFeatureStore(FeatureStore):
 
             # Replace-by-record: drop any prior rows for this record so a redo
             # after a partial failure converges instead of duplicating (#160).
-            await conn.execute(table.delete().where(table.c.record_srn == record_srn))
+            replaced = await conn.execute(table.delete().where(table.c.record_srn == record_srn))
 
             for i in range(0, len(enriched_rows), chunk_size):
                 chunk = enriched_rows[i : i + chunk_size]
                 await conn.execute(table.insert(), chunk)
                 total += len(chunk)
+
+            # Net row change for the instance statistics, committed with the rows.
+            delta = total - replaced.rowcount
+            if delta:
+                await conn.execute(row_delta(pg_table, delta))
         return total
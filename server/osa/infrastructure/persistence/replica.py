@@ -0,0 +1,113 @@
+"""ReplicaRouter — send public reads to the read replica while it is fresh enough.
+
+The public read surfaces (``/data`` and the MCP tools) are anonymous and
+read-only, so they can be served from a streaming replica instead of competing
+with outbox claims and bulk publishes on the primary. A replica can fall
+behind, though, and a catalog that omits a just-published record for minutes
+is worse than a slower one. Replication lag is therefore probed — at most once
+per ``check_interval`` — and read sessions fall back to the primary while it
+exceeds ``max_lag``:
+
+- lag is ``now() - pg_last_xact_replay_timestamp()``, except that a replica
+  which is streaming and has replayed everything it received counts as current
+  (an idle primary writes nothing, so the last replayed commit ages without
+  any real lag);
+- a replica whose WAL receiver isn't streaming has caught up only with what it
+  received before losing the primary, so it is judged by replay age alone;
+- a replica that has replayed nothing yet, isn't in recovery, or can't be
+  reached counts as stale.
+
+The fallback is a read-sized pool on the primary, not the API pool: a burst of
+``/data`` streams during replica trouble must not starve request scopes.
+
+Without a ``READ_URL`` the read engine already points at the primary and no
+probe runs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from osa.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+_LAG_SQL = text(
+    """
+    SELECT CASE
+      WHEN NOT pg_is_in_recovery() THEN NULL
+      WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn()
+        AND EXISTS (SELECT 1 FROM pg_stat_wal_receiver WHERE status = 'streaming')
+        THEN 0
+      ELSE extract(epoch FROM now() - pg_last_xact_replay_timestamp())
+    END
+    """
+)
+
+
+class ReplicaRouter:
+    """Choose the engine for read sessions (see module docstring)."""
+
+    def __init__(
+        self,
+        read_engine: AsyncEngine,
+        fallback_engine: AsyncEngine,
+        *,
+        replica: bool,
+        max_lag: float = 10.0,
+        check_interval: float = 5.0,
+    ) -> None:
+        self._read = read_engine
+        self._fallback = fallback_engine
+        self._replica = replica
+        self._max_lag = max_lag
+        self._check_interval = check_interval
+        self._fresh = True
+        self._checked_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def engine(self) -> AsyncEngine:
+        """The read engine while the replica is within ``max_lag``, else the fallback."""
+        if not self._replica:
+            return self._read
+        if self._check_due():
+            async with self._lock:
+                if self._check_due():
+                    await self._check()
+        return self._read if self._fresh else self._fallback
+
+    def _check_due(self) -> bool:
+        return (
+            self._checked_at is None or time.monotonic() - self._checked_at >= self._check_interval
+        )
+
+    async def _check(self) -> None:
+        try:
+            lag = await self.lag()
+        except Exception as e:
+            logger.warn("Read replica lag probe failed: {error}", error=str(e))
+            lag = None
+        fresh = lag is not None and lag <= self._max_lag
+        if fresh != self._fresh:
+            if fresh:
+                logger.info(
+                    "Read replica caught up (lag {lag}); reading from it", lag=f"{lag:.1f}s"
+                )
+            else:
+                logger.warn(
+                    "Read replica lag {lag} exceeds {max_lag}s; reading from the primary",
+                    lag="unknown" if lag is None else f"{lag:.1f}s",
+                    max_lag=self._max_lag,
+                )
+        self._fresh = fresh
+        self._checked_at = time.monotonic()
+
+    async def lag(self) -> float | None:
+        """Seconds the replica trails the primary (``None`` = unknown or not a replica)."""
+        async with self._read.connect() as conn:
+            value = await conn.scalar(_LAG_SQL)
+        return None if value is None else float(value)
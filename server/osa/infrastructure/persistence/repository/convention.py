@@ -22,6 +22,10 @@ def _convention_to_row(convention: Convention) -> dict[str, Any]:
         "schema_version": convention.schema_id.version.root,
         "file_requirements": convention.file_requirements.model_dump(),
         "hooks": [name.root for name in convention.hooks],  # hook-name registry refs
+        "hook_dependencies": {
+            hook.root: [dep.root for dep in after]
+            for hook, after in convention.hook_dependencies.items()
+        },
         "source": convention.ingester.model_dump() if convention.ingester else None,
         "docs": convention.docs.model_dump(mode="json"),
         "created_at": convention.created_at,
@@ -40,6 +44,7 @@ def _row_to_convention(row: dict[str, Any]) -> Convention:
         ),
         file_requirements=FileRequirements.model_validate(row["file_requirements"]),
         hooks=list(row.get("hooks") or []),
+        hook_dependencies=row.get("hook_dependencies") or {},
         ingester=IngesterDefinition.model_validate(source_data) if source_data else None,
         docs=ConventionDocs.model_validate(row["docs"]),
         created_at=row["created_at"],
@@ -65,6 +70,7 @@ class PostgresConventionRepository(ConventionRepository):
                 "schema_version": stmt.excluded.schema_version,
                 "file_requirements": stmt.excluded.file_requirements,
                 "hooks": stmt.excluded.hooks,
+                "hook_dependencies": stmt.excluded.hook_dependencies,
                 "source": stmt.excluded.source,
                 "docs": stmt.excluded.docs,
             },
@@ -1,12 +1,14 @@
 """SQLAlchemy adapter implementing EventRepository."""
 
 import logging
+from collections import Counter
 from datetime import UTC, datetime, timedelta
 from typing import TypeVar
 from uuid import uuid4
 
 from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
-from sqlalchemy import CursorResult, func, insert, or_, select, update
+from sqlalchemy import ColumnElement, CursorResult, bindparam, func, insert, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from osa.domain.shared.error import InfrastructureError
@@ -17,9 +19,15 @@ from osa.domain.shared.event import (
     DeliveryStatus,
     Event,
     EventId,
+    FailedDelivery,
+    FailedDeliveryFilter,
 )
 from osa.domain.shared.port.event_repository import EventRepository
-from osa.infrastructure.persistence.tables import deliveries_table, events_table
+from osa.infrastructure.persistence.tables import (
+    deliveries_table,
+    events_table,
+    worker_counts_table,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +65,7 @@ class SQLAlchemyEventRepository(EventRepository):
         event: Event,
         consumer_groups: set[str],
         deliver_after: datetime | None = None,
+        priority: int = 0,
     ) -> None:
         """Save event to append-only log and create delivery rows."""
         now = datetime.now(UTC)
@@ -80,6 +89,7 @@ class SQLAlchemyEventRepository(EventRepository):
                 status=DeliveryStatus.PENDING.value,
                 retry_count=0,
                 deliver_after=deliver_after,
+                priority=int(priority),
                 updated_at=now,
             )
             await self._session.execute(delivery_stmt)
@@ -208,6 +218,7 @@ class SQLAlchemyEventRepository(EventRepository):
 
         Uses FOR UPDATE SKIP LOCKED on the deliveries table, joining to
         events to filter by event_type and return the full event payload.
+        Higher-priority deliveries are claimed first; FIFO within a priority.
         """
         now = datetime.now(UTC)
 
@@ -233,7 +244,7 @@ class SQLAlchemyEventRepository(EventRepository):
                 events_table.c.event_type.in_(event_types),
                 deliver_after_eligible,
             )
-            .order_by(events_table.c.created_at.asc())
+            .order_by(deliveries_table.c.priority.desc(), events_table.c.created_at.asc())
             .limit(limit)
             .with_for_update(skip_locked=True, of=deliveries_table)
         )
@@ -364,7 +375,20 @@ class SQLAlchemyEventRepository(EventRepository):
         if oldest is not None and oldest.tzinfo is None:
             oldest = oldest.replace(tzinfo=UTC)
 
-        return DeliveryStats(counts=counts, oldest_pending_created_at=oldest)
+        deferred_stmt = (
+            select(deliveries_table.c.consumer_group, func.count())
+            .where(
+                deliveries_table.c.status == DeliveryStatus.PENDING.value,
+                deliveries_table.c.deliver_after > func.now(),
+            )
+            .group_by(deliveries_table.c.consumer_group)
+        )
+        deferred = {
+            group: row_count
+            for group, row_count in (await self._session.execute(deferred_stmt)).all()
+        }
+
+        return DeliveryStats(counts=counts, oldest_pending_created_at=oldest, deferred=deferred)
 
     async def mark_failed_with_retry(
         self,
@@ -426,6 +450,135 @@ class SQLAlchemyEventRepository(EventRepository):
 
         await self._session.execute(update_stmt)
 
+    @staticmethod
+    def _failed_matching(criteria: FailedDeliveryFilter) -> list[ColumnElement[bool]]:
+        """WHERE clauses selecting failed deliveries; ``updated_at`` is when they failed."""
+        clauses = [deliveries_table.c.status == DeliveryStatus.FAILED.value]
+        if criteria.consumer_group is not None:
+            clauses.append(deliveries_table.c.consumer_group == criteria.consumer_group)
+        if criteria.exclude_consumer_groups:
+            clauses.append(
+                deliveries_table.c.consumer_group.not_in(sorted(criteria.exclude_consumer_groups))
+            )
+        if criteria.error_contains:
+            clauses.append(
+                deliveries_table.c.delivery_error.icontains(
+                    criteria.error_contains, autoescape=True
+                )
+            )
+        if criteria.failed_after is not None:
+            clauses.append(deliveries_table.c.updated_at >= criteria.failed_after)
+        if criteria.failed_before is not None:
+            clauses.append(deliveries_table.c.updated_at < criteria.failed_before)
+        return clauses
+
+    async def list_failed_deliveries(
+        self,
+        criteria: FailedDeliveryFilter,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[FailedDelivery]:
+        """List failed deliveries matching *criteria*, most recently failed first."""
+        stmt = (
+            select(
+                deliveries_table.c.id,
+                deliveries_table.c.event_id,
+                events_table.c.event_type,
+                deliveries_table.c.consumer_group,
+                deliveries_table.c.delivery_error,
+                deliveries_table.c.retry_count,
+                deliveries_table.c.updated_at,
+            )
+            .join(events_table, deliveries_table.c.event_id == events_table.c.id)
+            .where(*self._failed_matching(criteria))
+            .order_by(deliveries_table.c.updated_at.desc(), deliveries_table.c.id)
+            .limit(limit)
+            .offset(offset)
+        )
+        result = await self._session.execute(stmt)
+        return [
+            FailedDelivery(
+                id=row.id,
+                event_id=row.event_id,
+                event_type=row.event_type,
+                consumer_group=row.consumer_group,
+                error=row.delivery_error,
+                retry_count=row.retry_count,
+                failed_at=row.updated_at,
+            )
+            for row in result.all()
+        ]
+
+    async def count_failed_deliveries(self, criteria: FailedDeliveryFilter) -> int:
+        """Count failed deliveries matching *criteria*."""
+        stmt = (
+            select(func.count())
+            .select_from(deliveries_table)
+            .where(*self._failed_matching(criteria))
+        )
+        return (await self._session.execute(stmt)).scalar_one()
+
+    async def requeue_failed_deliveries(
+        self,
+        criteria: FailedDeliveryFilter,
+        *,
+        limit: int,
+        window_seconds: float,
+    ) -> dict[str, int]:
+        """Reset matching failed deliveries to pending, release times spread over a window."""
+        select_stmt = (
+            select(deliveries_table.c.id, deliveries_table.c.consumer_group)
+            .where(*self._failed_matching(criteria))
+            .order_by(deliveries_table.c.updated_at, deliveries_table.c.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        rows = (await self._session.execute(select_stmt)).all()
+        if not rows:
+            return {}
+
+        now = datetime.now(UTC)
+        step = window_seconds / len(rows)
+        update_stmt = (
+            update(deliveries_table)
+            .where(deliveries_table.c.id == bindparam("delivery_id"))
+            .values(
+                status=DeliveryStatus.PENDING.value,
+                retry_count=0,
+                claimed_at=None,
+                delivered_at=None,
+                deliver_after=bindparam("release_at"),
+                updated_at=now,
+            )
+        )
+        await self._session.execute(
+            update_stmt,
+            [
+                {"delivery_id": row.id, "release_at": now + timedelta(seconds=i * step)}
+                for i, row in enumerate(rows)
+            ],
+        )
+        return dict(Counter(row.consumer_group for row in rows))
+
+    async def set_worker_count(self, consumer_group: str, workers: int) -> None:
+        """Upsert the runtime worker count for a consumer group."""
+        stmt = pg_insert(worker_counts_table).values(
+            consumer_group=consumer_group, workers=workers, updated_at=datetime.now(UTC)
+        )
+        await self._session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["consumer_group"],
+                set_={"workers": stmt.excluded.workers, "updated_at": stmt.excluded.updated_at},
+            )
+        )
+
+    async def get_worker_counts(self) -> dict[str, int]:
+        """Runtime worker counts keyed by consumer group."""
+        result = await self._session.execute(
+            select(worker_counts_table.c.consumer_group, worker_counts_table.c.workers)
+        )
+        return {group: workers for group, workers in result.all()}
+
     def _deserialize(self, event_type: str, payload: dict | str) -> Event | None:
         """Deserialize an event from stored data."""
         event_cls = Event._registry.get(event_type)
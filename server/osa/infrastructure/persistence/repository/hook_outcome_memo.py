@@ -0,0 +1,58 @@
+"""PostgreSQL adapter for the HookOutcomeMemo port."""
+
+from __future__ import annotations
+
+from collections.abc import Collection, Mapping
+from datetime import UTC, datetime
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from osa.domain.validation.model.batch_outcome import BatchRecordOutcome
+from osa.domain.validation.model.hook_release import HookReleaseId
+from osa.domain.validation.port.outcome_memo import HookOutcomeMemo
+from osa.infrastructure.persistence.tables import hook_outcome_memo_table
+
+
+class PostgresHookOutcomeMemo(HookOutcomeMemo):
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_many(
+        self, release_id: HookReleaseId, keys: Collection[str]
+    ) -> dict[str, BatchRecordOutcome]:
+        if not keys:
+            return {}
+        t = hook_outcome_memo_table
+        result = await self.session.execute(
+            select(t.c.input_key, t.c.outcome).where(
+                t.c.release_id == release_id, t.c.input_key.in_(list(keys))
+            )
+        )
+        return {row.input_key: BatchRecordOutcome.model_validate(row.outcome) for row in result}
+
+    async def put_many(
+        self, release_id: HookReleaseId, outcomes: Mapping[str, BatchRecordOutcome]
+    ) -> None:
+        if not outcomes:
+            return
+        now = datetime.now(UTC)
+        # Insert-once: a concurrent batch memoizing the same input is a no-op.
+        await self.session.execute(
+            pg_insert(hook_outcome_memo_table)
+            .values(
+                [
+                    {
+                        "release_id": release_id,
+                        "input_key": key,
+                        "status": outcome.status.value,
+                        "outcome": outcome.model_dump(mode="json"),
+                        "created_at": now,
+                    }
+                    for key, outcome in outcomes.items()
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=["release_id", "input_key"])
+        )
+        await self.session.flush()
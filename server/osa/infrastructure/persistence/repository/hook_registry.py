@@ -76,6 +76,10 @@ class PostgresHookRegistry(HookRegistry):
             duration_s=row["duration_s"],
             oom_retries=row["oom_retries"],
             log_ref=row["log_ref"],
+            records=row["records"],
+            input_mb=row["input_mb"],
+            memory=row["memory"],
+            oom_batch_mb=row["oom_batch_mb"],
         )
 
     async def upsert_identity(self, name: HookName, feature: TableFeatureSpec) -> Hook:
@@ -245,6 +249,10 @@ class PostgresHookRegistry(HookRegistry):
                 duration_s=run.duration_s,
                 oom_retries=run.oom_retries,
                 log_ref=run.log_ref,
+                records=run.records,
+                input_mb=run.input_mb,
+                memory=run.memory,
+                oom_batch_mb=run.oom_batch_mb,
             )
             .on_conflict_do_nothing(index_elements=["id"])
         )
@@ -257,6 +265,15 @@ class PostgresHookRegistry(HookRegistry):
         row = result.mappings().first()
         return self._to_run(dict(row)) if row else None
 
+    async def recent_runs(self, release_id: HookReleaseId, limit: int) -> list[HookRun]:
+        result = await self.session.execute(
+            select(hook_runs_table)
+            .where(hook_runs_table.c.release_id == release_id)
+            .order_by(hook_runs_table.c.finished_at.desc())
+            .limit(limit)
+        )
+        return [self._to_run(dict(row)) for row in result.mappings()]
+
     async def resolve_live(self, names: list[HookName]) -> dict[HookName, HookRelease]:
         if not names:
             return {}
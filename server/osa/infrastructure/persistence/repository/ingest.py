@@ -3,7 +3,7 @@
 import logging
 from datetime import datetime
 
-from sqlalchemy import RowMapping, case, select, update
+from sqlalchemy import RowMapping, case, exists, func, or_, select, update
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -13,11 +13,12 @@ from osa.domain.ingest.model.ingest_run import (
     IngestStatus,
     RunClosed,
     RunUpdate,
+    ShardProgress,
 )
 from osa.domain.ingest.port.repository import IngestRunRepository
 from osa.domain.shared.error import NotFoundError
 from osa.domain.shared.failure import FailureKind
-from osa.infrastructure.persistence.tables import ingest_runs_table
+from osa.infrastructure.persistence.tables import ingest_runs_table, ingest_shards_table
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +50,7 @@ class PostgresIngestRunRepository(IngestRunRepository):
             "completed_at": ingest_run.completed_at,
             "failure_reason": ingest_run.failure_reason,
             "failure_kind": ingest_run.failure_kind.value if ingest_run.failure_kind else None,
+            "shards": ingest_run.shards,
         }
         stmt = (
             insert(ingest_runs_table)
@@ -59,6 +61,14 @@ class PostgresIngestRunRepository(IngestRunRepository):
             )
         )
         await self._session.execute(stmt)
+        if ingest_run.sharded:
+            await self._session.execute(
+                insert(ingest_shards_table)
+                .values(
+                    [{"ingest_run_id": ingest_run.id, "shard": s} for s in range(ingest_run.shards)]
+                )
+                .on_conflict_do_nothing()
+            )
         await self._session.flush()
 
     async def get(self, id: str) -> IngestRun | None:
@@ -163,6 +173,67 @@ class PostgresIngestRunRepository(IngestRunRepository):
         await self._session.flush()
         return await self._applied_or_closed(result.mappings().first(), id)
 
+    async def get_shard(self, id: str, shard: int) -> ShardProgress | None:
+        s = ingest_shards_table
+        stmt = select(s).where(s.c.ingest_run_id == id, s.c.shard == shard)
+        row = (await self._session.execute(stmt)).mappings().first()
+        if row is None:
+            return None
+        return ShardProgress(
+            shard=row["shard"], batches_ingested=row["batches_ingested"], finished=row["finished"]
+        )
+
+    async def advance_shard(
+        self, id: str, shard: int, *, batches: int | None = None, finished: bool
+    ) -> RunUpdate:
+        """Advance one shard and re-aggregate the run row, under the run's row lock.
+
+        The lock serializes shards of the same run: each statement after it sees
+        every earlier shard update committed, so the re-aggregated sum never
+        misses a concurrent shard (READ COMMITTED takes a fresh snapshot per
+        statement).
+        """
+        t = ingest_runs_table
+        s = ingest_shards_table
+        locked = await self._session.execute(
+            select(t.c.id)
+            .where(t.c.id == id)
+            .where(t.c.status.in_(_NON_TERMINAL))
+            .with_for_update()
+        )
+        if locked.first() is None:
+            return await self._applied_or_closed(None, id)
+
+        values: dict = {
+            "batches_ingested": s.c.batches_ingested + 1
+            if batches is None
+            else case((s.c.batches_ingested < batches, batches), else_=s.c.batches_ingested)
+        }
+        if finished:
+            values["finished"] = True
+        await self._session.execute(
+            update(s).where(s.c.ingest_run_id == id, s.c.shard == shard).values(**values)
+        )
+
+        total = (
+            select(func.coalesce(func.sum(s.c.batches_ingested), 0))
+            .where(s.c.ingest_run_id == id)
+            .scalar_subquery()
+        )
+        unfinished = exists().where(s.c.ingest_run_id == id, s.c.finished.is_(False))
+        stmt = (
+            update(t)
+            .where(t.c.id == id)
+            .values(
+                batches_ingested=total,
+                ingestion_finished=or_(t.c.ingestion_finished, ~unfinished),
+            )
+            .returning(*t.c)
+        )
+        result = await self._session.execute(stmt)
+        await self._session.flush()
+        return await self._applied_or_closed(result.mappings().first(), id)
+
     async def increment_failed(self, id: str) -> RunUpdate:
         """Atomically increment batches_failed while the run is non-terminal (#152).
 
@@ -266,4 +337,5 @@ def _row_to_ingest_run(row: dict) -> IngestRun:
         completed_at=row.get("completed_at"),
         failure_reason=row.get("failure_reason"),
         failure_kind=FailureKind(raw_kind) if raw_kind else None,
+        shards=row.get("shards") or 1,
     )
@@ -8,6 +8,7 @@ from osa.domain.record.model.aggregate import Record
 from osa.domain.record.port.repository import RecordRepository
 from osa.domain.shared.model.srn import RecordSRN
 from osa.infrastructure.persistence.mappers.record import record_to_dict, row_to_record
+from osa.infrastructure.persistence.row_deltas import RECORDS, row_delta
 from osa.infrastructure.persistence.tables import records_table
 
 
@@ -22,6 +23,7 @@ class PostgresRecordRepository(RecordRepository):
         record_dict = record_to_dict(record)
         stmt = insert(records_table).values(**record_dict)
         await self.session.execute(stmt)
+        await self.session.execute(row_delta(RECORDS, 1))
         await self.session.flush()
 
     async def save_many(self, records: list[Record]) -> list[Record]:
@@ -44,8 +46,10 @@ class PostgresRecordRepository(RecordRepository):
             .returning(records_table.c.srn)
         )
         result = await self.session.execute(stmt)
-        await self.session.flush()
         inserted_srns = {row[0] for row in result.fetchall()}
+        if inserted_srns:
+            await self.session.execute(row_delta(RECORDS, len(inserted_srns)))
+        await self.session.flush()
         return [r for r in records if str(r.srn) in inserted_srns]
 
     async def get(self, srn: RecordSRN) -> Record | None:
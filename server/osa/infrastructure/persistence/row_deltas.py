@@ -0,0 +1,21 @@
+"""Row-count deltas feeding the incremental instance statistics.
+
+Writers of counted rows (records, feature tables) append one delta per write,
+inside the transaction that writes the rows, so a delta is visible exactly
+when its rows are. :class:`~osa.infrastructure.data.postgres_statistics_store.PostgresStatisticsStore`
+folds them into the ``instance_statistics`` snapshot.
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.sql.dml import Insert
+
+from osa.infrastructure.persistence.tables import instance_statistics_deltas_table
+
+RECORDS = "records"
+
+
+def row_delta(table_name: str, delta: int) -> Insert:
+    """INSERT recording that *table_name* gained *delta* rows (negative: lost)."""
+    return sa.insert(instance_statistics_deltas_table).values(
+        table_name=table_name, row_delta=delta
+    )
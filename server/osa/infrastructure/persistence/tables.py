@@ -10,6 +10,7 @@ from sqlalchemy import (
     Index,
     Integer,
     MetaData,
+    SmallInteger,
     String,
     Table,
     Text,
@@ -133,6 +134,8 @@ deliveries_table = Table(
     Column("delivery_error", Text, nullable=True),
     Column("retry_count", Integer, nullable=False, server_default=text("0")),
     Column("deliver_after", DateTime(timezone=True), nullable=True),
+    # Claim order within a consumer group: higher first (DeliveryPriority).
+    Column("priority", SmallInteger, nullable=False, server_default=text("0")),
     Column("updated_at", DateTime(timezone=True), nullable=False),
     UniqueConstraint("event_id", "consumer_group", name="uq_delivery_event_consumer"),
 )
@@ -171,6 +174,26 @@ Index(
     postgresql_where=text("status = 'failed'"),
 )
 
+# Priority lanes: the highest pending priority of a group without a full scan
+Index(
+    "idx_deliveries_priority",
+    deliveries_table.c.consumer_group,
+    deliveries_table.c.priority.desc(),
+    postgresql_where=text("status = 'pending'"),
+)
+
+
+# ============================================================================
+# WORKER COUNTS TABLE (runtime per-consumer-group concurrency)
+# ============================================================================
+worker_counts_table = Table(
+    "worker_counts",
+    metadata,
+    Column("consumer_group", String(128), primary_key=True),
+    Column("workers", Integer, nullable=False),
+    Column("updated_at", DateTime(timezone=True), nullable=False),
+)
+
 
 # ============================================================================
 # USERS TABLE (Authentication)
@@ -291,6 +314,8 @@ conventions_table = Table(
     Column("schema_version", String, nullable=False),
     Column("file_requirements", JSON, nullable=False),  # FileRequirements as dict
     Column("hooks", JSON, nullable=False, default=[]),  # List of hook names (str) — registry refs
+    # {hook name: [hook names it runs after]} — optional per-batch ordering
+    Column("hook_dependencies", JSON, nullable=False, default={}, server_default=text("'{}'")),
     Column("source", JSON, nullable=True),  # IngesterDefinition as dict
     Column("docs", JSONB, nullable=False),  # ConventionDocs as dict — mandatory (#151)
     Column("created_at", DateTime(timezone=True), nullable=False),
@@ -336,17 +361,35 @@ metadata_tables_table = Table(
 # ============================================================================
 # INSTANCE STATISTICS (materialized snapshot of O(rows) aggregates)
 # ============================================================================
-# Single-row snapshot refreshed periodically by the WorkerPool. Holds the
-# instance-wide aggregates that are expensive to compute live (storage size and
-# total feature-table rows); cheap counts (records, this-month) stay live on the
-# read path. ``id`` is a fixed singleton (always 1).
+# Single-row snapshot maintained by the WorkerPool: the only thing GET /stats
+# reads. Row counts are folded in from ``instance_statistics_deltas`` and
+# periodically reconciled by a full recount (``reconciled_at``);
+# ``records_this_month`` counts from ``month_start`` and restarts with each
+# month. ``id`` is a fixed singleton (always 1).
 instance_statistics_table = Table(
     "instance_statistics",
     metadata,
     Column("id", Integer, primary_key=True),
     Column("storage_bytes", BigInteger, nullable=False),
     Column("feature_rows", BigInteger, nullable=False),
+    Column("records", BigInteger, nullable=False, server_default=text("0")),
+    Column("records_this_month", BigInteger, nullable=False, server_default=text("0")),
+    Column("month_start", DateTime(timezone=True), nullable=True),
     Column("computed_at", DateTime(timezone=True), nullable=False),
+    Column("reconciled_at", DateTime(timezone=True), nullable=True),
+)
+
+# Append-only row-count changes, written in the same transaction as the rows
+# they count (``table_name`` is ``records`` or a feature table's pg_table).
+# Appending instead of updating a counter keeps concurrent writers off one hot
+# row; the statistics fold consumes (deletes) them.
+instance_statistics_deltas_table = Table(
+    "instance_statistics_deltas",
+    metadata,
+    Column("id", BigInteger, primary_key=True, autoincrement=True),
+    Column("table_name", String, nullable=False),
+    Column("row_delta", BigInteger, nullable=False),
+    Column("recorded_at", DateTime(timezone=True), nullable=False, server_default=text("now()")),
 )
 
 
@@ -389,11 +432,29 @@ ingest_runs_table = Table(
     # machine FailureKind, exposed via GET /ingestions/{id}.
     Column("failure_reason", Text, nullable=True),
     Column("failure_kind", String(32), nullable=True),
+    # Independent sourcing streams (1 = unsharded); see ingest_shards.
+    Column("shards", Integer, nullable=False, server_default=text("1")),
 )
 
 Index("idx_ingest_runs_convention", ingest_runs_table.c.convention_id)
 Index("idx_ingest_runs_status", ingest_runs_table.c.status)
 
+# Per-shard sourcing progress of a sharded run. The run row's batches_ingested
+# and ingestion_finished aggregate these (sum / all finished).
+ingest_shards_table = Table(
+    "ingest_shards",
+    metadata,
+    Column(
+        "ingest_run_id",
+        String,
+        ForeignKey("ingest_runs.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column("shard", Integer, primary_key=True),
+    Column("batches_ingested", Integer, nullable=False, server_default=text("0")),
+    Column("finished", Boolean, nullable=False, server_default=text("false")),
+)
+
 
 # ============================================================================
 # DEVICE AUTHORIZATIONS TABLE (Authentication - OAuth Device Flow)
@@ -489,6 +550,30 @@ hook_runs_table = Table(
     Column("duration_s", Float, nullable=False),
     Column("oom_retries", Integer, nullable=False, server_default=text("0")),
     Column("log_ref", Text, nullable=True),
+    # Sizing inputs: batch shape and the memory limit of the final attempt.
+    Column("records", Integer, nullable=False, server_default=text("0")),
+    Column("input_mb", Float, nullable=False, server_default=text("0")),
+    Column("memory", String(16), nullable=True),
+    Column("oom_batch_mb", Float, nullable=True),
 )
 
 Index("idx_hook_runs_release", hook_runs_table.c.release_id)  # recall: rows from a release
+
+
+# Outcome memo: a release's per-record verdict keyed by a content hash of the
+# record's input (metadata + file digests). Insert-once; re-ingesting unchanged
+# data recalls these instead of re-running the hook.
+hook_outcome_memo_table = Table(
+    "hook_outcome_memo",
+    metadata,
+    Column(
+        "release_id",
+        PGUUID(as_uuid=True),
+        ForeignKey("hook_releases.id"),
+        primary_key=True,
+    ),
+    Column("input_key", String(64), primary_key=True),  # sha256 hex
+    Column("status", String(16), nullable=False),  # OutcomeStatus (passed | rejected)
+    Column("outcome", JSONB, nullable=False),  # BatchRecordOutcome as produced
+    Column("created_at", DateTime(timezone=True), nullable=False),
+)
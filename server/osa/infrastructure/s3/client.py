@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
+from typing import Any, TypeVar
 
 from osa.domain.shared.error import InfrastructureError
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# DeleteObjects accepts at most 1,000 keys per request.
+DELETE_BATCH_SIZE = 1000
+
 
 class S3Client:
     """Async S3 client with bucket baked in.
@@ -19,15 +26,21 @@ class S3Client:
     (env vars, IRSA, Pod Identity, instance profile, etc.).
 
     The aioboto3 Session is the long-lived object; clients are ephemeral.
+
+    Prefix operations (``delete_prefix``, ``copy_prefix``) keep up to
+    ``max_concurrency`` requests in flight on one client, whose connection
+    pool is sized to match.
     """
 
     def __init__(
         self,
         bucket: str,
         endpoint_url: str | None = None,
+        max_concurrency: int = 16,
     ) -> None:
         self._bucket = bucket
         self._endpoint_url = endpoint_url
+        self._max_concurrency = max_concurrency
 
     @asynccontextmanager
     async def _client(self):
@@ -37,9 +50,12 @@ class S3Client:
         async credential chain (Pod Identity, IRSA) resolves correctly.
         """
         import aioboto3
+        from aiobotocore.config import AioConfig
 
         session = aioboto3.Session()
-        kwargs: dict[str, str] = {}
+        kwargs: dict[str, Any] = {
+            "config": AioConfig(max_pool_connections=self._max_concurrency),
+        }
         if self._endpoint_url:
             kwargs["endpoint_url"] = self._endpoint_url
         async with session.client("s3", **kwargs) as client:
@@ -57,6 +73,21 @@ class S3Client:
             resp = await client.get_object(Bucket=self._bucket, Key=key)
             return await resp["Body"].read()
 
+    async def get_object_range(self, key: str, start: int) -> bytes:
+        """Bytes of an object from offset *start* to its end (empty if there are none)."""
+        from botocore.exceptions import ClientError
+
+        async with self._client() as client:
+            try:
+                resp = await client.get_object(
+                    Bucket=self._bucket, Key=key, Range=f"bytes={start}-"
+                )
+            except ClientError as exc:
+                if exc.response["Error"]["Code"] in ("404", "NoSuchKey", "InvalidRange"):
+                    return b""
+                raise
+            return await resp["Body"].read()
+
     async def get_object_stream(self, key: str, chunk_size: int = 8192) -> AsyncIterator[bytes]:
         """Stream an object in chunks."""
         async with self._client() as client:
@@ -70,17 +101,31 @@ class S3Client:
         async with self._client() as client:
             await client.delete_object(Bucket=self._bucket, Key=key)
 
-    async def delete_objects(self, prefix: str) -> None:
-        """Delete all objects under a prefix."""
-        keys = await self.list_objects(prefix)
-        if not keys:
-            return
+    async def delete_prefix(self, prefix: str) -> int:
+        """Delete all objects under a prefix. Returns the number deleted.
+
+        Listing is pipelined with deletion: each full page of keys is handed to
+        a ``DeleteObjects`` request while the next page is still being listed.
+        """
+
+        async def _batches(client: Any) -> AsyncIterator[list[str]]:
+            batch: list[str] = []
+            async for key in self._list_keys(client, prefix):
+                batch.append(key)
+                if len(batch) == DELETE_BATCH_SIZE:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+
+        deleted = 0
         async with self._client() as client:
-            for i in range(0, len(keys), 1000):
-                batch = keys[i : i + 1000]
+
+            async def _delete(batch: list[str]) -> None:
+                nonlocal deleted
                 resp = await client.delete_objects(
                     Bucket=self._bucket,
-                    Delete={"Objects": [{"Key": k} for k in batch]},
+                    Delete={"Objects": [{"Key": k} for k in batch], "Quiet": True},
                 )
                 errors = resp.get("Errors", [])
                 if errors:
@@ -88,6 +133,60 @@ class S3Client:
                     raise InfrastructureError(
                         f"S3 batch delete failed for {len(errors)} object(s): {failed_keys}"
                     )
+                deleted += len(batch)
+
+            await self._bounded(_batches(client), _delete)
+        return deleted
+
+    async def copy_prefix(
+        self, source_prefix: str, dest_prefix: str, *, delete_source: bool = False
+    ) -> int:
+        """Server-side copy every object under ``source_prefix`` to ``dest_prefix``.
+
+        Keys keep their path relative to the source prefix. With
+        ``delete_source`` each object is removed once its copy has landed, making
+        this a move. Returns the number of objects copied.
+        """
+        copied = 0
+        async with self._client() as client:
+
+            async def _copy(key: str) -> None:
+                nonlocal copied
+                dest_key = dest_prefix + key[len(source_prefix) :]
+                await client.copy_object(
+                    Bucket=self._bucket,
+                    CopySource={"Bucket": self._bucket, "Key": key},
+                    Key=dest_key,
+                )
+                if delete_source:
+                    await client.delete_object(Bucket=self._bucket, Key=key)
+                copied += 1
+
+            await self._bounded(self._list_keys(client, source_prefix), _copy)
+        return copied
+
+    async def _bounded(self, items: AsyncIterable[T], op: Callable[[T], Awaitable[None]]) -> None:
+        """Apply ``op`` to each item with at most ``max_concurrency`` in flight.
+
+        The producer blocks while every slot is busy, so a long listing never
+        runs ahead of the requests consuming it. The first failure cancels the
+        remaining work and is re-raised as-is.
+        """
+        slots = asyncio.Semaphore(self._max_concurrency)
+
+        async def _run(item: T) -> None:
+            try:
+                await op(item)
+            finally:
+                slots.release()
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                async for item in items:
+                    await slots.acquire()
+                    tg.create_task(_run(item))
+        except BaseExceptionGroup as eg:
+            raise eg.exceptions[0] from None
 
     async def copy_object(self, source_key: str, dest_key: str) -> None:
         """Server-side copy within the same bucket."""
@@ -100,13 +199,29 @@ class S3Client:
 
     async def list_objects(self, prefix: str) -> list[str]:
         """List all object keys under a prefix."""
+        return [key async for key in self.list_prefix(prefix)]
+
+    async def list_prefix(self, prefix: str) -> AsyncIterator[str]:
+        """Yield object keys under a prefix as each listing page arrives."""
+        async with self._client() as client:
+            async for key in self._list_keys(client, prefix):
+                yield key
+
+    async def _list_keys(self, client: Any, prefix: str) -> AsyncIterator[str]:
+        paginator = client.get_paginator("list_objects_v2")
+        async for page in paginator.paginate(Bucket=self._bucket, Prefix=prefix):
+            for obj in page.get("Contents", []):
+                yield obj["Key"]
+
+    async def list_etags(self, prefix: str) -> dict[str, str]:
+        """``{key: etag}`` for every object under a prefix (quotes stripped)."""
+        etags: dict[str, str] = {}
         async with self._client() as client:
-            keys: list[str] = []
             paginator = client.get_paginator("list_objects_v2")
             async for page in paginator.paginate(Bucket=self._bucket, Prefix=prefix):
                 for obj in page.get("Contents", []):
-                    keys.append(obj["Key"])
-            return keys
+                    etags[obj["Key"]] = obj["ETag"].strip('"')
+        return etags
 
     async def head_object(self, key: str) -> bool:
         """Check if an object exists."""
@@ -9,6 +9,13 @@ from botocore.exceptions import ClientError
 
 from osa.infrastructure.runner_utils import relative_path
 from osa.infrastructure.s3.client import S3Client
+from osa.infrastructure.storage.jsonl import (
+    decode_chunks,
+    encode_lines,
+    iter_line_chunks,
+    read_candidates,
+    stale_variants,
+)
 from osa.infrastructure.storage.layout import StorageLayout
 
 logger = logging.getLogger(__name__)
@@ -37,8 +44,8 @@ class S3IngestStorage:
         """Convert a StorageLayout path to an S3 key."""
         return relative_path(path, self._data_mount_path)
 
-    async def read_session(self, ingest_run_id: str) -> dict[str, Any] | None:
-        key = self._key(self._layout.ingest_session_file(ingest_run_id))
+    async def read_session(self, ingest_run_id: str, shard: int = 0) -> dict[str, Any] | None:
+        key = self._key(self._layout.ingest_session_file(ingest_run_id, shard))
         try:
             data = await self._s3.get_object(key)
             return json.loads(data)
@@ -47,34 +54,53 @@ class S3IngestStorage:
                 return None
             raise
 
-    async def write_session(self, ingest_run_id: str, session: dict[str, Any]) -> None:
-        key = self._key(self._layout.ingest_session_file(ingest_run_id))
+    async def write_session(
+        self, ingest_run_id: str, session: dict[str, Any], shard: int = 0
+    ) -> None:
+        key = self._key(self._layout.ingest_session_file(ingest_run_id, shard))
         await self._s3.put_object(key, json.dumps(session))
 
     async def write_records(
         self, ingest_run_id: str, batch_index: int, records: list[dict[str, Any]]
     ) -> None:
-        ingester_dir = self._layout.ingest_batch_ingester_dir(ingest_run_id, batch_index)
-        key = f"{self._key(ingester_dir)}/records.jsonl"
-        content = "".join(json.dumps(r) + "\n" for r in records)
-        await self._s3.put_object(key, content)
+        fmt = self._layout.intermediate_format
+        records_file = self._layout.ingest_batch_records_file(ingest_run_id, batch_index)
+        body = encode_lines((json.dumps(r) for r in records), fmt)
+        await self._s3.put_object(self._key(records_file), body)
+        # A redo under a different format must not leave the old variant behind.
+        ingester_prefix = self._key(records_file.parent)
+        for stale in stale_variants("records.jsonl", fmt):
+            await self._s3.delete_object(f"{ingester_prefix}/{stale}")
 
     async def read_records(self, ingest_run_id: str, batch_index: int) -> list[dict[str, Any]]:
+        """Stream the batch's records object, decoding per its extension."""
         ingester_dir = self._layout.ingest_batch_ingester_dir(ingest_run_id, batch_index)
-        key = f"{self._key(ingester_dir)}/records.jsonl"
-        try:
-            data = await self._s3.get_object(key)
-        except ClientError as exc:
-            if _is_not_found(exc):
-                return []
-            raise
-        records: list[dict[str, Any]] = []
-        for line in data.decode().split("\n"):
-            line = line.strip()
-            if not line:
-                continue
-            records.append(json.loads(line))
-        return records
+        prefix = self._key(ingester_dir)
+        for name, fmt in read_candidates("records.jsonl", self._layout.intermediate_format):
+            records: list[dict[str, Any]] = []
+            body = self._s3.get_object_stream(f"{prefix}/{name}", chunk_size=1 << 20)
+            try:
+                async for lines in iter_line_chunks(decode_chunks(body, fmt)):
+                    for line in lines:
+                        line = line.strip()
+                        if line:
+                            records.append(json.loads(line))
+            except ClientError as exc:
+                # Absence surfaces on the first read, before any record is parsed.
+                if _is_not_found(exc):
+                    continue
+                raise
+            return records
+        return []
+
+    async def seal_batch_files(self, ingest_run_id: str, batch_index: int) -> None:
+        """No-op: object storage has no hardlinks to dedupe files onto."""
+
+    async def batch_file_digests(self, ingest_run_id: str, batch_index: int) -> dict[str, str]:
+        """ETags of the batch's file objects — content-derived, no download."""
+        prefix = self._key(self.batch_files_dir(ingest_run_id, batch_index)) + "/"
+        etags = await self._s3.list_etags(prefix)
+        return {key.removeprefix(prefix): etag for key, etag in etags.items()}
 
     def batch_dir(self, ingest_run_id: str, batch_index: int) -> Path:
         return self._layout.ingest_batch_dir(ingest_run_id, batch_index)
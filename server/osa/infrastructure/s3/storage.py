@@ -6,8 +6,7 @@ via aioboto3 while container pods (hooks/sources) still mount the PVC via S3 CSI
 
 import hashlib
 import json
-import logging
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Collection
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -24,8 +23,23 @@ from osa.domain.validation.model.batch_outcome import (
 )
 from osa.infrastructure.runner_utils import relative_path
 from osa.infrastructure.s3.client import S3Client
-
-logger = logging.getLogger(__name__)
+from osa.infrastructure.storage.batch_outcomes import (
+    BATCH_OUTPUT_FILES,
+    OUTCOME_CHUNK_BYTES,
+    batch_output_files,
+    parse_features_tail,
+    parse_outcome_lines,
+)
+from osa.infrastructure.storage.blocking import run_blocking
+from osa.infrastructure.storage.jsonl import (
+    IntermediateFormat,
+    decode_chunks,
+    encode_lines,
+    iter_line_chunks,
+    read_candidates,
+    stale_variants,
+    variant_name,
+)
 
 
 class S3StorageAdapter(FileStoragePort):
@@ -39,9 +53,17 @@ class S3StorageAdapter(FileStoragePort):
     by K8s runners (string math, no filesystem I/O).
     """
 
-    def __init__(self, s3: S3Client, data_mount_path: str) -> None:
+    def __init__(
+        self,
+        s3: S3Client,
+        data_mount_path: str,
+        intermediate_format: IntermediateFormat = IntermediateFormat.JSONL,
+    ) -> None:
         self._s3 = s3
         self._data_mount_path = data_mount_path
+        # Encoding of the canonical outcome objects written by write_batch_outcomes;
+        # reads detect each object's format from its key's extension.
+        self._intermediate_format = intermediate_format
 
     # ── Key/path helpers ─────────────────────────────────────────────
 
@@ -119,7 +141,7 @@ class S3StorageAdapter(FileStoragePort):
         deposition_id: DepositionSRN,
     ) -> None:
         prefix = f"{self._dep_prefix(deposition_id)}/"
-        await self._s3.delete_objects(prefix)
+        await self._s3.delete_prefix(prefix)
 
     # ── Ingester storage ──────────────────────────────────────────────
 
@@ -145,20 +167,17 @@ class S3StorageAdapter(FileStoragePort):
         source_id: str,
         deposition_srn: DepositionSRN,
     ) -> None:
-        """S3 server-side copy from ingester staging to deposition files prefix."""
-        source_prefix = f"{relative_path(staging_dir, self._data_mount_path)}/{source_id}/"
+        """S3 server-side move from ingester staging to deposition files prefix.
 
-        dest_prefix = self._files_prefix(deposition_srn)
+        Objects are copied (and their staging copies deleted) concurrently.
+        """
+        source_prefix = f"{relative_path(staging_dir, self._data_mount_path)}/{source_id}/"
+        dest_prefix = f"{self._files_prefix(deposition_srn)}/"
 
-        keys = await self._s3.list_objects(source_prefix)
-        for key in keys:
-            filename = key.rsplit("/", 1)[-1]
-            dest_key = f"{dest_prefix}/{filename}"
-            try:
-                await self._s3.copy_object(key, dest_key)
-                await self._s3.delete_object(key)
-            except Exception as e:
-                raise InfrastructureError(f"Failed to copy file {filename}: {e}") from e
+        try:
+            await self._s3.copy_prefix(source_prefix, dest_prefix, delete_source=True)
+        except Exception as e:
+            raise InfrastructureError(f"Failed to move files for {source_id}: {e}") from e
 
     # ── HookStoragePort ──────────────────────────────────────────────
 
@@ -172,6 +191,13 @@ class S3StorageAdapter(FileStoragePort):
             / hook_name
         )
 
+    def get_hook_batch_dir(self, batch_id: str, hook_name: str) -> Path:
+        """Return path for PVC subpath computation (no I/O)."""
+        return Path(self._data_mount_path) / "validation-batches" / batch_id / "hooks" / hook_name
+
+    async def delete_hook_batch(self, batch_id: str) -> None:
+        await self._s3.delete_prefix(f"validation-batches/{batch_id}/")
+
     async def write_checkpoint(
         self, work_dir: Path, outcomes: dict[HookRecordId, BatchRecordOutcome]
     ) -> None:
@@ -181,40 +207,67 @@ class S3StorageAdapter(FileStoragePort):
         content = "".join(o.model_dump_json() + "\n" for o in outcomes.values())
         await self._s3.put_object(key, content)
 
+    async def read_outcomes_since(
+        self, work_dir: Path, offset: int, *, final: bool = False
+    ) -> tuple[list[BatchRecordOutcome], int]:
+        """Ranged GET of the hook's features.jsonl from *offset* on."""
+        prefix = relative_path(work_dir, self._data_mount_path)
+        data = await self._s3.get_object_range(f"{prefix}/output/features.jsonl", offset)
+        outcomes, consumed = await run_blocking(parse_features_tail, data, final=final)
+        return outcomes, offset + consumed
+
+    async def read_output_outcomes(
+        self, work_dir: Path, *, statuses: Collection[OutcomeStatus] | None = None
+    ) -> dict[HookRecordId, BatchRecordOutcome]:
+        """Read the hook's plain JSONL outputs under ``{work_dir}/output`` from S3."""
+        output_prefix = f"{relative_path(work_dir, self._data_mount_path)}/output"
+        present = set(await self._s3.list_objects(f"{output_prefix}/"))
+        outcomes: dict[HookRecordId, BatchRecordOutcome] = {}
+        for filename, status, field_map in batch_output_files(statuses):
+            key = f"{output_prefix}/{filename}"
+            if key not in present:
+                continue
+            data = await self._s3.get_object(key)
+            for outcome in await run_blocking(
+                parse_outcome_lines, data.splitlines(), filename, status, field_map
+            ):
+                outcomes[outcome.record_id] = outcome
+        return outcomes
+
     async def write_batch_outcomes(
         self,
         work_dir: Path,
         outcomes: dict[HookRecordId, BatchRecordOutcome],
     ) -> None:
-        """Write canonical features.jsonl, rejections.jsonl, errors.jsonl to S3."""
+        """Write canonical features/rejections/errors JSONL to S3 in the configured format."""
         prefix = relative_path(work_dir, self._data_mount_path)
         output_prefix = f"{prefix}/output"
+        fmt = self._intermediate_format
 
-        features: list[str] = []
-        rejections: list[str] = []
-        errors: list[str] = []
-
+        lines: dict[str, list[str]] = {filename: [] for filename, _, _ in BATCH_OUTPUT_FILES}
         for outcome in outcomes.values():
             row: dict[str, Any] = {"id": outcome.record_id}
             if outcome.status == OutcomeStatus.PASSED:
                 row["features"] = outcome.features
-                features.append(json.dumps(row))
+                lines["features.jsonl"].append(json.dumps(row))
             elif outcome.status == OutcomeStatus.REJECTED:
                 row["reason"] = outcome.reason
-                rejections.append(json.dumps(row))
+                lines["rejections.jsonl"].append(json.dumps(row))
             elif outcome.status == OutcomeStatus.ERRORED:
                 row["error"] = outcome.error
                 row["retryable"] = outcome.retryable
-                errors.append(json.dumps(row))
-
-        for filename, lines in [
-            ("features.jsonl", features),
-            ("rejections.jsonl", rejections),
-            ("errors.jsonl", errors),
-        ]:
-            if lines:
-                key = f"{output_prefix}/{filename}"
-                await self._s3.put_object(key, "\n".join(lines) + "\n")
+                lines["errors.jsonl"].append(json.dumps(row))
+
+        # Other-format variants (the hook's own plain copy, or leftovers from an
+        # earlier setting) are dropped so readers see exactly one object.
+        present = set(await self._s3.list_objects(f"{output_prefix}/"))
+        for filename, rows in lines.items():
+            if rows:
+                key = f"{output_prefix}/{variant_name(filename, fmt)}"
+                await self._s3.put_object(key, encode_lines(rows, fmt))
+            for stale in stale_variants(filename, fmt):
+                if f"{output_prefix}/{stale}" in present:
+                    await self._s3.delete_object(f"{output_prefix}/{stale}")
 
     # ── FeatureStoragePort ───────────────────────────────────────────
 
@@ -283,45 +336,38 @@ class S3StorageAdapter(FileStoragePort):
     async def read_batch_outcomes(
         self, output_dir: str, hook_name: str
     ) -> dict[HookRecordId, BatchRecordOutcome]:
-        """Read JSONL batch outputs from S3."""
+        """Collect :meth:`iter_batch_outcomes` into a dict keyed by record ID."""
+        return {o.record_id: o async for o in self.iter_batch_outcomes(output_dir, hook_name)}
+
+    async def iter_batch_outcomes(
+        self,
+        output_dir: str,
+        hook_name: str,
+        *,
+        statuses: Collection[OutcomeStatus] | None = None,
+    ) -> AsyncIterator[BatchRecordOutcome]:
+        """Stream JSONL batch outputs from S3 without buffering whole objects.
+
+        One listing of the output prefix tells which variant (plain or
+        compressed) of each file exists. The body is read in
+        ``OUTCOME_CHUNK_BYTES`` pieces, decompressed as it arrives, and complete
+        lines are parsed on the storage I/O pool.
+        """
         prefix = relative_path(Path(output_dir), self._data_mount_path)
         hook_prefix = f"{prefix}/hooks/{hook_name}/output"
-        outcomes: dict[HookRecordId, BatchRecordOutcome] = {}
-
-        file_status_map: list[tuple[str, OutcomeStatus, dict[str, str]]] = [
-            ("features.jsonl", OutcomeStatus.PASSED, {"features": "features"}),
-            ("rejections.jsonl", OutcomeStatus.REJECTED, {"reason": "reason"}),
-            ("errors.jsonl", OutcomeStatus.ERRORED, {"error": "error", "retryable": "retryable"}),
-        ]
-
-        for filename, status, field_map in file_status_map:
-            key = f"{hook_prefix}/{filename}"
-            try:
-                data_bytes = await self._s3.get_object(key)
-            except Exception:
+        present = set(await self._s3.list_objects(f"{hook_prefix}/"))
+
+        for filename, status, field_map in batch_output_files(statuses):
+            for name, fmt in read_candidates(filename, self._intermediate_format):
+                key = f"{hook_prefix}/{name}"
+                if key in present:
+                    break
+            else:
                 continue
 
-            for line in data_bytes.decode().split("\n"):
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    data = json.loads(line)
-                except json.JSONDecodeError:
-                    logger.warning("Skipping malformed JSON line in %s", filename)
-                    continue
-                raw_id = data.get("id")
-                if not raw_id:
-                    logger.warning("Skipping JSONL line without 'id' in %s", filename)
-                    continue
-                record_id = HookRecordId(raw_id)
-                kwargs: dict[str, Any] = {
-                    "record_id": record_id,
-                    "status": status,
-                }
-                for src, dst in field_map.items():
-                    if src in data:
-                        kwargs[dst] = data[src]
-                outcomes[record_id] = BatchRecordOutcome(**kwargs)
-
-        return outcomes
+            body = self._s3.get_object_stream(key, chunk_size=OUTCOME_CHUNK_BYTES)
+            async for lines in iter_line_chunks(decode_chunks(body, fmt)):
+                for outcome in await run_blocking(
+                    parse_outcome_lines, lines, filename, status, field_map
+                ):
+                    yield outcome
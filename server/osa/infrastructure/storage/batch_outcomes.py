@@ -0,0 +1,103 @@
+"""Line-level parsing of a hook's batch outcome JSONL files.
+
+A batch hook writes ``features.jsonl`` / ``rejections.jsonl`` /
+``errors.jsonl`` under ``hooks/{name}/output``; each record appears in exactly
+one of them. Storage adapters stream those files and hand lines here a chunk at
+a time, so peak memory follows the chunk size rather than the batch's total
+feature volume.
+"""
+
+import json
+import logging
+from collections.abc import Collection, Iterable
+from pathlib import Path
+from typing import Any
+
+from osa.domain.validation.model.batch_outcome import (
+    BatchRecordOutcome,
+    HookRecordId,
+    OutcomeStatus,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bytes of JSONL read (and parsed) per step when streaming outcome files.
+OUTCOME_CHUNK_BYTES = 1 << 20
+
+BATCH_OUTPUT_FILES: list[tuple[str, OutcomeStatus, dict[str, str]]] = [
+    ("features.jsonl", OutcomeStatus.PASSED, {"features": "features"}),
+    ("rejections.jsonl", OutcomeStatus.REJECTED, {"reason": "reason"}),
+    ("errors.jsonl", OutcomeStatus.ERRORED, {"error": "error", "retryable": "retryable"}),
+]
+
+
+def batch_output_files(
+    statuses: Collection[OutcomeStatus] | None = None,
+) -> list[tuple[str, OutcomeStatus, dict[str, str]]]:
+    """The outcome files to read, narrowed to ``statuses`` (all when ``None``)."""
+    if statuses is None:
+        return BATCH_OUTPUT_FILES
+    return [entry for entry in BATCH_OUTPUT_FILES if entry[1] in statuses]
+
+
+def parse_outcome_lines(
+    lines: Iterable[str | bytes],
+    filename: str,
+    status: OutcomeStatus,
+    field_map: dict[str, str],
+) -> list[BatchRecordOutcome]:
+    """Parse JSONL lines from one outcome file, skipping blank or malformed rows."""
+    outcomes: list[BatchRecordOutcome] = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError:
+            logger.warning("Skipping malformed JSON line in %s", filename)
+            continue
+        raw_id = data.get("id")
+        if not raw_id:
+            logger.warning("Skipping JSONL line without 'id' in %s", filename)
+            continue
+        kwargs: dict[str, Any] = {
+            "record_id": HookRecordId(raw_id),
+            "status": status,
+        }
+        for src, dst in field_map.items():
+            if src in data:
+                kwargs[dst] = data[src]
+        outcomes.append(BatchRecordOutcome(**kwargs))
+    return outcomes
+
+
+def parse_features_tail(
+    data: bytes, *, final: bool = False
+) -> tuple[list[BatchRecordOutcome], int]:
+    """Passed outcomes on the complete features.jsonl lines of *data*.
+
+    *data* is the file read from some offset; returns the outcomes and how many
+    bytes they consumed. A trailing partial line is left for the next read
+    unless *final* (the writer has exited, so it is complete as is).
+    """
+    end = len(data) if final else data.rfind(b"\n") + 1
+    if not end:
+        return [], 0
+    filename, status, field_map = BATCH_OUTPUT_FILES[0]
+    return parse_outcome_lines(data[:end].splitlines(), filename, status, field_map), end
+
+
+def read_output_dir(
+    output_dir: Path, statuses: Collection[OutcomeStatus] | None = None
+) -> dict[HookRecordId, BatchRecordOutcome]:
+    """Parse the outcome files a hook run left in *output_dir* (blocking)."""
+    outcomes: dict[HookRecordId, BatchRecordOutcome] = {}
+    for filename, status, field_map in batch_output_files(statuses):
+        path = output_dir / filename
+        if not path.exists():
+            continue
+        with path.open("rb") as f:
+            for outcome in parse_outcome_lines(f, filename, status, field_map):
+                outcomes[outcome.record_id] = outcome
+    return outcomes
@@ -0,0 +1,182 @@
+"""Content-addressed blob store for deposition and ingest files (filesystem).
+
+Files keep their usual paths — deposition ``files/`` and an ingest batch's
+``ingester/files/{source_id}/`` — so hooks see the same per-record mount
+layout. With dedupe enabled, each file is *adopted*: its content is hashed
+and the path becomes a hardlink to ``blobs/sha256/{ab}/{digest}``. A second
+copy of the same payload (a re-ingest, a new record version) costs one
+``link()`` instead of the bytes.
+
+Hardlinks, not symlinks: hook containers bind-mount per-record directories
+read-only, and a symlink pointing outside the mount would dangle inside the
+container. The link count doubles as the reference count — a blob whose only
+remaining link is the store's own entry is garbage (:meth:`collect_garbage`).
+A shared inode is never written in place: writers replace the path (rename, or
+unlink then write — see :func:`detach`), so the blob's other links
+keep their bytes. Blob modes are left alone; a read-only shared inode would
+only make those replacing copies fail.
+
+Dedupe saves disk space, not I/O: each payload is still written (or renamed)
+into place and then hashed before it is linked to its blob.
+
+Mounts without hardlink support (e.g. mountpoint-for-s3) degrade to no
+dedupe: files are left as written.
+"""
+
+import errno
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from uuid import uuid4
+
+from osa.infrastructure.storage.layout import StorageLayout
+
+logger = logging.getLogger(__name__)
+
+_HASH_CHUNK = 1 << 20
+_MANIFEST = "manifest.json"
+# errnos meaning "this filesystem can't hardlink here" rather than a real fault.
+_NO_LINKS = {errno.EXDEV, errno.EPERM, errno.ENOTSUP, errno.EOPNOTSUPP, errno.EMLINK}
+
+
+def sha256_file(path: Path) -> str:
+    """Hex sha256 of a file, read in chunks."""
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(_HASH_CHUNK):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def detach(path: Path) -> None:
+    """Unlink ``path`` (if present) so the next write creates a new inode.
+
+    Call before copying onto a path that may be adopted: writing through a
+    hardlink to a shared blob would rewrite every file sharing it.
+    """
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+class FilesystemBlobStore:
+    """Deduplicating content-addressed store keyed by sha256 digest.
+
+    All methods are blocking; async callers run them via ``run_blocking``.
+    """
+
+    def __init__(self, layout: StorageLayout) -> None:
+        self._layout = layout
+        self._links_supported = True
+
+    def blob_path(self, digest: str) -> Path:
+        return self._layout.blob_path(digest)
+
+    def adopt(self, path: Path, digest: str | None = None) -> str:
+        """Make ``path`` share storage with the blob for its content.
+
+        The first file seen with a digest becomes the blob (linked in, no copy);
+        later ones are atomically replaced by a link to it. Returns the digest.
+        """
+        digest = digest or sha256_file(path)
+        if not self._links_supported:
+            return digest
+        blob = self.blob_path(digest)
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            # Two passes: a concurrent GC may remove the blob between our checks.
+            for _ in range(2):
+                try:
+                    os.link(path, blob)
+                    return digest
+                except FileExistsError:
+                    pass
+                try:
+                    if os.path.samefile(path, blob):
+                        return digest
+                    tmp = path.with_name(f".{path.name}.{uuid4().hex}.blob")
+                    os.link(blob, tmp)
+                except FileNotFoundError:
+                    continue
+                os.replace(tmp, path)
+                return digest
+        except OSError as e:
+            if e.errno not in _NO_LINKS:
+                raise
+            self._links_supported = False
+            logger.warning("Hardlinks unsupported under %s (%s); file dedupe disabled", blob, e)
+        return digest
+
+    def adopt_tree(self, root: Path) -> dict[str, str]:
+        """Adopt every regular file under ``root``. Returns ``{relpath: digest}``."""
+        return {relpath: self.adopt(path) for relpath, path in _walk_files(root)}
+
+    def refcount(self, digest: str) -> int:
+        """Number of files sharing the blob (excluding the store's own entry)."""
+        try:
+            return os.stat(self.blob_path(digest)).st_nlink - 1
+        except FileNotFoundError:
+            return 0
+
+    def collect_garbage(self) -> int:
+        """Remove blobs no file references any more. Returns the number removed."""
+        removed = 0
+        blob_dir = self._layout.blob_dir()
+        if not blob_dir.is_dir():
+            return 0
+        for shard in blob_dir.iterdir():
+            if not shard.is_dir():
+                continue
+            for blob in shard.iterdir():
+                try:
+                    if blob.stat().st_nlink <= 1:
+                        blob.unlink()
+                        removed += 1
+                except FileNotFoundError:
+                    continue
+        return removed
+
+
+def hash_tree(root: Path) -> dict[str, str]:
+    """``{relpath: digest}`` of every regular file under ``root``, without adopting."""
+    return {relpath: sha256_file(path) for relpath, path in _walk_files(root)}
+
+
+def _walk_files(root: Path) -> list[tuple[str, Path]]:
+    """Regular files under ``root`` (symlinks skipped), sorted by relative path."""
+    files: list[tuple[str, Path]] = []
+    if not root.is_dir():
+        return files
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for name in filenames:
+            path = Path(dirpath) / name
+            if path.is_symlink() or not path.is_file():
+                continue
+            files.append((path.relative_to(root).as_posix(), path))
+    return sorted(files)
+
+
+# ── Manifests ───────────────────────────────────────────────────────────
+
+
+def read_manifest(directory: Path) -> dict[str, str]:
+    """``{relpath: digest}`` for the files under ``directory`` ({} if none)."""
+    path = directory / _MANIFEST
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def write_manifest(directory: Path, entries: dict[str, str]) -> None:
+    """Atomically write ``directory/manifest.json`` (removed when empty)."""
+    path = directory / _MANIFEST
+    if not entries:
+        path.unlink(missing_ok=True)
+        return
+    directory.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(_MANIFEST + ".tmp")
+    tmp.write_text(json.dumps(dict(sorted(entries.items())), indent=0))
+    os.replace(tmp, path)
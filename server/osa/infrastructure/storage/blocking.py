@@ -0,0 +1,48 @@
+"""Bounded thread pool for blocking storage I/O.
+
+Filesystem adapters expose ``async def`` methods but the work underneath is
+plain POSIX I/O. On the S3-CSI (mountpoint-for-s3) data mount a single
+``write_text`` or ``rmtree`` can take hundreds of milliseconds, and running it
+inline stalls every coroutine sharing the worker's event loop. Adapters route
+that work through :func:`run_blocking` instead.
+
+The pool is dedicated (not the loop's default executor, which ``to_thread``
+and DNS resolution share) and size-bounded, so a burst of slow mount calls
+queues here rather than fanning out into unbounded threads.
+"""
+
+import asyncio
+import functools
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import ParamSpec, TypeVar
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+MAX_STORAGE_IO_THREADS = 8
+
+_executor: ThreadPoolExecutor | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=MAX_STORAGE_IO_THREADS,
+            thread_name_prefix="osa-storage-io",
+        )
+    return _executor
+
+
+async def run_blocking(func: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> T:
+    """Run a blocking callable on the storage I/O pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), functools.partial(func, *args, **kwargs))
+
+
+def write_output_text(path: Path, text: str) -> None:
+    """Write *text* to *path*, creating its parent directory (run via :func:`run_blocking`)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
@@ -0,0 +1,186 @@
+"""Intermediate JSONL formats — plain, gzip, or zstd, chosen by file extension.
+
+Server-written intermediates (an ingest batch's ``records.jsonl`` and the
+canonical hook outcome files) can be stored compressed to cut PVC usage and S3
+transfer. The format is part of the file name (``records.jsonl.zst``), so
+readers detect it per file and runs written under an earlier setting stay
+readable. Writers remove other-format siblings, so exactly one variant of a
+file exists at a time.
+
+zstd uses the standard library's ``compression.zstd`` (Python 3.14+) or, on
+older interpreters, the optional ``zstandard`` package.
+"""
+
+import gzip
+import zlib
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from enum import StrEnum
+from pathlib import Path
+from types import ModuleType
+from typing import Any, TextIO, cast
+
+from osa.domain.shared.error import ConfigurationError
+
+
+class IntermediateFormat(StrEnum):
+    """Encoding of server-written JSONL intermediates; the value is the extension."""
+
+    JSONL = "jsonl"
+    JSONL_GZ = "jsonl.gz"
+    JSONL_ZST = "jsonl.zst"
+
+    @property
+    def compression_suffix(self) -> str:
+        """Suffix appended to a plain ``*.jsonl`` name (``""`` when uncompressed)."""
+        return self.value.removeprefix("jsonl")
+
+
+def _zstd() -> ModuleType:
+    try:
+        from compression import zstd  # type: ignore[import-not-found]  # Python 3.14+
+
+        return zstd
+    except ImportError:
+        pass
+    try:
+        import zstandard  # type: ignore[import-not-found]
+
+        return zstandard
+    except ImportError:
+        raise ConfigurationError(
+            "intermediate format 'jsonl.zst' needs Python 3.14+ or the 'zstandard' package"
+        ) from None
+
+
+def ensure_available(fmt: IntermediateFormat) -> None:
+    """Fail fast (at wiring time) if ``fmt``'s codec is not importable."""
+    if fmt is IntermediateFormat.JSONL_ZST:
+        _zstd()
+
+
+def variant_name(name: str, fmt: IntermediateFormat) -> str:
+    """``records.jsonl`` → ``records.jsonl.zst`` (or unchanged for plain JSONL)."""
+    return name + fmt.compression_suffix
+
+
+def read_candidates(
+    name: str, preferred: IntermediateFormat
+) -> list[tuple[str, IntermediateFormat]]:
+    """Names a ``*.jsonl`` file may be stored under, the configured format first."""
+    order = [preferred, *(f for f in IntermediateFormat if f is not preferred)]
+    return [(variant_name(name, fmt), fmt) for fmt in order]
+
+
+def stale_variants(name: str, fmt: IntermediateFormat) -> list[str]:
+    """Other-format names of ``name`` that a write in ``fmt`` must remove."""
+    return [variant_name(name, other) for other in IntermediateFormat if other is not fmt]
+
+
+def format_of(path: str | Path) -> IntermediateFormat:
+    """Detect the format from a file name's extension."""
+    name = str(path)
+    for fmt in (IntermediateFormat.JSONL_ZST, IntermediateFormat.JSONL_GZ):
+        if name.endswith("." + fmt.value):
+            return fmt
+    return IntermediateFormat.JSONL
+
+
+# ── Local files ─────────────────────────────────────────────────────────
+
+
+def open_text(path: Path, mode: str, fmt: IntermediateFormat | None = None) -> TextIO:
+    """Open a (possibly compressed) JSONL file in text mode ``"r"`` or ``"w"``.
+
+    The codec streams, so callers write or read line by line without ever
+    holding the decompressed file.
+    """
+    fmt = fmt if fmt is not None else format_of(path)
+    text_mode = mode + "t"
+    if fmt is IntermediateFormat.JSONL_GZ:
+        return gzip.open(path, text_mode, encoding="utf-8")  # type: ignore[return-value]
+    if fmt is IntermediateFormat.JSONL_ZST:
+        return _zstd().open(path, text_mode, encoding="utf-8")
+    return cast(TextIO, path.open(mode, encoding="utf-8"))
+
+
+# ── Byte streams (object storage) ───────────────────────────────────────
+
+
+class _Passthrough:
+    def compress(self, data: bytes) -> bytes:
+        return data
+
+    def decompress(self, data: bytes) -> bytes:
+        return data
+
+    def flush(self) -> bytes:
+        return b""
+
+
+def _compressor(fmt: IntermediateFormat) -> Any:
+    if fmt is IntermediateFormat.JSONL_GZ:
+        return zlib.compressobj(wbits=31)  # gzip container
+    if fmt is IntermediateFormat.JSONL_ZST:
+        compressor = _zstd().ZstdCompressor()
+        # ``zstandard`` exposes streaming through compressobj(); the stdlib
+        # ZstdCompressor is itself incremental.
+        return compressor.compressobj() if hasattr(compressor, "compressobj") else compressor
+    return _Passthrough()
+
+
+def _decompressor(fmt: IntermediateFormat) -> Any:
+    if fmt is IntermediateFormat.JSONL_GZ:
+        return zlib.decompressobj(wbits=31)
+    if fmt is IntermediateFormat.JSONL_ZST:
+        decompressor = _zstd().ZstdDecompressor()
+        if hasattr(decompressor, "decompressobj"):
+            return decompressor.decompressobj()
+        return decompressor
+    return _Passthrough()
+
+
+def encode_lines(lines: Iterable[str], fmt: IntermediateFormat) -> bytes:
+    """Encode JSONL lines (without newlines) into an object body.
+
+    Lines are compressed as they are produced, so only the compressed body is
+    held in memory.
+    """
+    compressor = _compressor(fmt)
+    parts: list[bytes] = []
+    for line in lines:
+        if out := compressor.compress(line.encode() + b"\n"):
+            parts.append(out)
+    parts.append(compressor.flush())
+    return b"".join(parts)
+
+
+async def decode_chunks(
+    chunks: AsyncIterable[bytes], fmt: IntermediateFormat
+) -> AsyncIterator[bytes]:
+    """Decompress a streamed object body chunk by chunk.
+
+    The codec is set up on the first chunk, so a missing object surfaces as the
+    store's own not-found error rather than a codec error.
+    """
+    decompressor = None
+    async for chunk in chunks:
+        if decompressor is None:
+            decompressor = _decompressor(fmt)
+        if out := decompressor.decompress(chunk):
+            yield out
+
+
+async def iter_line_chunks(chunks: AsyncIterable[bytes]) -> AsyncIterator[list[bytes]]:
+    """Regroup a byte stream into lists of complete lines.
+
+    A line split across chunks is carried over and emitted whole with the next
+    chunk (or on its own at the end of the stream).
+    """
+    pending = b""
+    async for chunk in chunks:
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        if lines:
+            yield lines
+    if pending:
+        yield [pending]
@@ -9,16 +9,32 @@ deposition paths will be migrated here in a follow-up.
 
 from pathlib import Path
 
+from osa.infrastructure.storage.jsonl import IntermediateFormat, variant_name
+
 
 class StorageLayout:
     """Computes storage paths relative to a data root.
 
     All methods return Path objects. Storage adapters prefix with their
     own root (filesystem base_path or S3 key prefix).
+
+    ``intermediate_format`` selects how server-written JSONL intermediates
+    (batch records, canonical hook outcomes) are encoded on write; reads
+    detect the format from the extension.
     """
 
-    def __init__(self, data_dir: Path) -> None:
+    def __init__(
+        self,
+        data_dir: Path,
+        intermediate_format: IntermediateFormat = IntermediateFormat.JSONL,
+    ) -> None:
         self._data_dir = data_dir
+        self._intermediate_format = intermediate_format
+
+    @property
+    def intermediate_format(self) -> IntermediateFormat:
+        """Encoding used when writing JSONL intermediates."""
+        return self._intermediate_format
 
     # ── Ingest paths ─────────────────────────────────────────────────
 
@@ -34,10 +50,27 @@ class StorageLayout:
         """Ingester output directory (records.jsonl, files/) for a batch."""
         return self.ingest_batch_dir(ingest_run_id, batch_index) / "ingester"
 
+    def ingest_batch_records_file(self, ingest_run_id: str, batch_index: int) -> Path:
+        """Records file for a batch, named for the configured intermediate format."""
+        return self.ingest_batch_ingester_dir(ingest_run_id, batch_index) / variant_name(
+            "records.jsonl", self._intermediate_format
+        )
+
     def ingest_batch_hook_dir(self, ingest_run_id: str, batch_index: int, hook_name: str) -> Path:
         """Hook output directory for a batch."""
         return self.ingest_batch_dir(ingest_run_id, batch_index) / "hooks" / hook_name
 
-    def ingest_session_file(self, ingest_run_id: str) -> Path:
-        """Session state file for ingester continuation."""
-        return self.ingest_run_dir(ingest_run_id) / "session.json"
+    def ingest_session_file(self, ingest_run_id: str, shard: int = 0) -> Path:
+        """Session state file for ingester continuation (one per shard)."""
+        name = "session.json" if shard == 0 else f"session-{shard}.json"
+        return self.ingest_run_dir(ingest_run_id) / name
+
+    # ── Content-addressed blobs ──────────────────────────────────────
+
+    def blob_dir(self) -> Path:
+        """Root of the sha256 blob store (filesystem file dedupe)."""
+        return self._data_dir / "blobs" / "sha256"
+
+    def blob_path(self, digest: str) -> Path:
+        """Blob for a sha256 hex digest, sharded by its first byte."""
+        return self.blob_dir() / digest[:2] / digest
@@ -13,6 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncEngine
 from osa.domain.ingest.port.instrumentation import IngestInstrumentation
 from osa.domain.shared.port.instrumentation import (
     OutboxInstrumentation,
+    SchedulerInstrumentation,
     WorkflowInstrumentation,
 )
 from osa.domain.validation.port.instrumentation import HookInstrumentation
@@ -20,8 +21,10 @@ from osa.infrastructure.telemetry.api import ApiInstrumentation
 from osa.infrastructure.telemetry.hook import OtelHookInstrumentation
 from osa.infrastructure.telemetry.ingest import OtelIngestInstrumentation
 from osa.infrastructure.telemetry.outbox import OtelOutboxInstrumentation
+from osa.infrastructure.telemetry.scheduler import OtelSchedulerInstrumentation
 from osa.infrastructure.telemetry.workflow import OtelWorkflowInstrumentation
 from osa.infrastructure.telemetry.sampler import TelemetrySampler
+from osa.infrastructure.persistence.database import ReadEngine, WorkerEngine
 from osa.util.di.base import Provider
 from osa.util.di.scope import Scope
 
@@ -35,13 +38,22 @@ class TelemetryProvider(Provider):
         return get_meter_provider().get_meter("osa")
 
     @provide(scope=Scope.APP)
-    def get_sampler(self, meter: Meter, engine: AsyncEngine) -> TelemetrySampler:
+    def get_sampler(
+        self,
+        meter: Meter,
+        engine: AsyncEngine,
+        read_engine: ReadEngine,
+        worker_engine: WorkerEngine,
+    ) -> TelemetrySampler:
         """The periodic gauge sampler (registers observable gauges on construction).
 
-        ``AsyncEngine`` is provided APP-scoped by ``PersistenceProvider``; the
+        The engines are provided APP-scoped by ``PersistenceProvider``; the
         WorkerPool drives :meth:`TelemetrySampler.refresh` on its loop.
         """
-        return TelemetrySampler(meter, engine)
+        engines = {"primary": engine, "read": read_engine, "worker": worker_engine}
+        # SQLite shares one engine between the roles: report it once.
+        distinct = {name: e for name, e in engines.items() if name == "primary" or e is not engine}
+        return TelemetrySampler(meter, distinct)
 
     hook = provide(OtelHookInstrumentation, scope=Scope.APP, provides=HookInstrumentation)
     ingest = provide(OtelIngestInstrumentation, scope=Scope.APP, provides=IngestInstrumentation)
@@ -49,4 +61,7 @@ class TelemetryProvider(Provider):
     workflow = provide(
         OtelWorkflowInstrumentation, scope=Scope.APP, provides=WorkflowInstrumentation
     )
+    scheduler = provide(
+        OtelSchedulerInstrumentation, scope=Scope.APP, provides=SchedulerInstrumentation
+    )
     api = provide(ApiInstrumentation, scope=Scope.APP)
@@ -1,6 +1,7 @@
 """OTel adapter implementing :class:`OutboxInstrumentation`.
 
-Owns the ``osa_deliveries_total`` / ``osa_dispatch_duration_seconds`` metrics.
+Owns the ``osa_deliveries_total`` / ``osa_dispatch_duration_seconds`` /
+``osa_deliveries_requeued_total`` metrics.
 The ``consumer_group`` label is bounded by the fixed set of registered handlers
 and ``status`` by :class:`DeliveryStatus`.
 """
@@ -24,6 +25,10 @@ class OtelOutboxInstrumentation(OutboxInstrumentation):
             unit="s",
             description="Wall-clock dispatch duration of a delivery, by consumer group.",
         )
+        self._requeued = meter.create_counter(
+            "osa_deliveries_requeued_total",
+            description="Count of failed deliveries requeued for replay, by consumer group.",
+        )
 
     def delivery_completed(
         self,
@@ -35,3 +40,6 @@ class OtelOutboxInstrumentation(OutboxInstrumentation):
     ) -> None:
         self._deliveries.add(1, {"consumer_group": consumer_group, "status": status.value})
         self._dispatch.record(duration_s, {"consumer_group": consumer_group})
+
+    def deliveries_requeued(self, *, consumer_group: str, count: int) -> None:
+        self._requeued.add(count, {"consumer_group": consumer_group})
@@ -1,7 +1,8 @@
 """Periodic telemetry sampler for point-in-time gauges.
 
 Some observability signals are *levels*, not events: outbox lag, per-group
-pending/failed backlog, DB connection-pool occupancy, and live worker counts.
+pending/failed/deferred backlog, DB connection-pool occupancy and checkout wait (per
+pool), and live worker counts.
 OpenTelemetry models these as **observable gauges** whose callbacks are invoked
 *synchronously* by the metric reader at collection time. Our sources, however,
 are async (a DB round-trip for delivery stats) and must not run inside a sync
@@ -31,6 +32,7 @@ from osa.domain.auth.model.identity import Identity, System
 from osa.domain.shared.event import DeliveryStatus, WorkerStatus
 from osa.domain.shared.port.event_repository import EventRepository
 from osa.infrastructure.logging import get_logger
+from osa.infrastructure.persistence.database import TimedQueuePool
 from osa.util.di.scope import Scope
 
 if TYPE_CHECKING:
@@ -41,11 +43,17 @@ logger = get_logger(__name__)
 
 @dataclass(frozen=True)
 class PoolStats:
-    """Point-in-time SQLAlchemy connection-pool occupancy."""
+    """Point-in-time SQLAlchemy connection-pool occupancy.
+
+    ``wait_mean_seconds`` / ``wait_max_seconds`` cover the checkouts since the
+    previous sample (zero for pools that don't time checkouts).
+    """
 
     checked_out: int
     size: int
     overflow: int
+    wait_mean_seconds: float = 0.0
+    wait_max_seconds: float = 0.0
 
 
 @dataclass(frozen=True)
@@ -57,8 +65,10 @@ class SamplerSnapshot:
             ``0.0`` when the queue is empty.
         pending_by_group: Pending delivery count per consumer group.
         failed_by_group: Failed delivery count per consumer group.
-        pool: Connection-pool occupancy, or None when the engine has no
-            meaningful pool (SQLite ``StaticPool``).
+        deferred_by_group: Pending deliveries per consumer group waiting for a
+            future ``deliver_after`` (backoffs, and replays not yet released).
+        pools: Connection-pool occupancy by pool name; engines without a
+            meaningful pool (SQLite ``StaticPool``) are left out.
         workers_busy: Worker loops currently processing.
         workers_total: Total worker loops in the pool.
     """
@@ -66,7 +76,8 @@ class SamplerSnapshot:
     outbox_lag_seconds: float = 0.0
     pending_by_group: Mapping[str, int] = field(default_factory=dict)
     failed_by_group: Mapping[str, int] = field(default_factory=dict)
-    pool: PoolStats | None = None
+    deferred_by_group: Mapping[str, int] = field(default_factory=dict)
+    pools: Mapping[str, PoolStats] = field(default_factory=dict)
     workers_busy: int = 0
     workers_total: int = 0
 
@@ -76,11 +87,12 @@ class TelemetrySampler:
 
     Owns the ``osa_outbox_*``, ``osa_db_pool_*``, and ``osa_workers_*`` gauges;
     each name is registered exactly once here. The gauges read from
-    :attr:`_snapshot`, refreshed out-of-band by :meth:`refresh`.
+    :attr:`_snapshot`, refreshed out-of-band by :meth:`refresh`. Pool gauges
+    carry a ``pool`` attribute naming the engine in *engines*.
     """
 
-    def __init__(self, meter: Meter, engine: AsyncEngine) -> None:
-        self._engine = engine
+    def __init__(self, meter: Meter, engines: Mapping[str, AsyncEngine]) -> None:
+        self._engines = dict(engines)
         self._snapshot = SamplerSnapshot()
 
         meter.create_observable_gauge(
@@ -99,6 +111,11 @@ class TelemetrySampler:
             callbacks=[self._observe_failed],
             description="Failed deliveries per consumer group.",
         )
+        meter.create_observable_gauge(
+            "osa_outbox_deferred",
+            callbacks=[self._observe_deferred],
+            description="Pending deliveries per consumer group not yet eligible to claim.",
+        )
         meter.create_observable_gauge(
             "osa_db_pool_checked_out",
             callbacks=[self._observe_pool_checked_out],
@@ -114,6 +131,18 @@ class TelemetrySampler:
             callbacks=[self._observe_pool_overflow],
             description="Overflow connections open beyond the base pool size.",
         )
+        meter.create_observable_gauge(
+            "osa_db_pool_wait_seconds",
+            callbacks=[self._observe_pool_wait],
+            unit="s",
+            description="Mean wait for a pooled connection over the last sample interval.",
+        )
+        meter.create_observable_gauge(
+            "osa_db_pool_wait_max_seconds",
+            callbacks=[self._observe_pool_wait_max],
+            unit="s",
+            description="Longest wait for a pooled connection over the last sample interval.",
+        )
         meter.create_observable_gauge(
             "osa_workers_busy",
             callbacks=[self._observe_workers_busy],
@@ -138,20 +167,29 @@ class TelemetrySampler:
         for group, count in self._snapshot.failed_by_group.items():
             yield Observation(count, {"consumer_group": group})
 
+    def _observe_deferred(self, options: CallbackOptions) -> Iterable[Observation]:
+        for group, count in self._snapshot.deferred_by_group.items():
+            yield Observation(count, {"consumer_group": group})
+
     def _observe_pool_checked_out(self, options: CallbackOptions) -> Iterable[Observation]:
-        pool = self._snapshot.pool
-        if pool is not None:
-            yield Observation(pool.checked_out)
+        for name, pool in self._snapshot.pools.items():
+            yield Observation(pool.checked_out, {"pool": name})
 
     def _observe_pool_size(self, options: CallbackOptions) -> Iterable[Observation]:
-        pool = self._snapshot.pool
-        if pool is not None:
-            yield Observation(pool.size)
+        for name, pool in self._snapshot.pools.items():
+            yield Observation(pool.size, {"pool": name})
 
     def _observe_pool_overflow(self, options: CallbackOptions) -> Iterable[Observation]:
-        pool = self._snapshot.pool
-        if pool is not None:
-            yield Observation(pool.overflow)
+        for name, pool in self._snapshot.pools.items():
+            yield Observation(pool.overflow, {"pool": name})
+
+    def _observe_pool_wait(self, options: CallbackOptions) -> Iterable[Observation]:
+        for name, pool in self._snapshot.pools.items():
+            yield Observation(pool.wait_mean_seconds, {"pool": name})
+
+    def _observe_pool_wait_max(self, options: CallbackOptions) -> Iterable[Observation]:
+        for name, pool in self._snapshot.pools.items():
+            yield Observation(pool.wait_max_seconds, {"pool": name})
 
     def _observe_workers_busy(self, options: CallbackOptions) -> Iterable[Observation]:
         yield Observation(self._snapshot.workers_busy)
@@ -165,7 +203,7 @@ class TelemetrySampler:
         """Sample every source and atomically swap in a fresh snapshot.
 
         Opens a UOW scope as the System identity (like the pool's other
-        housekeeping loops), reads outbox delivery health, the DB pool, and the
+        housekeeping loops), reads outbox delivery health, the DB pools, and the
         live worker states, then assembles a new :class:`SamplerSnapshot`.
         """
         try:
@@ -190,17 +228,13 @@ class TelemetrySampler:
                 if status is DeliveryStatus.FAILED
             }
 
-            pool = self._engine.sync_engine.pool
-            # SQLite StaticPool has no meaningful occupancy stats — skip it.
-            pool_stats = (
-                PoolStats(
-                    checked_out=pool.checkedout(),
-                    size=pool.size(),
-                    overflow=pool.overflow(),
-                )
-                if isinstance(pool, QueuePool)
-                else None
-            )
+            deferred_by_group = dict(stats.deferred)
+
+            pools = {
+                name: stats
+                for name, engine in self._engines.items()
+                if (stats := _pool_stats(engine)) is not None
+            }
 
             workers_busy = sum(1 for w in workers if w.state.status is WorkerStatus.PROCESSING)
 
@@ -208,7 +242,8 @@ class TelemetrySampler:
                 outbox_lag_seconds=lag,
                 pending_by_group=pending_by_group,
                 failed_by_group=failed_by_group,
-                pool=pool_stats,
+                deferred_by_group=deferred_by_group,
+                pools=pools,
                 workers_busy=workers_busy,
                 workers_total=len(workers),
             )
@@ -216,3 +251,18 @@ class TelemetrySampler:
             # A stale gauge beats a crashed sampler: warn and keep the previous
             # snapshot so the loop survives and metrics merely go stale.
             logger.warn("Telemetry sampler refresh failed: {error}", error=str(exc))
+
+
+def _pool_stats(engine: AsyncEngine) -> PoolStats | None:
+    pool = engine.sync_engine.pool
+    # SQLite StaticPool has no meaningful occupancy stats — skip it.
+    if not isinstance(pool, QueuePool):
+        return None
+    wait_mean, wait_max = pool.waits.drain() if isinstance(pool, TimedQueuePool) else (0.0, 0.0)
+    return PoolStats(
+        checked_out=pool.checkedout(),
+        size=pool.size(),
+        overflow=pool.overflow(),
+        wait_mean_seconds=wait_mean,
+        wait_max_seconds=wait_max,
+    )
@@ -0,0 +1,39 @@
+"""OTel adapter implementing :class:`SchedulerInstrumentation`.
+
+Owns the ``osa_scheduler_*`` metric family — no other class emits these names.
+The only label is the bounded :class:`WorkSource` value, so cardinality stays
+fixed however many conventions are queued.
+"""
+
+from opentelemetry.metrics import Meter
+
+from osa.domain.shared.model.workload import WorkSource
+from osa.domain.shared.port.instrumentation import SchedulerInstrumentation
+
+
+class OtelSchedulerInstrumentation(SchedulerInstrumentation):
+    """Emits container-admission metrics through an injected OTel :class:`Meter`."""
+
+    def __init__(self, meter: Meter) -> None:
+        self._queued = meter.create_up_down_counter(
+            "osa_scheduler_queue_depth",
+            description="Container launches waiting for admission, by source.",
+        )
+        self._wait = meter.create_histogram(
+            "osa_scheduler_wait_seconds",
+            unit="s",
+            description="Time container launches waited for admission, by source.",
+        )
+        self._rejected = meter.create_counter(
+            "osa_scheduler_rejected_total",
+            description="Container launches refused because the admission queue was full.",
+        )
+
+    def queue_depth_changed(self, *, source: WorkSource, delta: int) -> None:
+        self._queued.add(delta, {"source": source.value})
+
+    def admitted(self, *, source: WorkSource, wait_s: float) -> None:
+        self._wait.record(wait_s, {"source": source.value})
+
+    def admission_rejected(self, *, source: WorkSource) -> None:
+        self._rejected.add(1, {"source": source.value})
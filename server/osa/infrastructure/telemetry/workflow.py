@@ -1,13 +1,15 @@
 """OTel adapter implementing :class:`WorkflowInstrumentation`.
 
-Owns the ``osa_workflow_stages_total`` metric — no other class emits this name.
-Label values are drawn only from bounded ``StrEnum`` members (``.value``) so
+Owns the ``osa_workflow_stages_total`` and ``osa_feature_insert_*`` metrics — no
+other class emits these names. Label values are drawn only from bounded
+``StrEnum`` members (``.value``) and feature names (one per deployed hook), so
 time-series cardinality stays finite (``WorkflowName × WorkflowStage ×
 StageOutcome``).
 """
 
 from opentelemetry.metrics import Meter
 
+from osa.domain.shared.model.hook import FeatureName
 from osa.domain.shared.model.workflow import StageOutcome, WorkflowName, WorkflowStage
 from osa.domain.shared.port.instrumentation import WorkflowInstrumentation
 
@@ -20,6 +22,15 @@ class OtelWorkflowInstrumentation(WorkflowInstrumentation):
             "osa_workflow_stages_total",
             description="Workflow stage executions by outcome.",
         )
+        self._insert_duration = meter.create_histogram(
+            "osa_feature_insert_duration_seconds",
+            unit="s",
+            description="Time to insert one batch's rows into one feature table, by feature.",
+        )
+        self._inserted_rows = meter.create_counter(
+            "osa_feature_insert_rows_total",
+            description="Feature rows inserted by ingest batches, by feature.",
+        )
 
     def stage_finished(
         self, *, workflow: WorkflowName, stage: WorkflowStage, outcome: StageOutcome
@@ -28,3 +39,8 @@ class OtelWorkflowInstrumentation(WorkflowInstrumentation):
             1,
             {"workflow": workflow.value, "stage": stage.value, "outcome": outcome.value},
         )
+
+    def features_inserted(self, *, feature: FeatureName, rows: int, duration_s: float) -> None:
+        attrs = {"feature": feature.root}
+        self._insert_duration.record(duration_s, attrs)
+        self._inserted_rows.add(rows, attrs)
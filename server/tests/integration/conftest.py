@@ -144,7 +144,8 @@ async def pg_session(pg_engine: AsyncEngine):
         await conn.execute(
             text(
                 "TRUNCATE TABLE depositions, conventions, schemas, ontologies, "
-                "ontology_terms, events, deliveries, records, validation_runs, "
+                "instance_statistics, instance_statistics_deltas, "
+                "ontology_terms, events, deliveries, worker_counts, records, validation_runs, "
                 "feature_tables, metadata_tables, hooks, hook_releases, hook_runs, "
                 "users, identities, refresh_tokens, "
                 "role_assignments CASCADE"
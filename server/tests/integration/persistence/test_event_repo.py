@@ -9,10 +9,16 @@ from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
 import pytest
-from sqlalchemy import update
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
-from osa.domain.shared.event import Event, EventId
+from osa.domain.shared.event import (
+    DeliveryPriority,
+    DeliveryStatus,
+    Event,
+    EventId,
+    FailedDeliveryFilter,
+)
 from osa.infrastructure.persistence.repository.event import SQLAlchemyEventRepository
 from osa.infrastructure.persistence.tables import deliveries_table
 
@@ -108,6 +114,34 @@ class TestEventRepoClaimDelivery:
         assert isinstance(result.deliveries[0].event, PongEvent)
         assert result.deliveries[0].event.data == "pong"
 
+    async def test_claim_takes_higher_priority_first(self, pg_session: AsyncSession):
+        repo = SQLAlchemyEventRepository(pg_session)
+
+        await repo.save_with_deliveries(
+            PingEvent(id=EventId(uuid4()), data="backfill"),
+            {CONSUMER_GROUP},
+            priority=DeliveryPriority.BACKGROUND,
+        )
+        await repo.save_with_deliveries(
+            PingEvent(id=EventId(uuid4()), data="normal"), {CONSUMER_GROUP}
+        )
+        await repo.save_with_deliveries(
+            PingEvent(id=EventId(uuid4()), data="interactive"),
+            {CONSUMER_GROUP},
+            priority=DeliveryPriority.INTERACTIVE,
+        )
+        await pg_session.commit()
+
+        claimed = []
+        for _ in range(3):
+            result = await repo.claim_delivery(
+                consumer_group=CONSUMER_GROUP, event_types=["PingEvent"], limit=1
+            )
+            claimed.extend(d.event.data for d in result.deliveries)
+        await pg_session.commit()
+
+        assert claimed == ["interactive", "normal", "backfill"]
+
     async def test_claim_concurrent_sessions_see_disjoint_deliveries(self, pg_engine: AsyncEngine):
         """Two concurrent sessions using FOR UPDATE SKIP LOCKED get disjoint sets."""
         factory = async_sessionmaker(pg_engine, expire_on_commit=False)
@@ -250,6 +284,103 @@ class TestEventRepoStaleDeliveries:
         assert data["status"] == "pending"
 
 
+async def _fail(repo: SQLAlchemyEventRepository, data: str, group: str, error: str) -> str:
+    """Save an event with one delivery and fail it permanently; returns the delivery id."""
+    await repo.save_with_deliveries(PingEvent(id=EventId(uuid4()), data=data), {group})
+    result = await repo.claim_delivery(consumer_group=group, event_types=["PingEvent"])
+    delivery_id = result.deliveries[0].id
+    await repo.mark_failed_with_retry(delivery_id, error=error, max_retries=1)
+    return delivery_id
+
+
+@pytest.mark.asyncio
+class TestEventRepoFailedDeliveries:
+    async def test_list_and_count_filter_by_group_and_error(self, pg_session: AsyncSession):
+        repo = SQLAlchemyEventRepository(pg_session)
+        s3 = await _fail(repo, "a", CONSUMER_GROUP, "S3 unavailable: timeout")
+        await _fail(repo, "b", CONSUMER_GROUP, "schema mismatch")
+        await _fail(repo, "c", "other-group", "s3 unavailable")
+        await pg_session.commit()
+
+        criteria = FailedDeliveryFilter(consumer_group=CONSUMER_GROUP, error_contains="s3")
+        listed = await repo.list_failed_deliveries(criteria)
+
+        assert [d.id for d in listed] == [s3]
+        assert listed[0].event_type == "PingEvent"
+        assert listed[0].retry_count == 1
+        assert await repo.count_failed_deliveries(FailedDeliveryFilter()) == 3
+
+    async def test_list_filters_by_failure_time(self, pg_session: AsyncSession):
+        repo = SQLAlchemyEventRepository(pg_session)
+        await _fail(repo, "a", CONSUMER_GROUP, "boom")
+        await pg_session.commit()
+        now = datetime.now(UTC)
+
+        assert await repo.list_failed_deliveries(FailedDeliveryFilter(failed_after=now)) == []
+        before = await repo.list_failed_deliveries(FailedDeliveryFilter(failed_before=now))
+        assert len(before) == 1
+
+    async def test_requeue_spreads_release_over_the_window(self, pg_session: AsyncSession):
+        repo = SQLAlchemyEventRepository(pg_session)
+        for i in range(4):
+            await _fail(repo, f"e{i}", CONSUMER_GROUP, "S3 unavailable")
+        await _fail(repo, "x", "other-group", "S3 unavailable")
+        await pg_session.commit()
+
+        requeued = await repo.requeue_failed_deliveries(
+            FailedDeliveryFilter(consumer_group=CONSUMER_GROUP), limit=10, window_seconds=60
+        )
+        await pg_session.commit()
+
+        assert requeued == {CONSUMER_GROUP: 4}
+        rows = (
+            await pg_session.execute(
+                select(
+                    deliveries_table.c.status,
+                    deliveries_table.c.retry_count,
+                    deliveries_table.c.deliver_after,
+                )
+                .where(deliveries_table.c.consumer_group == CONSUMER_GROUP)
+                .order_by(deliveries_table.c.deliver_after)
+            )
+        ).all()
+        assert {(r.status, r.retry_count) for r in rows} == {(DeliveryStatus.PENDING.value, 0)}
+        gaps = [(b.deliver_after - a.deliver_after).total_seconds() for a, b in zip(rows, rows[1:])]
+        assert gaps == pytest.approx([15.0, 15.0, 15.0])
+        # Released over time: only the first slot is claimable now.
+        claimed = await repo.claim_delivery(
+            consumer_group=CONSUMER_GROUP, event_types=["PingEvent"], limit=10
+        )
+        assert len(claimed.deliveries) == 1
+
+    async def test_requeue_respects_limit(self, pg_session: AsyncSession):
+        repo = SQLAlchemyEventRepository(pg_session)
+        for i in range(3):
+            await _fail(repo, f"e{i}", CONSUMER_GROUP, "boom")
+        await pg_session.commit()
+
+        requeued = await repo.requeue_failed_deliveries(
+            FailedDeliveryFilter(), limit=2, window_seconds=0
+        )
+        await pg_session.commit()
+
+        assert requeued == {CONSUMER_GROUP: 2}
+        assert await repo.count_failed_deliveries(FailedDeliveryFilter()) == 1
+
+
+@pytest.mark.asyncio
+class TestEventRepoWorkerCounts:
+    async def test_set_worker_count_upserts(self, pg_session: AsyncSession):
+        repo = SQLAlchemyEventRepository(pg_session)
+
+        await repo.set_worker_count(CONSUMER_GROUP, 4)
+        await repo.set_worker_count(CONSUMER_GROUP, 2)
+        await repo.set_worker_count("other-group", 0)
+        await pg_session.commit()
+
+        assert await repo.get_worker_counts() == {CONSUMER_GROUP: 2, "other-group": 0}
+
+
 @pytest.mark.asyncio
 class TestEventRepoFindLatestByType:
     async def test_find_latest_by_type(self, pg_session: AsyncSession):
@@ -273,3 +404,20 @@ class TestEventRepoFindLatestByType:
         repo = SQLAlchemyEventRepository(pg_session)
         latest = await repo.find_latest_by_type(PingEvent)
         assert latest is None
+
+    async def test_requeue_skips_excluded_groups(self, pg_session: AsyncSession):
+        repo = SQLAlchemyEventRepository(pg_session)
+        await _fail(repo, "a", CONSUMER_GROUP, "boom")
+        await _fail(repo, "b", "other-group", "boom")
+        await pg_session.commit()
+
+        requeued = await repo.requeue_failed_deliveries(
+            FailedDeliveryFilter(exclude_consumer_groups=frozenset({"other-group"})),
+            limit=10,
+            window_seconds=0,
+        )
+        await pg_session.commit()
+
+        assert requeued == {CONSUMER_GROUP: 1}
+        still_failed = await repo.list_failed_deliveries(FailedDeliveryFilter())
+        assert [d.consumer_group for d in still_failed] == ["other-group"]
@@ -0,0 +1,79 @@
+"""Integration tests for PostgresStatisticsStore — delta folding and reconcile."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from osa.infrastructure.data.postgres_statistics_store import PostgresStatisticsStore
+from osa.infrastructure.persistence.row_deltas import RECORDS, row_delta
+from osa.infrastructure.persistence.tables import instance_statistics_deltas_table
+from tests.integration.conftest import seed_record
+
+
+async def _refresh(engine: AsyncEngine, **kwargs) -> None:  # noqa: ANN003
+    async with async_sessionmaker(engine)() as session:
+        await PostgresStatisticsStore(session, **kwargs).refresh()
+        await session.commit()
+
+
+async def _append(engine: AsyncEngine, table_name: str, delta: int) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(row_delta(table_name, delta))
+
+
+@pytest.mark.asyncio
+class TestStatisticsRefresh:
+    async def test_first_refresh_reconciles_by_counting(
+        self, pg_engine: AsyncEngine, pg_session: AsyncSession
+    ):
+        # Seeded directly: no deltas, so only a recount can see them.
+        await seed_record(pg_engine, srn="urn:osa:localhost:rec:a@1")
+        await seed_record(
+            pg_engine,
+            srn="urn:osa:localhost:rec:b@1",
+            published_at=datetime.now(UTC) - timedelta(days=62),
+        )
+
+        await _refresh(pg_engine)
+
+        snapshot = await PostgresStatisticsStore(pg_session).read_snapshot()
+        assert snapshot is not None
+        assert snapshot.records == 2
+        assert snapshot.records_this_month == 1
+        assert snapshot.reconciled_at is not None
+
+    async def test_later_refreshes_fold_deltas_without_counting(
+        self, pg_engine: AsyncEngine, pg_session: AsyncSession
+    ):
+        await _refresh(pg_engine)
+        # Rows that exist only as deltas prove the fold didn't recount.
+        await _append(pg_engine, RECORDS, 3)
+        await _append(pg_engine, "pocket_detect", 10)
+        await _append(pg_engine, "pocket_detect", -4)
+
+        await _refresh(pg_engine)
+
+        snapshot = await PostgresStatisticsStore(pg_session).read_snapshot()
+        assert snapshot is not None
+        assert snapshot.records == 3
+        assert snapshot.records_this_month == 3
+        assert snapshot.feature_rows == 6
+        pending = await pg_session.execute(
+            select(func.count()).select_from(instance_statistics_deltas_table)
+        )
+        assert pending.scalar_one() == 0
+
+    async def test_reconcile_replaces_drifted_counts(
+        self, pg_engine: AsyncEngine, pg_session: AsyncSession
+    ):
+        await seed_record(pg_engine, srn="urn:osa:localhost:rec:a@1")
+        await _refresh(pg_engine)
+        await _append(pg_engine, RECORDS, 5)  # drift: no such rows
+
+        await _refresh(pg_engine, reconcile_interval=0.001)
+
+        snapshot = await PostgresStatisticsStore(pg_session).read_snapshot()
+        assert snapshot is not None
+        assert snapshot.records == 1
@@ -77,7 +77,9 @@ async def _register_convention(
         convention_repo=PostgresConventionRepository(pg_session),
         schema_service=schema_service,
         metadata_service=metadata_service,
-        hook_registry=HookRegistryService(registry=PostgresHookRegistry(pg_session)),
+        hook_registry=HookRegistryService(
+            registry=PostgresHookRegistry(pg_session), outbox=AsyncMock()
+        ),
         outbox=AsyncMock(),
         node_domain=Domain("localhost"),
     )
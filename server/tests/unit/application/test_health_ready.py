@@ -150,3 +150,21 @@ class TestReady:
         body = resp.json()
         assert body["components"]["workers"]["status"] == "error"
         assert body["components"]["db"]["status"] == "ok"
+
+    def test_api_role_reports_workers_unchecked(self, monkeypatch):
+        # An API-only replica never starts workers; that must not degrade it.
+        monkeypatch.setenv("OSA_ROLE", "api")
+        app = create_app(providers=[OkDbProvider()])
+        client = TestClient(app, raise_server_exceptions=False)
+        resp = client.get("/api/v1/ready")
+        assert resp.status_code == 200
+        assert resp.json()["components"]["workers"]["status"] == "unchecked"
+
+    def test_reports_replica_and_singleton_leaders(self):
+        app = create_app(providers=[OkDbProvider(), AlivePoolProvider()])
+        client = TestClient(app, raise_server_exceptions=False)
+        body = client.get("/api/v1/ready").json()
+        # The default SQLite setup is single-process: this replica leads everything.
+        assert body["replica"]
+        assert body["leaders"]
+        assert set(body["leaders"].values()) == {body["replica"]}
@@ -0,0 +1,89 @@
+"""Unit tests for the worker role: consumer-group partitioning and the CLI."""
+
+import pytest
+
+from osa.application import worker
+from osa.application.cli import build_parser
+from osa.application.worker import WorkerSupervisor, partition_groups
+
+GROUPS = ["ProcessSubmission", "ProcessBatch", "PrefetchHookImage"]
+
+
+class TestPartitionGroups:
+    def test_single_process_runs_every_group(self):
+        assert partition_groups(GROUPS, 1) == [GROUPS]
+
+    def test_groups_split_round_robin(self):
+        assert partition_groups(GROUPS, 2) == [
+            ["ProcessSubmission", "PrefetchHookImage"],
+            ["ProcessBatch"],
+        ]
+
+    def test_spare_processes_rejoin_groups(self):
+        partitions = partition_groups(GROUPS, 5)
+
+        assert partitions[:3] == [[g] for g in GROUPS]
+        assert partitions[3:] == [["ProcessSubmission"], ["ProcessBatch"]]
+
+    def test_every_group_is_covered(self):
+        for processes in range(1, 7):
+            covered = {g for part in partition_groups(GROUPS, processes) for g in part}
+            assert covered == set(GROUPS)
+
+    def test_rejects_empty_inputs(self):
+        with pytest.raises(ValueError):
+            partition_groups(GROUPS, 0)
+        with pytest.raises(ValueError):
+            partition_groups([], 2)
+
+
+class FakeChild:
+    """Stand-in child process; one that does not drain stays alive until killed."""
+
+    def __init__(self, name: str, *, drains: bool) -> None:
+        self.name = name
+        self.alive = not drains
+        self.killed = False
+        self.joins: list[float | None] = []
+
+    def is_alive(self) -> bool:
+        return self.alive
+
+    def join(self, timeout: float | None = None) -> None:
+        self.joins.append(timeout)
+
+    def kill(self) -> None:
+        self.killed = True
+        self.alive = False
+
+
+class TestSupervisorShutdown:
+    def test_child_missing_the_drain_deadline_is_killed(self, monkeypatch):
+        monkeypatch.setattr(worker, "_EXIT_GRACE_S", 0.0)
+        drained = FakeChild("osa-worker-0", drains=True)
+        stuck = FakeChild("osa-worker-1", drains=False)
+        supervisor = WorkerSupervisor([["ProcessBatch"], ["ProcessSubmission"]], drain_timeout=0)
+        supervisor._children = [drained, stuck]  # type: ignore[list-item]
+
+        supervisor._wait()
+
+        assert not drained.killed
+        assert stuck.killed
+        assert stuck.joins[-1] is None
+
+
+class TestCli:
+    def test_worker_command_parses_processes_and_groups(self):
+        args = build_parser().parse_args(
+            ["worker", "--processes", "3", "--groups", "ProcessBatch, PrefetchHookImage"]
+        )
+
+        assert args.command == "worker"
+        assert args.processes == 3
+        assert args.groups == ["ProcessBatch", "PrefetchHookImage"]
+
+    def test_worker_defaults_defer_to_config(self):
+        args = build_parser().parse_args(["worker"])
+
+        assert args.processes is None
+        assert args.groups is None
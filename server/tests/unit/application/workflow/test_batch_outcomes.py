@@ -0,0 +1,100 @@
+"""Unit tests for :class:`BatchOutcomeCache`.
+
+The cache sits between ProcessBatch's PUBLISH and INSERT_FEATURES stages: it
+keeps each hook's passed-ID set and run.json provenance after the first read,
+while feature payloads are always streamed from storage, never held.
+"""
+
+from collections.abc import AsyncIterator, Collection
+
+from osa.application.workflow.batch_outcomes import BatchOutcomeCache
+from osa.domain.shared.model.provenance import RunRef
+from osa.domain.validation.model.batch_outcome import (
+    BatchRecordOutcome,
+    HookRecordId,
+    OutcomeStatus,
+)
+
+
+def _outcome(rid: str, status: OutcomeStatus = OutcomeStatus.PASSED) -> BatchRecordOutcome:
+    return BatchRecordOutcome(
+        record_id=HookRecordId(rid),
+        status=status,
+        features=[{"rid": rid}] if status == OutcomeStatus.PASSED else [],
+    )
+
+
+class _CountingStorage:
+    """Feature storage fake that counts full streams and run.json reads."""
+
+    def __init__(self, outcomes: dict[str, list[BatchRecordOutcome]]) -> None:
+        self._outcomes = outcomes
+        self.streams: list[tuple[str, frozenset[OutcomeStatus] | None]] = []
+        self.run_ref_reads = 0
+
+    async def iter_batch_outcomes(
+        self,
+        output_dir: str,
+        hook_name: str,
+        *,
+        statuses: Collection[OutcomeStatus] | None = None,
+    ) -> AsyncIterator[BatchRecordOutcome]:
+        self.streams.append((hook_name, frozenset(statuses) if statuses else None))
+        for outcome in self._outcomes.get(hook_name, []):
+            if statuses is None or outcome.status in statuses:
+                yield outcome
+
+    async def read_run_ref(self, output_dir: str, hook_name: str) -> RunRef | None:
+        self.run_ref_reads += 1
+        return RunRef(run_id="run-1", release_id="rel-1")
+
+
+async def test_passed_ids_read_once_and_only_passed_file() -> None:
+    storage = _CountingStorage(
+        {"h": [_outcome("a"), _outcome("b", OutcomeStatus.REJECTED), _outcome("c")]}
+    )
+    cache = BatchOutcomeCache(storage, "/batch")  # type: ignore[arg-type]
+
+    assert await cache.passed_ids("h") == {"a", "c"}
+    assert await cache.passed_ids("h") == {"a", "c"}
+
+    assert storage.streams == [("h", frozenset({OutcomeStatus.PASSED}))]
+
+
+async def test_iter_passed_streams_features() -> None:
+    storage = _CountingStorage({"h": [_outcome("a"), _outcome("b", OutcomeStatus.ERRORED)]})
+    cache = BatchOutcomeCache(storage, "/batch")  # type: ignore[arg-type]
+
+    seen = [o async for o in cache.iter_passed("h")]
+
+    assert [(o.record_id, o.features) for o in seen] == [("a", [{"rid": "a"}])]
+
+
+async def test_iter_passed_skips_storage_when_nothing_passed() -> None:
+    storage = _CountingStorage({"h": [_outcome("x", OutcomeStatus.REJECTED)]})
+    cache = BatchOutcomeCache(storage, "/batch")  # type: ignore[arg-type]
+
+    assert await cache.passed_ids("h") == frozenset()
+    assert [o async for o in cache.iter_passed("h")] == []
+
+    assert len(storage.streams) == 1
+
+
+async def test_run_ref_cached() -> None:
+    storage = _CountingStorage({})
+    cache = BatchOutcomeCache(storage, "/batch")  # type: ignore[arg-type]
+
+    first = await cache.run_ref("h")
+    assert await cache.run_ref("h") == first
+    assert storage.run_ref_reads == 1
+
+
+async def test_featured_ids_exclude_passed_records_without_features() -> None:
+    bare = BatchRecordOutcome(record_id=HookRecordId("b"), status=OutcomeStatus.PASSED)
+    storage = _CountingStorage({"h": [_outcome("a"), bare]})
+    cache = BatchOutcomeCache(storage, "/batch")  # type: ignore[arg-type]
+
+    assert await cache.featured_ids("h") == {"a"}
+    assert await cache.passed_ids("h") == {"a", "b"}
+
+    assert len(storage.streams) == 1
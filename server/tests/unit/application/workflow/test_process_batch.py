@@ -7,6 +7,7 @@ drift) and add new coverage for stage skipping, checkpoint ordering, and the
 DB-recomputed publish mapping.
 """
 
+import asyncio
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
@@ -14,7 +15,12 @@ from uuid import uuid4
 
 import pytest
 
-from osa.application.workflow.process_batch import ProcessBatch
+from osa.application.workflow.process_batch import (
+    HookBatchStage,
+    IngestBatchStage,
+    ProcessBatch,
+    PublishBatchStage,
+)
 from osa.domain.ingest.event.events import (
     HookBatchCompleted,
     IngesterBatchReady,
@@ -27,14 +33,16 @@ from osa.domain.ingest.model.ingest_run import (
     IngestRunId,
     IngestStatus,
     RunClosed,
+    ShardProgress,
 )
 from osa.domain.shared.error import NotFoundError, PermanentError, TransientError
-from osa.domain.shared.event import EventId
+from osa.domain.shared.event import DeliveryPriority, EventId
 from osa.domain.shared.failure import DecisionKind, FailureKind, FailurePolicy, RuntimeFailure
 from osa.domain.shared.model.hook import HookName, OciConfig, OciLimits, TableFeatureSpec
 from osa.domain.shared.model.source import IngesterDefinition
 from osa.domain.shared.model.srn import ConventionSlug, Domain, LocalId, RecordSRN, RecordVersion
 from osa.domain.shared.model.workflow import StageOutcome, WorkflowName, WorkflowStage
+from osa.domain.shared.scheduler import ContainerScheduler
 from osa.domain.shared.port.ingester_runner import IngesterOutput
 from osa.domain.validation.model.batch_outcome import (
     BatchRecordOutcome,
@@ -45,6 +53,7 @@ from osa.domain.validation.model.hook import Hook
 from osa.domain.validation.model.hook_release import HookRelease, HookReleaseId
 from osa.domain.validation.model.hook_result import HookExecution, HookStatus
 from osa.domain.validation.model.hook_run import HookRun, HookRunId, HookRunStatus
+from osa.domain.validation.service.hook_memo import HookMemoService
 
 _T0 = datetime(2026, 1, 1, tzinfo=UTC)
 
@@ -67,14 +76,18 @@ class _RecordingHookInstrumentation:
 
 
 class _RecordingWorkflowInstrumentation:
-    """Records every ``stage_finished`` call for assertion."""
+    """Records every ``stage_finished`` and ``features_inserted`` call for assertion."""
 
     def __init__(self) -> None:
         self.stages: list[tuple[WorkflowName, WorkflowStage, StageOutcome]] = []
+        self.inserts: list[tuple[str, int]] = []
 
     def stage_finished(self, *, workflow, stage, outcome) -> None:  # noqa: ANN001
         self.stages.append((workflow, stage, outcome))
 
+    def features_inserted(self, *, feature, rows, duration_s) -> None:  # noqa: ANN001
+        self.inserts.append((feature.root, rows))
+
 
 class _RecordingUnitOfWork:
     """Records the interleaving of commits against a shared timeline."""
@@ -88,6 +101,20 @@ class _RecordingUnitOfWork:
         self.timeline.append("commit")
 
 
+class _InMemoryMemo:
+    """HookOutcomeMemo double: a dict keyed by (release_id, input_key)."""
+
+    def __init__(self) -> None:
+        self.rows: dict[tuple[HookReleaseId, str], BatchRecordOutcome] = {}
+
+    async def get_many(self, release_id, keys):  # noqa: ANN001, ANN201
+        return {k: self.rows[(release_id, k)] for k in keys if (release_id, k) in self.rows}
+
+    async def put_many(self, release_id, outcomes) -> None:  # noqa: ANN001
+        for key, outcome in outcomes.items():
+            self.rows.setdefault((release_id, key), outcome)
+
+
 def _logged(timeline: list[str], label: str, result):  # noqa: ANN001, ANN201
     """An async side_effect that records ``label`` on the timeline then returns ``result``."""
 
@@ -116,6 +143,7 @@ def _make_run(
     *,
     batches_ingested: int = 0,
     limit: int | None = None,
+    shards: int = 1,
 ) -> IngestRun:
     return IngestRun(
         id=IngestRunId("run-1"),
@@ -124,6 +152,7 @@ def _make_run(
         batch_size=100,
         batches_ingested=batches_ingested,
         limit=limit,
+        shards=shards,
         started_at=_T0,
     )
 
@@ -207,6 +236,12 @@ def _make_registry(names: tuple[str, ...], *, get_run_result: HookRun | None) ->
     return registry
 
 
+async def _iter_outcomes(outcomes, statuses):  # noqa: ANN001, ANN202
+    for outcome in outcomes.values():
+        if statuses is None or outcome.status in statuses:
+            yield outcome
+
+
 def _make_handler(
     *,
     run: IngestRun | None = None,
@@ -220,6 +255,8 @@ def _make_handler(
     hooks_done: bool = False,
     has_capacity: bool = True,
     records=None,  # noqa: ANN001
+    hook_memo: HookMemoService | None = None,
+    handler_type: type[ProcessBatch] = ProcessBatch,
 ) -> ProcessBatch:
     run = run if run is not None else _make_run()
     if executions is None:
@@ -267,17 +304,21 @@ def _make_handler(
     ingest_storage.batch_files_dir = MagicMock(return_value=Path("/tmp/files"))
     ingest_storage.hook_work_dir = MagicMock(return_value=Path("/tmp/hook"))
     ingest_storage.batch_dir = MagicMock(return_value=Path("/tmp/batch"))
+    ingest_storage.batch_file_digests.return_value = {}
 
     hook_service = AsyncMock()
     hook_service.run_hooks_for_batch.side_effect = _logged(timeline, "hooks_run", executions)
 
     feature_storage = AsyncMock()
-    feature_storage.read_batch_outcomes.return_value = outcomes
+    feature_storage.iter_batch_outcomes = MagicMock(
+        side_effect=lambda *_args, **kwargs: _iter_outcomes(outcomes, kwargs.get("statuses"))
+    )
     from osa.domain.shared.model.provenance import RunRef
 
     feature_storage.read_run_ref.return_value = RunRef(run_id="hr-1", release_id="rel-1")
 
     feature_service = AsyncMock()
+    feature_service.insert_concurrency = 4
     feature_service.insert_features.side_effect = _logged(timeline, "insert_features", 1)
 
     record_service = AsyncMock()
@@ -291,17 +332,28 @@ def _make_handler(
     ingest_service.ensure_running.return_value = run
     ingest_service.mark_batch_ingested.return_value = Applied(run)
     ingest_service.close_sourcing.return_value = Applied(run)
+    # Unsharded runs: the run's own counters are the one sourcing stream.
+    ingest_service.sourcing_position.side_effect = lambda r, _i: ShardProgress(
+        shard=0, batches_ingested=r.batches_ingested, finished=r.ingestion_finished
+    )
+    ingest_service.batch_sourced.side_effect = lambda r, i: r.batches_ingested > i
     ingest_service.complete_batch.side_effect = _logged(timeline, "complete", None)
 
-    handler = ProcessBatch(
+    hook_sizing = AsyncMock()
+    hook_sizing.for_releases.return_value = {}
+
+    handler = handler_type(
         ingest_service=ingest_service,
         convention_service=convention_service,
         ingester_runner=ingester_runner,
+        scheduler=ContainerScheduler(slots=4),
         ingest_storage=ingest_storage,
         hook_service=hook_service,
         hook_registry=_make_registry(
             hook_names, get_run_result=_make_hook_run() if hooks_done else None
         ),
+        hook_sizing=hook_sizing,
+        hook_memo=hook_memo or HookMemoService(memo=_InMemoryMemo(), enabled=False),
         record_service=record_service,
         feature_service=feature_service,
         feature_storage=feature_storage,
@@ -314,6 +366,21 @@ def _make_handler(
     return handler
 
 
+def _ready_event(batch_index: int = 0) -> IngesterBatchReady:
+    return IngesterBatchReady(
+        id=EventId(uuid4()),
+        ingest_run_id=IngestRunId("run-1"),
+        batch_index=batch_index,
+        has_more=True,
+    )
+
+
+def _hooked_event(batch_index: int = 0) -> HookBatchCompleted:
+    return HookBatchCompleted(
+        id=EventId(uuid4()), ingest_run_id=IngestRunId("run-1"), batch_index=batch_index
+    )
+
+
 def _emitted(handler: ProcessBatch) -> list:
     return [call.args[0] for call in handler.outbox.append.call_args_list]
 
@@ -354,6 +421,19 @@ class TestHappyPath:
         assert len(continuations) == 1
         assert continuations[0].batch_index == 3
 
+    @pytest.mark.asyncio
+    async def test_batch_events_keep_the_run_priority(self) -> None:
+        handler = _make_handler()
+        event = _make_event().model_copy(update={"priority": DeliveryPriority.BACKGROUND})
+
+        await handler.handle(event)
+
+        staged = (NextBatchRequested, IngesterBatchReady, HookBatchCompleted)
+        calls = [c for c in handler.outbox.append.call_args_list if isinstance(c.args[0], staged)]
+        assert len(calls) == 3
+        assert all(c.args[0].priority == DeliveryPriority.BACKGROUND for c in calls)
+        assert all(c.kwargs["priority"] == DeliveryPriority.BACKGROUND for c in calls)
+
     @pytest.mark.asyncio
     async def test_complete_batch_called_last_with_mapping_length(self) -> None:
         handler = _make_handler(mapping={"rec-1": _srn("r-1"), "rec-2": _srn("r-2")})
@@ -507,7 +587,7 @@ class TestIngestLimitEarlyExit:
 
         await handler.handle(_make_event(batch_index=1))
 
-        handler.ingest_service.close_sourcing.assert_awaited_once_with("run-1")
+        handler.ingest_service.close_sourcing.assert_awaited_once_with("run-1", shard=None)
         handler.ingester_runner.run.assert_not_called()
         handler.hook_service.run_hooks_for_batch.assert_not_called()
 
@@ -897,7 +977,7 @@ class TestFinalAndLimitedBatches:
 
         await handler.handle(_make_event(batch_index=1))
 
-        handler.ingest_service.close_sourcing.assert_awaited_once_with("run-1")
+        handler.ingest_service.close_sourcing.assert_awaited_once_with("run-1", shard=None)
         handler.ingester_runner.run.assert_not_called()
         handler.hook_service.run_hooks_for_batch.assert_not_called()
         handler.record_service.bulk_publish.assert_not_called()
@@ -921,6 +1001,63 @@ class TestFinalAndLimitedBatches:
         ]
 
 
+class TestShardedSourcing:
+    @pytest.mark.asyncio
+    async def test_shard_chains_on_its_own_stride(self) -> None:
+        # Batch 4 of a 3-shard run is shard 1's second pull: its session file,
+        # the ingester's partition env, and the continuation all stay on shard 1.
+        handler = _make_handler(run=_make_run(batches_ingested=3, shards=3))
+        handler.ingest_service.sourcing_position.side_effect = None
+        handler.ingest_service.sourcing_position.return_value = ShardProgress(
+            shard=1, batches_ingested=1
+        )
+        handler.ingest_service.batch_sourced.side_effect = None
+        handler.ingest_service.batch_sourced.return_value = False
+
+        await handler.handle(_make_event(batch_index=4))
+
+        handler.ingest_storage.read_session.assert_awaited_once_with("run-1", shard=1)
+        inputs = handler.ingester_runner.run.await_args.kwargs["inputs"]
+        assert (inputs.shard, inputs.shards) == (1, 3)
+        handler.ingest_storage.write_session.assert_awaited_once_with(
+            "run-1", {"cursor": "next"}, shard=1
+        )
+        assert handler.ingest_service.mark_batch_ingested.await_args.kwargs["shards"] == 3
+        requests = [e for e in _emitted(handler) if isinstance(e, NextBatchRequested)]
+        assert [r.batch_index for r in requests] == [7]
+
+    @pytest.mark.asyncio
+    async def test_shard_limit_closes_only_that_shard(self) -> None:
+        # limit=200 over 2 shards is 100 records each; shard 1 already pulled one
+        # full batch, so its redelivery closes shard 1 and leaves shard 0 running.
+        handler = _make_handler(run=_make_run(batches_ingested=1, limit=200, shards=2))
+        handler.ingest_service.sourcing_position.side_effect = None
+        handler.ingest_service.sourcing_position.return_value = ShardProgress(
+            shard=1, batches_ingested=1
+        )
+        handler.ingest_service.batch_sourced.side_effect = None
+        handler.ingest_service.batch_sourced.return_value = False
+
+        await handler.handle(_make_event(batch_index=3))
+
+        handler.ingest_service.close_sourcing.assert_awaited_once_with("run-1", shard=1)
+        handler.ingester_runner.run.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_shard_beyond_a_small_limit_sources_nothing(self) -> None:
+        # limit=3 over 8 shards: shards 0-2 take one record each, shard 5 none.
+        handler = _make_handler(run=_make_run(limit=3, shards=8))
+        handler.ingest_service.sourcing_position.side_effect = None
+        handler.ingest_service.sourcing_position.return_value = ShardProgress(shard=5)
+        handler.ingest_service.batch_sourced.side_effect = None
+        handler.ingest_service.batch_sourced.return_value = False
+
+        await handler.handle(_make_event(batch_index=5))
+
+        handler.ingest_service.close_sourcing.assert_awaited_once_with("run-1", shard=5)
+        handler.ingester_runner.run.assert_not_called()
+
+
 class TestPublishRedoRecovery:
     @pytest.mark.asyncio
     async def test_publish_redo_recovers_mapping_from_db(self) -> None:
@@ -972,6 +1109,73 @@ class TestPublishRedoRecovery:
         )
 
 
+class TestFeatureInsertFanOut:
+    @staticmethod
+    def _track_overlap(handler: ProcessBatch) -> list[int]:
+        """Make inserts yield, recording how many are in flight at each start."""
+        in_flight: list[int] = []
+        active = 0
+
+        async def insert(**kwargs) -> int:  # noqa: ANN003
+            nonlocal active
+            active += 1
+            in_flight.append(active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return 1
+
+        handler.feature_service.insert_features.side_effect = insert
+        return in_flight
+
+    @pytest.mark.asyncio
+    async def test_features_insert_concurrently(self) -> None:
+        handler = _make_handler(
+            hook_names=("hook_a", "hook_b", "hook_c"),
+            executions=[_passed_exec(n) for n in ("hook_a", "hook_b", "hook_c")],
+        )
+        in_flight = self._track_overlap(handler)
+
+        await handler.handle(_make_event())
+
+        assert max(in_flight) == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self) -> None:
+        handler = _make_handler(
+            hook_names=("hook_a", "hook_b", "hook_c"),
+            executions=[_passed_exec(n) for n in ("hook_a", "hook_b", "hook_c")],
+        )
+        handler.feature_service.insert_concurrency = 1
+        in_flight = self._track_overlap(handler)
+
+        await handler.handle(_make_event())
+
+        assert in_flight == [1, 1, 1]
+
+    @pytest.mark.asyncio
+    async def test_each_feature_reports_its_insert(self) -> None:
+        handler = _make_handler(
+            hook_names=("hook_a", "hook_b"),
+            executions=[_passed_exec("hook_a"), _passed_exec("hook_b")],
+        )
+
+        await handler.handle(_make_event())
+
+        assert sorted(handler.instrumentation.inserts) == [("hook_a", 1), ("hook_b", 1)]
+
+    @pytest.mark.asyncio
+    async def test_failed_insert_is_raised_as_is(self) -> None:
+        handler = _make_handler(
+            hook_names=("hook_a", "hook_b"),
+            executions=[_passed_exec("hook_a"), _passed_exec("hook_b")],
+        )
+        handler.feature_service.insert_features.side_effect = TransientError("db gone")
+
+        with pytest.raises(TransientError, match="db gone"):
+            await handler.handle(_make_event())
+        handler.ingest_service.complete_batch.assert_not_called()
+
+
 class TestPartialProvenance:
     @pytest.mark.asyncio
     async def test_partial_provenance_reruns_all_hooks(self) -> None:
@@ -1019,3 +1223,119 @@ class TestHookRetryStageOutcome:
         ) in stages
         assert not any(stage == WorkflowStage.PUBLISH for _, stage, _ in stages)
         assert not any(stage == WorkflowStage.INSERT_FEATURES for _, stage, _ in stages)
+
+
+class TestHooksMemo:
+    @pytest.mark.asyncio
+    async def test_fresh_outcomes_are_remembered_and_recalled(self) -> None:
+        memo = HookMemoService(memo=_InMemoryMemo())
+        release = _make_release()
+        execution = _passed_exec("pockets").model_copy(update={"release_id": release.id})
+        first = _make_handler(executions=[execution], hook_memo=memo)
+        first.hook_registry.resolve_live.return_value = {release.hook_name: release}
+
+        await first.handle(_make_event())
+
+        # The next batch carrying the same record content reuses the outcome.
+        second = _make_handler(executions=[execution], hook_memo=memo)
+        second.hook_registry.resolve_live.return_value = {release.hook_name: release}
+        await second.handle(_make_event(batch_index=1))
+
+        known = second.hook_service.run_hooks_for_batch.await_args.kwargs["known"]
+        outcome = known[HookName("pockets")][HookRecordId("rec-1")]
+        assert outcome.status is OutcomeStatus.PASSED
+        assert outcome.features == [{"v": 1}]
+
+    @pytest.mark.asyncio
+    async def test_failed_hook_outcomes_are_not_remembered(self) -> None:
+        store = _InMemoryMemo()
+        handler = _make_handler(
+            executions=[_failed_exec("pockets", FailureKind.CONFIG)],
+            hook_memo=HookMemoService(memo=store),
+        )
+
+        await handler.handle(_make_event())
+
+        assert store.rows == {}
+
+    @pytest.mark.asyncio
+    async def test_disabled_memo_skips_digests(self) -> None:
+        handler = _make_handler()
+
+        await handler.handle(_make_event())
+
+        handler.ingest_storage.batch_file_digests.assert_not_awaited()
+        assert handler.hook_service.run_hooks_for_batch.await_args.kwargs["known"] == {}
+
+
+# ── Stages as separate consumer groups ───────────────────────────────────────
+
+
+class TestBatchStageHandlers:
+    @pytest.mark.asyncio
+    async def test_ingest_stage_sources_and_hands_off(self) -> None:
+        handler = _make_handler(handler_type=IngestBatchStage)
+
+        await handler.handle(_make_event())
+
+        assert handler.uow.timeline == ["commit", "ingest_run", "commit"]
+        assert any(isinstance(e, IngesterBatchReady) for e in _emitted(handler))
+        handler.hook_service.run_hooks_for_batch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_ingest_stage_skips_a_sourced_batch(self) -> None:
+        handler = _make_handler(handler_type=IngestBatchStage, run=_make_run(batches_ingested=1))
+
+        await handler.handle(_make_event())
+
+        handler.ingester_runner.run.assert_not_called()
+        assert _emitted(handler) == []
+
+    @pytest.mark.asyncio
+    async def test_hook_stage_runs_hooks_and_hands_off(self) -> None:
+        handler = _make_handler(handler_type=HookBatchStage)
+
+        await handler.handle(_ready_event())
+
+        assert handler.uow.timeline == ["commit", "hooks_run", "commit"]
+        assert any(isinstance(e, HookBatchCompleted) for e in _emitted(handler))
+        handler.record_service.bulk_publish.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_hook_stage_without_hooks_hands_off_on_the_delivery_commit(self) -> None:
+        handler = _make_handler(handler_type=HookBatchStage, hook_names=(), executions=[])
+
+        await handler.handle(_ready_event())
+
+        assert handler.uow.timeline == []
+        assert [type(e) for e in _emitted(handler)] == [HookBatchCompleted]
+
+    @pytest.mark.asyncio
+    async def test_hook_stage_redelivery_does_not_hand_off_twice(self) -> None:
+        handler = _make_handler(handler_type=HookBatchStage, hooks_done=True)
+
+        await handler.handle(_ready_event())
+
+        handler.hook_service.run_hooks_for_batch.assert_not_called()
+        assert _emitted(handler) == []
+
+    @pytest.mark.asyncio
+    async def test_publish_stage_publishes_inserts_and_completes(self) -> None:
+        handler = _make_handler(handler_type=PublishBatchStage)
+
+        await handler.handle(_hooked_event())
+
+        assert handler.uow.timeline == ["publish", "commit", "insert_features", "complete"]
+        handler.ingester_runner.run.assert_not_called()
+        handler.hook_service.run_hooks_for_batch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stage_for_a_terminal_run_is_dropped(self) -> None:
+        handler = _make_handler(
+            handler_type=PublishBatchStage, run=_make_run(status=IngestStatus.COMPLETED)
+        )
+
+        await handler.handle(_hooked_event())
+
+        handler.record_service.bulk_publish.assert_not_called()
+        handler.ingest_service.complete_batch.assert_not_called()
@@ -181,6 +181,43 @@ class TestDataConfig:
         assert cfg.data.max_page_limit == 250
 
 
+class TestStorageConfig:
+    """Intermediate-file encoding is operator configuration (OSA_STORAGE__*)."""
+
+    def test_default_is_plain_jsonl(self):
+        assert config_from_yaml({}).storage.intermediate_format == "jsonl"
+
+    def test_env_override(self):
+        cfg = config_from_yaml({}, env_overrides={"OSA_STORAGE__INTERMEDIATE_FORMAT": "jsonl.gz"})
+        assert cfg.storage.intermediate_format == "jsonl.gz"
+
+    def test_unknown_format_raises(self):
+        with pytest.raises(Exception):  # Pydantic ValidationError
+            config_from_yaml({"storage": {"intermediate_format": "parquet"}})
+
+    def test_file_dedupe_off_by_default(self):
+        assert config_from_yaml({}).storage.dedupe_files is False
+
+    def test_file_dedupe_env_override(self):
+        cfg = config_from_yaml({}, env_overrides={"OSA_STORAGE__DEDUPE_FILES": "true"})
+        assert cfg.storage.dedupe_files is True
+
+
+class TestOciRunnerConfig:
+    """The warm hook container pool is opt-in (OSA_RUNNER__OCI__*)."""
+
+    def test_warm_pool_disabled_by_default(self):
+        assert config_from_yaml({}).runner.oci.warm_pool_size == 0
+
+    def test_env_override(self):
+        cfg = config_from_yaml({}, env_overrides={"OSA_RUNNER__OCI__WARM_POOL_SIZE": "4"})
+        assert cfg.runner.oci.warm_pool_size == 4
+
+    def test_max_runs_must_be_positive(self):
+        with pytest.raises(Exception):  # Pydantic ValidationError
+            config_from_yaml({"runner": {"oci": {"warm_pool_max_runs": 0}}})
+
+
 class TestObservabilityConfig:
     """Telemetry export configuration group (metrics/logs/traces), OSA_OBSERVABILITY__*."""
 
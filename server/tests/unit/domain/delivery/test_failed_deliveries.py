@@ -0,0 +1,163 @@
+"""Unit tests for failed-delivery inspection and bulk requeue."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from osa.domain.auth.model.principal import Principal
+from osa.domain.auth.model.role import Role
+from osa.domain.auth.model.value import ProviderIdentity, UserId
+from osa.domain.delivery.command.requeue_failed_deliveries import (
+    RequeueFailedDeliveries,
+    RequeueFailedDeliveriesHandler,
+)
+from osa.domain.delivery.query.list_failed_deliveries import (
+    ListFailedDeliveries,
+    ListFailedDeliveriesHandler,
+)
+from osa.domain.shared.error import AuthorizationError, ValidationError
+from osa.domain.shared.event import FailedDelivery, FailedDeliveryFilter
+from osa.domain.shared.model.subscription_registry import NonReplayableGroups
+from osa.domain.shared.outbox import Outbox
+
+FAILED_AT = datetime(2026, 10, 18, 12, 0, tzinfo=UTC)
+
+
+class RecordingOutboxInstrumentation:
+    def __init__(self) -> None:
+        self.requeued: list[tuple[str, int]] = []
+
+    def delivery_completed(self, **kwargs) -> None:  # noqa: ANN003
+        pass
+
+    def deliveries_requeued(self, *, consumer_group: str, count: int) -> None:
+        self.requeued.append((consumer_group, count))
+
+
+def _principal(role: Role = Role.SUPERADMIN) -> Principal:
+    return Principal(
+        user_id=UserId.generate(),
+        provider_identity=ProviderIdentity(provider="orcid", external_id="0000-0001"),
+        roles=frozenset({role}),
+    )
+
+
+NON_REPLAYABLE = NonReplayableGroups(frozenset({"ProcessBatch", "ProcessSubmission"}))
+
+
+def _requeue_handler(
+    outbox: AsyncMock,
+    principal: Principal | None = None,
+    instrumentation: RecordingOutboxInstrumentation | None = None,
+) -> RequeueFailedDeliveriesHandler:
+    return RequeueFailedDeliveriesHandler(
+        principal=principal or _principal(),
+        outbox=outbox,
+        instrumentation=instrumentation or RecordingOutboxInstrumentation(),
+        non_replayable=NON_REPLAYABLE,
+    )
+
+
+def _outbox() -> AsyncMock:
+    outbox = AsyncMock(spec=Outbox)
+    outbox.failed_deliveries.return_value = [
+        FailedDelivery(
+            id="d-1",
+            event_id="e-1",
+            event_type="NextBatchRequested",
+            consumer_group="ProcessBatch",
+            error="S3 unavailable",
+            retry_count=5,
+            failed_at=FAILED_AT,
+        )
+    ]
+    outbox.count_failed.return_value = 37
+    outbox.requeue_failed.return_value = {"PrefetchHookImage": 30, "MeterUsage": 7}
+    return outbox
+
+
+@pytest.mark.asyncio
+class TestListFailedDeliveries:
+    async def test_lists_a_page_with_the_filtered_total(self):
+        outbox = _outbox()
+        handler = ListFailedDeliveriesHandler(principal=_principal(), outbox=outbox)
+
+        result = await handler.run(
+            ListFailedDeliveries(consumer_group="ProcessBatch", error="s3", limit=10)
+        )
+
+        criteria = FailedDeliveryFilter(consumer_group="ProcessBatch", error_contains="s3")
+        outbox.failed_deliveries.assert_awaited_once_with(criteria, limit=10, offset=0)
+        outbox.count_failed.assert_awaited_once_with(criteria)
+        assert result.total == 37
+        assert [d.id for d in result.items] == ["d-1"]
+        assert result.items[0].failed_at == FAILED_AT
+
+    async def test_requires_superadmin(self):
+        handler = ListFailedDeliveriesHandler(principal=_principal(Role.ADMIN), outbox=_outbox())
+
+        with pytest.raises(AuthorizationError):
+            await handler.run(ListFailedDeliveries())
+
+
+@pytest.mark.asyncio
+class TestRequeueFailedDeliveries:
+    async def test_requeues_over_the_window_and_records_progress(self):
+        outbox = _outbox()
+        instrumentation = RecordingOutboxInstrumentation()
+        handler = _requeue_handler(outbox, instrumentation=instrumentation)
+        before = datetime.now(UTC)
+
+        result = await handler.run(
+            RequeueFailedDeliveries(
+                failed_after=FAILED_AT - timedelta(hours=1), limit=500, window_seconds=600
+            )
+        )
+
+        outbox.requeue_failed.assert_awaited_once_with(
+            FailedDeliveryFilter(
+                failed_after=FAILED_AT - timedelta(hours=1),
+                exclude_consumer_groups=NON_REPLAYABLE,
+            ),
+            limit=500,
+            window_seconds=600,
+        )
+        assert result.requeued == 37
+        assert result.by_consumer_group == {"PrefetchHookImage": 30, "MeterUsage": 7}
+        assert result.release_until >= before + timedelta(seconds=600)
+        assert result.skipped_consumer_groups == ["ProcessBatch", "ProcessSubmission"]
+        assert sorted(instrumentation.requeued) == [
+            ("MeterUsage", 7),
+            ("PrefetchHookImage", 30),
+        ]
+
+    async def test_a_named_replayable_group_skips_nothing(self):
+        outbox = _outbox()
+        handler = _requeue_handler(outbox)
+
+        result = await handler.run(RequeueFailedDeliveries(consumer_group="PrefetchHookImage"))
+
+        outbox.requeue_failed.assert_awaited_once_with(
+            FailedDeliveryFilter(consumer_group="PrefetchHookImage"),
+            limit=1000,
+            window_seconds=300.0,
+        )
+        assert result.skipped_consumer_groups == []
+
+    async def test_refuses_a_group_whose_on_exhausted_compensated(self):
+        outbox = _outbox()
+        handler = _requeue_handler(outbox)
+
+        with pytest.raises(ValidationError, match="ProcessBatch cannot be requeued") as exc:
+            await handler.run(RequeueFailedDeliveries(consumer_group="ProcessBatch"))
+        assert exc.value.code == "consumer_group_not_replayable"
+        outbox.requeue_failed.assert_not_awaited()
+
+    async def test_requires_superadmin(self):
+        outbox = _outbox()
+        handler = _requeue_handler(outbox, principal=_principal(Role.ADMIN))
+
+        with pytest.raises(AuthorizationError):
+            await handler.run(RequeueFailedDeliveries())
+        outbox.requeue_failed.assert_not_awaited()
@@ -0,0 +1,53 @@
+"""Unit tests for SetWorkerCount — runtime consumer-group resizing."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from osa.domain.auth.model.principal import Principal
+from osa.domain.auth.model.role import Role
+from osa.domain.auth.model.value import ProviderIdentity, UserId
+from osa.domain.delivery.command.set_worker_count import SetWorkerCount, SetWorkerCountHandler
+from osa.domain.shared.error import AuthorizationError, NotFoundError
+from osa.domain.shared.model.subscription_registry import SubscriptionRegistry
+from osa.domain.shared.outbox import Outbox
+
+REGISTRY = SubscriptionRegistry({"NextBatchRequested": {"ProcessBatch"}})
+
+
+def _principal(role: Role) -> Principal:
+    return Principal(
+        user_id=UserId.generate(),
+        provider_identity=ProviderIdentity(provider="orcid", external_id="0000-0001"),
+        roles=frozenset({role}),
+    )
+
+
+def _handler(role: Role = Role.SUPERADMIN) -> SetWorkerCountHandler:
+    return SetWorkerCountHandler(
+        principal=_principal(role), outbox=AsyncMock(spec=Outbox), registry=REGISTRY
+    )
+
+
+@pytest.mark.asyncio
+class TestSetWorkerCount:
+    async def test_stores_the_count_for_a_known_group(self):
+        handler = _handler()
+
+        result = await handler.run(SetWorkerCount(consumer_group="ProcessBatch", workers=2))
+
+        assert result.workers == 2
+        handler.outbox.set_worker_count.assert_awaited_once_with("ProcessBatch", 2)
+
+    async def test_rejects_unknown_group(self):
+        handler = _handler()
+
+        with pytest.raises(NotFoundError):
+            await handler.run(SetWorkerCount(consumer_group="Nope", workers=2))
+        handler.outbox.set_worker_count.assert_not_awaited()
+
+    async def test_requires_superadmin(self):
+        handler = _handler(Role.ADMIN)
+
+        with pytest.raises(AuthorizationError):
+            await handler.run(SetWorkerCount(consumer_group="ProcessBatch", workers=2))
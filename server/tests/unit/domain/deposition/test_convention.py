@@ -2,8 +2,12 @@
 
 from datetime import UTC, datetime
 
+import pytest
+
 from osa.domain.deposition.model.convention import Convention
 from osa.domain.deposition.model.value import FileRequirements
+from osa.domain.shared.error import ValidationError
+from osa.domain.shared.model.hook import HookName
 from osa.domain.shared.model.srn import ConventionSlug, SchemaId
 from tests.factories import make_convention_docs
 
@@ -79,3 +83,33 @@ class TestConventionIdentity:
             created_at=datetime.now(UTC),
         )
         assert conv.id.root == "my-conv"
+
+
+class TestConventionHookDependencies:
+    def _conv(self, hooks: list[str], deps: dict[str, list[str]]) -> Convention:
+        return Convention(
+            id=_make_conv_slug(),
+            title="Test",
+            description="A test convention",
+            schema_id=_make_schema_id(),
+            file_requirements=_make_file_reqs(),
+            hooks=hooks,
+            hook_dependencies=deps,
+            docs=make_convention_docs(),
+            created_at=datetime.now(UTC),
+        )
+
+    def test_defaults_to_unordered(self):
+        assert self._conv(["a", "b"], {}).hook_dependencies == {}
+
+    def test_accepts_acyclic_order(self):
+        conv = self._conv(["a", "b", "c"], {"c": ["a", "b"]})
+        assert [h.root for h in conv.hook_dependencies[HookName("c")]] == ["a", "b"]
+
+    def test_rejects_undeclared_hook(self):
+        with pytest.raises(ValidationError, match="undeclared hooks: z"):
+            self._conv(["a", "b"], {"b": ["z"]})
+
+    def test_rejects_cycle(self):
+        with pytest.raises(ValidationError, match="cycle"):
+            self._conv(["a", "b"], {"a": ["b"], "b": ["a"]})
@@ -224,3 +224,28 @@ class TestBatchFailureAccounting:
         assert completed is True
         assert run.status == IngestStatus.COMPLETED
         assert run.completed_at == now
+
+
+class TestSharding:
+    def test_unsharded_by_default(self) -> None:
+        run = _make_run(limit=100)
+        assert run.shards == 1
+        assert not run.sharded
+        assert run.next_batch_index(4) == 5
+        assert run.shard_limit(0) == 100
+
+    def test_stride_namespace(self) -> None:
+        run = _make_run(shards=3)
+        assert run.sharded
+        assert [run.shard_of(i) for i in range(6)] == [0, 1, 2, 0, 1, 2]
+        assert run.shard_batch(7) == 2
+        assert run.next_batch_index(7) == 10
+
+    def test_limit_split_across_shards(self) -> None:
+        run = _make_run(shards=3, limit=100)
+        assert [run.shard_limit(s) for s in range(3)] == [34, 33, 33]
+        assert _make_run(shards=3).shard_limit(0) is None
+
+    def test_limit_below_shard_count_never_overshoots(self) -> None:
+        run = _make_run(shards=8, limit=3)
+        assert [run.shard_limit(s) for s in range(8)] == [1, 1, 1, 0, 0, 0, 0, 0]
@@ -4,10 +4,13 @@ from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from pydantic import ValidationError
 
+from osa.domain.ingest.command.start_ingest import StartIngest
 from osa.domain.ingest.model.ingest_run import Applied, IngestStatus, RunClosed
 from osa.domain.ingest.service.ingest import IngestService
 from osa.domain.shared.error import ConflictError, NotFoundError
+from osa.domain.shared.event import DeliveryPriority
 from osa.domain.shared.model.source import IngesterDefinition
 from osa.domain.shared.model.srn import Domain
 
@@ -30,13 +33,14 @@ class RecordingIngestInstrumentation:
         self.runs_finished.append((status, kind))
 
 
-def _make_convention(*, has_ingester: bool = True):
+def _make_convention(*, has_ingester: bool = True, shards: int = 1):
     conv = MagicMock()
     conv.srn = "test-conv"
     conv.ingester = (
         IngesterDefinition(
             image="ghcr.io/example/ingester:v1",
             digest="sha256:abc123",
+            shards=shards,
         )
         if has_ingester
         else None
@@ -140,6 +144,84 @@ class TestStartIngest:
             )
 
 
+class TestStartIngestCommand:
+    def test_priority_accepts_the_delivery_lanes(self):
+        command = StartIngest(convention_id="pdb", priority=DeliveryPriority.BACKGROUND)
+
+        assert command.priority == -10
+
+    @pytest.mark.parametrize("priority", [-32769, 32768])
+    def test_priority_outside_smallint_range_is_rejected(self, priority):
+        with pytest.raises(ValidationError):
+            StartIngest(convention_id="pdb", priority=priority)
+
+
+class TestShardedSourcing:
+    """A shardable ingester runs one sourcing stream per shard."""
+
+    @pytest.mark.asyncio
+    async def test_start_emits_one_request_per_shard(self) -> None:
+        service = _make_service(convention=_make_convention(shards=3))
+
+        run = await service.start_ingest(convention_id="test-conv")
+
+        assert run.shards == 3
+        requests = [c.args[0] for c in service.outbox.append.call_args_list[1:]]
+        assert [r.batch_index for r in requests] == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_start_requests_carry_the_run_priority(self) -> None:
+        service = _make_service(convention=_make_convention(shards=2))
+
+        await service.start_ingest(convention_id="test-conv", priority=DeliveryPriority.BACKGROUND)
+
+        calls = service.outbox.append.call_args_list[1:]
+        assert [c.args[0].priority for c in calls] == [DeliveryPriority.BACKGROUND] * 2
+        assert [c.kwargs["priority"] for c in calls] == [DeliveryPriority.BACKGROUND] * 2
+
+    @pytest.mark.asyncio
+    async def test_mark_batch_ingested_advances_the_shard(self) -> None:
+        from osa.domain.ingest.model.ingest_run import IngestRunId
+
+        service = _make_service()
+
+        await service.mark_batch_ingested(
+            IngestRunId("run-1"), 7, ingestion_finished=True, shards=3
+        )
+
+        # Batch 7 is shard 1's third pull.
+        service.ingest_repo.advance_shard.assert_awaited_once_with(
+            "run-1", 1, batches=3, finished=True
+        )
+        service.ingest_repo.mark_batch_ingested.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_close_sourcing_finishes_only_the_shard(self) -> None:
+        from osa.domain.ingest.model.ingest_run import IngestRunId
+
+        service = _make_service()
+
+        await service.close_sourcing(IngestRunId("run-1"), shard=2)
+
+        service.ingest_repo.advance_shard.assert_awaited_once_with("run-1", 2, finished=True)
+        service.ingest_repo.increment_batches_ingested.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_batch_sourced_reads_shard_progress(self) -> None:
+        from osa.domain.ingest.model.ingest_run import ShardProgress
+
+        service = _make_service()
+        run = await _make_service(convention=_make_convention(shards=2)).start_ingest(
+            convention_id="test-conv"
+        )
+        service.ingest_repo.get_shard.return_value = ShardProgress(shard=1, batches_ingested=2)
+
+        # Shard 1 has pulled indices 1 and 3; index 5 is still to come.
+        assert await service.batch_sourced(run, 3) is True
+        assert await service.batch_sourced(run, 5) is False
+        service.ingest_repo.get_shard.assert_awaited_with(run.id, 1)
+
+
 class TestEnsureRunning:
     """ensure_running — transition a PENDING run to RUNNING; no-op otherwise."""
 
@@ -105,6 +105,20 @@ def test_oci_limits_custom():
     assert limits.cpu == "1.0"
 
 
+@pytest.mark.parametrize(("cpu", "cores"), [("500m", 0.5), ("2", 2.0), ("0.5", 0.5)])
+def test_parse_cpu_accepts_cores_and_millicores(cpu, cores):
+    from osa.domain.shared.model.hook import parse_cpu
+
+    assert parse_cpu(cpu) == cores
+
+
+def test_parse_cpu_rejects_garbage():
+    from osa.domain.shared.model.hook import parse_cpu
+
+    with pytest.raises(ValueError):
+        parse_cpu("two")
+
+
 def test_oci_config_fields():
     from osa.domain.shared.model.hook import OciConfig, OciLimits
 
@@ -9,7 +9,7 @@ from uuid import uuid4
 
 import pytest
 
-from osa.domain.shared.event import ClaimResult, Delivery, Event, EventId
+from osa.domain.shared.event import ClaimResult, Delivery, DeliveryPriority, Event, EventId
 from osa.domain.shared.model.subscription_registry import SubscriptionRegistry
 from osa.domain.shared.outbox import Outbox
 
@@ -57,7 +57,19 @@ class TestOutboxAppendCreatesDeliveries:
         await outbox.append(event)
 
         mock_repo.save_with_deliveries.assert_called_once_with(
-            event, consumer_groups={"HandlerA", "HandlerB"}, deliver_after=None
+            event, consumer_groups={"HandlerA", "HandlerB"}, deliver_after=None, priority=0
+        )
+
+    async def test_append_passes_priority_to_deliveries(self, outbox: Outbox, mock_repo: AsyncMock):
+        event = DummyEvent(id=EventId(uuid4()), data="backfill")
+
+        await outbox.append(event, priority=DeliveryPriority.BACKGROUND)
+
+        mock_repo.save_with_deliveries.assert_called_once_with(
+            event,
+            consumer_groups={"HandlerA", "HandlerB"},
+            deliver_after=None,
+            priority=DeliveryPriority.BACKGROUND,
         )
 
     async def test_append_audit_only_event_creates_zero_deliveries(
@@ -74,7 +86,7 @@ class TestOutboxAppendCreatesDeliveries:
         await outbox.append(event)
 
         mock_repo.save_with_deliveries.assert_called_once_with(
-            event, consumer_groups=set(), deliver_after=None
+            event, consumer_groups=set(), deliver_after=None, priority=0
         )
 
 
@@ -0,0 +1,258 @@
+"""Unit tests for ContainerScheduler — fair, priority- and resource-aware admission."""
+
+import asyncio
+
+import pytest
+
+from osa.domain.shared.failure import FailureKind, RuntimeFailure
+from osa.domain.shared.model.workload import Workload, WorkSource
+from osa.domain.shared.scheduler import ContainerScheduler
+
+DEP = Workload(source=WorkSource.DEPOSITION, convention="pdb")
+INGEST_A = Workload(source=WorkSource.INGEST, convention="pdb")
+INGEST_B = Workload(source=WorkSource.INGEST, convention="uniprot")
+
+
+class RecordingSchedulerInstrumentation:
+    def __init__(self) -> None:
+        self.depth = 0
+        self.waits: list[tuple[WorkSource, float]] = []
+        self.rejected: list[WorkSource] = []
+
+    def queue_depth_changed(self, *, source, delta) -> None:  # noqa: ANN001
+        self.depth += delta
+
+    def admitted(self, *, source, wait_s) -> None:  # noqa: ANN001
+        self.waits.append((source, wait_s))
+
+    def admission_rejected(self, *, source) -> None:  # noqa: ANN001
+        self.rejected.append(source)
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class _Harness:
+    """Queues launches behind a held slot, then lets them run one at a time."""
+
+    def __init__(self, scheduler: ContainerScheduler) -> None:
+        self.scheduler = scheduler
+        self.order: list[str] = []
+        self.tasks: list[asyncio.Task] = []
+        self._gate = asyncio.Event()
+
+    def launch(self, label: str, workload: Workload, **demand) -> None:  # noqa: ANN003
+        async def _run() -> None:
+            async with self.scheduler.admit(workload, **demand):
+                self.order.append(label)
+                await self._gate.wait()
+
+        self.tasks.append(asyncio.create_task(_run()))
+
+    async def drain(self) -> None:
+        self._gate.set()
+        await asyncio.gather(*self.tasks)
+
+
+class TestAdmission:
+    @pytest.mark.asyncio
+    async def test_free_slot_admits_immediately(self):
+        scheduler = ContainerScheduler(slots=2)
+
+        async with scheduler.admit(INGEST_A):
+            assert scheduler.running == 1
+            assert scheduler.queued == 0
+        assert scheduler.running == 0
+
+    @pytest.mark.asyncio
+    async def test_slots_cap_concurrency(self):
+        scheduler = ContainerScheduler(slots=2)
+        harness = _Harness(scheduler)
+        for i in range(5):
+            harness.launch(f"i{i}", INGEST_A)
+        await _settle()
+
+        assert scheduler.running == 2
+        assert scheduler.queued == 3
+        await harness.drain()
+        assert len(harness.order) == 5
+
+    @pytest.mark.asyncio
+    async def test_deposition_not_starved_by_ingest_backlog(self):
+        scheduler = ContainerScheduler(slots=1)
+        harness = _Harness(scheduler)
+        harness.launch("hold", INGEST_A)
+        await _settle()
+        for i in range(10):
+            harness.launch(f"ingest{i}", INGEST_A)
+        harness.launch("deposition", DEP)
+        await _settle()
+
+        await harness.drain()
+
+        # Weight 4 vs 1: the late deposition overtakes the queued ingest batches.
+        assert harness.order.index("deposition") <= 2
+
+    @pytest.mark.asyncio
+    async def test_conventions_share_the_ingest_weight(self):
+        scheduler = ContainerScheduler(slots=1)
+        harness = _Harness(scheduler)
+        harness.launch("hold", INGEST_A)
+        await _settle()
+        for i in range(4):
+            harness.launch(f"a{i}", INGEST_A)
+        for i in range(4):
+            harness.launch(f"b{i}", INGEST_B)
+        await _settle()
+
+        await harness.drain()
+
+        # The second run interleaves instead of waiting out the first's backlog.
+        assert harness.order.index("b0") <= 2
+        assert harness.order.index("b1") < harness.order.index("a3")
+
+    @pytest.mark.asyncio
+    async def test_priority_beats_fair_share(self):
+        scheduler = ContainerScheduler(slots=1)
+        harness = _Harness(scheduler)
+        harness.launch("hold", INGEST_A)
+        await _settle()
+        harness.launch("deposition", DEP)
+        harness.launch("urgent", Workload(source=WorkSource.INGEST, convention="x", priority=1))
+        await _settle()
+
+        await harness.drain()
+
+        assert harness.order[1] == "urgent"
+
+    @pytest.mark.asyncio
+    async def test_deposition_admitted_ahead_of_queued_ingest(self):
+        scheduler = ContainerScheduler(slots=1)
+        harness = _Harness(scheduler)
+        harness.launch("hold", Workload.of(WorkSource.INGEST, "pdb"))
+        await _settle()
+        harness.launch("ingest", Workload.of(WorkSource.INGEST, "pdb"))
+        harness.launch("other-run", Workload.of(WorkSource.INGEST, "uniprot"))
+        harness.launch("deposition", Workload.of(WorkSource.DEPOSITION, "pdb"))
+        await _settle()
+
+        await harness.drain()
+
+        assert harness.order[1] == "deposition"
+
+    @pytest.mark.asyncio
+    async def test_idle_flows_are_forgotten(self):
+        scheduler = ContainerScheduler(slots=1)
+        harness = _Harness(scheduler)
+        harness.launch("a", INGEST_A)
+        harness.launch("b", INGEST_B)
+        await _settle()
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(scheduler.admit(DEP).__aenter__(), 0.01)
+
+        await harness.drain()
+
+        assert scheduler._active == {}
+        assert scheduler._last_finish == {}
+
+
+class TestResourcePacking:
+    @pytest.mark.asyncio
+    async def test_memory_budget_packs_by_declared_limits(self):
+        scheduler = ContainerScheduler(slots=8, memory=4 * 1024**3)
+        harness = _Harness(scheduler)
+        for i in range(3):
+            harness.launch(f"h{i}", INGEST_A, memory="2g")
+        await _settle()
+
+        assert scheduler.running == 2
+        await harness.drain()
+
+    @pytest.mark.asyncio
+    async def test_cpu_budget_accepts_millicore_limits(self):
+        scheduler = ContainerScheduler(slots=8, cpu=1.0)
+        harness = _Harness(scheduler)
+        for i in range(3):
+            harness.launch(f"h{i}", INGEST_A, cpu="500m")
+        await _settle()
+
+        assert scheduler.running == 2
+        await harness.drain()
+
+    @pytest.mark.asyncio
+    async def test_oversized_ticket_runs_alone(self):
+        scheduler = ContainerScheduler(slots=8, memory=1024**3)
+
+        async with scheduler.admit(INGEST_A, memory="8g"):
+            assert scheduler.running == 1
+
+    @pytest.mark.asyncio
+    async def test_small_tickets_backfill_until_bypass_limit(self):
+        scheduler = ContainerScheduler(slots=8, cpu=2.0, max_bypass=1)
+        harness = _Harness(scheduler)
+        harness.launch("hold", INGEST_A, cpu=1.5)
+        await _settle()
+        harness.launch("big", INGEST_A, cpu=1.0)
+        harness.launch("small1", INGEST_B, cpu=0.25)
+        harness.launch("small2", INGEST_B, cpu=0.25)
+        await _settle()
+
+        # One small launch backfilled past the blocked one; the next must wait.
+        assert harness.order == ["hold", "small1"]
+        await harness.drain()
+        assert harness.order.index("big") < harness.order.index("small2")
+
+
+class TestBoundsAndCancellation:
+    @pytest.mark.asyncio
+    async def test_full_queue_fails_fast_as_transient_runtime(self):
+        instrumentation = RecordingSchedulerInstrumentation()
+        scheduler = ContainerScheduler(slots=1, max_queued=1, instrumentation=instrumentation)
+        harness = _Harness(scheduler)
+        harness.launch("hold", INGEST_A)
+        harness.launch("queued", INGEST_A)
+        await _settle()
+
+        with pytest.raises(RuntimeFailure) as exc_info:
+            async with scheduler.admit(INGEST_A):
+                pass
+
+        assert exc_info.value.kind is FailureKind.RUNTIME
+        assert instrumentation.rejected == [WorkSource.INGEST]
+        await harness.drain()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_the_queue(self):
+        scheduler = ContainerScheduler(slots=1)
+        harness = _Harness(scheduler)
+        harness.launch("hold", INGEST_A)
+        await _settle()
+
+        waiter = asyncio.create_task(asyncio.wait_for(scheduler.admit(DEP).__aenter__(), 0.01))
+        with pytest.raises(asyncio.TimeoutError):
+            await waiter
+
+        assert scheduler.queued == 0
+        await harness.drain()
+        assert scheduler.running == 0
+
+    @pytest.mark.asyncio
+    async def test_metrics_track_depth_and_wait(self):
+        instrumentation = RecordingSchedulerInstrumentation()
+        scheduler = ContainerScheduler(slots=1, instrumentation=instrumentation)
+        harness = _Harness(scheduler)
+        harness.launch("hold", INGEST_A)
+        harness.launch("next", DEP)
+        await _settle()
+        assert instrumentation.depth == 1
+
+        await harness.drain()
+
+        assert instrumentation.depth == 0
+        assert [source for source, _ in instrumentation.waits] == [
+            WorkSource.INGEST,
+            WorkSource.DEPOSITION,
+        ]
+        assert all(wait >= 0 for _, wait in instrumentation.waits)
@@ -0,0 +1,325 @@
+"""Unit tests for HookBatcher — coalesced deposition validation."""
+
+import asyncio
+import gc
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from osa.domain.shared.failure import FailureKind, RuntimeFailure
+from osa.domain.shared.model.hook import ColumnDef, HookIdentity, OciConfig, TableFeatureSpec
+from osa.domain.shared.model.workload import Workload, WorkSource
+from osa.domain.validation.model.batch_outcome import (
+    BatchRecordOutcome,
+    HookRecordId,
+    OutcomeStatus,
+)
+from osa.domain.validation.model.hook_input import HookRecord
+from osa.domain.validation.model.hook_release import HookRelease, HookReleaseId
+from osa.domain.validation.model.hook_result import HookResult, HookStatus
+from osa.domain.validation.port.hook_runner import HookInputs
+from osa.domain.validation.service.hook_batcher import HookBatcher
+
+HOOK = HookIdentity(
+    name="detect_pockets",
+    feature=TableFeatureSpec(
+        cardinality="one",
+        columns=[ColumnDef(name="score", json_type="number", required=True)],
+    ),
+)
+RELEASE = HookRelease(
+    id=HookReleaseId(uuid4()),
+    hook_name="detect_pockets",
+    version=1,
+    runtime=OciConfig(image="img:v1", digest="sha256:abc"),
+    source_ref="git:abc",
+    built_at=datetime.now(UTC),
+)
+HOOK_SET = [HOOK.name]
+
+
+class FakeBatchStorage:
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.outcomes: dict[HookRecordId, BatchRecordOutcome] = {}
+        self.written: dict[Path, dict[HookRecordId, BatchRecordOutcome]] = {}
+        self.deleted: list[str] = []
+
+    def get_hook_batch_dir(self, batch_id: str, hook_name: str) -> Path:
+        path = self.root / batch_id / "hooks" / hook_name
+        path.mkdir(parents=True)
+        return path
+
+    async def read_batch_outcomes(
+        self, output_dir: str, hook_name: str
+    ) -> dict[HookRecordId, BatchRecordOutcome]:
+        return dict(self.outcomes)
+
+    async def write_batch_outcomes(
+        self, work_dir: Path, outcomes: dict[HookRecordId, BatchRecordOutcome]
+    ) -> None:
+        self.written[work_dir] = dict(outcomes)
+
+    async def delete_hook_batch(self, batch_id: str) -> None:
+        self.deleted.append(batch_id)
+
+
+class FakeHookService:
+    """Records each run's record ids; batched runs (> 1 record) can be made to fail."""
+
+    def __init__(self, storage: FakeBatchStorage) -> None:
+        self.hook_storage = storage
+        self.runs: list[list[str]] = []
+        self.scopes = 0
+        self.batch_failure: Exception | None = None
+        self.gate: asyncio.Event | None = None
+
+    async def run_hook(
+        self, hook: HookIdentity, release: HookRelease, inputs: HookInputs, work_dir: Path
+    ) -> HookResult:
+        self.runs.append([record.id for record in inputs.records])
+        if self.gate is not None:
+            await self.gate.wait()
+        if len(inputs.records) > 1 and self.batch_failure is not None:
+            raise self.batch_failure
+        return HookResult(hook_name=hook.name, status=HookStatus.PASSED, duration_seconds=1.0)
+
+
+def _batcher(hook_service: FakeHookService, **kwargs) -> HookBatcher:  # noqa: ANN003
+    """An enabled batcher whose batches run on *hook_service*, counting scopes opened."""
+
+    @asynccontextmanager
+    async def scope():
+        hook_service.scopes += 1
+        yield hook_service
+
+    return HookBatcher(enabled=True, hook_service_scope=scope, **kwargs)
+
+
+def _inputs(record_id: str, convention: str = "pdb") -> HookInputs:
+    return HookInputs(
+        records=[HookRecord(id=record_id, metadata={})],
+        run_id=f"run-{record_id}",
+        workload=Workload(source=WorkSource.DEPOSITION, convention=convention),
+    )
+
+
+def _outcome(record_id: str, status: OutcomeStatus, **kwargs) -> BatchRecordOutcome:  # noqa: ANN003
+    return BatchRecordOutcome(record_id=HookRecordId(record_id), status=status, **kwargs)
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> FakeBatchStorage:
+    return FakeBatchStorage(tmp_path / "batches")
+
+
+@pytest.fixture
+def hook_service(storage: FakeBatchStorage) -> FakeHookService:
+    return FakeHookService(storage)
+
+
+async def _validate(
+    batcher: HookBatcher,
+    hook_service: FakeHookService,
+    tmp_path: Path,
+    record_ids: list[str],
+    convention: str = "pdb",
+) -> list[HookResult]:
+    async def one(record_id: str) -> HookResult:
+        work_dir = tmp_path / record_id
+        work_dir.mkdir(exist_ok=True)
+        return await batcher.run_hook(
+            hook_service,  # type: ignore[arg-type]
+            HOOK,
+            RELEASE,
+            _inputs(record_id, convention),
+            work_dir,
+            hook_set=HOOK_SET,
+        )
+
+    return list(await asyncio.gather(*(one(rid) for rid in record_ids)))
+
+
+class TestPassthrough:
+    @pytest.mark.asyncio
+    async def test_disabled_runs_each_deposition_solo(self, hook_service, tmp_path):
+        batcher = HookBatcher(enabled=False)
+
+        await _validate(batcher, hook_service, tmp_path, ["a", "b"])
+
+        assert hook_service.runs == [["a"], ["b"]]
+
+    @pytest.mark.asyncio
+    async def test_checkpointed_work_dir_runs_solo(self, hook_service, storage, tmp_path):
+        batcher = _batcher(hook_service, window=0.05)
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "_checkpoint.jsonl").write_text("")
+        storage.outcomes = {HookRecordId("b"): _outcome("b", OutcomeStatus.PASSED)}
+
+        await _validate(batcher, hook_service, tmp_path, ["a", "b"])
+
+        assert sorted(hook_service.runs) == [["a"], ["b"]]
+
+
+class TestCoalescing:
+    @pytest.mark.asyncio
+    async def test_concurrent_depositions_share_one_run(self, hook_service, storage, tmp_path):
+        batcher = _batcher(hook_service, window=0.05)
+        storage.outcomes = {
+            HookRecordId(rid): _outcome(rid, OutcomeStatus.PASSED, features=[{"score": 1}])
+            for rid in ("a", "b", "c")
+        }
+
+        results = await _validate(batcher, hook_service, tmp_path, ["a", "b", "c"])
+
+        assert hook_service.runs == [["a", "b", "c"]]
+        assert [r.status for r in results] == [HookStatus.PASSED] * 3
+        # Each deposition's work dir gets only its own record's outcome.
+        assert storage.written[tmp_path / "b"] == {HookRecordId("b"): storage.outcomes["b"]}
+        assert len(storage.deleted) == 1
+
+    @pytest.mark.asyncio
+    async def test_max_records_flushes_before_the_window(self, hook_service, storage, tmp_path):
+        batcher = _batcher(hook_service, window=60, max_records=2)
+        storage.outcomes = {
+            HookRecordId(rid): _outcome(rid, OutcomeStatus.PASSED) for rid in ("a", "b")
+        }
+
+        await asyncio.wait_for(_validate(batcher, hook_service, tmp_path, ["a", "b"]), 5)
+
+        assert hook_service.runs == [["a", "b"]]
+
+    @pytest.mark.asyncio
+    async def test_conventions_are_not_mixed(self, hook_service, storage, tmp_path):
+        batcher = _batcher(hook_service, window=0.05)
+
+        await asyncio.gather(
+            _validate(batcher, hook_service, tmp_path, ["a"], convention="pdb"),
+            _validate(batcher, hook_service, tmp_path, ["b"], convention="uniprot"),
+        )
+
+        assert sorted(hook_service.runs) == [["a"], ["b"]]
+
+    @pytest.mark.asyncio
+    async def test_rejected_record_rejects_only_its_deposition(
+        self, hook_service, storage, tmp_path
+    ):
+        batcher = _batcher(hook_service, window=0.05)
+        storage.outcomes = {
+            HookRecordId("a"): _outcome("a", OutcomeStatus.PASSED),
+            HookRecordId("b"): _outcome("b", OutcomeStatus.REJECTED, reason="no pockets"),
+        }
+
+        a, b = await _validate(batcher, hook_service, tmp_path, ["a", "b"])
+
+        assert a.status is HookStatus.PASSED
+        assert b.status is HookStatus.REJECTED
+        assert b.rejection_reason == "no pockets"
+
+
+class TestFallback:
+    @pytest.mark.asyncio
+    async def test_failed_batch_validates_each_deposition_solo(
+        self, hook_service, storage, tmp_path
+    ):
+        batcher = _batcher(hook_service, window=0.05)
+        hook_service.batch_failure = RuntimeFailure(FailureKind.RUNTIME, "exit 1")
+
+        results = await _validate(batcher, hook_service, tmp_path, ["a", "b"])
+
+        assert hook_service.runs[0] == ["a", "b"]
+        assert sorted(hook_service.runs[1:]) == [["a"], ["b"]]
+        assert [r.status for r in results] == [HookStatus.PASSED] * 2
+        assert len(storage.deleted) == 1
+
+    @pytest.mark.asyncio
+    async def test_errored_record_is_revalidated_solo(self, hook_service, storage, tmp_path):
+        batcher = _batcher(hook_service, window=0.05)
+        storage.outcomes = {
+            HookRecordId("a"): _outcome("a", OutcomeStatus.PASSED),
+            HookRecordId("b"): _outcome("b", OutcomeStatus.ERRORED, error="boom"),
+        }
+
+        await _validate(batcher, hook_service, tmp_path, ["a", "b"])
+
+        assert hook_service.runs == [["a", "b"], ["b"]]
+        assert tmp_path / "b" not in storage.written
+
+    @pytest.mark.asyncio
+    async def test_cancelled_deposition_leaves_an_open_batch(self, hook_service, storage, tmp_path):
+        batcher = _batcher(hook_service, window=0.1)
+        storage.outcomes = {HookRecordId("b"): _outcome("b", OutcomeStatus.PASSED)}
+        (tmp_path / "a").mkdir()
+        cancelled = asyncio.create_task(
+            batcher.run_hook(
+                hook_service,  # type: ignore[arg-type]
+                HOOK,
+                RELEASE,
+                _inputs("a"),
+                tmp_path / "a",
+                hook_set=HOOK_SET,
+            )
+        )
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        await _validate(batcher, hook_service, tmp_path, ["b"])
+
+        assert hook_service.runs == [["b"]]
+
+    @pytest.mark.asyncio
+    async def test_failure_for_a_cancelled_caller_is_retrieved(
+        self, hook_service, storage, tmp_path
+    ):
+        reported: list[dict] = []
+        asyncio.get_running_loop().set_exception_handler(lambda _, ctx: reported.append(ctx))
+        batcher = _batcher(hook_service, window=60, max_records=2)
+        hook_service.batch_failure = ValueError("boom")
+        hook_service.gate = asyncio.Event()
+        tasks = [
+            asyncio.create_task(_validate(batcher, hook_service, tmp_path, [rid])) for rid in "ab"
+        ]
+        while not hook_service.runs:  # the batch is running
+            await asyncio.sleep(0)
+        tasks[0].cancel()
+        await asyncio.sleep(0)
+        hook_service.gate.set()
+
+        with pytest.raises(ValueError):
+            await tasks[1]
+        with pytest.raises(asyncio.CancelledError):
+            await tasks[0]
+        # Drop every reference to the failure (its traceback pins the batch).
+        del tasks
+        hook_service.batch_failure = None
+        gc.collect()
+
+        assert not [ctx for ctx in reported if "never retrieved" in ctx["message"]]
+
+
+class TestScope:
+    @pytest.mark.asyncio
+    async def test_batch_runs_in_its_own_scope_not_the_callers(
+        self, hook_service, storage, tmp_path
+    ):
+        caller = FakeHookService(storage)
+        batcher = _batcher(hook_service, window=0.05)
+        storage.outcomes = {
+            HookRecordId("a"): _outcome("a", OutcomeStatus.PASSED),
+            HookRecordId("b"): _outcome("b", OutcomeStatus.ERRORED, error="boom"),
+        }
+
+        await _validate(batcher, caller, tmp_path, ["a", "b"])
+
+        # The batched run and the solo fallback both ran on the batch's scope.
+        assert caller.runs == []
+        assert hook_service.runs == [["a", "b"], ["b"]]
+        assert hook_service.scopes == 1
+        assert len(storage.deleted) == 1
+
+    def test_enabled_without_a_scope_is_rejected(self):
+        with pytest.raises(ValueError, match="hook_service_scope"):
+            HookBatcher(enabled=True)
@@ -0,0 +1,133 @@
+"""Unit tests for the hook outcome memo — input keys and HookMemoService."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from uuid import uuid4
+
+import pytest
+
+from osa.domain.validation.model.batch_outcome import (
+    BatchRecordOutcome,
+    HookRecordId,
+    OutcomeStatus,
+)
+from osa.domain.validation.model.hook_input import HookRecord
+from osa.domain.validation.model.hook_memo import input_key, input_keys
+from osa.domain.validation.model.hook_release import HookReleaseId
+from osa.domain.validation.service.hook_memo import HookMemoService
+
+
+class FakeMemo:
+    def __init__(self) -> None:
+        self.rows: dict[tuple[HookReleaseId, str], BatchRecordOutcome] = {}
+        self.puts: list[int] = []
+
+    async def get_many(self, release_id, keys):
+        return {k: self.rows[(release_id, k)] for k in keys if (release_id, k) in self.rows}
+
+    async def put_many(self, release_id, outcomes) -> None:
+        self.puts.append(len(outcomes))
+        for key, outcome in outcomes.items():
+            self.rows.setdefault((release_id, key), outcome)
+
+
+def _outcome(record_id: str, status: OutcomeStatus = OutcomeStatus.PASSED) -> BatchRecordOutcome:
+    return BatchRecordOutcome(
+        record_id=HookRecordId(record_id),
+        status=status,
+        features=[{"score": 1.0}] if status is OutcomeStatus.PASSED else [],
+    )
+
+
+async def _stream(*outcomes: BatchRecordOutcome) -> AsyncIterator[BatchRecordOutcome]:
+    for outcome in outcomes:
+        yield outcome
+
+
+class TestInputKey:
+    def test_stable_under_key_order(self):
+        a = input_key({"x": 1, "y": [1, 2]}, {"a.pdb": "d1", "b.cif": "d2"})
+        b = input_key({"y": [1, 2], "x": 1}, {"b.cif": "d2", "a.pdb": "d1"})
+        assert a == b
+
+    def test_changes_with_metadata_or_file_content(self):
+        base = input_key({"x": 1}, {"a.pdb": "d1"})
+        assert input_key({"x": 2}, {"a.pdb": "d1"}) != base
+        assert input_key({"x": 1}, {"a.pdb": "d9"}) != base
+        assert input_key({"x": 1}, {"renamed.pdb": "d1"}) != base
+
+    def test_batch_digests_are_split_per_record(self):
+        records = [HookRecord(id="r1", metadata={}), HookRecord(id="r2", metadata={})]
+        digests = {"r1/a.pdb": "d1", "r2/a.pdb": "d1", "r2/sub/b.cif": "d2"}
+
+        keys = input_keys(records, digests)
+
+        assert keys["r1"] == input_key({}, {"a.pdb": "d1"})
+        assert keys["r2"] == input_key({}, {"a.pdb": "d1", "sub/b.cif": "d2"})
+
+
+class TestHookMemoService:
+    @pytest.mark.asyncio
+    async def test_recall_readdresses_shared_content(self):
+        release = HookReleaseId(uuid4())
+        service = HookMemoService(memo=FakeMemo())
+        await service.remember(release, {"r1": "k"}, _stream(_outcome("r1")))
+
+        recalled = await service.recall(release, {"r2": "k", "r3": "other"})
+
+        assert list(recalled) == ["r2"]
+        assert recalled[HookRecordId("r2")].record_id == "r2"
+        assert recalled[HookRecordId("r2")].features == [{"score": 1.0}]
+
+    @pytest.mark.asyncio
+    async def test_recall_is_scoped_to_release(self):
+        service = HookMemoService(memo=FakeMemo())
+        await service.remember(HookReleaseId(uuid4()), {"r1": "k"}, _stream(_outcome("r1")))
+
+        assert await service.recall(HookReleaseId(uuid4()), {"r1": "k"}) == {}
+
+    @pytest.mark.asyncio
+    async def test_errors_and_skipped_records_are_not_remembered(self):
+        memo = FakeMemo()
+        service = HookMemoService(memo=memo)
+        keys = {"r1": "k1", "r2": "k2", "r3": "k3"}
+
+        stored = await service.remember(
+            HookReleaseId(uuid4()),
+            keys,
+            _stream(
+                _outcome("r1"),
+                _outcome("r2", OutcomeStatus.ERRORED),
+                _outcome("r3", OutcomeStatus.REJECTED),
+            ),
+            skip={"r1"},
+        )
+
+        assert stored == 1
+        assert {key for _, key in memo.rows} == {"k3"}
+
+    @pytest.mark.asyncio
+    async def test_writes_in_chunks(self, monkeypatch: pytest.MonkeyPatch):
+        import osa.domain.validation.service.hook_memo as module
+
+        monkeypatch.setattr(module, "_WRITE_CHUNK", 2)
+        memo = FakeMemo()
+        keys = {f"r{i}": f"k{i}" for i in range(5)}
+
+        stored = await HookMemoService(memo=memo).remember(
+            HookReleaseId(uuid4()), keys, _stream(*(_outcome(r) for r in keys))
+        )
+
+        assert stored == 5
+        assert memo.puts == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_disabled_is_inert(self):
+        memo = FakeMemo()
+        service = HookMemoService(memo=memo, enabled=False)
+        release = HookReleaseId(uuid4())
+
+        assert await service.remember(release, {"r1": "k"}, _stream(_outcome("r1"))) == 0
+        assert await service.recall(release, {"r1": "k"}) == {}
+        assert memo.rows == {}
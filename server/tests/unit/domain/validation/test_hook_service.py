@@ -1,5 +1,6 @@
 """Tests for HookService — OOM retry with checkpointing."""
 
+from collections.abc import Collection
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -25,6 +26,7 @@ from osa.domain.shared.failure import FailureKind, FailurePolicy, RuntimeFailure
 from osa.domain.validation.model.hook_release import HookRelease, HookReleaseId
 from osa.domain.validation.model.hook_result import HookResult, HookStatus
 from osa.domain.validation.port.hook_runner import HookInputs
+from osa.infrastructure.storage.batch_outcomes import parse_features_tail, read_output_dir
 
 
 def _make_hook(name: str = "detect_pockets") -> HookIdentity:
@@ -93,6 +95,19 @@ class FakeHookStorage:
     ) -> None:
         self.written_outcomes[str(work_dir)] = dict(outcomes)
 
+    async def read_outcomes_since(
+        self, work_dir: Path, offset: int, *, final: bool = False
+    ) -> tuple[list[BatchRecordOutcome], int]:
+        path = work_dir / "output" / "features.jsonl"
+        data = path.read_bytes()[offset:] if path.exists() else b""
+        outcomes, consumed = parse_features_tail(data, final=final)
+        return outcomes, offset + consumed
+
+    async def read_output_outcomes(
+        self, work_dir: Path, *, statuses: Collection[OutcomeStatus] | None = None
+    ) -> dict[HookRecordId, BatchRecordOutcome]:
+        return read_output_dir(work_dir / "output", statuses)
+
     async def read_batch_outcomes(
         self, output_dir: str, hook_name: str
     ) -> dict[HookRecordId, BatchRecordOutcome]:
@@ -150,7 +165,7 @@ class TestHookServiceBatchTimestamps:
     """
 
     @pytest.mark.asyncio
-    async def test_per_hook_windows_are_distinct_and_sequential(self, tmp_path: Path):
+    async def test_per_hook_windows_are_distinct(self, tmp_path: Path):
         import asyncio
         import json
 
@@ -168,7 +183,8 @@ class TestHookServiceBatchTimestamps:
         (wd2 / "output").mkdir(parents=True)
 
         async def mock_run(h, rel, inputs, wd):
-            await asyncio.sleep(0.01)  # make the two windows measurably distinct
+            # Different durations make the two windows measurably distinct.
+            await asyncio.sleep(0.01 if h.name.root == "hook_one" else 0.03)
             (wd / "output" / "features.jsonl").write_text(
                 json.dumps({"id": records[0].id, "features": [{"score": 0.9}]}) + "\n"
             )
@@ -190,8 +206,182 @@ class TestHookServiceBatchTimestamps:
         for e in executions:
             assert e.started_at <= e.finished_at
             assert e.failure is None
-        # Sequential, non-overlapping per-hook windows — not one shared batch span.
-        assert executions[1].started_at >= executions[0].finished_at
+        # Per-hook windows — not one shared batch span.
+        assert executions[0].finished_at < executions[1].finished_at
+
+
+class TestHookServiceBatchConcurrency:
+    """Independent hooks in a batch overlap; declared dependencies serialise."""
+
+    @staticmethod
+    def _tracking_runner(records: list[HookRecord], log: list[str], delay: float = 0.02):
+        import asyncio
+        import json
+
+        state = {"running": 0, "peak": 0}
+
+        async def mock_run(h, rel, inputs, wd):
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+            log.append(f"start:{h.name.root}")
+            await asyncio.sleep(delay)
+            (wd / "output" / "features.jsonl").write_text(
+                json.dumps({"id": records[0].id, "features": [{"score": 0.9}]}) + "\n"
+            )
+            log.append(f"end:{h.name.root}")
+            state["running"] -= 1
+            return _passed_result(hook_name=h.name.root)
+
+        runner = AsyncMock()
+        runner.run.side_effect = mock_run
+        return runner, state
+
+    @staticmethod
+    def _batch(tmp_path: Path, names: list[str]):
+        pairs = [(_make_hook(n), _make_release(n)) for n in names]
+        work_dirs = {}
+        for hook, _ in pairs:
+            wd = tmp_path / hook.name.root
+            (wd / "output").mkdir(parents=True)
+            work_dirs[hook.name] = wd
+        return pairs, work_dirs
+
+    @pytest.mark.asyncio
+    async def test_independent_hooks_run_concurrently(self, tmp_path: Path):
+        from osa.domain.validation.service.hook import HookService
+
+        records = _make_records(1)
+        log: list[str] = []
+        runner, state = self._tracking_runner(records, log)
+        pairs, work_dirs = self._batch(tmp_path, ["a", "b", "c"])
+        service = HookService(
+            hook_runner=runner, hook_storage=FakeHookStorage(), failure_policy=FailurePolicy()
+        )
+
+        execs = await service.run_hooks_for_batch(pairs, _inputs(records), work_dirs)
+
+        assert state["peak"] == 3
+        assert [e.hook_name.root for e in execs] == ["a", "b", "c"]
+        assert all(e.failure is None for e in execs)
+
+    @pytest.mark.asyncio
+    async def test_hook_slots_cap_concurrency(self, tmp_path: Path):
+        from osa.domain.validation.service.hook import HookService, HookSlots
+
+        records = _make_records(1)
+        log: list[str] = []
+        runner, state = self._tracking_runner(records, log)
+        pairs, work_dirs = self._batch(tmp_path, ["a", "b", "c", "d"])
+        service = HookService(
+            hook_runner=runner,
+            hook_storage=FakeHookStorage(),
+            failure_policy=FailurePolicy(),
+            hook_slots=HookSlots(2),
+        )
+
+        await service.run_hooks_for_batch(pairs, _inputs(records), work_dirs)
+
+        assert state["peak"] == 2
+
+    @pytest.mark.asyncio
+    async def test_scheduler_admits_each_launch_at_release_limits(self, tmp_path: Path):
+        from osa.domain.shared.model.workload import Workload, WorkSource
+        from osa.domain.shared.scheduler import ContainerScheduler
+        from osa.domain.validation.service.hook import HookService
+
+        records = _make_records(1)
+        log: list[str] = []
+        runner, state = self._tracking_runner(records, log)
+        pairs, work_dirs = self._batch(tmp_path, ["a", "b", "c"])
+        scheduler = ContainerScheduler(slots=8, memory=2 * 1024**3)
+        service = HookService(
+            hook_runner=runner,
+            hook_storage=FakeHookStorage(),
+            failure_policy=FailurePolicy(),
+            scheduler=scheduler,
+        )
+        workload = Workload(source=WorkSource.INGEST, convention="pdb")
+        inputs = HookInputs(records=records, run_id="test-run", workload=workload)
+
+        await service.run_hooks_for_batch(pairs, inputs, work_dirs)
+
+        # 1g releases against a 2g budget: two containers at a time.
+        assert state["peak"] == 2
+        assert scheduler.running == 0
+
+    @pytest.mark.asyncio
+    async def test_declared_dependency_runs_after(self, tmp_path: Path):
+        from osa.domain.shared.model.hook import HookName
+        from osa.domain.validation.service.hook import HookService
+
+        records = _make_records(1)
+        log: list[str] = []
+        runner, _ = self._tracking_runner(records, log)
+        pairs, work_dirs = self._batch(tmp_path, ["a", "b", "c"])
+        service = HookService(
+            hook_runner=runner, hook_storage=FakeHookStorage(), failure_policy=FailurePolicy()
+        )
+
+        execs = await service.run_hooks_for_batch(
+            pairs,
+            _inputs(records),
+            work_dirs,
+            depends_on={HookName("c"): [HookName("a")], HookName("x"): [HookName("a")]},
+        )
+
+        assert log.index("start:c") > log.index("end:a")
+        assert log.index("start:b") < log.index("end:a")  # b is unconstrained
+        by_name = {e.hook_name.root: e for e in execs}
+        assert by_name["c"].started_at >= by_name["a"].finished_at
+
+    @pytest.mark.asyncio
+    async def test_dependent_still_runs_when_dependency_fails(self, tmp_path: Path):
+        from osa.domain.shared.model.hook import HookName
+        from osa.domain.validation.service.hook import HookService
+
+        records = _make_records(1)
+        pairs, work_dirs = self._batch(tmp_path, ["a", "b"])
+
+        async def mock_run(h, rel, inputs, wd):
+            if h.name.root == "a":
+                raise RuntimeFailure(FailureKind.HOOK_EXIT, "exit 1", exit_code=1)
+            return _passed_result(hook_name=h.name.root)
+
+        runner = AsyncMock()
+        runner.run.side_effect = mock_run
+        service = HookService(
+            hook_runner=runner, hook_storage=FakeHookStorage(), failure_policy=FailurePolicy()
+        )
+
+        execs = await service.run_hooks_for_batch(
+            pairs, _inputs(records), work_dirs, depends_on={HookName("b"): [HookName("a")]}
+        )
+
+        assert execs[0].failure == FailureKind.HOOK_EXIT
+        assert execs[1].status == HookStatus.PASSED
+
+    @pytest.mark.asyncio
+    async def test_dependency_cycle_rejected_before_running(self, tmp_path: Path):
+        from graphlib import CycleError
+
+        from osa.domain.shared.model.hook import HookName
+        from osa.domain.validation.service.hook import HookService
+
+        records = _make_records(1)
+        pairs, work_dirs = self._batch(tmp_path, ["a", "b"])
+        runner = AsyncMock()
+        service = HookService(
+            hook_runner=runner, hook_storage=FakeHookStorage(), failure_policy=FailurePolicy()
+        )
+
+        with pytest.raises(CycleError):
+            await service.run_hooks_for_batch(
+                pairs,
+                _inputs(records),
+                work_dirs,
+                depends_on={HookName("a"): [HookName("b")], HookName("b"): [HookName("a")]},
+            )
+        runner.run.assert_not_called()
 
 
 class TestHookServiceBatchErrorsAsValues:
@@ -240,7 +430,7 @@ class TestHookServiceBatchErrorsAsValues:
         # The execution carries the observed cause — disposition is the policy's call.
         assert execs[1].status is None and execs[1].failure == FailureKind.IMAGE_PULL
         # Each keeps its own window.
-        assert execs[1].started_at >= execs[0].finished_at
+        assert all(e.started_at <= e.finished_at for e in execs)
 
     @pytest.mark.asyncio
     async def test_failed_execution_preserves_cause_kind(self, tmp_path: Path):
@@ -840,3 +1030,355 @@ class TestHookServiceCorruptedCheckpoint:
 
         assert result.status == HookStatus.PASSED
         runner.run.assert_called_once()
+
+
+class TestHookServiceSizing:
+    """Adaptive sizing: launch memory and sub-batches from a HookSizing."""
+
+    @staticmethod
+    def _sizing(release: HookRelease, **bounds: Any):
+        from osa.domain.validation.model.hook_sizing import HookSizing
+
+        return HookSizing(
+            release_id=release.id,
+            hook_name=release.hook_name,
+            declared_memory=release.runtime.limits.memory,
+            runs_observed=4,
+            oom_runs=1,
+            **bounds,
+        )
+
+    @staticmethod
+    def _writing_runner(work_dir: Path, calls: list[list[str]]):
+        import json
+
+        async def run(h, rel, inputs, wd):
+            # Each container run rewrites output/ with only its own records.
+            calls.append([r.id for r in inputs.records])
+            (work_dir / "output").mkdir(exist_ok=True)
+            (work_dir / "output" / "features.jsonl").write_text(
+                "".join(
+                    json.dumps({"id": r.id, "features": [{"score": 1.0}]}) + "\n"
+                    for r in inputs.records
+                )
+            )
+            return _passed_result()
+
+        return run
+
+    @pytest.mark.asyncio
+    async def test_oversized_batch_runs_as_sub_batches(self, tmp_path: Path):
+        from osa.domain.validation.service.hook import HookService
+
+        release = _make_release()
+        records = _make_records(5)
+        calls: list[list[str]] = []
+        runner = AsyncMock()
+        runner.run.side_effect = self._writing_runner(tmp_path, calls)
+        storage = FakeHookStorage()
+        service = HookService(
+            hook_runner=runner, hook_storage=storage, failure_policy=FailurePolicy()
+        )
+
+        result = await service.run_hook(
+            _make_hook(),
+            release,
+            _inputs(records),
+            tmp_path,
+            self._sizing(release, max_batch_records=2),
+        )
+
+        assert result.status == HookStatus.PASSED
+        assert calls == [["rec0", "rec1"], ["rec2", "rec3"], ["rec4"]]
+        # Every sub-batch's features survive into the canonical outcomes.
+        assert set(storage.written_outcomes[str(tmp_path)]) == {r.id for r in records}
+
+    @pytest.mark.asyncio
+    async def test_oom_in_later_sub_batch_does_not_rerun_earlier_ones(self, tmp_path: Path):
+        from osa.domain.validation.service.hook import HookService
+
+        release = _make_release()
+        records = _make_records(4)
+        calls: list[list[str]] = []
+        write = self._writing_runner(tmp_path, calls)
+
+        async def run(h, rel, inputs, wd):
+            if len(calls) == 1:
+                calls.append([r.id for r in inputs.records])
+                raise _oom_failure()
+            return await write(h, rel, inputs, wd)
+
+        runner = AsyncMock()
+        runner.run.side_effect = run
+        service = HookService(
+            hook_runner=runner, hook_storage=FakeHookStorage(), failure_policy=FailurePolicy()
+        )
+
+        result = await service.run_hook(
+            _make_hook(),
+            release,
+            _inputs(records),
+            tmp_path,
+            self._sizing(release, max_batch_records=2),
+        )
+
+        assert result.oom_retries == 1
+        assert calls == [["rec0", "rec1"], ["rec2", "rec3"], ["rec2", "rec3"]]
+        assert runner.run.call_args_list[2][0][1].runtime.limits.memory == "2g"
+
+    @pytest.mark.asyncio
+    async def test_execution_samples_only_completed_attempts(self, tmp_path: Path):
+        from osa.domain.validation.service.hook import HookService
+
+        hook = _make_hook()
+        release = _make_release()
+        records = [HookRecord(id=f"rec{i}", metadata={}, size_hint_mb=10) for i in range(4)]
+        calls: list[list[str]] = []
+        write = self._writing_runner(tmp_path, calls)
+
+        async def run(h, rel, inputs, wd):
+            if len(calls) == 1:
+                calls.append([r.id for r in inputs.records])
+                raise _oom_failure()
+            return await write(h, rel, inputs, wd)
+
+        runner = AsyncMock()
+        runner.run.side_effect = run
+        service = HookService(
+            hook_runner=runner, hook_storage=FakeHookStorage(), failure_policy=FailurePolicy()
+        )
+
+        [execution] = await service.run_hooks_for_batch(
+            [(hook, release)],
+            _inputs(records),
+            {hook.name: tmp_path},
+            sizing={hook.name: self._sizing(release, max_batch_records=2)},
+        )
+
+        # Four records ran to completion (the OOMed attempt is not counted), and
+        # the final limit was raised for the 20 MB sub-batch, not the batch.
+        assert calls == [["rec0", "rec1"], ["rec2", "rec3"], ["rec2", "rec3"]]
+        assert (execution.records, execution.oom_retries) == (4, 1)
+        assert execution.oom_batch_mb == 20.0
+        # Container time of the two completed attempts only.
+        assert execution.duration_s == 10.0
+
+    @pytest.mark.asyncio
+    async def test_batch_launches_at_recommended_memory_and_records_shape(self, tmp_path: Path):
+        from osa.domain.validation.service.hook import HookService
+
+        hook = _make_hook()
+        release = _make_release(memory="1g")
+        records = [HookRecord(id=f"rec{i}", metadata={}, size_hint_mb=10) for i in range(3)]
+        runner = AsyncMock()
+        runner.run.side_effect = self._writing_runner(tmp_path, [])
+        service = HookService(
+            hook_runner=runner, hook_storage=FakeHookStorage(), failure_policy=FailurePolicy()
+        )
+
+        [execution] = await service.run_hooks_for_batch(
+            [(hook, release)],
+            _inputs(records),
+            {hook.name: tmp_path},
+            sizing={hook.name: self._sizing(release, memory="4g")},
+        )
+
+        assert runner.run.call_args[0][1].runtime.limits.memory == "4g"
+        assert execution.release_id == release.id
+        assert (execution.records, execution.input_mb, execution.memory) == (3, 30.0, "4g")
+
+
+class TestHookServiceKnownOutcomes:
+    """Memoized outcomes are taken as done: only the other records run."""
+
+    @staticmethod
+    def _known(*ids: str) -> dict[HookRecordId, BatchRecordOutcome]:
+        return {
+            HookRecordId(i): BatchRecordOutcome(
+                record_id=HookRecordId(i), status=OutcomeStatus.PASSED, features=[{"memo": True}]
+            )
+            for i in ids
+        }
+
+    @pytest.mark.asyncio
+    async def test_only_unknown_records_run(self, tmp_path: Path):
+        from osa.domain.validation.service.hook import HookService
+
+        calls: list[list[str]] = []
+        runner = AsyncMock()
+        runner.run.side_effect = TestHookServiceSizing._writing_runner(tmp_path, calls)
+        storage = FakeHookStorage()
+        service = HookService(
+            hook_runner=runner, hook_storage=storage, failure_policy=FailurePolicy()
+        )
+
+        await service.run_hook(
+            _make_hook(),
+            _make_release(),
+            _inputs(_make_records(3)),
+            tmp_path,
+            known=self._known("rec1"),
+        )
+
+        assert calls == [["rec0", "rec2"]]
+        written = storage.written_outcomes[str(tmp_path)]
+        assert set(written) == {"rec0", "rec1", "rec2"}
+        assert written[HookRecordId("rec1")].features == [{"memo": True}]
+
+    @pytest.mark.asyncio
+    async def test_fully_known_batch_runs_no_container(self, tmp_path: Path):
+        from osa.domain.validation.service.hook import HookService
+
+        hook = _make_hook()
+        runner = AsyncMock()
+        storage = FakeHookStorage()
+        service = HookService(
+            hook_runner=runner, hook_storage=storage, failure_policy=FailurePolicy()
+        )
+
+        [execution] = await service.run_hooks_for_batch(
+            [(hook, _make_release())],
+            _inputs(_make_records(2)),
+            {hook.name: tmp_path},
+            known={hook.name: self._known("rec0", "rec1")},
+        )
+
+        assert execution.status == HookStatus.PASSED
+        runner.run.assert_not_awaited()
+        assert set(storage.written_outcomes[str(tmp_path)]) == {"rec0", "rec1"}
+
+    @pytest.mark.asyncio
+    async def test_memoized_records_not_counted_in_execution(self, tmp_path: Path):
+        from osa.domain.validation.service.hook import HookService
+
+        hook = _make_hook()
+        records = [HookRecord(id=f"rec{i}", metadata={}, size_hint_mb=10) for i in range(3)]
+        runner = AsyncMock()
+        runner.run.side_effect = TestHookServiceSizing._writing_runner(tmp_path, [])
+        service = HookService(
+            hook_runner=runner, hook_storage=FakeHookStorage(), failure_policy=FailurePolicy()
+        )
+
+        [execution] = await service.run_hooks_for_batch(
+            [(hook, _make_release())],
+            _inputs(records),
+            {hook.name: tmp_path},
+            known={hook.name: self._known("rec1")},
+        )
+
+        assert (execution.records, execution.input_mb) == (2, 20.0)
+
+
+class TestHookServiceOutputTail:
+    """Tailing features.jsonl while the container runs."""
+
+    @staticmethod
+    def _line(record_id: str) -> str:
+        import json
+
+        return json.dumps({"id": record_id, "features": [{"score": 1.0}]}) + "\n"
+
+    @pytest.mark.asyncio
+    async def test_features_checkpointed_while_running(self, tmp_path: Path):
+        import asyncio
+
+        from osa.domain.validation.service.hook import HookService
+
+        storage = FakeHookStorage()
+        mid_run: dict[HookRecordId, BatchRecordOutcome] = {}
+
+        async def run(h, rel, inputs, wd):
+            out = tmp_path / "output"
+            out.mkdir()
+            with (out / "features.jsonl").open("w") as f:
+                f.write(self._line("rec0") + self._line("rec1")[:10])  # rec1 half-written
+                f.flush()
+                await asyncio.sleep(0.05)
+                mid_run.update(storage.checkpoints.get(str(tmp_path), {}))
+                f.write(self._line("rec1")[10:] + self._line("rec2"))
+            return _passed_result()
+
+        runner = AsyncMock()
+        runner.run.side_effect = run
+        service = HookService(
+            hook_runner=runner,
+            hook_storage=storage,
+            failure_policy=FailurePolicy(),
+            output_tail_interval=0.01,
+        )
+
+        result = await service.run_hook(
+            _make_hook(), _make_release(), _inputs(_make_records(3)), tmp_path
+        )
+
+        assert result.status == HookStatus.PASSED
+        assert set(mid_run) == {"rec0"}
+        assert set(storage.written_outcomes[str(tmp_path)]) == {"rec0", "rec1", "rec2"}
+
+    @pytest.mark.asyncio
+    async def test_unterminated_last_line_is_read_after_exit(self, tmp_path: Path):
+        from osa.domain.validation.service.hook import HookService
+
+        storage = FakeHookStorage()
+
+        async def run(h, rel, inputs, wd):
+            (tmp_path / "output").mkdir()
+            (tmp_path / "output" / "features.jsonl").write_text(
+                self._line("rec0") + self._line("rec1").rstrip("\n")
+            )
+            return _passed_result()
+
+        runner = AsyncMock()
+        runner.run.side_effect = run
+        service = HookService(
+            hook_runner=runner,
+            hook_storage=storage,
+            failure_policy=FailurePolicy(),
+            output_tail_interval=60,
+        )
+
+        await service.run_hook(_make_hook(), _make_release(), _inputs(_make_records(2)), tmp_path)
+
+        assert set(storage.written_outcomes[str(tmp_path)]) == {"rec0", "rec1"}
+
+    @pytest.mark.asyncio
+    async def test_tail_errors_do_not_fail_the_run(self, tmp_path: Path):
+        import asyncio
+
+        from osa.domain.validation.service.hook import HookService
+
+        storage = FakeHookStorage()
+        real_read = storage.read_outcomes_since
+        polls = 0
+
+        async def flaky(
+            work_dir: Path, offset: int, *, final: bool = False
+        ) -> tuple[list[BatchRecordOutcome], int]:
+            nonlocal polls
+            polls += 1
+            if polls == 1:
+                raise OSError("transient read failure")
+            return await real_read(work_dir, offset, final=final)
+
+        storage.read_outcomes_since = flaky  # type: ignore[method-assign]
+
+        async def run(h, rel, inputs, wd):
+            (tmp_path / "output").mkdir()
+            (tmp_path / "output" / "features.jsonl").write_text(
+                "".join(self._line(r.id) for r in inputs.records)
+            )
+            await asyncio.sleep(0.03)
+            return _passed_result()
+
+        runner = AsyncMock()
+        runner.run.side_effect = run
+        service = HookService(
+            hook_runner=runner,
+            hook_storage=storage,
+            failure_policy=FailurePolicy(),
+            output_tail_interval=0.01,
+        )
+
+        await service.run_hook(_make_hook(), _make_release(), _inputs(_make_records(2)), tmp_path)
+
+        assert set(storage.written_outcomes[str(tmp_path)]) == {"rec0", "rec1"}
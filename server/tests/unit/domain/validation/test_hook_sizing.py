@@ -0,0 +1,235 @@
+"""Unit tests for adaptive hook sizing — the policy, its sub-batching, and the
+admin read handler."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from osa.domain.auth.model.principal import Principal
+from osa.domain.auth.model.role import Role
+from osa.domain.auth.model.value import ProviderIdentity, UserId
+from osa.domain.shared.error import AuthorizationError, NotFoundError
+from osa.domain.shared.model.hook import HookName, OciConfig, OciLimits
+from osa.domain.validation.model.hook_input import HookRecord
+from osa.domain.validation.model.hook_release import HookRelease, HookReleaseId
+from osa.domain.validation.model.hook_run import HookRun, HookRunId, HookRunStatus
+from osa.domain.validation.model.hook_sizing import HookSizing, HookSizingPolicy
+from osa.domain.validation.query.get_hook_sizing import GetHookSizing, GetHookSizingHandler
+from osa.domain.validation.service.hook_sizing import HookSizingService
+
+_T0 = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _release(memory: str = "1g", timeout: int = 100) -> HookRelease:
+    return HookRelease(
+        id=HookReleaseId(uuid4()),
+        hook_name=HookName("pocket_detect"),
+        version=3,
+        runtime=OciConfig(
+            image="img:v1",
+            digest="sha256:abc",
+            limits=OciLimits(memory=memory, timeout_seconds=timeout),
+        ),
+        source_ref="git:abc",
+        built_at=_T0,
+    )
+
+
+def _run(
+    release: HookRelease,
+    *,
+    memory: str | None = "1g",
+    oom_retries: int = 0,
+    records: int = 10,
+    input_mb: float = 100.0,
+    duration_s: float = 10.0,
+    status: HookRunStatus = HookRunStatus.PASSED,
+    oom_batch_mb: float | None = None,
+) -> HookRun:
+    return HookRun(
+        id=HookRunId(uuid4()),
+        release_id=release.id,
+        status=status,
+        started_at=_T0,
+        finished_at=_T0,
+        duration_s=duration_s,
+        oom_retries=oom_retries,
+        records=records,
+        input_mb=input_mb,
+        memory=memory,
+        oom_batch_mb=oom_batch_mb,
+    )
+
+
+class TestHookSizingPolicy:
+    def test_no_history_keeps_declared_limits(self):
+        release = _release()
+        sizing = HookSizingPolicy().recommend(release, [])
+
+        assert sizing.runs_observed == 0
+        assert sizing.memory is None
+        assert sizing.max_batch_records is None and sizing.max_batch_mb is None
+        assert sizing.apply(release) is release
+
+    def test_clean_runs_never_lower_memory(self):
+        release = _release(memory="2g")
+        sizing = HookSizingPolicy().recommend(release, [_run(release, memory="2g")] * 3)
+
+        assert sizing.memory is None
+        assert sizing.oom_rate == 0.0
+
+    def test_oom_retried_runs_raise_starting_memory(self):
+        release = _release(memory="1g")
+        runs = [
+            _run(release, memory="1g"),
+            _run(release, memory="2g", oom_retries=1),
+            _run(release, memory="4g", oom_retries=2),
+        ]
+
+        sizing = HookSizingPolicy().recommend(release, runs)
+
+        assert sizing.memory == "4g"
+        assert sizing.oom_runs == 2
+        assert sizing.apply(release).runtime.limits.memory == "4g"
+        assert sizing.apply(release).id == release.id
+
+    def test_errored_oom_run_assumes_one_more_doubling(self):
+        release = _release(memory="1g")
+        runs = [_run(release, memory="8g", oom_retries=3, status=HookRunStatus.ERROR)]
+
+        assert HookSizingPolicy().recommend(release, runs).memory == "16g"
+
+    def test_recommendation_capped_and_batches_bounded_by_cap(self):
+        release = _release(memory="1g")
+        # 8 GiB sufficed for 100 MB of input: ~82 MB of memory per input MB.
+        runs = [_run(release, memory="8g", oom_retries=3, input_mb=100.0)]
+
+        sizing = HookSizingPolicy(max_memory="4g").recommend(release, runs)
+
+        assert sizing.memory == "4g"
+        assert sizing.memory_mb_per_input_mb == pytest.approx(81.92)
+        assert sizing.max_batch_mb == pytest.approx(50.0)
+
+    def test_density_uses_the_oomed_sub_batch_not_the_whole_batch(self):
+        release = _release(memory="1g")
+        # 8 GiB was raised for a 25 MB sub-batch of a 100 MB batch.
+        runs = [_run(release, memory="8g", oom_retries=3, input_mb=100.0, oom_batch_mb=25.0)]
+
+        sizing = HookSizingPolicy(max_memory="4g").recommend(release, runs)
+
+        assert sizing.memory_mb_per_input_mb == pytest.approx(327.68)
+        assert sizing.max_batch_mb == pytest.approx(12.5)
+
+    def test_run_with_no_completed_records_is_still_a_memory_sample(self):
+        release = _release(memory="1g")
+        runs = [_run(release, memory="4g", oom_retries=2, records=0, oom_batch_mb=10.0)]
+
+        sizing = HookSizingPolicy().recommend(release, runs)
+
+        assert sizing.memory == "4g"
+        assert sizing.seconds_per_record is None
+
+    def test_pace_bounds_records_per_sub_batch(self):
+        release = _release(timeout=100)
+        runs = [_run(release, records=10, duration_s=20.0), _run(release, records=5, duration_s=5)]
+
+        sizing = HookSizingPolicy(timeout_headroom=0.8).recommend(release, runs)
+
+        assert sizing.seconds_per_record == 2.0
+        assert sizing.max_batch_records == 40
+
+    def test_rows_without_sizing_columns_are_ignored(self):
+        release = _release()
+        legacy = _run(release, memory=None, oom_retries=2, records=0)
+
+        sizing = HookSizingPolicy().recommend(release, [legacy])
+
+        assert sizing.runs_observed == 0
+        assert sizing.memory is None
+
+
+class TestSplit:
+    def _sizing(self, **bounds) -> HookSizing:
+        release = _release()
+        return HookSizing(
+            release_id=release.id,
+            hook_name=release.hook_name,
+            declared_memory="1g",
+            runs_observed=1,
+            oom_runs=0,
+            **bounds,
+        )
+
+    @staticmethod
+    def _records(*sizes: float) -> list[HookRecord]:
+        return [HookRecord(id=f"r{i}", metadata={}, size_hint_mb=s) for i, s in enumerate(sizes)]
+
+    def test_unbounded_is_one_batch(self):
+        records = self._records(1, 2, 3)
+        assert self._sizing().split(records) == [records]
+
+    def test_split_by_input_mb(self):
+        chunks = self._sizing(max_batch_mb=10).split(self._records(4, 4, 4, 20, 1))
+        assert [[r.id for r in c] for c in chunks] == [["r0", "r1"], ["r2"], ["r3"], ["r4"]]
+
+    def test_split_by_record_count(self):
+        chunks = self._sizing(max_batch_records=2).split(self._records(0, 0, 0))
+        assert [len(c) for c in chunks] == [2, 1]
+
+
+def _principal(role: Role = Role.ADMIN) -> Principal:
+    return Principal(
+        user_id=UserId.generate(),
+        provider_identity=ProviderIdentity(provider="test", external_id="ext"),
+        roles=frozenset({role}),
+    )
+
+
+class TestGetHookSizingHandler:
+    def _handler(self, release: HookRelease | None, runs: list[HookRun], role=Role.ADMIN):
+        registry = AsyncMock()
+        registry.resolve_live.return_value = {release.hook_name: release} if release else {}
+        registry.get_release.return_value = release
+        port = AsyncMock()
+        port.recent_runs.return_value = runs
+        sizing = HookSizingService(registry=port, policy=HookSizingPolicy(window=5))
+        return GetHookSizingHandler(principal=_principal(role), registry=registry, sizing=sizing)
+
+    @pytest.mark.asyncio
+    async def test_reports_live_release_recommendation(self):
+        release = _release(memory="1g")
+        handler = self._handler(release, [_run(release, memory="2g", oom_retries=1)])
+
+        detail = await handler.run(GetHookSizing(name=HookName("pocket_detect")))
+
+        assert detail.release_id == release.id
+        assert detail.version == 3
+        assert detail.recommended_memory == "2g"
+        assert detail.oom_rate == 1.0
+        handler.sizing.registry.recent_runs.assert_awaited_once_with(release.id, 5)
+
+    @pytest.mark.asyncio
+    async def test_missing_live_release_is_not_found(self):
+        handler = self._handler(None, [])
+        with pytest.raises(NotFoundError):
+            await handler.run(GetHookSizing(name=HookName("pocket_detect")))
+
+    @pytest.mark.asyncio
+    async def test_requires_admin(self):
+        handler = self._handler(_release(), [], role=Role.DEPOSITOR)
+        with pytest.raises(AuthorizationError):
+            await handler.run(GetHookSizing(name=HookName("pocket_detect")))
+
+
+class TestHookSizingService:
+    @pytest.mark.asyncio
+    async def test_disabled_policy_recommends_nothing(self):
+        port = AsyncMock()
+        service = HookSizingService(registry=port, policy=HookSizingPolicy(enabled=False))
+
+        assert await service.for_releases([_release()]) == {}
+        port.recent_runs.assert_not_awaited()
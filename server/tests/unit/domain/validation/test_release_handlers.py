@@ -229,3 +229,72 @@ class TestGetReleaseHandler:
         handler = GetReleaseHandler(service=service)
         with pytest.raises(NotFoundError):
             await handler.run(GetRelease(name=NAME, version=99))
+
+
+class TestReleaseActivation:
+    """Live-pointer moves append HookReleaseActivated so the image is pre-pulled."""
+
+    def _service(self):
+        from osa.domain.validation.service.hook_registry import HookRegistryService
+
+        return HookRegistryService(registry=AsyncMock(), outbox=AsyncMock())
+
+    @pytest.mark.asyncio
+    async def test_new_release_emits_activation(self) -> None:
+        from osa.domain.validation.event import HookReleaseActivated
+
+        service = self._service()
+        new = _release(2, "sha256:new")
+        service.registry.create_release.return_value = ReleaseOutcome(release=new, created=True)
+
+        await service.create_release(NAME, new.runtime, "git")
+
+        (event,) = service.outbox.append.await_args.args
+        assert isinstance(event, HookReleaseActivated)
+        assert (event.release_id, event.version) == (new.id, 2)
+        assert (event.image, event.digest) == ("reg/pocket:abc", "sha256:new")
+
+    @pytest.mark.asyncio
+    async def test_idempotent_release_emits_nothing(self) -> None:
+        service = self._service()
+        existing = _release(1, "sha256:old")
+        service.registry.create_release.return_value = ReleaseOutcome(
+            release=existing, created=False
+        )
+
+        await service.create_release(NAME, existing.runtime, "git")
+
+        service.outbox.append.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_set_live_emits_activation_for_target(self) -> None:
+        old = _release(1, "sha256:old")
+        service = self._service()
+        service.registry.set_live.return_value = _hook(live=old.id)
+        service.registry.get_release.return_value = old
+
+        await service.set_live(NAME, 1)
+
+        (event,) = service.outbox.append.await_args.args
+        assert (event.release_id, event.digest) == (old.id, "sha256:old")
+
+    @pytest.mark.asyncio
+    async def test_prefetch_handler_pulls_event_image(self) -> None:
+        from osa.domain.shared.event import EventId
+        from osa.domain.validation.event import HookReleaseActivated
+        from osa.domain.validation.handler import PrefetchHookImage
+
+        prefetcher = AsyncMock()
+        handler = PrefetchHookImage(prefetcher=prefetcher)
+        await handler.handle(
+            HookReleaseActivated(
+                id=EventId(uuid4()),
+                hook_name=NAME,
+                release_id=HookReleaseId(uuid4()),
+                version=3,
+                image="reg/pocket:abc",
+                digest="sha256:x",
+            )
+        )
+
+        prefetcher.prefetch.assert_awaited_once_with("reg/pocket:abc", "sha256:x")
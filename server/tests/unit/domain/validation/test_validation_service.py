@@ -7,6 +7,7 @@ from uuid import uuid4
 
 import pytest
 
+from osa.domain.shared.scheduler import ContainerScheduler
 from osa.domain.shared.model.hook import (
     ColumnDef,
     HookName,
@@ -22,6 +23,7 @@ from osa.domain.validation.model.hook_result import HookResult, HookStatus
 from osa.domain.validation.model.hook_input import HookRecord
 from osa.domain.validation.model.hook_run import HookRunStatus
 from osa.domain.validation.port.hook_runner import HookInputs
+from osa.domain.validation.service.hook_batcher import HookBatcher
 from osa.domain.validation.service.validation import ValidationService
 
 
@@ -89,8 +91,10 @@ def _make_service(
         hs.get_hook_output_dir = MagicMock(return_value=Path("/tmp/hooks/test"))
     if not hasattr(hs, "get_files_dir") or not callable(hs.get_files_dir):
         hs.get_files_dir = MagicMock(return_value=Path("/tmp/files/test"))
-    # write_checkpoint / write_batch_outcomes / write_run_ref / write_hook_log are async
+    # write_checkpoint / write_batch_outcomes / write_run_ref / write_hook_log and
+    # read_output_outcomes are async
     hs.write_checkpoint = AsyncMock()
+    hs.read_output_outcomes = AsyncMock(return_value={})
     hs.write_batch_outcomes = AsyncMock()
     hs.write_run_ref = AsyncMock()
     hs.write_hook_log = AsyncMock(return_value="/tmp/hooks/test/output/hook.log")
@@ -101,6 +105,8 @@ def _make_service(
         hook_registry=hook_registry or _make_registry(["pocket_detect"]),
         failure_policy=FailurePolicy(),
         node_domain=Domain("localhost"),
+        scheduler=ContainerScheduler(slots=4),
+        hook_batcher=HookBatcher(),
     )
 
 
@@ -13,6 +13,7 @@ from uuid import uuid4
 
 import pytest
 
+from osa.domain.shared.scheduler import ContainerScheduler
 from osa.domain.shared.model.hook import (
     ColumnDef,
     HookName,
@@ -25,6 +26,7 @@ from osa.domain.validation.model import RunStatus
 from osa.domain.validation.model.hook import Hook
 from osa.domain.validation.model.hook_release import HookRelease, HookReleaseId
 from osa.domain.validation.model.hook_result import HookResult, HookStatus
+from osa.domain.validation.service.hook_batcher import HookBatcher
 from osa.domain.validation.service.validation import ValidationService
 
 
@@ -104,6 +106,7 @@ class TestDecoupledValidationService:
         hook_storage.get_hook_output_dir.return_value = Path("/tmp/hooks/pocketeer")
         hook_storage.get_files_dir.return_value = Path("/data/files/test-dep")
         hook_storage.write_checkpoint = AsyncMock()
+        hook_storage.read_output_outcomes = AsyncMock(return_value={})
         hook_storage.write_batch_outcomes = AsyncMock()
         hook_storage.write_run_ref = AsyncMock()
 
@@ -114,6 +117,8 @@ class TestDecoupledValidationService:
             hook_registry=_make_registry("pocketeer"),
             failure_policy=FailurePolicy(),
             node_domain=Domain("localhost"),
+            scheduler=ContainerScheduler(slots=4),
+            hook_batcher=HookBatcher(),
         )
 
         run, hook_results = await service.validate_deposition(
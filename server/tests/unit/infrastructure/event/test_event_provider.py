@@ -9,14 +9,22 @@ from typing import ClassVar
 import pytest
 import pytest_asyncio
 from dishka import make_async_container
+from sqlalchemy.ext.asyncio import create_async_engine
 
+from osa.config import BatchStagesConfig, Config, WorkerConfig
+from osa.domain.shared.error import ConfigurationError
 from osa.domain.shared.event import Event, EventHandler, EventId
+from osa.domain.shared.model.subscription_registry import NonReplayableGroups
 from osa.infrastructure.event.di import (
     EventProvider,
     HandlerTypes,
     _CORE_HANDLERS,
     build_subscription_registry,
+    consumer_groups,
 )
+from osa.infrastructure.event.worker import WorkerPool
+from osa.infrastructure.persistence.database import WorkerEngine
+from osa.infrastructure.telemetry.sampler import TelemetrySampler
 from osa.util.di.scope import Scope
 
 
@@ -155,6 +163,29 @@ class TestSubscriptionRegistry:
             assert extended_registry[event_type] == consumers
 
 
+class TestNonReplayableGroups:
+    @pytest.mark.asyncio
+    async def test_compensating_handlers_are_not_replayable(self):
+        container = make_async_container(
+            EventProvider(extra_handlers=[AlphaHandler]),
+            scopes=Scope,  # type: ignore[arg-type]
+            skip_validation=True,
+        )
+        try:
+            groups = await container.get(NonReplayableGroups)
+        finally:
+            await container.close()
+
+        # Stage handlers are listed whether or not this config runs them.
+        assert groups == {
+            "ProcessSubmission",
+            "ProcessBatch",
+            "IngestBatchStage",
+            "HookBatchStage",
+            "PublishBatchStage",
+        }
+
+
 # ---------------------------------------------------------------------------
 # DI integration: full container resolution
 # ---------------------------------------------------------------------------
@@ -214,3 +245,85 @@ class TestEventProviderDI:
         handler_types = await container.get(HandlerTypes)
         assert AlphaHandler in handler_types
         assert BetaHandler in handler_types
+
+
+# ---------------------------------------------------------------------------
+# WorkerPool consumer-group selection (worker processes)
+# ---------------------------------------------------------------------------
+
+
+class TestWorkerPoolSelection:
+    async def _pool(self, worker: WorkerConfig) -> WorkerPool:
+        from dishka import Provider, provide
+
+        class SamplerProvider(Provider):
+            @provide(scope=Scope.APP)
+            def sampler(self) -> TelemetrySampler:
+                return None  # type: ignore[return-value]
+
+            @provide(scope=Scope.APP)
+            def engine(self) -> WorkerEngine:
+                return WorkerEngine(create_async_engine("sqlite+aiosqlite://"))
+
+        config = Config(base_url="http://localhost:8000", worker=worker)
+        container = make_async_container(
+            EventProvider(extra_handlers=[AlphaHandler, BetaHandler]),
+            SamplerProvider(),
+            context={Config: config},
+            scopes=Scope,  # type: ignore[arg-type]
+            skip_validation=True,
+        )
+        try:
+            return await container.get(WorkerPool)
+        finally:
+            await container.close()
+
+    def test_consumer_groups_lists_core_then_extra(self):
+        groups = consumer_groups([AlphaHandler])
+        assert groups == [*(h.__name__ for h in _CORE_HANDLERS), "AlphaHandler"]
+
+    @pytest.mark.asyncio
+    async def test_default_registers_every_group(self):
+        pool = await self._pool(WorkerConfig())
+        groups = {w.consumer_group for w in pool.workers}
+        assert groups == set(consumer_groups([AlphaHandler, BetaHandler]))
+
+    @pytest.mark.asyncio
+    async def test_subset_registers_only_selected_groups(self):
+        pool = await self._pool(WorkerConfig(consumer_groups=["AlphaHandler"], singletons=False))
+        assert [w.consumer_group for w in pool.workers] == ["AlphaHandler"]
+        assert pool._singletons is False
+        # The stale-claim sweep still honours the slowest group's claim timeout.
+        assert pool._stale_claim_timeout == max(h.__claim_timeout__ for h in _CORE_HANDLERS)
+
+    def test_batch_stages_replace_process_batch(self):
+        config = Config(
+            base_url="http://localhost:8000",
+            worker=WorkerConfig(batch_stages=BatchStagesConfig(enabled=True)),
+        )
+        groups = consumer_groups(config=config)
+        assert "ProcessBatch" not in groups
+        assert groups[1:4] == ["IngestBatchStage", "HookBatchStage", "PublishBatchStage"]
+
+    @pytest.mark.asyncio
+    async def test_batch_stages_get_their_own_concurrency(self):
+        pool = await self._pool(
+            WorkerConfig(
+                hook_concurrency=3,
+                batch_stages=BatchStagesConfig(
+                    enabled=True, ingest_concurrency=1, publish_concurrency=2
+                ),
+            )
+        )
+        counts: dict[str, int] = {}
+        for w in pool.workers:
+            counts[w.consumer_group] = counts.get(w.consumer_group, 0) + 1
+        assert "ProcessBatch" not in counts
+        assert counts["IngestBatchStage"] == 1
+        assert counts["HookBatchStage"] == 3
+        assert counts["PublishBatchStage"] == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_group_is_a_configuration_error(self):
+        with pytest.raises(ConfigurationError, match="GammaHandler"):
+            await self._pool(WorkerConfig(consumer_groups=["GammaHandler"]))
@@ -0,0 +1,92 @@
+"""Unit tests for LeaderElector — advisory-lock election of singleton tasks."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from osa.infrastructure.event.leader import (
+    SINGLETON_TASKS,
+    STATISTICS_REFRESH,
+    STALE_CLAIM_CLEANUP,
+    LeaderElector,
+)
+
+
+def _engine(dialect: str = "postgresql", conn: AsyncMock | None = None) -> MagicMock:
+    engine = MagicMock()
+    engine.dialect = SimpleNamespace(name=dialect)
+    engine.connect = AsyncMock(return_value=conn)
+    return engine
+
+
+def _conn(granted: set[str]) -> AsyncMock:
+    """Connection whose pg_try_advisory_lock grants only the *granted* tasks."""
+    conn = AsyncMock()
+
+    async def scalar(statement, params):  # noqa: ANN001, ANN202
+        return params["key"].removeprefix("osa:leader:") in granted
+
+    conn.scalar = AsyncMock(side_effect=scalar)
+    return conn
+
+
+class TestLocalDatabase:
+    @pytest.mark.asyncio
+    async def test_non_postgres_leads_every_task_without_a_connection(self):
+        engine = _engine("sqlite")
+        elector = LeaderElector(engine, identity="host:1")
+
+        await elector.start()
+
+        assert all(elector.is_leader(task) for task in SINGLETON_TASKS)
+        assert await elector.describe(AsyncMock()) == {task: "host:1" for task in SINGLETON_TASKS}
+        engine.connect.assert_not_awaited()
+        await elector.stop()
+
+
+class TestElection:
+    @pytest.mark.asyncio
+    async def test_leads_only_the_tasks_whose_lock_it_won(self):
+        elector = LeaderElector(_engine(conn=_conn({STATISTICS_REFRESH})), identity="host:1")
+
+        await elector._renew()
+
+        assert elector.is_leader(STATISTICS_REFRESH)
+        assert not elector.is_leader(STALE_CLAIM_CLEANUP)
+
+    @pytest.mark.asyncio
+    async def test_follower_takes_over_once_the_lock_frees(self):
+        granted: set[str] = set()
+        elector = LeaderElector(_engine(conn=_conn(granted)), identity="host:2")
+        await elector._renew()
+        assert not elector.is_leader(STATISTICS_REFRESH)
+
+        granted.add(STATISTICS_REFRESH)  # the previous leader's session ended
+        await elector._renew()
+
+        assert elector.is_leader(STATISTICS_REFRESH)
+
+    @pytest.mark.asyncio
+    async def test_leadership_lapses_without_renewal(self):
+        elector = LeaderElector(_engine(conn=_conn({STATISTICS_REFRESH})), lease_seconds=30.0)
+        await elector._renew()
+
+        elector._renewed_at -= 31.0
+
+        assert not elector.is_leader(STATISTICS_REFRESH)
+
+    @pytest.mark.asyncio
+    async def test_stop_closes_the_session_and_drops_leadership(self):
+        conn = _conn(set(SINGLETON_TASKS))
+        elector = LeaderElector(_engine(conn=conn))
+        await elector._renew()
+
+        await elector.stop()
+
+        assert not any(elector.is_leader(task) for task in SINGLETON_TASKS)
+        conn.invalidate.assert_awaited_once()
+
+    def test_renewal_must_fit_inside_the_lease(self):
+        with pytest.raises(ValueError):
+            LeaderElector(_engine(), lease_seconds=5.0, renew_interval=5.0)
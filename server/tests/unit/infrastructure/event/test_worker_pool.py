@@ -18,6 +18,7 @@ from osa.domain.shared.event import (
     EventId,
 )
 from osa.domain.shared.outbox import Outbox
+from osa.infrastructure.event.worker import Worker
 
 
 class DummyEvent(Event):
@@ -215,6 +216,158 @@ class TestWorkerPoolManagement:
             assert worker._container is container
 
 
+class TestWorkerPoolSingletons:
+    """Singleton tasks run in one worker process only."""
+
+    @pytest.mark.asyncio
+    async def test_pool_without_singletons_starts_only_workers(self):
+        from osa.infrastructure.event.worker import WorkerPool
+
+        container = make_mock_container()
+        pool = WorkerPool(container=container, sampler=MagicMock(), singletons=False)
+        pool.register(DummyHandler)
+
+        async with pool:
+            assert all(w._task is not None for w in pool.workers)
+            assert pool._stale_claim_task is None
+            assert pool._device_auth_cleanup_task is None
+            assert pool._statistics_task is None
+            assert pool._telemetry_sampler_task is None
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_deliveries_past_the_drain_timeout(self):
+        from osa.infrastructure.event.worker import WorkerPool
+
+        pool = WorkerPool(
+            container=make_mock_container(), stale_claim_interval=0, drain_timeout=0.01
+        )
+        pool.register(DummyHandler)
+        await pool.start()
+        stuck = asyncio.create_task(asyncio.sleep(60))
+        pool.workers[0]._task = stuck
+
+        await pool.stop()
+        await asyncio.sleep(0)
+
+        assert stuck.cancelled()
+
+
+class TestWorkerPoolResize:
+    """Consumer groups are resized at runtime without restarting the pool."""
+
+    @pytest.mark.asyncio
+    async def test_growing_a_group_starts_new_workers(self):
+        from osa.infrastructure.event.worker import WorkerPool
+
+        pool = WorkerPool(container=make_mock_container(), stale_claim_interval=0)
+        pool.register(DummyHandler)
+
+        async with pool:
+            pool.resize("DummyHandler", 3)
+
+            assert [w.name for w in pool.workers] == [
+                "DummyHandler",
+                "DummyHandler-1",
+                "DummyHandler-2",
+            ]
+            assert all(w.is_alive for w in pool.workers)
+
+    @pytest.mark.asyncio
+    async def test_shrinking_retires_the_highest_instances(self):
+        from osa.infrastructure.event.worker import WorkerPool
+
+        pool = WorkerPool(container=make_mock_container(), stale_claim_interval=0)
+        for _ in range(3):
+            pool.add_worker(Worker(DummyHandler, instance_id=len(pool.workers)))
+        pool.register(AnotherHandler)
+
+        async with pool:
+            retired = pool.workers[1:3]
+            pool.resize("DummyHandler", 1)
+
+            assert [w.name for w in pool.workers] == ["DummyHandler", "AnotherHandler"]
+            assert all(w._shutdown for w in retired)
+
+        assert all(not w.is_alive for w in retired)
+
+    @pytest.mark.asyncio
+    async def test_group_paused_at_zero_can_grow_again(self):
+        from osa.infrastructure.event.worker import WorkerPool
+
+        pool = WorkerPool(container=make_mock_container(), stale_claim_interval=0)
+        pool.register(DummyHandler)
+
+        async with pool:
+            pool.resize("DummyHandler", 0)
+            assert pool.workers == []
+
+            pool.resize("DummyHandler", 2)
+            assert [w.name for w in pool.workers] == ["DummyHandler", "DummyHandler-1"]
+
+    def test_groups_the_pool_does_not_run_are_ignored(self):
+        from osa.infrastructure.event.worker import WorkerPool
+
+        pool = WorkerPool()
+        pool.register(DummyHandler)
+
+        pool.resize("AnotherHandler", 4)
+
+        assert [w.name for w in pool.workers] == ["DummyHandler"]
+
+    @pytest.mark.asyncio
+    async def test_sync_applies_stored_worker_counts(self):
+        from osa.infrastructure.event.worker import WorkerPool
+
+        outbox = AsyncMock(spec=Outbox)
+        outbox.claim.return_value = ClaimResult(deliveries=[], claimed_at=datetime.now(UTC))
+        outbox.worker_counts = AsyncMock(return_value={"DummyHandler": 2, "Elsewhere": 5})
+        pool = WorkerPool(
+            container=make_mock_container(outbox),
+            stale_claim_interval=0,
+            singletons=False,
+            worker_count_sync_interval=60,
+        )
+        pool.register(DummyHandler)
+
+        async with pool:
+            await asyncio.sleep(0.02)
+
+            assert [w.name for w in pool.workers] == ["DummyHandler", "DummyHandler-1"]
+
+
+class TestWorkerPoolLeadership:
+    """Singleton tasks only act on the replica leading them."""
+
+    @pytest.mark.asyncio
+    async def test_follower_skips_stale_claim_cleanup(self):
+        from osa.infrastructure.event.worker import WorkerPool
+
+        outbox = AsyncMock(spec=Outbox)
+        outbox.claim.return_value = ClaimResult(deliveries=[], claimed_at=datetime.now(UTC))
+        outbox.reset_stale_claims = AsyncMock(return_value=0)
+        leader = MagicMock()
+        leader.start = AsyncMock()
+        leader.stop = AsyncMock()
+        leader.is_leader.return_value = False
+
+        pool = WorkerPool(
+            container=make_mock_container(outbox), stale_claim_interval=0.01, leader=leader
+        )
+        pool.register(DummyHandler)
+
+        async with pool:
+            await asyncio.sleep(0.05)
+
+        leader.start.assert_awaited_once()
+        leader.stop.assert_awaited_once()
+        outbox.reset_stale_claims.assert_not_awaited()
+
+        leader.is_leader.return_value = True
+        async with pool:
+            await asyncio.sleep(0.05)
+        outbox.reset_stale_claims.assert_awaited()
+
+
 class TestWorkerPoolStaleClaims:
     """Tests for stale claim cleanup in WorkerPool."""
 
@@ -0,0 +1,321 @@
+"""Unit tests for JobInformer — shared LIST+WATCH Job/Pod tracking.
+
+Driven by ``FakeKube``, an in-memory stand-in for the API server that hands out
+resourceVersions, streams watch events, and can close or expire watches.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from osa.config import K8sConfig
+from osa.domain.shared.failure import FailureKind, RuntimeFailure
+from osa.infrastructure.k8s.informer import JobInformer, WatchExpired
+from osa.infrastructure.k8s.ingester_runner import K8sIngesterRunner
+from osa.infrastructure.k8s.runner import K8sHookRunner
+
+
+class FakeKube:
+    """In-memory API server: LIST snapshots plus resumable WATCH streams."""
+
+    def __init__(self) -> None:
+        self.version = 0
+        self.objects: dict[str, dict[str, Any]] = {"jobs": {}, "pods": {}}
+        self.list_calls = {"jobs": 0, "pods": 0}
+        self.watch_versions: dict[str, list[str]] = {"jobs": [], "pods": []}
+        self._streams: dict[str, list[asyncio.Queue]] = {"jobs": [], "pods": []}
+        self._expire: set[str] = set()
+
+    async def list_objects(self, kind: str, namespace: str, selector: str) -> tuple[list[Any], str]:
+        self.list_calls[kind] += 1
+        return list(self.objects[kind].values()), str(self.version)
+
+    async def watch(self, kind: str, namespace: str, selector: str, resource_version: str):
+        self.watch_versions[kind].append(resource_version)
+        if kind in self._expire:
+            self._expire.discard(kind)
+            raise WatchExpired("410 Gone")
+        queue: asyncio.Queue = asyncio.Queue()
+        self._streams[kind].append(queue)
+        try:
+            while (event := await queue.get()) is not None:
+                yield event
+        finally:
+            self._streams[kind].remove(queue)
+
+    # ── Test controls ──
+
+    def put(self, kind: str, obj: Any, event_type: str = "MODIFIED", *, stream: bool = True):
+        self.version += 1
+        obj.metadata.resource_version = str(self.version)
+        if event_type == "DELETED":
+            self.objects[kind].pop(obj.metadata.name, None)
+        else:
+            self.objects[kind][obj.metadata.name] = obj
+        if stream:
+            for queue in self._streams[kind]:
+                queue.put_nowait((event_type, obj))
+
+    def close_streams(self, kind: str) -> None:
+        for queue in self._streams[kind]:
+            queue.put_nowait(None)
+
+    def expire_next_watch(self, kind: str) -> None:
+        self._expire.add(kind)
+
+    def watching(self, kind: str) -> int:
+        return len(self._streams[kind])
+
+
+def _meta(name: str, labels: dict[str, str] | None = None) -> SimpleNamespace:
+    return SimpleNamespace(name=name, labels=labels or {}, resource_version=None)
+
+
+def _job(name: str, *, succeeded: int = 0, failed: int = 0, conditions=None) -> SimpleNamespace:
+    return SimpleNamespace(
+        metadata=_meta(name, {"osa.io/role": "hook"}),
+        status=SimpleNamespace(
+            succeeded=succeeded, failed=failed, active=1, conditions=conditions or []
+        ),
+    )
+
+
+def _pod(
+    name: str,
+    job: str,
+    phase: str = "Pending",
+    *,
+    waiting: str | None = None,
+    unschedulable: bool = False,
+) -> SimpleNamespace:
+    statuses = None
+    if waiting:
+        statuses = [SimpleNamespace(state=SimpleNamespace(waiting=SimpleNamespace(reason=waiting)))]
+    conditions = (
+        [SimpleNamespace(type="PodScheduled", reason="Unschedulable")] if unschedulable else []
+    )
+    return SimpleNamespace(
+        metadata=_meta(name, {"osa.io/role": "hook", "job-name": job}),
+        status=SimpleNamespace(
+            phase=phase, reason=None, container_statuses=statuses, conditions=conditions
+        ),
+    )
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+async def kube():
+    return FakeKube()
+
+
+@pytest.fixture
+async def informer(kube: FakeKube):
+    informer = JobInformer(kube, "osa", max_backoff=0.01)
+    await informer.start()
+    await informer.wait_synced(timeout=1)
+    await _settle()
+    yield informer
+    await informer.stop()
+
+
+class TestWaitFinished:
+    @pytest.mark.asyncio
+    async def test_resolves_on_success_event(self, kube: FakeKube, informer: JobInformer):
+        waiting = asyncio.create_task(informer.wait_finished("job-a", timeout=1))
+        await _settle()
+        kube.put("jobs", _job("job-a"), "ADDED")
+        await _settle()
+        assert not waiting.done()
+
+        kube.put("jobs", _job("job-a", succeeded=1))
+
+        assert await waiting is None
+        assert kube.list_calls == {"jobs": 1, "pods": 1}
+
+    @pytest.mark.asyncio
+    async def test_failed_condition_returns_reason(self, kube: FakeKube, informer: JobInformer):
+        waiting = asyncio.create_task(informer.wait_finished("job-a", timeout=1))
+        await _settle()
+        failed = SimpleNamespace(type="Failed", status="True", reason="DeadlineExceeded")
+
+        kube.put("jobs", _job("job-a", conditions=[failed]))
+
+        assert await waiting == "DeadlineExceeded"
+
+    @pytest.mark.asyncio
+    async def test_already_finished_resolves_from_cache(
+        self, kube: FakeKube, informer: JobInformer
+    ):
+        kube.put("jobs", _job("job-a", succeeded=1), "ADDED")
+        await _settle()
+
+        assert await informer.wait_finished("job-a", timeout=1) is None
+
+    @pytest.mark.asyncio
+    async def test_deleted_job_fails_waiter(self, kube: FakeKube, informer: JobInformer):
+        kube.put("jobs", _job("job-a"), "ADDED")
+        waiting = asyncio.create_task(informer.wait_finished("job-a", timeout=1))
+        await _settle()
+
+        kube.put("jobs", _job("job-a"), "DELETED")
+
+        with pytest.raises(RuntimeFailure, match="deleted"):
+            await waiting
+
+    @pytest.mark.asyncio
+    async def test_timeout(self, informer: JobInformer):
+        with pytest.raises(RuntimeFailure) as exc_info:
+            await informer.wait_finished("job-a", timeout=0.01)
+        assert exc_info.value.kind is FailureKind.TIMEOUT
+
+
+class TestWaitScheduled:
+    @pytest.mark.asyncio
+    async def test_running_pod_resolves(self, kube: FakeKube, informer: JobInformer):
+        waiting = asyncio.create_task(informer.wait_scheduled("job-a", timeout=1))
+        kube.put("pods", _pod("job-a-x", "job-a"), "ADDED")
+        await _settle()
+        assert not waiting.done()
+
+        kube.put("pods", _pod("job-a-x", "job-a", "Running"))
+
+        assert await waiting is None
+
+    @pytest.mark.asyncio
+    async def test_image_pull_error_raises(self, kube: FakeKube, informer: JobInformer):
+        waiting = asyncio.create_task(informer.wait_scheduled("job-a", timeout=1))
+        await _settle()
+
+        kube.put("pods", _pod("job-a-x", "job-a", waiting="ErrImagePull"))
+
+        with pytest.raises(RuntimeFailure) as exc_info:
+            await waiting
+        assert exc_info.value.kind is FailureKind.IMAGE_PULL
+
+    @pytest.mark.asyncio
+    async def test_other_jobs_pods_are_ignored(self, kube: FakeKube, informer: JobInformer):
+        waiting = asyncio.create_task(informer.wait_scheduled("job-a", timeout=0.05))
+        await _settle()
+
+        kube.put("pods", _pod("job-b-x", "job-b", "Running"))
+
+        with pytest.raises(RuntimeFailure):
+            await waiting
+
+
+class TestWatchResumption:
+    @pytest.mark.asyncio
+    async def test_closed_stream_resumes_from_last_version(
+        self, kube: FakeKube, informer: JobInformer
+    ):
+        kube.put("jobs", _job("job-a"), "ADDED")
+        await _settle()
+        last_seen = kube.objects["jobs"]["job-a"].metadata.resource_version
+
+        kube.close_streams("jobs")
+        await _settle()
+
+        assert kube.watch_versions["jobs"][-1] == last_seen
+        assert kube.list_calls["jobs"] == 1
+        assert kube.watching("jobs") == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_version_relists_and_catches_up(
+        self, kube: FakeKube, informer: JobInformer
+    ):
+        kube.put("jobs", _job("job-a"), "ADDED")
+        waiting = asyncio.create_task(informer.wait_finished("job-a", timeout=1))
+        await _settle()
+
+        # The Job finishes while the watch is down and its version has expired.
+        kube.expire_next_watch("jobs")
+        kube.put("jobs", _job("job-a", succeeded=1), stream=False)
+        kube.close_streams("jobs")
+
+        assert await waiting is None
+        assert kube.list_calls["jobs"] == 2
+
+    @pytest.mark.asyncio
+    async def test_watch_errors_back_off_and_retry(self, kube: FakeKube):
+        calls = 0
+        real_watch = kube.watch
+
+        def flaky(*args):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise ConnectionError("reset")
+            return real_watch(*args)
+
+        kube.watch = flaky  # type: ignore[method-assign]
+        informer = JobInformer(kube, "osa", max_backoff=0.01)
+        await informer.start()
+        try:
+            await informer.wait_synced(timeout=1)
+            for _ in range(50):
+                if kube.watching("jobs"):
+                    break
+                await asyncio.sleep(0.01)
+            assert kube.watching("jobs") == 1
+        finally:
+            await informer.stop()
+
+
+class TestRunnersUseInformer:
+    def _config(self) -> K8sConfig:
+        return K8sConfig(namespace="osa", data_pvc_name="pvc", s3_bucket="b")
+
+    @pytest.mark.asyncio
+    async def test_has_capacity_reads_cache(self, kube: FakeKube, informer: JobInformer):
+        runner = K8sIngesterRunner(
+            api_client=MagicMock(), config=self._config(), s3=AsyncMock(), informer=informer
+        )
+        runner._core_api = AsyncMock()
+
+        assert await runner.has_capacity() is True
+        kube.put("pods", _pod("job-a-x", "job-a", unschedulable=True), "ADDED")
+        await _settle()
+        assert await runner.has_capacity() is False
+        runner._core_api.list_namespaced_pod.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_hook_runner_waits_without_polling(self, kube: FakeKube, informer: JobInformer):
+        runner = K8sHookRunner(
+            api_client=MagicMock(), config=self._config(), s3=AsyncMock(), informer=informer
+        )
+        runner._batch_api = AsyncMock()
+        runner._core_api = AsyncMock()
+
+        async def lifecycle() -> None:
+            kube.put("pods", _pod("job-a-x", "job-a", "Running"), "ADDED")
+            kube.put("jobs", _job("job-a", succeeded=1), "ADDED")
+
+        task = asyncio.create_task(lifecycle())
+        await runner._wait_for_scheduling("job-a", "osa")
+        await runner._wait_for_completion("job-a", "osa", timeout_seconds=1)
+        await task
+
+        runner._core_api.list_namespaced_pod.assert_not_awaited()
+        runner._batch_api.read_namespaced_job.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_hook_runner_diagnoses_failure(self, kube: FakeKube, informer: JobInformer):
+        runner = K8sHookRunner(
+            api_client=MagicMock(), config=self._config(), s3=AsyncMock(), informer=informer
+        )
+        runner._core_api = AsyncMock()
+        failed = SimpleNamespace(type="Failed", status="True", reason="DeadlineExceeded")
+        kube.put("jobs", _job("job-a", conditions=[failed]), "ADDED")
+        await _settle()
+
+        with pytest.raises(RuntimeFailure) as exc_info:
+            await runner._wait_for_completion("job-a", "osa", timeout_seconds=1)
+
+        assert exc_info.value.kind is FailureKind.TIMEOUT
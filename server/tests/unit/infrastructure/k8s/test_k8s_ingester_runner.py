@@ -237,6 +237,19 @@ class TestSourceJobSpec:
         assert env_dict["OSA_FILES"] == "/osa/files"
         assert env_dict["OSA_LIMIT"] == "100"
         assert env_dict["OSA_OFFSET"] == "50"
+        assert "OSA_SHARD" not in env_dict
+
+    def test_shard_env_vars(self):
+        runner = _make_runner()
+        spec = runner._build_job_spec(
+            _make_ingester(),
+            work_dir=Path("/data/sources/localhost_conv1/staging/run1"),
+            files_dir=Path("/data/sources/localhost_conv1/staging/run1/files"),
+            inputs=IngesterInputs(convention_id=_CONV_SLUG, shard=2, shards=4),
+        )
+        env_dict = {e.name: e.value for e in spec.spec.template.spec.containers[0].env}
+        assert env_dict["OSA_SHARD"] == "2"
+        assert env_dict["OSA_SHARDS"] == "4"
 
     def test_since_env_var(self):
         from datetime import datetime, UTC
@@ -0,0 +1,132 @@
+"""Unit tests for K8sImagePrefetcher — pre-pull DaemonSet spec and lifecycle."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from osa.config import K8sConfig
+from osa.domain.shared.failure import FailureKind, RuntimeFailure
+from osa.infrastructure.k8s.prepull import K8sImagePrefetcher, prepull_name
+
+IMAGE = "ghcr.io/example/hook:v1"
+DIGEST = "sha256:abc"
+
+
+def _prefetcher(**config) -> K8sImagePrefetcher:
+    cfg = K8sConfig(namespace="osa", data_pvc_name="pvc", prepull_timeout_seconds=1, **config)
+    prefetcher = K8sImagePrefetcher(api_client=MagicMock(), config=cfg, poll_interval=0.01)
+    prefetcher._apps_api = AsyncMock()
+    prefetcher._core_api = AsyncMock()
+    return prefetcher
+
+
+def _daemonset(desired: int) -> SimpleNamespace:
+    return SimpleNamespace(status=SimpleNamespace(desired_number_scheduled=desired))
+
+
+def _pod(*, waiting: str | None = None, image_id: str = "", running: bool = False):
+    state = SimpleNamespace(
+        waiting=SimpleNamespace(reason=waiting) if waiting else None,
+        running=SimpleNamespace() if running else None,
+        terminated=None,
+    )
+    return SimpleNamespace(
+        spec=SimpleNamespace(node_name="node-1"),
+        status=SimpleNamespace(
+            init_container_statuses=[SimpleNamespace(state=state, image_id=image_id)]
+        ),
+    )
+
+
+def _pods(*pods) -> SimpleNamespace:
+    return SimpleNamespace(items=list(pods))
+
+
+class TestDaemonSetSpec:
+    def test_hook_image_pinned_in_init_container(self):
+        ds = _prefetcher()._build_daemonset("osa-prepull-x", f"{IMAGE}@{DIGEST}")
+        spec = ds.spec.template.spec
+
+        assert spec.init_containers[0].image == f"{IMAGE}@{DIGEST}"
+        assert spec.init_containers[0].image_pull_policy == "IfNotPresent"
+        assert spec.containers[0].image == "registry.k8s.io/pause:3.10"
+        assert spec.automount_service_account_token is False
+        assert ds.spec.selector.match_labels == ds.spec.template.metadata.labels
+
+    def test_pull_secrets_forwarded(self):
+        ds = _prefetcher(image_pull_secrets=["regcred"])._build_daemonset("n", IMAGE)
+        assert [s.name for s in ds.spec.template.spec.image_pull_secrets] == ["regcred"]
+
+    def test_name_is_deterministic_dns_label(self):
+        name = prepull_name(f"{IMAGE}@{DIGEST}")
+        assert name == prepull_name(f"{IMAGE}@{DIGEST}")
+        assert name != prepull_name(f"{IMAGE}@sha256:other")
+        assert len(name) <= 63 and name.startswith("osa-prepull-")
+
+
+class TestPrefetch:
+    @pytest.mark.asyncio
+    async def test_waits_for_every_node_then_cleans_up(self):
+        prefetcher = _prefetcher()
+        prefetcher._apps_api.read_namespaced_daemon_set.return_value = _daemonset(2)
+        prefetcher._core_api.list_namespaced_pod.side_effect = [
+            _pods(_pod(waiting="ContainerCreating"), _pod(waiting="ContainerCreating")),
+            _pods(_pod(running=True), _pod(waiting="CrashLoopBackOff", image_id="docker://x")),
+        ]
+
+        await prefetcher.prefetch(IMAGE, DIGEST)
+
+        assert prefetcher._core_api.list_namespaced_pod.await_count == 2
+        prefetcher._apps_api.delete_namespaced_daemon_set.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_pull_error_raises_image_pull(self):
+        prefetcher = _prefetcher()
+        prefetcher._apps_api.read_namespaced_daemon_set.return_value = _daemonset(1)
+        prefetcher._core_api.list_namespaced_pod.return_value = _pods(
+            _pod(waiting="ImagePullBackOff")
+        )
+
+        with pytest.raises(RuntimeFailure) as exc_info:
+            await prefetcher.prefetch(IMAGE, DIGEST)
+
+        assert exc_info.value.kind is FailureKind.IMAGE_PULL
+        prefetcher._apps_api.delete_namespaced_daemon_set.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_existing_daemonset_is_shared(self):
+        prefetcher = _prefetcher()
+        conflict = Exception("exists")
+        conflict.status = 409  # type: ignore[attr-defined]
+        prefetcher._apps_api.create_namespaced_daemon_set.side_effect = conflict
+        prefetcher._apps_api.read_namespaced_daemon_set.return_value = _daemonset(1)
+        prefetcher._core_api.list_namespaced_pod.return_value = _pods(_pod(running=True))
+
+        await prefetcher.prefetch(IMAGE, DIGEST)
+
+        prefetcher._apps_api.read_namespaced_daemon_set.assert_awaited()
+
+    @pytest.mark.asyncio
+    async def test_timeout_is_not_an_error(self):
+        prefetcher = _prefetcher()
+        prefetcher._apps_api.read_namespaced_daemon_set.return_value = _daemonset(1)
+        prefetcher._core_api.list_namespaced_pod.return_value = _pods(
+            _pod(waiting="ContainerCreating")
+        )
+
+        await prefetcher.prefetch(IMAGE, DIGEST)
+
+        prefetcher._apps_api.delete_namespaced_daemon_set.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_rbac_error_classified(self):
+        prefetcher = _prefetcher()
+        denied = Exception("forbidden")
+        denied.status = 403  # type: ignore[attr-defined]
+        prefetcher._apps_api.create_namespaced_daemon_set.side_effect = denied
+
+        with pytest.raises(RuntimeFailure) as exc_info:
+            await prefetcher.prefetch(IMAGE, DIGEST)
+
+        assert exc_info.value.kind is FailureKind.RBAC
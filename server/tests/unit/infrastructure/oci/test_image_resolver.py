@@ -0,0 +1,203 @@
+"""Unit tests for ImageResolver — cached hook image resolution and prefetch."""
+
+import asyncio
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import aiodocker
+import pytest
+
+from osa.domain.shared.failure import FailureKind, RuntimeFailure
+from osa.domain.shared.model.hook import (
+    ColumnDef,
+    HookIdentity,
+    OciConfig,
+    OciLimits,
+    TableFeatureSpec,
+)
+from osa.domain.validation.model.hook_input import HookRecord
+from osa.domain.validation.model.hook_release import HookRelease, HookReleaseId
+from osa.domain.validation.model.hook_result import HookStatus
+from osa.domain.validation.port.hook_runner import HookInputs
+from osa.infrastructure.oci.images import ImageResolver
+from osa.infrastructure.oci.runner import OciHookRunner
+
+IMAGE = "ghcr.io/example/hook:v1"
+DIGEST = "sha256:abc"
+
+
+def _missing() -> aiodocker.DockerError:
+    return aiodocker.DockerError(404, {"message": "No such image"})
+
+
+def _docker(*, local_tag: bool = True) -> AsyncMock:
+    docker = AsyncMock()
+    if not local_tag:
+        docker.images.inspect.side_effect = _missing()
+    return docker
+
+
+class TestResolve:
+    @pytest.mark.asyncio
+    async def test_local_tag_preferred(self):
+        docker = _docker()
+        assert await ImageResolver(docker).resolve(IMAGE, DIGEST) == IMAGE
+        docker.images.pull.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_pulls_when_absent(self):
+        docker = _docker(local_tag=False)
+        assert await ImageResolver(docker).resolve(IMAGE, DIGEST) == IMAGE
+        docker.images.pull.assert_awaited_once_with(IMAGE)
+
+    @pytest.mark.asyncio
+    async def test_pull_failure_is_image_pull_and_not_cached(self):
+        docker = _docker(local_tag=False)
+        docker.images.pull.side_effect = aiodocker.DockerError(500, {"message": "denied"})
+        resolver = ImageResolver(docker)
+
+        with pytest.raises(RuntimeFailure) as exc_info:
+            await resolver.resolve(IMAGE, DIGEST)
+        assert exc_info.value.kind is FailureKind.IMAGE_PULL
+
+        docker.images.pull.side_effect = None
+        assert await resolver.resolve(IMAGE, DIGEST) == IMAGE
+
+
+class TestCache:
+    @pytest.mark.asyncio
+    async def test_hit_within_ttl(self):
+        docker = _docker()
+        resolver = ImageResolver(docker, ttl=60)
+
+        await resolver.resolve(IMAGE, DIGEST)
+        await resolver.resolve(IMAGE, DIGEST)
+
+        assert docker.images.inspect.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_disables_cache(self):
+        docker = _docker()
+        resolver = ImageResolver(docker, ttl=0)
+
+        await resolver.resolve(IMAGE, DIGEST)
+        await resolver.resolve(IMAGE, DIGEST)
+
+        assert docker.images.inspect.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_forget_drops_entry(self):
+        docker = _docker()
+        resolver = ImageResolver(docker, ttl=60)
+        await resolver.resolve(IMAGE, DIGEST)
+
+        resolver.forget(IMAGE, DIGEST)
+        await resolver.resolve(IMAGE, DIGEST)
+
+        assert docker.images.inspect.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_resolutions_share_one_pull(self):
+        docker = _docker(local_tag=False)
+        gate = asyncio.Event()
+
+        async def slow_pull(ref: str) -> None:
+            await gate.wait()
+
+        docker.images.pull.side_effect = slow_pull
+        resolver = ImageResolver(docker)
+
+        waiters = [asyncio.create_task(resolver.resolve(IMAGE, DIGEST)) for _ in range(3)]
+        await asyncio.sleep(0)
+        gate.set()
+
+        assert await asyncio.gather(*waiters) == [IMAGE] * 3
+        docker.images.pull.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_abort_shared_pull(self):
+        docker = _docker(local_tag=False)
+        gate = asyncio.Event()
+
+        async def slow_pull(ref: str) -> None:
+            await gate.wait()
+
+        docker.images.pull.side_effect = slow_pull
+        resolver = ImageResolver(docker)
+
+        first = asyncio.create_task(resolver.resolve(IMAGE, DIGEST))
+        second = asyncio.create_task(resolver.resolve(IMAGE, DIGEST))
+        await asyncio.sleep(0)
+        first.cancel()
+        gate.set()
+
+        assert await second == IMAGE
+
+    @pytest.mark.asyncio
+    async def test_prefetch_populates_cache(self):
+        docker = _docker()
+        resolver = ImageResolver(docker, ttl=60)
+
+        await resolver.prefetch(IMAGE, DIGEST)
+        await resolver.resolve(IMAGE, DIGEST)
+
+        assert docker.images.inspect.await_count == 1
+
+
+class TestRunnerResolution:
+    def _release(self, timeout: int) -> HookRelease:
+        return HookRelease(
+            id=HookReleaseId(uuid4()),
+            hook_name="pocket_detect",
+            version=1,
+            runtime=OciConfig(
+                image=IMAGE, digest=DIGEST, limits=OciLimits(timeout_seconds=timeout)
+            ),
+            source_ref="git:abc",
+            built_at=datetime.now(UTC),
+        )
+
+    def _hook(self) -> HookIdentity:
+        return HookIdentity(
+            name="pocket_detect",
+            feature=TableFeatureSpec(
+                cardinality="many",
+                columns=[ColumnDef(name="score", json_type="number", required=True)],
+            ),
+        )
+
+    @pytest.mark.asyncio
+    async def test_slow_pull_does_not_count_against_hook_timeout(self, tmp_path: Path):
+        docker = _docker(local_tag=False)
+
+        async def slow_pull(ref: str) -> None:
+            await asyncio.sleep(1.2)
+
+        docker.images.pull.side_effect = slow_pull
+        container = AsyncMock()
+        container.wait.return_value = {"StatusCode": 0}
+        container.show.return_value = {"State": {"OOMKilled": False}}
+        docker.containers.create.return_value = container
+        runner = OciHookRunner(docker=docker, images=ImageResolver(docker))
+        inputs = HookInputs(records=[HookRecord(id="r", metadata={})], run_id="run")
+
+        result = await runner.run(self._hook(), self._release(timeout=1), inputs, tmp_path)
+
+        assert result.status == HookStatus.PASSED
+        assert result.duration_seconds < 1
+
+    @pytest.mark.asyncio
+    async def test_missing_image_on_create_invalidates_cache(self, tmp_path: Path):
+        docker = _docker()
+        docker.containers.create.side_effect = _missing()
+        resolver = ImageResolver(docker, ttl=60)
+        runner = OciHookRunner(docker=docker, images=resolver)
+        inputs = HookInputs(records=[HookRecord(id="r", metadata={})], run_id="run")
+
+        with pytest.raises(RuntimeFailure):
+            await runner.run(self._hook(), self._release(timeout=5), inputs, tmp_path)
+        await resolver.resolve(IMAGE, DIGEST)
+
+        assert docker.images.inspect.await_count == 2
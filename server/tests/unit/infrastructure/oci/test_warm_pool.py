@@ -0,0 +1,363 @@
+"""Unit tests for the OCI runner's warm container pool (persistent hook protocol)."""
+
+import asyncio
+import json
+import os
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+import aiodocker
+import pytest
+
+from osa.domain.shared.failure import FailureKind, RuntimeFailure
+from osa.domain.shared.model.hook import (
+    ColumnDef,
+    HookIdentity,
+    OciConfig,
+    OciLimits,
+    TableFeatureSpec,
+)
+from osa.domain.validation.model.hook_input import HookRecord
+from osa.domain.validation.model.hook_release import HookRelease, HookReleaseId
+from osa.domain.validation.model.hook_result import HookStatus
+from osa.domain.validation.port.hook_runner import HookInputs
+from osa.infrastructure.oci.pool import PROTOCOL_LABEL, WarmContainer, WarmContainerPool
+from osa.infrastructure.oci.runner import OciHookRunner
+
+HOOK = HookIdentity(
+    name="pocket_detect",
+    feature=TableFeatureSpec(
+        cardinality="one", columns=[ColumnDef(name="score", json_type="number", required=True)]
+    ),
+)
+
+
+def _release(memory: str = "1g") -> HookRelease:
+    return HookRelease(
+        id=HookReleaseId(uuid4()),
+        hook_name="pocket_detect",
+        version=1,
+        runtime=OciConfig(
+            image="ghcr.io/example/hook:v1",
+            digest="sha256:abc",
+            limits=OciLimits(timeout_seconds=5, memory=memory),
+        ),
+        source_ref="git:abc",
+        built_at=datetime.now(UTC),
+    )
+
+
+class _FakeContainer:
+    """A persistent-protocol hook: answers each request by scoring every record."""
+
+    def __init__(self, owner: "_FakeDocker", config: dict[str, Any]) -> None:
+        self.id = f"c{len(owner.created)}"
+        self.config = config
+        self.owner = owner
+        mounts = dict(b.split(":")[1::-1] for b in config["HostConfig"]["Binds"])
+        self.mounts = {k: Path(v) for k, v in mounts.items()}
+        self.deleted = False
+        self.running = False
+        self.oom = False
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        self.running = True
+        self._task = asyncio.create_task(self._serve())
+
+    async def _serve(self) -> None:
+        request = self.mounts["/osa/ctl"] / "request.json"
+        answered = 0
+        while self.running:
+            await asyncio.sleep(0.001)
+            if not request.exists():
+                continue
+            seq = json.loads(request.read_text())["seq"]
+            if seq == answered:
+                continue
+            behaviour = self.owner.behaviour
+            if behaviour == "die":
+                self.running = False
+                self.oom = True
+                return
+            out = self.mounts["/osa/out"]
+            records = (self.mounts["/osa/in"] / "records.jsonl").read_text().splitlines()
+            with (out / "features.jsonl").open("w") as f:
+                for line in records:
+                    rid = json.loads(line)["id"]
+                    seen = sorted(p.name for p in (self.mounts["/osa/files"] / rid).glob("*"))
+                    f.write(json.dumps({"id": rid, "features": [{"files": seen}]}) + "\n")
+            if behaviour == "slow":
+                await self.owner.respond.wait()
+            exit_code = 1 if behaviour == "fail" else 0
+            tmp = self.mounts["/osa/ctl"] / "response.tmp"
+            tmp.write_text(json.dumps({"seq": seq, "exit_code": exit_code}))
+            os.replace(tmp, self.mounts["/osa/ctl"] / "response.json")
+            answered = seq
+
+    async def show(self) -> dict[str, Any]:
+        return {"State": {"Running": self.running, "OOMKilled": self.oom, "ExitCode": 137}}
+
+    async def log(self, **kwargs: Any) -> list[str]:
+        return ["boom"]
+
+    async def delete(self, force: bool = False) -> None:
+        self.deleted = True
+        self.running = False
+        if self._task is not None:
+            self._task.cancel()
+
+
+class _FakeImages:
+    def __init__(self, labels: dict[str, str]) -> None:
+        self.labels = labels
+        self.inspects = 0
+
+    async def inspect(self, ref: str) -> dict[str, Any]:
+        self.inspects += 1
+        return {"Config": {"Labels": self.labels}}
+
+
+class _FakeContainers:
+    def __init__(self, owner: "_FakeDocker") -> None:
+        self.owner = owner
+
+    async def create(self, config: dict[str, Any]) -> _FakeContainer:
+        container = _FakeContainer(self.owner, config)
+        self.owner.created.append(container)
+        return container
+
+
+class _FakeDocker:
+    def __init__(self, labels: dict[str, str] | None = None) -> None:
+        self.created: list[_FakeContainer] = []
+        self.behaviour = "ok"
+        self.respond = asyncio.Event()
+        self.images = _FakeImages(labels if labels is not None else {PROTOCOL_LABEL: "persistent"})
+        self.containers = _FakeContainers(self)
+
+
+def _runner(docker: _FakeDocker, pool: WarmContainerPool) -> OciHookRunner:
+    return OciHookRunner(docker=docker, pool=pool, poll_interval=0.001)  # type: ignore[arg-type]
+
+
+def _work_dir(tmp_path: Path, name: str) -> Path:
+    wd = tmp_path / "runs" / name
+    wd.mkdir(parents=True)
+    return wd
+
+
+@pytest.fixture
+def pool(tmp_path: Path) -> WarmContainerPool:
+    return WarmContainerPool(tmp_path / "hook-pool", max_idle_per_release=2, max_runs=3)
+
+
+class TestWarmRuns:
+    @pytest.mark.asyncio
+    async def test_container_reused_across_runs(self, tmp_path: Path, pool: WarmContainerPool):
+        docker = _FakeDocker()
+        runner = _runner(docker, pool)
+        release = _release()
+
+        for i in range(2):
+            wd = _work_dir(tmp_path, f"r{i}")
+            inputs = HookInputs(records=[HookRecord(id=f"rec{i}", metadata={})], run_id="r")
+            result = await runner.run(HOOK, release, inputs, wd)
+
+            assert result.status == HookStatus.PASSED
+            lines = (wd / "output" / "features.jsonl").read_text().splitlines()
+            assert [json.loads(line)["id"] for line in lines] == [f"rec{i}"]
+
+        assert len(docker.created) == 1
+        assert not docker.created[0].deleted
+        env = docker.created[0].config["Env"]
+        assert "OSA_PROTOCOL=persistent" in env
+        host = docker.created[0].config["HostConfig"]
+        assert host["NetworkMode"] == "none" and host["ReadonlyRootfs"] is True
+        assert host["CapDrop"] == ["ALL"]
+        assert pool.known_protocol("ghcr.io/example/hook:v1") is True
+
+    @pytest.mark.asyncio
+    async def test_mounted_slot_dirs_survive_between_runs(
+        self, tmp_path: Path, pool: WarmContainerPool
+    ):
+        docker = _FakeDocker()
+        runner = _runner(docker, pool)
+        release = _release()
+        inodes: list[dict[str, int]] = []
+
+        for i in range(2):
+            inputs = HookInputs(records=[HookRecord(id=f"rec{i}", metadata={})], run_id="r")
+            await runner.run(HOOK, release, inputs, _work_dir(tmp_path, f"r{i}"))
+            mounts = docker.created[0].mounts
+            inodes.append(
+                {p: mounts[p].stat().st_ino for p in ("/osa/in", "/osa/files", "/osa/out")}
+            )
+
+        assert inodes[0] == inodes[1]
+
+    @pytest.mark.asyncio
+    async def test_features_mirrored_before_the_response(
+        self, tmp_path: Path, pool: WarmContainerPool
+    ):
+        docker = _FakeDocker()
+        docker.behaviour = "slow"
+        runner = _runner(docker, pool)
+        wd = _work_dir(tmp_path, "r")
+        inputs = HookInputs(records=[HookRecord(id="rec", metadata={})], run_id="r")
+        run = asyncio.create_task(runner.run(HOOK, _release(), inputs, wd))
+        mirrored = wd / "output" / "features.jsonl"
+
+        for _ in range(500):
+            if mirrored.exists() and mirrored.read_text().endswith("\n"):
+                break
+            await asyncio.sleep(0.01)
+        assert not run.done()
+        assert json.loads(mirrored.read_text())["id"] == "rec"
+
+        docker.respond.set()
+        result = await run
+        assert result.status == HookStatus.PASSED
+
+    @pytest.mark.asyncio
+    async def test_record_files_are_staged_into_slot(self, tmp_path: Path, pool: WarmContainerPool):
+        docker = _FakeDocker()
+        runner = _runner(docker, pool)
+        files = tmp_path / "files" / "rec1"
+        files.mkdir(parents=True)
+        (files / "a.cif").write_text("x")
+        wd = _work_dir(tmp_path, "r")
+        inputs = HookInputs(
+            records=[HookRecord(id="rec1", metadata={})], run_id="r", files_dirs={"rec1": files}
+        )
+
+        await runner.run(HOOK, _release(), inputs, wd)
+
+        line = json.loads((wd / "output" / "features.jsonl").read_text())
+        assert line["features"] == [{"files": ["a.cif"]}]
+
+    @pytest.mark.asyncio
+    async def test_recycled_after_max_runs(self, tmp_path: Path, pool: WarmContainerPool):
+        docker = _FakeDocker()
+        runner = _runner(docker, pool)
+        release = _release()
+        inputs = HookInputs(records=[HookRecord(id="rec", metadata={})], run_id="r")
+
+        for i in range(4):
+            await runner.run(HOOK, release, inputs, _work_dir(tmp_path, f"r{i}"))
+
+        assert len(docker.created) == 2
+        assert docker.created[0].deleted
+
+    @pytest.mark.asyncio
+    async def test_unlabelled_image_runs_one_shot(self, tmp_path: Path, pool: WarmContainerPool):
+        docker = _FakeDocker(labels={})
+        runner = _runner(docker, pool)
+        called: list[str] = []
+
+        async def one_shot(*args: Any) -> dict:
+            called.append("one-shot")
+            return {"status": HookStatus.PASSED, "progress": []}
+
+        runner._run_container = one_shot  # type: ignore[method-assign]
+        inputs = HookInputs(records=[HookRecord(id="rec", metadata={})], run_id="r")
+
+        await runner.run(HOOK, _release(), inputs, _work_dir(tmp_path, "r"))
+
+        assert called == ["one-shot"]
+        assert docker.created == []
+
+
+class TestWarmFailures:
+    @pytest.mark.asyncio
+    async def test_nonzero_exit_recycles_container(self, tmp_path: Path, pool: WarmContainerPool):
+        docker = _FakeDocker()
+        docker.behaviour = "fail"
+        runner = _runner(docker, pool)
+        release = _release()
+        inputs = HookInputs(records=[HookRecord(id="rec", metadata={})], run_id="r")
+
+        with pytest.raises(RuntimeFailure) as exc_info:
+            await runner.run(HOOK, release, inputs, _work_dir(tmp_path, "r1"))
+        assert exc_info.value.kind is FailureKind.HOOK_EXIT
+        assert exc_info.value.container_logs == "boom"
+        assert docker.created[0].deleted
+
+        docker.behaviour = "ok"
+        await runner.run(HOOK, release, inputs, _work_dir(tmp_path, "r2"))
+        assert len(docker.created) == 2
+
+    @pytest.mark.asyncio
+    async def test_container_death_surfaces_oom(self, tmp_path: Path, pool: WarmContainerPool):
+        docker = _FakeDocker()
+        docker.behaviour = "die"
+        runner = _runner(docker, pool)
+        inputs = HookInputs(records=[HookRecord(id="rec", metadata={})], run_id="r")
+
+        with pytest.raises(RuntimeFailure) as exc_info:
+            await runner.run(HOOK, _release(), inputs, _work_dir(tmp_path, "r"))
+
+        assert exc_info.value.kind is FailureKind.OOM
+        assert docker.created[0].deleted
+
+    @pytest.mark.asyncio
+    async def test_docker_error_on_start_cleans_slot(self, tmp_path: Path, pool: WarmContainerPool):
+        docker = _FakeDocker()
+
+        async def broken(config: dict[str, Any]) -> None:
+            raise aiodocker.DockerError(500, {"message": "no space"})
+
+        docker.containers.create = broken  # type: ignore[method-assign]
+        runner = _runner(docker, pool)
+        inputs = HookInputs(records=[HookRecord(id="rec", metadata={})], run_id="r")
+
+        with pytest.raises(RuntimeFailure) as exc_info:
+            await runner.run(HOOK, _release(), inputs, _work_dir(tmp_path, "r"))
+
+        assert exc_info.value.kind is FailureKind.RUNTIME
+        assert list(pool.root.iterdir()) == []
+
+
+class TestPoolLifecycle:
+    @pytest.mark.asyncio
+    async def test_close_removes_idle_containers(self, tmp_path: Path, pool: WarmContainerPool):
+        docker = _FakeDocker()
+        runner = _runner(docker, pool)
+        inputs = HookInputs(records=[HookRecord(id="rec", metadata={})], run_id="r")
+        await runner.run(HOOK, _release(), inputs, _work_dir(tmp_path, "r"))
+
+        await pool.close()
+
+        assert docker.created[0].deleted
+        assert list(pool.root.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_discard_removes_slot_when_delete_fails(self, pool: WarmContainerPool):
+        class _Undeletable:
+            id = "c0"
+
+            async def delete(self, force: bool = False) -> None:
+                raise aiodocker.DockerError(500, {"message": "daemon gone"})
+
+        slot = pool.new_slot("s0")
+
+        await pool.discard(WarmContainer(container=_Undeletable(), slot_dir=slot))
+
+        assert not slot.exists()
+
+    @pytest.mark.asyncio
+    async def test_idle_containers_expire(self, tmp_path: Path):
+        pool = WarmContainerPool(tmp_path / "hook-pool", idle_timeout=0.001)
+        docker = _FakeDocker()
+        runner = _runner(docker, pool)
+        release = _release()
+        inputs = HookInputs(records=[HookRecord(id="rec", metadata={})], run_id="r")
+        await runner.run(HOOK, release, inputs, _work_dir(tmp_path, "r1"))
+        await asyncio.sleep(0.01)
+
+        await runner.run(HOOK, release, inputs, _work_dir(tmp_path, "r2"))
+
+        assert len(docker.created) == 2
+        assert docker.created[0].deleted
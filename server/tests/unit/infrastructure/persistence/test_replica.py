@@ -0,0 +1,87 @@
+"""Unit tests for ReplicaRouter — lag-bounded read routing."""
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from osa.config import Config, DatabaseConfig
+from osa.infrastructure.persistence.database import create_read_fallback_engine
+from osa.infrastructure.persistence.replica import _LAG_SQL, ReplicaRouter
+
+
+class FakeLagRouter(ReplicaRouter):
+    """Router whose lag probe returns scripted values instead of querying."""
+
+    def __init__(self, lags: list[float | None | Exception], **kwargs) -> None:  # noqa: ANN003
+        self.read = create_async_engine("postgresql+asyncpg://u:p@replica/db")
+        self.fallback = create_async_engine("postgresql+asyncpg://u:p@primary/db")
+        super().__init__(self.read, self.fallback, **kwargs)
+        self.lags = lags
+        self.probes = 0
+
+    async def lag(self) -> float | None:
+        self.probes += 1
+        value = self.lags.pop(0)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+
+@pytest.mark.asyncio
+class TestReplicaRouter:
+    async def test_without_replica_reads_never_probe(self):
+        router = FakeLagRouter([], replica=False)
+
+        assert await router.engine() is router.read
+        assert router.probes == 0
+
+    async def test_fresh_replica_serves_reads(self):
+        router = FakeLagRouter([2.0], replica=True, max_lag=10)
+
+        assert await router.engine() is router.read
+
+    async def test_lagging_replica_falls_back_to_primary(self):
+        router = FakeLagRouter([30.0], replica=True, max_lag=10)
+
+        assert await router.engine() is router.fallback
+
+    @pytest.mark.parametrize("lag", [None, ConnectionError("replica down")])
+    async def test_unknown_lag_falls_back_to_primary(self, lag):
+        router = FakeLagRouter([lag], replica=True)
+
+        assert await router.engine() is router.fallback
+
+    async def test_lag_is_probed_once_per_check_interval(self):
+        router = FakeLagRouter([30.0, 1.0], replica=True, max_lag=10, check_interval=60)
+
+        await router.engine()
+        assert await router.engine() is router.fallback
+        assert router.probes == 1
+
+    async def test_reads_return_to_the_replica_once_it_catches_up(self):
+        router = FakeLagRouter([30.0, 1.0], replica=True, max_lag=10, check_interval=0)
+
+        assert await router.engine() is router.fallback
+        assert await router.engine() is router.read
+
+
+class TestLagProbe:
+    def test_caught_up_counts_only_while_streaming(self):
+        # A replica that lost the primary has "replayed all it received" forever.
+        assert "pg_stat_wal_receiver" in str(_LAG_SQL)
+        assert "status = 'streaming'" in str(_LAG_SQL)
+
+    def test_fallback_is_a_read_sized_pool_on_the_primary(self):
+        config = Config(
+            base_url="http://localhost:8000",
+            database=DatabaseConfig(
+                url="postgresql+asyncpg://u:p@primary/db",
+                read_url="postgresql+asyncpg://u:p@replica/db",
+                pool_size=20,
+                read_pool_size=3,
+            ),
+        )
+
+        engine = create_read_fallback_engine(config)
+
+        assert engine.url.host == "primary"
+        assert engine.pool.size() == 3
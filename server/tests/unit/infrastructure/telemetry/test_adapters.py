@@ -19,13 +19,15 @@ from opentelemetry.sdk.metrics.export import (
 from osa.domain.ingest.model.ingest_run import IngestStatus
 from osa.domain.shared.event import DeliveryStatus
 from osa.domain.shared.failure import DecisionKind, FailureKind
-from osa.domain.shared.model.hook import HookName
+from osa.domain.shared.model.hook import FeatureName, HookName
 from osa.domain.shared.model.workflow import StageOutcome, WorkflowName, WorkflowStage
+from osa.domain.shared.model.workload import WorkSource
 from osa.domain.validation.model.hook_run import HookRunStatus
 from osa.infrastructure.telemetry.api import ApiInstrumentation
 from osa.infrastructure.telemetry.hook import OtelHookInstrumentation
 from osa.infrastructure.telemetry.ingest import OtelIngestInstrumentation
 from osa.infrastructure.telemetry.outbox import OtelOutboxInstrumentation
+from osa.infrastructure.telemetry.scheduler import OtelSchedulerInstrumentation
 from osa.infrastructure.telemetry.workflow import OtelWorkflowInstrumentation
 
 
@@ -172,6 +174,16 @@ def test_outbox_delivery_completed_counter_and_histogram(reader, meter):
     assert h_point.sum == pytest.approx(0.25)
 
 
+def test_outbox_deliveries_requeued_counter(reader, meter):
+    instr = OtelOutboxInstrumentation(meter)
+    instr.deliveries_requeued(consumer_group="ProcessBatch", count=40)
+    instr.deliveries_requeued(consumer_group="ProcessBatch", count=2)
+
+    (attrs, point) = _points(reader, "osa_deliveries_requeued_total")[0]
+    assert attrs == {"consumer_group": "ProcessBatch"}
+    assert point.value == 42
+
+
 # ── Workflow adapter ──────────────────────────────────────────────────────────
 
 
@@ -216,9 +228,38 @@ def test_workflow_stage_finished_exact_label_dict(reader, meter):
     assert point.value == 1
 
 
+def test_workflow_features_inserted_records_duration_and_rows_by_feature(reader, meter):
+    instr = OtelWorkflowInstrumentation(meter)
+
+    instr.features_inserted(feature=FeatureName("pockets"), rows=120, duration_s=0.5)
+
+    (h_attrs, h_point) = _points(reader, "osa_feature_insert_duration_seconds")[0]
+    assert h_attrs == {"feature": "pockets"}
+    assert h_point.sum == pytest.approx(0.5)
+    (c_attrs, c_point) = _points(reader, "osa_feature_insert_rows_total")[0]
+    assert c_attrs == {"feature": "pockets"}
+    assert c_point.value == 120
+
+
 # ── API adapter ───────────────────────────────────────────────────────────────
 
 
+def test_scheduler_queue_depth_and_wait_by_source(reader, meter):
+    instr = OtelSchedulerInstrumentation(meter)
+    instr.queue_depth_changed(source=WorkSource.INGEST, delta=1)
+    instr.queue_depth_changed(source=WorkSource.INGEST, delta=1)
+    instr.queue_depth_changed(source=WorkSource.INGEST, delta=-1)
+    instr.admitted(source=WorkSource.DEPOSITION, wait_s=0.25)
+    instr.admission_rejected(source=WorkSource.INGEST)
+
+    depth = {a["source"]: p.value for a, p in _points(reader, "osa_scheduler_queue_depth")}
+    assert depth == {"ingest": 1}
+    (attrs, wait) = _points(reader, "osa_scheduler_wait_seconds")[0]
+    assert attrs == {"source": "deposition"} and wait.sum == 0.25
+    (_, rejected) = _points(reader, "osa_scheduler_rejected_total")[0]
+    assert rejected.value == 1
+
+
 def test_api_unhandled_error_counter(reader, meter):
     instr = ApiInstrumentation(meter)
     instr.unhandled_error()
@@ -16,6 +16,7 @@ from osa.application.di import create_container  # noqa: E402
 from osa.domain.ingest.port.instrumentation import IngestInstrumentation  # noqa: E402
 from osa.domain.shared.port.instrumentation import (  # noqa: E402
     OutboxInstrumentation,
+    SchedulerInstrumentation,
     WorkflowInstrumentation,
 )
 from osa.domain.validation.port.instrumentation import HookInstrumentation  # noqa: E402
@@ -23,6 +24,7 @@ from osa.infrastructure.telemetry.api import ApiInstrumentation  # noqa: E402
 from osa.infrastructure.telemetry.hook import OtelHookInstrumentation  # noqa: E402
 from osa.infrastructure.telemetry.ingest import OtelIngestInstrumentation  # noqa: E402
 from osa.infrastructure.telemetry.outbox import OtelOutboxInstrumentation  # noqa: E402
+from osa.infrastructure.telemetry.scheduler import OtelSchedulerInstrumentation  # noqa: E402
 from osa.infrastructure.telemetry.workflow import OtelWorkflowInstrumentation  # noqa: E402
 
 
@@ -34,16 +36,18 @@ def test_ports_resolve_to_otel_adapters() -> None:
         ingest = await container.get(IngestInstrumentation)
         outbox = await container.get(OutboxInstrumentation)
         workflow = await container.get(WorkflowInstrumentation)
+        scheduler = await container.get(SchedulerInstrumentation)
         api = await container.get(ApiInstrumentation)
         meter = await container.get(Meter)
-        return hook, ingest, outbox, workflow, api, meter
+        return hook, ingest, outbox, workflow, scheduler, api, meter
 
-    hook, ingest, outbox, workflow, api, meter = asyncio.run(resolve())
+    hook, ingest, outbox, workflow, scheduler, api, meter = asyncio.run(resolve())
 
     assert isinstance(hook, OtelHookInstrumentation)
     assert isinstance(ingest, OtelIngestInstrumentation)
     assert isinstance(outbox, OtelOutboxInstrumentation)
     assert isinstance(workflow, OtelWorkflowInstrumentation)
+    assert isinstance(scheduler, OtelSchedulerInstrumentation)
     assert isinstance(api, ApiInstrumentation)
     assert isinstance(meter, Meter)
 
@@ -23,6 +23,7 @@ from sqlalchemy.ext.asyncio import create_async_engine
 
 from osa.domain.shared.event import DeliveryStats, DeliveryStatus, WorkerStatus
 from osa.domain.shared.port.event_repository import EventRepository
+from osa.infrastructure.persistence.database import TimedQueuePool
 from osa.infrastructure.telemetry.sampler import (
     PoolStats,
     SamplerSnapshot,
@@ -95,7 +96,7 @@ def _fake_worker(status: WorkerStatus) -> object:
 
 def _pg_engine():
     """A QueuePool-backed engine (never connects) so pool gauges are populated."""
-    return create_async_engine("postgresql+asyncpg://u:p@localhost/db")
+    return create_async_engine("postgresql+asyncpg://u:p@localhost/db", poolclass=TimedQueuePool)
 
 
 def _sqlite_engine():
@@ -107,14 +108,16 @@ def _sqlite_engine():
 
 
 def test_fresh_sampler_emits_zeroes_and_no_pool(reader, meter):
-    TelemetrySampler(meter, _pg_engine())
+    TelemetrySampler(meter, {"primary": _pg_engine()})
 
     assert _points(reader, "osa_outbox_lag_seconds") == [({}, 0.0)]
     assert _points(reader, "osa_outbox_pending") == []
     assert _points(reader, "osa_outbox_failed") == []
+    assert _points(reader, "osa_outbox_deferred") == []
     assert _points(reader, "osa_db_pool_checked_out") == []
     assert _points(reader, "osa_db_pool_size") == []
     assert _points(reader, "osa_db_pool_overflow") == []
+    assert _points(reader, "osa_db_pool_wait_seconds") == []
     assert _points(reader, "osa_workers_busy") == [({}, 0)]
     assert _points(reader, "osa_workers_total") == [({}, 0)]
 
@@ -124,7 +127,7 @@ def test_fresh_sampler_emits_zeroes_and_no_pool(reader, meter):
 
 @pytest.mark.asyncio
 async def test_refresh_populates_all_gauges(reader, meter):
-    sampler = TelemetrySampler(meter, _pg_engine())
+    sampler = TelemetrySampler(meter, {"primary": _pg_engine()})
 
     oldest = datetime.now(UTC) - timedelta(seconds=12)
     stats = DeliveryStats(
@@ -135,6 +138,7 @@ async def test_refresh_populates_all_gauges(reader, meter):
             ("ProcessBatch", DeliveryStatus.DELIVERED): 99,
         },
         oldest_pending_created_at=oldest,
+        deferred={"ProcessBatch": 1},
     )
     container = _make_container(_FakeRepo(stats))
     workers = [
@@ -155,18 +159,22 @@ async def test_refresh_populates_all_gauges(reader, meter):
     failed = {a["consumer_group"]: v for a, v in _points(reader, "osa_outbox_failed")}
     assert failed == {"ProcessBatch": 2}
 
+    deferred = {a["consumer_group"]: v for a, v in _points(reader, "osa_outbox_deferred")}
+    assert deferred == {"ProcessBatch": 1}
+
     assert _points(reader, "osa_workers_busy") == [({}, 2)]
     assert _points(reader, "osa_workers_total") == [({}, 3)]
 
-    # QueuePool → pool gauges present (single unlabelled point each).
-    assert len(_points(reader, "osa_db_pool_size")) == 1
+    # QueuePool → pool gauges present (one point per pool, labelled by name).
+    assert _points(reader, "osa_db_pool_size") == [({"pool": "primary"}, 5)]
     assert len(_points(reader, "osa_db_pool_checked_out")) == 1
     assert len(_points(reader, "osa_db_pool_overflow")) == 1
+    assert _points(reader, "osa_db_pool_wait_seconds") == [({"pool": "primary"}, 0.0)]
 
 
 @pytest.mark.asyncio
 async def test_refresh_no_pending_reports_zero_lag(reader, meter):
-    sampler = TelemetrySampler(meter, _pg_engine())
+    sampler = TelemetrySampler(meter, {"primary": _pg_engine()})
     stats = DeliveryStats(counts={}, oldest_pending_created_at=None)
     container = _make_container(_FakeRepo(stats))
 
@@ -175,18 +183,39 @@ async def test_refresh_no_pending_reports_zero_lag(reader, meter):
     assert _points(reader, "osa_outbox_lag_seconds") == [({}, 0.0)]
 
 
+@pytest.mark.asyncio
+async def test_refresh_reports_wait_per_pool_since_last_sample(reader, meter):
+    primary, read = _pg_engine(), _pg_engine()
+    sampler = TelemetrySampler(meter, {"primary": primary, "read": read})
+    read.sync_engine.pool.waits.record(0.5)
+    read.sync_engine.pool.waits.record(1.5)
+    container = _make_container(_FakeRepo(DeliveryStats(counts={}, oldest_pending_created_at=None)))
+
+    await sampler.refresh(container, [])
+
+    waits = {a["pool"]: v for a, v in _points(reader, "osa_db_pool_wait_seconds")}
+    assert waits == {"primary": 0.0, "read": 1.0}
+    waits_max = {a["pool"]: v for a, v in _points(reader, "osa_db_pool_wait_max_seconds")}
+    assert waits_max == {"primary": 0.0, "read": 1.5}
+
+    # Each sample covers only the checkouts since the previous one.
+    await sampler.refresh(container, [])
+    waits = {a["pool"]: v for a, v in _points(reader, "osa_db_pool_wait_seconds")}
+    assert waits["read"] == 0.0
+
+
 # ── SQLite StaticPool → no pool gauges ────────────────────────────────────────
 
 
 @pytest.mark.asyncio
 async def test_static_pool_yields_no_pool_gauges(reader, meter):
-    sampler = TelemetrySampler(meter, _sqlite_engine())
+    sampler = TelemetrySampler(meter, {"primary": _sqlite_engine()})
     stats = DeliveryStats(counts={}, oldest_pending_created_at=None)
     container = _make_container(_FakeRepo(stats))
 
     await sampler.refresh(container, [])
 
-    assert sampler._snapshot.pool is None
+    assert sampler._snapshot.pools == {}
     assert _points(reader, "osa_db_pool_checked_out") == []
     assert _points(reader, "osa_db_pool_size") == []
     assert _points(reader, "osa_db_pool_overflow") == []
@@ -202,13 +231,13 @@ async def test_refresh_error_keeps_previous_snapshot(meter, monkeypatch):
     fake_logger = MagicMock()
     monkeypatch.setattr(sampler_module, "logger", fake_logger)
 
-    sampler = TelemetrySampler(meter, _pg_engine())
+    sampler = TelemetrySampler(meter, {"primary": _pg_engine()})
 
     good = SamplerSnapshot(
         outbox_lag_seconds=5.0,
         pending_by_group={"ProcessBatch": 7},
         failed_by_group={},
-        pool=PoolStats(checked_out=1, size=5, overflow=0),
+        pools={"primary": PoolStats(checked_out=1, size=5, overflow=0)},
         workers_busy=1,
         workers_total=2,
     )
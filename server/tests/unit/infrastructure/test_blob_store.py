@@ -0,0 +1,212 @@
+"""Tests for the content-addressed file blob store and its adapter wiring."""
+
+import errno
+import hashlib
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from osa.domain.shared.model.srn import DepositionSRN
+from osa.infrastructure.persistence.adapter.ingest_storage import FilesystemIngestStorage
+from osa.infrastructure.persistence.adapter.storage import FilesystemStorageAdapter
+from osa.infrastructure.storage.blobs import FilesystemBlobStore, read_manifest
+from osa.infrastructure.storage.layout import StorageLayout
+
+RUN = "urn:osa:localhost:ing:run-1"
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+@pytest.fixture
+def layout(tmp_path: Path) -> StorageLayout:
+    return StorageLayout(tmp_path)
+
+
+@pytest.fixture
+def blobs(layout: StorageLayout) -> FilesystemBlobStore:
+    return FilesystemBlobStore(layout)
+
+
+class TestAdopt:
+    def test_identical_files_share_one_inode(self, tmp_path: Path, blobs: FilesystemBlobStore):
+        a, b = tmp_path / "a.bin", tmp_path / "b.bin"
+        a.write_bytes(b"payload")
+        b.write_bytes(b"payload")
+
+        da = blobs.adopt(a)
+        db = blobs.adopt(b)
+
+        assert da == db == _digest(b"payload")
+        assert os.path.samefile(a, b)
+        assert os.path.samefile(a, blobs.blob_path(da))
+        assert blobs.refcount(da) == 2
+        assert b.read_bytes() == b"payload"
+
+    def test_adopting_twice_is_idempotent(self, tmp_path: Path, blobs: FilesystemBlobStore):
+        a = tmp_path / "a.bin"
+        a.write_bytes(b"x")
+
+        digest = blobs.adopt(a)
+        blobs.adopt(a, digest)
+
+        assert blobs.refcount(digest) == 1
+
+    def test_blob_mode_is_left_alone(self, tmp_path: Path, blobs: FilesystemBlobStore):
+        a = tmp_path / "a.bin"
+        a.write_bytes(b"x")
+        mode = os.stat(a).st_mode
+
+        digest = blobs.adopt(a)
+
+        assert os.stat(blobs.blob_path(digest)).st_mode == mode
+
+    def test_no_hardlinks_leaves_files_in_place(self, tmp_path: Path, blobs: FilesystemBlobStore):
+        a = tmp_path / "a.bin"
+        a.write_bytes(b"x")
+
+        with patch("os.link", side_effect=OSError(errno.EXDEV, "cross-device")):
+            digest = blobs.adopt(a)
+        # Disabled for the rest of the process, without retrying link().
+        b = tmp_path / "b.bin"
+        b.write_bytes(b"x")
+        assert blobs.adopt(b) == digest
+
+        assert a.read_bytes() == b"x"
+        assert not blobs.blob_path(digest).exists()
+
+    def test_adopt_tree_returns_relative_digests(self, tmp_path: Path, blobs: FilesystemBlobStore):
+        root = tmp_path / "files"
+        (root / "rec-1").mkdir(parents=True)
+        (root / "rec-2").mkdir()
+        (root / "rec-1" / "s.cif").write_bytes(b"same")
+        (root / "rec-2" / "s.cif").write_bytes(b"same")
+        (root / "rec-2" / "link").symlink_to(root / "rec-1" / "s.cif")
+
+        entries = blobs.adopt_tree(root)
+
+        assert entries == {"rec-1/s.cif": _digest(b"same"), "rec-2/s.cif": _digest(b"same")}
+        assert blobs.refcount(_digest(b"same")) == 2
+
+
+class TestCollectGarbage:
+    def test_removes_only_unreferenced_blobs(self, tmp_path: Path, blobs: FilesystemBlobStore):
+        keep, drop = tmp_path / "keep", tmp_path / "drop"
+        keep.write_bytes(b"keep")
+        drop.write_bytes(b"drop")
+        dk, dd = blobs.adopt(keep), blobs.adopt(drop)
+
+        drop.unlink()
+
+        assert blobs.collect_garbage() == 1
+        assert blobs.blob_path(dk).exists()
+        assert not blobs.blob_path(dd).exists()
+
+    def test_empty_store(self, blobs: FilesystemBlobStore):
+        assert blobs.collect_garbage() == 0
+
+
+class TestDepositionDedupe:
+    @pytest.fixture
+    def adapter(self, tmp_path: Path, blobs: FilesystemBlobStore) -> FilesystemStorageAdapter:
+        return FilesystemStorageAdapter(str(tmp_path / "files"), blobs=blobs)
+
+    async def test_same_upload_in_two_depositions_is_stored_once(
+        self, adapter: FilesystemStorageAdapter, blobs: FilesystemBlobStore
+    ):
+        dep1 = DepositionSRN.parse("urn:osa:localhost:dep:one")
+        dep2 = DepositionSRN.parse("urn:osa:localhost:dep:two")
+
+        f1 = await adapter.save_file(dep1, "data.csv", b"a,b", 3)
+        await adapter.save_file(dep2, "copy.csv", b"a,b", 3)
+
+        digest = f1.checksum.removeprefix("sha256:")
+        assert os.path.samefile(
+            adapter.get_files_dir(dep1) / "data.csv", adapter.get_files_dir(dep2) / "copy.csv"
+        )
+        assert blobs.refcount(digest) == 2
+        assert read_manifest(adapter._dep_dir(dep1)) == {"data.csv": digest}
+
+    async def test_delete_updates_manifest_and_releases_blob(
+        self, adapter: FilesystemStorageAdapter, blobs: FilesystemBlobStore
+    ):
+        dep = DepositionSRN.parse("urn:osa:localhost:dep:one")
+        await adapter.save_file(dep, "data.csv", b"a,b", 3)
+
+        await adapter.delete_file(dep, "data.csv")
+
+        assert read_manifest(adapter._dep_dir(dep)) == {}
+        assert blobs.collect_garbage() == 1
+
+    async def test_overwrite_replaces_manifest_entry(self, adapter: FilesystemStorageAdapter):
+        dep = DepositionSRN.parse("urn:osa:localhost:dep:one")
+        await adapter.save_file(dep, "data.csv", b"v1", 2)
+        await adapter.save_file(dep, "data.csv", b"v2", 2)
+
+        assert (adapter.get_files_dir(dep) / "data.csv").read_bytes() == b"v2"
+        assert read_manifest(adapter._dep_dir(dep)) == {"data.csv": _digest(b"v2")}
+
+    async def test_moved_source_files_are_adopted(
+        self, tmp_path: Path, adapter: FilesystemStorageAdapter, blobs: FilesystemBlobStore
+    ):
+        dep = DepositionSRN.parse("urn:osa:localhost:dep:one")
+        staging = tmp_path / "staging"
+        (staging / "src1").mkdir(parents=True)
+        (staging / "src1" / "data.csv").write_bytes(b"abc")
+
+        await adapter.move_source_files_to_deposition(staging, "src1", dep)
+
+        assert read_manifest(adapter._dep_dir(dep)) == {"data.csv": _digest(b"abc")}
+        assert blobs.refcount(_digest(b"abc")) == 1
+
+    async def test_copy_fallback_replaces_a_shared_target(
+        self, tmp_path: Path, adapter: FilesystemStorageAdapter, blobs: FilesystemBlobStore
+    ):
+        # data.csv shares its blob with another deposition; the move can't
+        # rename (cross-device mount), so it copies onto the linked target.
+        dep = DepositionSRN.parse("urn:osa:localhost:dep:one")
+        other = DepositionSRN.parse("urn:osa:localhost:dep:two")
+        await adapter.save_file(dep, "data.csv", b"old", 3)
+        await adapter.save_file(other, "data.csv", b"old", 3)
+        staging = tmp_path / "staging"
+        (staging / "src1").mkdir(parents=True)
+        (staging / "src1" / "data.csv").write_bytes(b"new")
+
+        with patch.object(Path, "rename", side_effect=OSError(errno.EXDEV, "cross-device")):
+            await adapter.move_source_files_to_deposition(staging, "src1", dep)
+
+        assert (adapter.get_files_dir(dep) / "data.csv").read_bytes() == b"new"
+        assert (adapter.get_files_dir(other) / "data.csv").read_bytes() == b"old"
+        assert read_manifest(adapter._dep_dir(dep)) == {"data.csv": _digest(b"new")}
+        assert blobs.refcount(_digest(b"old")) == 1
+
+
+class TestIngestSeal:
+    async def test_seal_dedupes_batch_files_and_writes_manifest(
+        self, layout: StorageLayout, blobs: FilesystemBlobStore
+    ):
+        storage = FilesystemIngestStorage(layout=layout, blobs=blobs)
+        files = storage.batch_files_dir(RUN, 0)
+        (files / "r1").mkdir()
+        (files / "r2").mkdir()
+        (files / "r1" / "x.pdb").write_bytes(b"atoms")
+        (files / "r2" / "x.pdb").write_bytes(b"atoms")
+
+        await storage.seal_batch_files(RUN, 0)
+
+        assert os.path.samefile(files / "r1" / "x.pdb", files / "r2" / "x.pdb")
+        manifest = read_manifest(layout.ingest_batch_ingester_dir(RUN, 0))
+        assert manifest == {"r1/x.pdb": _digest(b"atoms"), "r2/x.pdb": _digest(b"atoms")}
+
+    async def test_seal_without_blob_store_is_noop(self, layout: StorageLayout):
+        storage = FilesystemIngestStorage(layout=layout)
+        files = storage.batch_files_dir(RUN, 0)
+        (files / "x").write_bytes(b"atoms")
+
+        await storage.seal_batch_files(RUN, 0)
+
+        assert read_manifest(layout.ingest_batch_ingester_dir(RUN, 0)) == {}
+        assert not layout.blob_dir().exists()
@@ -6,6 +6,7 @@ from pathlib import Path
 import pytest
 
 from osa.domain.shared.model.srn import DepositionSRN
+from osa.domain.validation.model.batch_outcome import OutcomeStatus
 from osa.infrastructure.persistence.adapter.storage import FilesystemStorageAdapter
 
 
@@ -169,3 +170,40 @@ class TestDeleteCleansHookOutputs:
         await adapter.delete_files_for_deposition(dep_srn)
 
         assert not (tmp_path / "depositions" / "localhost_test-dep").exists()
+
+
+class TestReadOutcomesSince:
+    @pytest.mark.asyncio
+    async def test_parses_complete_lines_past_offset(self, tmp_path: Path):
+        adapter = FilesystemStorageAdapter(base_path=str(tmp_path))
+        (tmp_path / "output").mkdir()
+        a = b'{"id": "a", "features": [{"x": 1}]}\n'
+        (tmp_path / "output" / "features.jsonl").write_bytes(a + b'{"id": "b"}')
+
+        outcomes, offset = await adapter.read_outcomes_since(tmp_path, 0)
+        assert [o.record_id for o in outcomes] == ["a"]
+        assert offset == len(a)
+
+        assert await adapter.read_outcomes_since(tmp_path, offset) == ([], offset)
+        outcomes, _ = await adapter.read_outcomes_since(tmp_path, offset, final=True)
+        assert [o.record_id for o in outcomes] == ["b"]
+
+    @pytest.mark.asyncio
+    async def test_missing_file_is_empty(self, tmp_path: Path):
+        adapter = FilesystemStorageAdapter(base_path=str(tmp_path))
+        assert await adapter.read_outcomes_since(tmp_path, 0) == ([], 0)
+
+
+class TestReadOutputOutcomes:
+    @pytest.mark.asyncio
+    async def test_reads_requested_statuses(self, tmp_path: Path):
+        adapter = FilesystemStorageAdapter(base_path=str(tmp_path))
+        (tmp_path / "output").mkdir()
+        (tmp_path / "output" / "features.jsonl").write_text('{"id": "a", "features": []}\n')
+        (tmp_path / "output" / "errors.jsonl").write_text('{"id": "e", "error": "boom"}\n')
+
+        everything = await adapter.read_output_outcomes(tmp_path)
+        errors = await adapter.read_output_outcomes(tmp_path, statuses={OutcomeStatus.ERRORED})
+
+        assert set(everything) == {"a", "e"}
+        assert [(o.record_id, o.error) for o in errors.values()] == [("e", "boom")]
@@ -1,11 +1,20 @@
 """T004: Unit tests for JSONL batch output parsing via FilesystemStorageAdapter."""
 
+import asyncio
+import gc
 import json
+import time
 from pathlib import Path
 
 import pytest
 
+from osa.domain.validation.model.batch_outcome import (
+    BatchRecordOutcome,
+    HookRecordId,
+    OutcomeStatus,
+)
 from osa.infrastructure.persistence.adapter.storage import FilesystemStorageAdapter
+from osa.infrastructure.storage.jsonl import IntermediateFormat
 
 
 def _write_jsonl(path: Path, lines: list[dict]) -> None:
@@ -130,3 +139,168 @@ class TestReadBatchOutcomes:
     ) -> None:
         outcomes = await adapter.read_batch_outcomes(str(tmp_path / "nonexistent"), HOOK)
         assert outcomes == {}
+
+
+class TestReadBatchOutcomesEventLoopLag:
+    """Large outcome reads run on the storage I/O pool, not the event loop."""
+
+    # A stalled loop shows up as one sleep overshooting by the full parse time
+    # (hundreds of ms here); an offloaded parse only costs GIL switch intervals.
+    MAX_LAG_S = 0.1
+
+    @pytest.fixture(autouse=True)
+    def _frozen_heap(self):
+        # Full gen-2 collections over the whole test session's heap pause every
+        # thread; freeze it so the probe measures the read, not the suite's GC.
+        gc.collect()
+        gc.freeze()
+        yield
+        gc.unfreeze()
+
+    @pytest.mark.anyio
+    async def test_loop_stays_responsive_during_large_read(
+        self, adapter: FilesystemStorageAdapter, tmp_path: Path
+    ) -> None:
+        output = _hook_output_dir(tmp_path)
+        _write_jsonl(
+            output / "features.jsonl",
+            [
+                {"id": f"rec{i}", "features": [{"score": i / 1000, "label": "x" * 64}]}
+                for i in range(60_000)
+            ],
+        )
+
+        max_lag = 0.0
+        done = asyncio.Event()
+
+        async def _probe() -> None:
+            nonlocal max_lag
+            loop = asyncio.get_running_loop()
+            while not done.is_set():
+                before = loop.time()
+                await asyncio.sleep(0.005)
+                max_lag = max(max_lag, loop.time() - before - 0.005)
+
+        probe = asyncio.create_task(_probe())
+        await asyncio.sleep(0)  # let the probe arm its first sleep
+        started = time.monotonic()
+        outcomes = await adapter.read_batch_outcomes(str(tmp_path), HOOK)
+        elapsed = time.monotonic() - started
+        done.set()
+        await probe
+
+        assert len(outcomes) == 60_000
+        assert max_lag < self.MAX_LAG_S, (
+            f"event loop stalled {max_lag:.3f}s during a {elapsed:.3f}s outcome read"
+        )
+
+
+class TestIterBatchOutcomes:
+    """Streaming reader: chunked reads, status filtering, same parse rules."""
+
+    @pytest.fixture(autouse=True)
+    def _tiny_chunks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # Force many chunks so records straddle read boundaries.
+        monkeypatch.setattr(
+            "osa.infrastructure.persistence.adapter.storage.OUTCOME_CHUNK_BYTES", 64
+        )
+
+    @pytest.mark.anyio
+    async def test_streams_every_record_across_chunks(
+        self, adapter: FilesystemStorageAdapter, tmp_path: Path
+    ) -> None:
+        output = _hook_output_dir(tmp_path)
+        _write_jsonl(
+            output / "features.jsonl",
+            [{"id": f"rec{i}", "features": [{"score": i}]} for i in range(50)],
+        )
+        _write_jsonl(output / "rejections.jsonl", [{"id": "bad", "reason": "nope"}])
+
+        seen = [o async for o in adapter.iter_batch_outcomes(str(tmp_path), HOOK)]
+
+        assert [o.record_id for o in seen[:50]] == [f"rec{i}" for i in range(50)]
+        assert seen[7].features == [{"score": 7}]
+        assert seen[-1].record_id == "bad"
+        assert seen[-1].status == "rejected"
+
+    @pytest.mark.anyio
+    async def test_statuses_filter_skips_other_files(
+        self, adapter: FilesystemStorageAdapter, tmp_path: Path
+    ) -> None:
+        output = _hook_output_dir(tmp_path)
+        _write_jsonl(output / "features.jsonl", [{"id": "ok", "features": []}])
+        _write_jsonl(output / "rejections.jsonl", [{"id": "bad", "reason": "nope"}])
+        _write_jsonl(output / "errors.jsonl", [{"id": "err", "error": "x"}])
+
+        seen = [
+            o.record_id
+            async for o in adapter.iter_batch_outcomes(
+                str(tmp_path), HOOK, statuses={OutcomeStatus.PASSED}
+            )
+        ]
+
+        assert seen == ["ok"]
+
+    @pytest.mark.anyio
+    async def test_malformed_lines_skipped(
+        self, adapter: FilesystemStorageAdapter, tmp_path: Path
+    ) -> None:
+        output = _hook_output_dir(tmp_path)
+        (output / "features.jsonl").write_text(
+            '{"id": "a", "features": []}\nnot json\n{"features": []}\n\n{"id": "b"}\n'
+        )
+
+        seen = [o.record_id async for o in adapter.iter_batch_outcomes(str(tmp_path), HOOK)]
+
+        assert seen == ["a", "b"]
+
+    @pytest.mark.anyio
+    async def test_missing_dir_yields_nothing(
+        self, adapter: FilesystemStorageAdapter, tmp_path: Path
+    ) -> None:
+        seen = [o async for o in adapter.iter_batch_outcomes(str(tmp_path / "nope"), HOOK)]
+        assert seen == []
+
+
+class TestCompressedBatchOutcomes:
+    """Canonical outcome files in a compressed intermediate format."""
+
+    @pytest.fixture
+    def gz_adapter(self, tmp_path: Path) -> FilesystemStorageAdapter:
+        return FilesystemStorageAdapter(
+            str(tmp_path), intermediate_format=IntermediateFormat.JSONL_GZ
+        )
+
+    @pytest.mark.anyio
+    async def test_canonical_gzip_replaces_plain_hook_output(
+        self, gz_adapter: FilesystemStorageAdapter, tmp_path: Path
+    ) -> None:
+        output = _hook_output_dir(tmp_path)
+        _write_jsonl(output / "features.jsonl", [{"id": "a", "features": []}])
+        outcomes = {
+            HookRecordId("a"): BatchRecordOutcome(
+                record_id=HookRecordId("a"), status=OutcomeStatus.PASSED, features=[{"v": 1}]
+            ),
+            HookRecordId("b"): BatchRecordOutcome(
+                record_id=HookRecordId("b"), status=OutcomeStatus.ERRORED, error="x"
+            ),
+        }
+
+        await gz_adapter.write_batch_outcomes(output.parent, outcomes)
+
+        assert sorted(p.name for p in output.iterdir()) == [
+            "errors.jsonl.gz",
+            "features.jsonl.gz",
+        ]
+        assert await gz_adapter.read_batch_outcomes(str(tmp_path), HOOK) == outcomes
+
+    @pytest.mark.anyio
+    async def test_plain_outputs_readable_when_gzip_configured(
+        self, gz_adapter: FilesystemStorageAdapter, tmp_path: Path
+    ) -> None:
+        output = _hook_output_dir(tmp_path)
+        _write_jsonl(output / "rejections.jsonl", [{"id": "r", "reason": "bad"}])
+
+        outcomes = await gz_adapter.read_batch_outcomes(str(tmp_path), HOOK)
+
+        assert outcomes["r"].reason == "bad"
@@ -1,11 +1,13 @@
 """Tests for FilesystemIngestStorage adapter."""
 
+import gzip
 import json
 from pathlib import Path
 
 import pytest
 
 from osa.infrastructure.persistence.adapter.ingest_storage import FilesystemIngestStorage
+from osa.infrastructure.storage.jsonl import IntermediateFormat
 from osa.infrastructure.storage.layout import StorageLayout
 
 
@@ -35,6 +37,13 @@ class TestReadWriteSession:
         result = await storage.read_session(SRN)
         assert result == {"offset": 200}
 
+    async def test_shards_keep_separate_sessions(self, storage: FilesystemIngestStorage):
+        await storage.write_session(SRN, {"offset": 100})
+        await storage.write_session(SRN, {"offset": 7}, shard=2)
+        assert await storage.read_session(SRN) == {"offset": 100}
+        assert await storage.read_session(SRN, shard=2) == {"offset": 7}
+        assert await storage.read_session(SRN, shard=1) is None
+
 
 class TestReadWriteRecords:
     async def test_read_returns_empty_when_no_records(self, storage: FilesystemIngestStorage):
@@ -69,6 +78,40 @@ class TestReadWriteRecords:
         assert json.loads(lines[0]) == records[0]
 
 
+class TestCompressedRecords:
+    @pytest.fixture
+    def gz_storage(self, tmp_path: Path) -> FilesystemIngestStorage:
+        layout = StorageLayout(tmp_path, intermediate_format=IntermediateFormat.JSONL_GZ)
+        return FilesystemIngestStorage(layout=layout)
+
+    async def test_gzip_roundtrip(self, gz_storage: FilesystemIngestStorage):
+        records = [{"source_id": f"rec{i}", "metadata": {"n": i}} for i in range(500)]
+        await gz_storage.write_records(SRN, batch_index=0, records=records)
+
+        work_dir = gz_storage.batch_work_dir(SRN, batch_index=0)
+        assert sorted(p.name for p in work_dir.iterdir()) == ["records.jsonl.gz"]
+        with gzip.open(work_dir / "records.jsonl.gz", "rt") as f:
+            assert json.loads(f.readline()) == records[0]
+        assert await gz_storage.read_records(SRN, batch_index=0) == records
+
+    async def test_plain_run_stays_readable_after_switch(
+        self, storage: FilesystemIngestStorage, gz_storage: FilesystemIngestStorage
+    ):
+        records = [{"source_id": "old", "metadata": {}}]
+        await storage.write_records(SRN, batch_index=0, records=records)
+        assert await gz_storage.read_records(SRN, batch_index=0) == records
+
+    async def test_rewrite_in_new_format_removes_old_variant(
+        self, storage: FilesystemIngestStorage, gz_storage: FilesystemIngestStorage
+    ):
+        await storage.write_records(SRN, batch_index=0, records=[{"source_id": "a"}])
+        await gz_storage.write_records(SRN, batch_index=0, records=[{"source_id": "b"}])
+
+        work_dir = storage.batch_work_dir(SRN, batch_index=0)
+        assert sorted(p.name for p in work_dir.iterdir()) == ["records.jsonl.gz"]
+        assert await storage.read_records(SRN, batch_index=0) == [{"source_id": "b"}]
+
+
 class TestPathLocators:
     def test_batch_work_dir_creates_directory(self, storage: FilesystemIngestStorage):
         d = storage.batch_work_dir(SRN, batch_index=0)
@@ -92,3 +135,22 @@ class TestPathLocators:
         bd = storage.batch_dir(SRN, batch_index=0)
         wd = storage.batch_work_dir(SRN, batch_index=0)
         assert wd.parent == bd
+
+
+class TestBatchFileDigests:
+    @pytest.mark.asyncio
+    async def test_hashes_unsealed_files_by_record_path(self, storage: FilesystemIngestStorage):
+        files = storage.batch_files_dir(SRN, batch_index=0)
+        (files / "rec-1").mkdir()
+        (files / "rec-1" / "a.pdb").write_text("ATOM")
+        (files / "rec-2").mkdir()
+        (files / "rec-2" / "a.pdb").write_text("ATOM")
+
+        digests = await storage.batch_file_digests(SRN, batch_index=0)
+
+        assert set(digests) == {"rec-1/a.pdb", "rec-2/a.pdb"}
+        assert digests["rec-1/a.pdb"] == digests["rec-2/a.pdb"]
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_has_no_digests(self, storage: FilesystemIngestStorage):
+        assert await storage.batch_file_digests(SRN, batch_index=0) == {}
@@ -0,0 +1,87 @@
+"""Tests for the intermediate JSONL codecs (plain, gzip, zstd)."""
+
+import gzip
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+
+from osa.domain.shared.error import ConfigurationError
+from osa.infrastructure.storage import jsonl
+from osa.infrastructure.storage.jsonl import IntermediateFormat
+
+
+def _zstd_available() -> bool:
+    try:
+        jsonl.ensure_available(IntermediateFormat.JSONL_ZST)
+    except ConfigurationError:
+        return False
+    return True
+
+
+FORMATS = [
+    IntermediateFormat.JSONL,
+    IntermediateFormat.JSONL_GZ,
+    pytest.param(
+        IntermediateFormat.JSONL_ZST,
+        marks=pytest.mark.skipif(not _zstd_available(), reason="no zstd codec"),
+    ),
+]
+
+
+async def _chunks(data: bytes, size: int) -> AsyncIterator[bytes]:
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+class TestNaming:
+    def test_variant_name_appends_compression_suffix(self) -> None:
+        assert jsonl.variant_name("records.jsonl", IntermediateFormat.JSONL) == "records.jsonl"
+        assert (
+            jsonl.variant_name("records.jsonl", IntermediateFormat.JSONL_ZST) == "records.jsonl.zst"
+        )
+
+    def test_format_detected_from_extension(self) -> None:
+        assert jsonl.format_of("a/records.jsonl.gz") is IntermediateFormat.JSONL_GZ
+        assert jsonl.format_of("a/records.jsonl.zst") is IntermediateFormat.JSONL_ZST
+        assert jsonl.format_of("a/records.jsonl") is IntermediateFormat.JSONL
+
+    def test_read_candidates_put_configured_format_first(self) -> None:
+        names = [n for n, _ in jsonl.read_candidates("f.jsonl", IntermediateFormat.JSONL_GZ)]
+        assert names == ["f.jsonl.gz", "f.jsonl", "f.jsonl.zst"]
+
+
+class TestFileRoundtrip:
+    @pytest.mark.parametrize("fmt", FORMATS)
+    def test_write_then_read_lines(self, tmp_path: Path, fmt: IntermediateFormat) -> None:
+        path = tmp_path / jsonl.variant_name("x.jsonl", fmt)
+        with jsonl.open_text(path, "w") as f:
+            for i in range(100):
+                f.write(f'{{"i": {i}}}\n')
+
+        with jsonl.open_text(path, "r") as f:
+            lines = f.readlines()
+
+        assert len(lines) == 100
+        assert lines[42] == '{"i": 42}\n'
+
+
+class TestByteStreams:
+    @pytest.mark.parametrize("fmt", FORMATS)
+    async def test_encode_then_stream_decode(self, fmt: IntermediateFormat) -> None:
+        rows = [f'{{"id": "r{i}", "pad": "{"x" * 40}"}}' for i in range(2000)]
+        body = jsonl.encode_lines(rows, fmt)
+
+        lines: list[bytes] = []
+        async for chunk in jsonl.iter_line_chunks(jsonl.decode_chunks(_chunks(body, 333), fmt)):
+            lines.extend(chunk)
+
+        assert [line.decode() for line in lines] == rows
+
+    def test_gzip_body_is_standard_gzip(self) -> None:
+        body = jsonl.encode_lines(['{"a": 1}'], IntermediateFormat.JSONL_GZ)
+        assert gzip.decompress(body) == b'{"a": 1}\n'
+
+    async def test_line_chunks_carry_partial_tail(self) -> None:
+        out = [c async for c in jsonl.iter_line_chunks(_chunks(b"ab\ncd\nef", 4))]
+        assert out == [[b"ab"], [b"cd"], [b"ef"]]
@@ -425,7 +425,7 @@ class TestContainerConfig:
         container.wait.return_value = {"StatusCode": 0}
         container.show.return_value = {"State": {"OOMKilled": False}}
 
-        runner = OciHookRunner(docker=docker)
+        runner = OciHookRunner(docker=docker, files_mount="per_record")
         hook = _make_hook()
         release = _make_release()
         files_dir = tmp_path / "files"
@@ -455,6 +455,48 @@ class TestContainerConfig:
         assert str(work_dir / "output") in out_bind
         assert any(":/osa/files/test:ro" in b for b in binds)
 
+    @pytest.mark.asyncio
+    async def test_single_files_mount_for_many_records(self, tmp_path: Path):
+        """Default mode: one /osa/files bind holding a {id}/ tree per record."""
+        docker = AsyncMock()
+        container = AsyncMock()
+        container.wait.return_value = {"StatusCode": 0}
+        container.show.return_value = {"State": {"OOMKilled": False}}
+        staged: dict[str, list[str]] = {}
+
+        async def _create(config):
+            files_bind = next(b for b in config["HostConfig"]["Binds"] if ":/osa/files:" in b)
+            base = Path(files_bind.split(":")[0])
+            staged.update({d.name: sorted(f.name for f in d.iterdir()) for d in base.iterdir()})
+            return container
+
+        docker.containers.create.side_effect = _create
+
+        files_dirs = {}
+        for i in range(50):
+            fdir = tmp_path / "batch" / "files" / f"rec-{i}"
+            fdir.mkdir(parents=True)
+            (fdir / "model.cif").write_text(str(i))
+            files_dirs[f"urn:rec:{i}"] = fdir
+        inputs = HookInputs(
+            records=[HookRecord(id=rid, metadata={}) for rid in files_dirs],
+            run_id="test-run",
+            files_dirs=files_dirs,
+        )
+        work_dir = tmp_path / "hook_work"
+        work_dir.mkdir()
+
+        await OciHookRunner(docker=docker).run(_make_hook(), _make_release(), inputs, work_dir)
+
+        binds = docker.containers.create.call_args[0][0]["HostConfig"]["Binds"]
+        assert len(binds) == 3
+        assert binds[-1] == f"{work_dir / 'input' / 'files'}:/osa/files:ro"
+        assert len(staged) == 50
+        assert staged["urn_rec_7"] == ["model.cif"]
+        # Staging is cleaned up; the source files are untouched.
+        assert not (work_dir / "input").exists()
+        assert (files_dirs["urn:rec:7"] / "model.cif").read_text() == "7"
+
     @pytest.mark.asyncio
     async def test_no_files_bind_when_no_files_dir(self, tmp_path: Path):
         """When files_dir is None, only staging and output mounts are created."""
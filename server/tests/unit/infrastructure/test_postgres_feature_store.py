@@ -61,6 +61,7 @@ def _mock_engine_with_reflect(table_name: str, feature_columns: list[str] | None
         sa.Table(table_name, metadata, *cols)
 
     conn.run_sync = AsyncMock(side_effect=fake_run_sync)
+    conn.execute.return_value = MagicMock(rowcount=0)  # no prior rows replaced
     return engine, conn
 
 
@@ -154,8 +155,9 @@ class TestInsertFeatures:
         count = await store.insert_features("pocket_detect", "urn:rec:1", rows, _RUN_ID)
 
         assert count == 2
-        # Replace semantics (#160): one DELETE (scoped to the record) + one insert chunk.
-        assert conn.execute.call_count == 2
+        # Replace semantics (#160): one DELETE (scoped to the record) + one insert
+        # chunk, then the row-count delta for the instance statistics.
+        assert conn.execute.call_count == 3
 
     @pytest.mark.asyncio
     async def test_deletes_existing_rows_for_record_before_insert(self):
@@ -187,7 +189,7 @@ class TestInsertFeatures:
 
         await store.insert_features("pocket_detect", "urn:rec:1", [{"score": 0.95}], _RUN_ID)
 
-        call_args = conn.execute.call_args
+        call_args = conn.execute.call_args_list[1]
         params = call_args[0][1]  # second positional arg is the params list
         assert len(params) == 1
         assert params[0]["record_srn"] == "urn:rec:1"
@@ -204,8 +206,8 @@ class TestInsertFeatures:
         count = await store.insert_features("hook", "urn:rec:1", rows, _RUN_ID)
 
         assert count == 2500
-        # 1 replace-DELETE + 3 insert chunks (1000 + 1000 + 500).
-        assert conn.execute.call_count == 4
+        # 1 replace-DELETE + 3 insert chunks (1000 + 1000 + 500) + 1 row delta.
+        assert conn.execute.call_count == 5
 
     @pytest.mark.asyncio
     async def test_single_chunk_for_small_batch(self):
@@ -216,8 +218,8 @@ class TestInsertFeatures:
         count = await store.insert_features("hook", "urn:rec:1", rows, _RUN_ID)
 
         assert count == 999
-        # 1 replace-DELETE + 1 insert chunk.
-        assert conn.execute.call_count == 2
+        # 1 replace-DELETE + 1 insert chunk + 1 row delta.
+        assert conn.execute.call_count == 3
 
     @pytest.mark.asyncio
     async def test_insert_rejects_invalid_hook_name(self):
@@ -245,3 +247,26 @@ class TestInsertFeatures:
 
         # run_sync should have been called for reflection
         conn.run_sync.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_records_net_row_delta(self):
+        engine, conn = _mock_engine_with_reflect("hook", ["score"])
+        conn.execute.return_value = MagicMock(rowcount=1)  # one prior row replaced
+        store = PostgresFeatureStore(engine=engine, session=AsyncMock())
+
+        await store.insert_features("hook", "urn:rec:1", [{"score": 1.0}, {"score": 2.0}], _RUN_ID)
+
+        delta_stmt = conn.execute.call_args_list[-1][0][0]
+        assert delta_stmt.table.name == "instance_statistics_deltas"
+        assert delta_stmt.compile().params == {"table_name": "hook", "row_delta": 1}
+
+    @pytest.mark.asyncio
+    async def test_like_for_like_replace_records_no_delta(self):
+        engine, conn = _mock_engine_with_reflect("hook", ["score"])
+        conn.execute.return_value = MagicMock(rowcount=1)
+        store = PostgresFeatureStore(engine=engine, session=AsyncMock())
+
+        await store.insert_features("hook", "urn:rec:1", [{"score": 1.0}], _RUN_ID)
+
+        # DELETE + insert chunk only.
+        assert conn.execute.call_count == 2
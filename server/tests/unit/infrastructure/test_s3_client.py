@@ -0,0 +1,140 @@
+"""Tests for S3Client bounded-concurrency prefix operations."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import pytest
+
+from osa.domain.shared.error import InfrastructureError
+from osa.infrastructure.s3.client import S3Client
+
+
+class _FakePaginator:
+    def __init__(self, owner: "_FakeBotoClient", page_size: int) -> None:
+        self._owner = owner
+        self._page_size = page_size
+
+    async def paginate(self, *, Bucket: str, Prefix: str) -> AsyncIterator[dict[str, Any]]:
+        keys = sorted(k for k in self._owner.objects if k.startswith(Prefix))
+        for i in range(0, len(keys), self._page_size):
+            self._owner.pages_listed += 1
+            yield {"Contents": [{"Key": k} for k in keys[i : i + self._page_size]]}
+            await asyncio.sleep(0)
+
+
+class _FakeBotoClient:
+    """In-memory stand-in for an aiobotocore S3 client that tracks concurrency."""
+
+    def __init__(self, keys: list[str], *, page_size: int = 1000) -> None:
+        self.objects: dict[str, bytes] = dict.fromkeys(keys, b"x")
+        self.page_size = page_size
+        self.pages_listed = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.delete_batches: list[int] = []
+        self.fail_keys: set[str] = set()
+
+    def get_paginator(self, name: str) -> _FakePaginator:
+        assert name == "list_objects_v2"
+        return _FakePaginator(self, self.page_size)
+
+    async def _request(self) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+
+    async def delete_objects(self, *, Bucket: str, Delete: dict[str, Any]) -> dict[str, Any]:
+        await self._request()
+        keys = [o["Key"] for o in Delete["Objects"]]
+        self.delete_batches.append(len(keys))
+        errors = [{"Key": k} for k in keys if k in self.fail_keys]
+        for k in keys:
+            if k not in self.fail_keys:
+                self.objects.pop(k, None)
+        return {"Errors": errors} if errors else {}
+
+    async def copy_object(self, *, Bucket: str, CopySource: dict[str, str], Key: str) -> None:
+        await self._request()
+        self.objects[Key] = self.objects[CopySource["Key"]]
+
+    async def delete_object(self, *, Bucket: str, Key: str) -> None:
+        await self._request()
+        self.objects.pop(Key, None)
+
+
+def _client_over(fake: _FakeBotoClient, *, max_concurrency: int = 4) -> S3Client:
+    s3 = S3Client(bucket="b", max_concurrency=max_concurrency)
+
+    @asynccontextmanager
+    async def _client():  # noqa: ANN202
+        yield fake
+
+    s3._client = _client  # type: ignore[method-assign]
+    return s3
+
+
+class TestListPrefix:
+    @pytest.mark.asyncio
+    async def test_yields_only_keys_under_prefix(self) -> None:
+        fake = _FakeBotoClient(["a/1", "a/2", "b/1"], page_size=1)
+        s3 = _client_over(fake)
+
+        assert [k async for k in s3.list_prefix("a/")] == ["a/1", "a/2"]
+        assert await s3.list_objects("b/") == ["b/1"]
+
+
+class TestDeletePrefix:
+    @pytest.mark.asyncio
+    async def test_deletes_in_bounded_concurrent_batches(self) -> None:
+        keys = [f"dep/files/{i:05d}" for i in range(4500)]
+        fake = _FakeBotoClient([*keys, "other/keep"], page_size=250)
+        s3 = _client_over(fake, max_concurrency=3)
+
+        deleted = await s3.delete_prefix("dep/")
+
+        assert deleted == 4500
+        assert list(fake.objects) == ["other/keep"]
+        assert sorted(fake.delete_batches) == [500, 1000, 1000, 1000, 1000]
+        assert 1 < fake.max_in_flight <= 3
+
+    @pytest.mark.asyncio
+    async def test_empty_prefix_is_noop(self) -> None:
+        fake = _FakeBotoClient(["other/keep"])
+        s3 = _client_over(fake)
+
+        assert await s3.delete_prefix("dep/") == 0
+        assert fake.delete_batches == []
+
+    @pytest.mark.asyncio
+    async def test_partial_failure_raises_infrastructure_error(self) -> None:
+        fake = _FakeBotoClient(["dep/a", "dep/b"])
+        fake.fail_keys = {"dep/b"}
+        s3 = _client_over(fake)
+
+        with pytest.raises(InfrastructureError, match="dep/b"):
+            await s3.delete_prefix("dep/")
+
+
+class TestCopyPrefix:
+    @pytest.mark.asyncio
+    async def test_copies_relative_keys(self) -> None:
+        fake = _FakeBotoClient(["stage/s1/a.txt", "stage/s1/sub/b.txt", "stage/s2/c.txt"])
+        s3 = _client_over(fake, max_concurrency=2)
+
+        copied = await s3.copy_prefix("stage/s1/", "dep/files/")
+
+        assert copied == 2
+        assert {"dep/files/a.txt", "dep/files/sub/b.txt", "stage/s1/a.txt"} <= set(fake.objects)
+        assert fake.max_in_flight <= 2
+
+    @pytest.mark.asyncio
+    async def test_delete_source_moves(self) -> None:
+        fake = _FakeBotoClient([f"stage/s1/{i}" for i in range(20)])
+        s3 = _client_over(fake)
+
+        await s3.copy_prefix("stage/s1/", "dep/files/", delete_source=True)
+
+        assert sorted(fake.objects) == sorted(f"dep/files/{i}" for i in range(20))
@@ -1,11 +1,16 @@
 """Tests for S3IngestStorage adapter."""
 
+import gzip
+import hashlib
+import json
+from collections.abc import AsyncIterator
 from pathlib import Path
 
 import pytest
 from botocore.exceptions import ClientError
 
 from osa.infrastructure.s3.ingest_storage import S3IngestStorage
+from osa.infrastructure.storage.jsonl import IntermediateFormat
 from osa.infrastructure.storage.layout import StorageLayout
 
 DATA_MOUNT = "/data/data"
@@ -34,6 +39,21 @@ class FakeS3Client:
             raise _not_found_error(key)
         return self._objects[key]
 
+    async def get_object_stream(self, key: str, chunk_size: int = 8192) -> AsyncIterator[bytes]:
+        data = await self.get_object(key)
+        for i in range(0, len(data), chunk_size):
+            yield data[i : i + chunk_size]
+
+    async def delete_object(self, key: str) -> None:
+        self._objects.pop(key, None)
+
+    async def list_etags(self, prefix: str) -> dict[str, str]:
+        return {
+            key: hashlib.md5(data).hexdigest()
+            for key, data in self._objects.items()
+            if key.startswith(prefix)
+        }
+
 
 @pytest.fixture
 def s3() -> FakeS3Client:
@@ -103,6 +123,40 @@ class TestReadWriteRecords:
         assert "/3/" in keys[0]
 
 
+class TestCompressedRecords:
+    @pytest.fixture
+    def gz_storage(self, s3: FakeS3Client) -> S3IngestStorage:
+        layout = StorageLayout(Path(DATA_MOUNT), intermediate_format=IntermediateFormat.JSONL_GZ)
+        return S3IngestStorage(s3=s3, layout=layout, data_mount_path=DATA_MOUNT)  # type: ignore[arg-type]
+
+    async def test_gzip_roundtrip_writes_compressed_object(
+        self, gz_storage: S3IngestStorage, s3: FakeS3Client
+    ):
+        records = [{"source_id": f"rec{i}", "metadata": {"n": i}} for i in range(500)]
+        await gz_storage.write_records(SRN, batch_index=0, records=records)
+
+        (key,) = s3._objects
+        assert key.endswith("records.jsonl.gz")
+        assert json.loads(gzip.decompress(s3._objects[key]).splitlines()[0]) == records[0]
+        assert await gz_storage.read_records(SRN, batch_index=0) == records
+
+    async def test_plain_run_stays_readable_after_switch(
+        self, storage: S3IngestStorage, gz_storage: S3IngestStorage
+    ):
+        records = [{"source_id": "old", "metadata": {}}]
+        await storage.write_records(SRN, batch_index=0, records=records)
+        assert await gz_storage.read_records(SRN, batch_index=0) == records
+
+    async def test_rewrite_in_new_format_removes_old_variant(
+        self, storage: S3IngestStorage, gz_storage: S3IngestStorage, s3: FakeS3Client
+    ):
+        await gz_storage.write_records(SRN, batch_index=0, records=[{"source_id": "a"}])
+        await storage.write_records(SRN, batch_index=0, records=[{"source_id": "b"}])
+
+        assert [k.rsplit("/", 1)[-1] for k in s3._objects] == ["records.jsonl"]
+        assert await gz_storage.read_records(SRN, batch_index=0) == [{"source_id": "b"}]
+
+
 class TestPathLocators:
     def test_batch_work_dir_returns_path(self, storage: S3IngestStorage):
         d = storage.batch_work_dir(SRN, batch_index=0)
@@ -128,3 +182,21 @@ class TestPathLocators:
         """S3 adapter should not create local directories."""
         d = storage.batch_work_dir(SRN, batch_index=99)
         assert not d.exists()
+
+
+class TestBatchFileDigests:
+    @pytest.mark.asyncio
+    async def test_etags_keyed_by_path_under_files_dir(
+        self, s3: FakeS3Client, storage: S3IngestStorage
+    ):
+        files_key = storage._key(storage.batch_files_dir(SRN, batch_index=0))
+        await s3.put_object(f"{files_key}/rec-1/a.pdb", b"ATOM")
+        await s3.put_object(f"{files_key}/rec-2/b.cif", b"data_x")
+        await s3.put_object(f"{files_key}-other/rec-9/c.pdb", b"ATOM")
+
+        digests = await storage.batch_file_digests(SRN, batch_index=0)
+
+        assert digests == {
+            "rec-1/a.pdb": hashlib.md5(b"ATOM").hexdigest(),
+            "rec-2/b.cif": hashlib.md5(b"data_x").hexdigest(),
+        }
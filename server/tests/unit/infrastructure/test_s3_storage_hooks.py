@@ -1,17 +1,25 @@
 """Tests for S3StorageAdapter hook-log read/write (#147)."""
 
+import json
 from collections.abc import AsyncIterator
+from pathlib import Path
 
 import pytest
 
 from osa.domain.shared.error import NotFoundError
+from osa.domain.validation.model.batch_outcome import (
+    BatchRecordOutcome,
+    HookRecordId,
+    OutcomeStatus,
+)
 from osa.infrastructure.s3.storage import S3StorageAdapter
+from osa.infrastructure.storage.jsonl import IntermediateFormat
 
 DATA_MOUNT = "/data/data"
 
 
 class FakeS3Client:
-    """Minimal in-memory S3 client exposing the methods read_hook_log uses."""
+    """Minimal in-memory S3 client exposing the methods the hook-output paths use."""
 
     def __init__(self) -> None:
         self._objects: dict[str, bytes] = {}
@@ -22,6 +30,18 @@ class FakeS3Client:
     async def head_object(self, key: str) -> bool:
         return key in self._objects
 
+    async def list_objects(self, prefix: str) -> list[str]:
+        return [k for k in self._objects if k.startswith(prefix)]
+
+    async def delete_object(self, key: str) -> None:
+        self._objects.pop(key, None)
+
+    async def get_object(self, key: str) -> bytes:
+        return self._objects[key]
+
+    async def get_object_range(self, key: str, start: int) -> bytes:
+        return self._objects.get(key, b"")[start:]
+
     async def get_object_stream(self, key: str, chunk_size: int = 8192) -> AsyncIterator[bytes]:
         data = self._objects[key]
         for i in range(0, len(data), chunk_size):
@@ -58,3 +78,114 @@ class TestReadHookLog:
     async def test_rejects_traversal_key(self, storage: S3StorageAdapter) -> None:
         with pytest.raises(ValueError, match="Invalid log_ref"):
             await storage.read_hook_log("depositions/../../etc/passwd")
+
+
+class TestIterBatchOutcomes:
+    OUTPUT_DIR = f"{DATA_MOUNT}/ingests/run-1/batches/0"
+    PREFIX = "ingests/run-1/batches/0/hooks/h/output"
+
+    @pytest.mark.asyncio
+    async def test_reassembles_lines_split_across_chunks(
+        self, storage: S3StorageAdapter, s3: FakeS3Client, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("osa.infrastructure.s3.storage.OUTCOME_CHUNK_BYTES", 7)
+        rows = [json.dumps({"id": f"rec{i}", "features": [{"v": i}]}) for i in range(20)]
+        # No trailing newline: the last record lives only in the carried-over tail.
+        await s3.put_object(f"{self.PREFIX}/features.jsonl", "\n".join(rows))
+
+        seen = [o async for o in storage.iter_batch_outcomes(self.OUTPUT_DIR, "h")]
+
+        assert [o.record_id for o in seen] == [f"rec{i}" for i in range(20)]
+        assert seen[-1].features == [{"v": 19}]
+
+    @pytest.mark.asyncio
+    async def test_statuses_filter_and_missing_objects(
+        self, storage: S3StorageAdapter, s3: FakeS3Client
+    ) -> None:
+        await s3.put_object(f"{self.PREFIX}/rejections.jsonl", '{"id": "bad", "reason": "no"}\n')
+
+        everything = [o async for o in storage.iter_batch_outcomes(self.OUTPUT_DIR, "h")]
+        passed_only = [
+            o
+            async for o in storage.iter_batch_outcomes(
+                self.OUTPUT_DIR, "h", statuses={OutcomeStatus.PASSED}
+            )
+        ]
+
+        assert [(o.record_id, o.status) for o in everything] == [("bad", "rejected")]
+        assert passed_only == []
+
+
+class TestCompressedBatchOutcomes:
+    WORK_DIR = Path(f"{DATA_MOUNT}/ingests/run-1/batches/0/hooks/h")
+    OUTPUT_DIR = f"{DATA_MOUNT}/ingests/run-1/batches/0"
+    PREFIX = "ingests/run-1/batches/0/hooks/h/output"
+
+    @pytest.mark.asyncio
+    async def test_gzip_canonical_replaces_plain_hook_output(self, s3: FakeS3Client) -> None:
+        storage = S3StorageAdapter(
+            s3=s3,  # type: ignore[arg-type]
+            data_mount_path=DATA_MOUNT,
+            intermediate_format=IntermediateFormat.JSONL_GZ,
+        )
+        # The hook's own (plain) output, as the container left it.
+        await s3.put_object(f"{self.PREFIX}/features.jsonl", '{"id": "a", "features": []}\n')
+        outcomes = {
+            HookRecordId("a"): BatchRecordOutcome(
+                record_id=HookRecordId("a"), status=OutcomeStatus.PASSED, features=[{"v": 1}]
+            ),
+            HookRecordId("b"): BatchRecordOutcome(
+                record_id=HookRecordId("b"), status=OutcomeStatus.REJECTED, reason="no"
+            ),
+        }
+
+        await storage.write_batch_outcomes(self.WORK_DIR, outcomes)
+
+        assert sorted(s3._objects) == [
+            f"{self.PREFIX}/features.jsonl.gz",
+            f"{self.PREFIX}/rejections.jsonl.gz",
+        ]
+        read = await storage.read_batch_outcomes(self.OUTPUT_DIR, "h")
+        assert read == outcomes
+
+    @pytest.mark.asyncio
+    async def test_plain_outputs_readable_when_gzip_configured(self, s3: FakeS3Client) -> None:
+        storage = S3StorageAdapter(
+            s3=s3,  # type: ignore[arg-type]
+            data_mount_path=DATA_MOUNT,
+            intermediate_format=IntermediateFormat.JSONL_GZ,
+        )
+        await s3.put_object(f"{self.PREFIX}/errors.jsonl", '{"id": "e", "error": "boom"}\n')
+
+        read = [o async for o in storage.iter_batch_outcomes(self.OUTPUT_DIR, "h")]
+
+        assert [(o.record_id, o.error) for o in read] == [("e", "boom")]
+
+
+class TestReadOutcomesSince:
+    WORK_DIR = Path(DATA_MOUNT) / "ingests" / "run-1" / "batches" / "0" / "hooks" / "h"
+    KEY = "ingests/run-1/batches/0/hooks/h/output"
+
+    @pytest.mark.asyncio
+    async def test_ranged_read_of_features(
+        self, storage: S3StorageAdapter, s3: FakeS3Client
+    ) -> None:
+        a = b'{"id": "a", "features": []}\n'
+        await s3.put_object(f"{self.KEY}/features.jsonl", a + b'{"id": "b", "features": []}\n')
+
+        outcomes, offset = await storage.read_outcomes_since(self.WORK_DIR, len(a))
+
+        assert [o.record_id for o in outcomes] == ["b"]
+        assert offset == len(a) + 28
+        assert await storage.read_outcomes_since(self.WORK_DIR / "missing", 0) == ([], 0)
+
+    @pytest.mark.asyncio
+    async def test_read_output_outcomes(self, storage: S3StorageAdapter, s3: FakeS3Client) -> None:
+        await s3.put_object(f"{self.KEY}/features.jsonl", '{"id": "a", "features": []}\n')
+        await s3.put_object(f"{self.KEY}/rejections.jsonl", '{"id": "r", "reason": "no"}\n')
+
+        outcomes = await storage.read_output_outcomes(
+            self.WORK_DIR, statuses={OutcomeStatus.REJECTED}
+        )
+
+        assert [(o.record_id, o.reason) for o in outcomes.values()] == [("r", "no")]